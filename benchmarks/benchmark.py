@@ -0,0 +1,457 @@
+#!/usr/bin/env python
+"""
+Benchmarks of kinematics, structure matrices, force distributions, criteria,
+and workspaces on the sample robots.
+
+Run all benchmarks and store their timings with
+
+    python benchmarks/benchmark.py --output results.json
+
+and compare a later run against these timings with
+
+    python benchmarks/benchmark.py --baseline results.json
+
+which exits with a non-zero status if any benchmark became slower than the
+baseline by more than the given threshold. Benchmarks can be selected by a
+regular expression on their names with `--filter`.
+"""
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+import argparse
+import datetime
+import functools
+import json
+import platform as _platform
+import re
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as _np
+
+import cdpyr
+from cdpyr.analysis import (
+    archetype as _archetype,
+    criterion as _criterion,
+    force_distribution as _force_distribution,
+    workspace as _workspace,
+)
+from cdpyr.analysis.kinematics import Pulley, Standard
+from cdpyr.analysis.structure_matrix import Calculator
+from cdpyr.exceptions import InvalidPoseException
+from cdpyr.motion.pose import Pose, PoseGenerator
+from cdpyr.robot import sample
+
+# sample robots by name
+ROBOTS = (
+        'robot_1t',
+        'robot_2t',
+        'robot_3t',
+        'robot_1r2t',
+        'robot_2r3t',
+        'robot_3r3t',
+        'segesta',
+        'ipanema_3',
+        'cogiro',
+)
+
+# spatial robots with a feasible force distribution in their home pose
+FORCE_ROBOTS = ('segesta', 'ipanema_3', 'cogiro')
+
+# spatial robots whose workspaces are benchmarked
+WORKSPACE_ROBOTS = ('robot_3r3t', 'ipanema_3')
+
+FORCE_DISTRIBUTIONS = (
+        'ClosedForm',
+        'ClosedFormImproved',
+        'AdvancedClosedForm',
+        'Barycentric',
+        'Dykstra',
+        'QuadraticProgram',
+)
+
+CRITERIA = (
+        'cable_length',
+        'collision',
+        'interference',
+        'singularities',
+        'wrench_closure',
+        'wrench_feasible',
+        'composite',
+)
+
+# steps per axis of grid workspaces and depths of hull workspaces
+GRID_STEPS = (5, 9, 17)
+HULL_DEPTHS = (1, 2, 3)
+
+# force limits, cable length limits, and half edge length of the workspace box
+FORCE_LIMITS = (10, 3000)
+CABLE_LIMITS = (0.0, 10.0)
+WORKSPACE_BOUND = 0.5
+
+# name of a benchmark and the function building the function to time, so
+# that failing setups are reported like failing benchmarks
+Case = Tuple[str, Callable[[], Callable[[], object]]]
+
+
+def _random_pose(robot) -> Pose:
+    # random pose matching the robot's motion pattern
+    generator = getattr(PoseGenerator,
+                        f'random_{robot.platforms[0].motion_pattern.human}'
+                        .lower())
+
+    return generator()
+
+
+def _backward(robot: str, kinematics: Callable):
+    robot = getattr(sample, robot)()
+    pose = _random_pose(robot)
+    kinematics = kinematics()
+
+    return lambda: kinematics.backward(robot, pose)
+
+
+def _forward(robot: str, kinematics: Callable):
+    robot = getattr(sample, robot)()
+    kinematics = kinematics()
+    joints = kinematics.backward(robot, _random_pose(robot)).joints
+
+    return lambda: kinematics.forward(robot, joints)
+
+
+def _structure_matrix(robot: str):
+    robot = getattr(sample, robot)()
+    pose = _random_pose(robot)
+    calculator = Calculator(Standard())
+
+    return lambda: calculator.evaluate(robot, pose)
+
+
+def _force_distribution_(robot: str, kind: str):
+    robot = getattr(sample, robot)()
+    pose = Pose()
+    wrench = robot.gravitational_wrench(pose)
+    algorithm = getattr(_force_distribution, kind)(Standard(), *FORCE_LIMITS)
+
+    return lambda: algorithm.evaluate(robot, pose, wrench)
+
+
+def _criterion_(robot: str, kind: str):
+    robot = getattr(sample, robot)()
+    pose = Pose()
+    kinematics = Standard()
+    criterion = {
+            'cable_length':    lambda: _criterion.CableLength(kinematics,
+                                                              CABLE_LIMITS),
+            'collision':       lambda: _criterion.Collision(kinematics),
+            'interference':    lambda: _criterion.Interference(kinematics),
+            'singularities':   lambda: _criterion.Singularities(kinematics),
+            'wrench_closure':  lambda: _criterion.WrenchClosure(
+                    _force_distribution.ClosedFormImproved(kinematics,
+                                                           *FORCE_LIMITS)),
+            'wrench_feasible': lambda: _criterion.WrenchFeasible(
+                    _force_distribution.ClosedFormImproved(kinematics,
+                                                           *FORCE_LIMITS)),
+            'composite':       lambda: _criterion.Composite([
+                    _criterion.CableLength(kinematics, CABLE_LIMITS),
+                    _criterion.Singularities(kinematics),
+            ]),
+    }[kind]()
+
+    def evaluate():
+        # invalid poses are a result of the criterion, not an error
+        try:
+            return criterion.evaluate(robot, pose)
+        except InvalidPoseException:
+            return False
+
+    return evaluate
+
+
+def _grid(robot: str, steps: int):
+    robot = getattr(sample, robot)()
+    grid = _workspace.Grid(_archetype.Translation(_np.eye(3)),
+                           _criterion.CableLength(Standard(), CABLE_LIMITS),
+                           [-WORKSPACE_BOUND] * 3,
+                           [WORKSPACE_BOUND] * 3,
+                           steps)
+
+    return lambda: grid.evaluate(robot)
+
+
+def _hull(robot: str, depth: int):
+    robot = getattr(sample, robot)()
+    hull = _workspace.Hull(_archetype.Translation(_np.eye(3)),
+                           _criterion.CableLength(Standard(), CABLE_LIMITS),
+                           center=[0.0, 0.0, 0.0],
+                           depth=depth)
+
+    return lambda: hull.evaluate(robot)
+
+
+def cases(quick: bool = False) -> Iterable[Case]:
+    """
+    All benchmark cases in a reproducible order
+
+    Parameters
+    ----------
+    quick : bool
+        Only benchmark the smallest workspaces.
+
+    Returns
+    -------
+    cases : Iterable[Case]
+        Tuples of benchmark name and function building the function to
+        time.
+    """
+    for robot in ROBOTS:
+        for kinematics in (Standard, Pulley):
+            kind = kinematics.__name__.lower()
+            yield (f'kinematics.{kind}.backward[{robot}]',
+                   functools.partial(_backward, robot, kinematics))
+            yield (f'kinematics.{kind}.forward[{robot}]',
+                   functools.partial(_forward, robot, kinematics))
+
+    for robot in ROBOTS:
+        yield (f'structure_matrix.evaluate[{robot}]',
+               functools.partial(_structure_matrix, robot))
+
+    for robot in FORCE_ROBOTS:
+        for kind in FORCE_DISTRIBUTIONS:
+            yield (f'force_distribution.{kind.lower()}[{robot}]',
+                   functools.partial(_force_distribution_, robot, kind))
+
+    for robot in FORCE_ROBOTS:
+        for kind in CRITERIA:
+            yield (f'criterion.{kind}[{robot}]',
+                   functools.partial(_criterion_, robot, kind))
+
+    for robot in WORKSPACE_ROBOTS:
+        for steps in GRID_STEPS[0:1] if quick else GRID_STEPS:
+            yield (f'workspace.grid[{robot},steps={steps}]',
+                   functools.partial(_grid, robot, steps))
+        for depth in HULL_DEPTHS[0:1] if quick else HULL_DEPTHS:
+            yield (f'workspace.hull[{robot},depth={depth}]',
+                   functools.partial(_hull, robot, depth))
+
+
+def measure(function: Callable[[], object],
+            repeat: int = 5,
+            minimum: float = 0.1) -> Dict[str, float]:
+    """
+    Time one function
+
+    The function is called in loops long enough to last at least `minimum`
+    seconds, and the loop is repeated `repeat` times.
+
+    Parameters
+    ----------
+    function : Callable
+        Function without arguments to time.
+    repeat : int
+        Number of timed loops.
+    minimum : float
+        Minimum duration of one loop in seconds.
+
+    Returns
+    -------
+    timings : dict
+        Minimum, median, and mean seconds per call, their standard deviation,
+        and the number of calls per loop and of loops.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        if timer.timeit(number) >= minimum or number >= 2 ** 20:
+            break
+        number *= 4
+
+    times = [duration / number for duration in timer.repeat(repeat, number)]
+
+    return {
+            'min':    min(times),
+            'median': statistics.median(times),
+            'mean':   statistics.mean(times),
+            'stdev':  statistics.stdev(times) if len(times) > 1 else 0.0,
+            'number': number,
+            'repeat': repeat,
+    }
+
+
+def run(selection: Optional[str] = None,
+        repeat: int = 5,
+        minimum: float = 0.1,
+        quick: bool = False,
+        verbose: bool = True) -> Dict[str, Dict]:
+    """
+    Run all selected benchmarks
+
+    Parameters
+    ----------
+    selection : str
+        Optional regular expression the benchmark names must match.
+    repeat : int
+        Number of timed loops per benchmark.
+    minimum : float
+        Minimum duration of one loop in seconds.
+    quick : bool
+        Only benchmark the smallest workspaces.
+    verbose : bool
+        Print every timing once it is measured.
+
+    Returns
+    -------
+    report : dict
+        Environment of the run under `meta` and timings of every benchmark
+        under `results`. Failing benchmarks store their error message.
+    """
+    pattern = re.compile(selection) if selection else None
+    results = {}
+    for name, setup in cases(quick):
+        if pattern is not None and not pattern.search(name):
+            continue
+
+        _np.random.seed(0)
+        try:
+            results[name] = measure(setup(), repeat, minimum)
+        except Exception as e:
+            results[name] = {'error': f'{type(e).__name__}: {e}'}
+
+        if verbose:
+            print(_format(name, results[name]), flush=True)
+
+    return {
+            'meta':    {
+                    'cdpyr':     cdpyr.__version__,
+                    'numpy':     _np.__version__,
+                    'python':    _platform.python_version(),
+                    'machine':   _platform.machine(),
+                    'processor': _platform.processor(),
+                    'system':    _platform.platform(),
+                    'date':      datetime.datetime.now().isoformat(),
+            },
+            'results': results,
+    }
+
+
+def compare(report: Dict[str, Dict],
+            baseline: Dict[str, Dict],
+            threshold: float = 1.25) -> List[Tuple[str, float, str]]:
+    """
+    Compare the timings of a report against a baseline report
+
+    Benchmarks are compared by the ratio of their minimum time per call as
+    it is the least affected by other load on the machine.
+
+    Parameters
+    ----------
+    report : dict
+        Report of the current run.
+    baseline : dict
+        Report of the baseline run.
+    threshold : float
+        Ratio of current over baseline time above which a benchmark is
+        considered a regression, and below whose inverse it is considered an
+        improvement.
+
+    Returns
+    -------
+    comparison : List[Tuple[str, float, str]]
+        Name, ratio of current over baseline time, and one of `regression`,
+        `improvement`, `unchanged`, or `error` for every benchmark in both
+        reports. Ratios of errors are `NaN`.
+    """
+    comparison = []
+    for name, current in report['results'].items():
+        try:
+            previous = baseline['results'][name]
+        except KeyError:
+            continue
+
+        if 'error' in current or 'error' in previous:
+            comparison.append((name, _np.nan, 'error'))
+            continue
+
+        ratio = current['min'] / previous['min']
+        if ratio > threshold:
+            status = 'regression'
+        elif ratio < 1.0 / threshold:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparison.append((name, ratio, status))
+
+    return comparison
+
+
+def _format(name: str, timing: Dict) -> str:
+    if 'error' in timing:
+        return f'{name:<52} {timing["error"]}'
+
+    return f'{name:<52} {_human(timing["min"]):>10} ' \
+           f'{_human(timing["median"]):>10} (x{timing["number"]})'
+
+
+def _human(seconds: float) -> str:
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3g} {unit}'
+
+    return f'{seconds / 1e-9:.3g} ns'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[
+        0])
+    parser.add_argument('-o', '--output',
+                        help='write the timings as JSON into this file')
+    parser.add_argument('-b', '--baseline',
+                        help='compare the timings against this JSON file')
+    parser.add_argument('-t', '--threshold', type=float, default=1.25,
+                        help='slowdown ratio considered a regression '
+                             '(default: %(default)s)')
+    parser.add_argument('-f', '--filter', dest='selection',
+                        help='only run benchmarks whose names match this '
+                             'regular expression')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='timed loops per benchmark (default: '
+                             '%(default)s)')
+    parser.add_argument('-m', '--minimum', type=float, default=0.1,
+                        help='minimum seconds per loop (default: '
+                             '%(default)s)')
+    parser.add_argument('-q', '--quick', action='store_true',
+                        help='only benchmark the smallest workspaces')
+    args = parser.parse_args(argv)
+
+    report = run(args.selection, args.repeat, args.minimum, args.quick)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    comparison = compare(report, baseline, args.threshold)
+    print()
+    for name, ratio, status in comparison:
+        print(f'{name:<52} {ratio:>8.2f}x {status}')
+
+    regressions = [name for name, _, status in comparison
+                   if status == 'regression']
+    if regressions:
+        print(f'\n{len(regressions)} of {len(comparison)} benchmarks are '
+              f'slower than the baseline by more than {args.threshold}x.')
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
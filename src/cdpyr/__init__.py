@@ -15,6 +15,7 @@ __all__ = [
         'mechanics',
         'mixin',
         'motion',
+        'realtime',
         'robot',
         'schema',
         'stream',
@@ -37,6 +38,7 @@ from cdpyr import (
     robot,
     motion,
     analysis,
+    realtime,
     # I/O imports
     stream,
     schema
@@ -2,18 +2,26 @@ __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
         'archetype',
+        'buffer',
+        'cache',
         'criterion',
         'force_distribution',
         'kinematics',
+        'kinetostatics',
+        'profile',
         'structure_matrix',
         'workspace',
 ]
 
 from cdpyr.analysis import (
     archetype,
+    buffer,
+    cache,
     criterion,
     force_distribution,
     kinematics,
+    kinetostatics,
+    profile,
     structure_matrix,
     workspace,
 )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Buffer',
+        'empty',
+]
+
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as _np
+from magic_repr import make_repr
+
+
+class Buffer(object):
+    """
+    Preallocated arrays reused across evaluations.
+
+    Algorithms given a buffer write their intermediate and final arrays
+    into it instead of allocating new ones on every call, so evaluating
+    poses of equal shape over and over allocates no array memory after the
+    first call. This avoids allocator overhead and garbage collector pauses
+    in real-time loops.
+
+    Arrays returned by algorithms using a buffer, including those stored in
+    their result objects, are overwritten by the next evaluation of the same
+    algorithm. Copy them if they need to persist.
+
+    Pass an instance as `buffer` to a kinematics algorithm, structure
+    matrix calculator, or force distribution to opt in. One buffer may be
+    shared by all of them.
+    """
+
+    allocations: int
+    _arrays: Dict[Hashable, _np.ndarray]
+
+    def __init__(self):
+        self.allocations = 0
+        self._arrays = {}
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def array(self,
+              key: Hashable,
+              shape: Tuple[int, ...],
+              dtype=float) -> _np.ndarray:
+        """
+        Array of `key`, allocated only if its shape or type changed
+
+        Arrays only grow along their first axis, so a shorter array e.g.,
+        of the last chunk of a batch is a leading slice of the longer one.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the array, usually a tuple of the requesting algorithm and
+            the array's name.
+        shape : Tuple[int, ...]
+            Shape of the array.
+        dtype : optional
+            Data type of the array. Defaults to `float`.
+
+        Returns
+        -------
+        array : ndarray
+            Uninitialized C-contiguous array.
+        """
+        shape = tuple(int(dim) for dim in shape)
+        try:
+            array = self._arrays[key]
+        except KeyError:
+            pass
+        else:
+            if array.dtype == dtype \
+                    and array.ndim == len(shape) \
+                    and array.shape[1:] == shape[1:] \
+                    and array.shape[0:1] >= shape[0:1]:
+                return array if array.shape == shape else array[0:shape[0]]
+
+        array = self._arrays[key] = _np.empty(shape, dtype=dtype)
+        self.allocations += 1
+
+        return array
+
+    def clear(self):
+        self._arrays.clear()
+        self.allocations = 0
+
+    def __contains__(self, key: Hashable):
+        return key in self._arrays
+
+    def __len__(self):
+        return len(self._arrays)
+
+    __repr__ = make_repr(
+            'nbytes',
+            'allocations',
+    )
+
+
+def empty(buffer: Optional[Buffer],
+          key: Hashable,
+          shape: Tuple[int, ...],
+          dtype=float) -> _np.ndarray:
+    """
+    Array of `key` from `buffer` if given, otherwise a new array
+
+    Parameters
+    ----------
+    buffer : Buffer
+        Optional buffer to take the array from.
+    key : Hashable
+        Key of the array in the buffer.
+    shape : Tuple[int, ...]
+        Shape of the array.
+    dtype : optional
+        Data type of the array. Defaults to `float`.
+
+    Returns
+    -------
+    array : ndarray
+        Uninitialized C-contiguous array.
+    """
+    if buffer is None:
+        return _np.empty(shape, dtype=dtype)
+
+    return buffer.array(key, shape, dtype)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Cache',
+        'fingerprint',
+]
+
+import contextlib
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Num
+
+
+class Cache(object):
+    """
+    Bounded least-recently-used cache of per-pose analysis results.
+
+    Entries are keyed on a fingerprint of the robot's geometry and the
+    pose's position and orientation quantized to `resolution`, such that
+    equal poses of equal robots share results regardless of the identity of
+    their Python objects. Poses closer than `resolution` may thus share
+    results, too.
+
+    Pass an instance as `cache` to a kinematics algorithm or structure
+    matrix calculator to opt in. Fingerprinting a robot is not free, so
+    runs over many poses of the same robot e.g., workspace algorithms `pin`
+    the robot to fingerprint it only once.
+    """
+
+    maxsize: int
+    resolution: Num
+    hits: int
+    misses: int
+    _data: OrderedDict
+    _pinned: Dict[int, Tuple[_robot.Robot, str]]
+
+    def __init__(self,
+                 maxsize: int = 2 ** 16,
+                 resolution: Num = 1e-9):
+        self.maxsize = max(int(maxsize), 0)
+        self.resolution = resolution
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._pinned = {}
+
+    @property
+    def currsize(self):
+        return len(self._data)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def key(self,
+            robot: _robot.Robot,
+            pose: _pose.Pose,
+            *args: Hashable) -> Tuple:
+        """
+        Key of a robot's pose
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot whose geometry is fingerprinted.
+        pose : Pose
+            Pose whose position and orientation are quantized.
+        args : Hashable
+            Additional values to distinguish e.g., results of different
+            algorithms.
+
+        Returns
+        -------
+        key : Tuple
+        """
+        position = pose.linear.position
+        quaternion = _np.asarray(pose.angular.quaternion, dtype=float)
+        # `q` and `-q` are the same rotation, so make the scalar part
+        # non-negative
+        if quaternion[3] < 0:
+            quaternion = -quaternion
+
+        quantized = _np.rint(_np.hstack((_np.asarray(position, dtype=float),
+                                         quaternion))
+                             / self.resolution).astype(_np.int64)
+
+        return (self.fingerprint(robot), quantized.tobytes()) + tuple(args)
+
+    def fingerprint(self, robot: _robot.Robot) -> str:
+        """
+        Fingerprint of a robot, memoized while the robot is pinned
+
+        Parameters
+        ----------
+        robot : Robot
+
+        Returns
+        -------
+        fingerprint : str
+        """
+        try:
+            return self._pinned[id(robot)][1]
+        except KeyError:
+            return fingerprint(robot)
+
+    @contextlib.contextmanager
+    def pin(self, robot: _robot.Robot):
+        """
+        Fingerprint a robot only once within the enclosed block
+
+        The robot must not be modified within the block, since its
+        fingerprint is not updated.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to pin.
+        """
+        key = id(robot)
+        outer = self._pinned.get(key)
+        # the robot is kept alive alongside its fingerprint so its id cannot
+        # be reused
+        self._pinned[key] = (robot, fingerprint(robot))
+        try:
+            yield self
+        finally:
+            if outer is None:
+                del self._pinned[key]
+            else:
+                self._pinned[key] = outer
+
+    def get(self, key: Hashable, factory: Callable[[], Any]):
+        """
+        Value of `key` if cached, otherwise cache and return `factory()`
+
+        Parameters
+        ----------
+        key : Hashable
+            Key as returned by `key`.
+        factory : Callable
+            Function without arguments returning the value on a cache miss.
+            Exceptions raised are propagated and nothing is cached.
+
+        Returns
+        -------
+        value : Any
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+        value = factory()
+        if self.maxsize:
+            self._data[key] = value
+            # evict least recently used entries
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: Hashable):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    __repr__ = make_repr(
+            'maxsize',
+            'resolution',
+            'currsize',
+            'hits',
+            'misses',
+    )
+
+
+def fingerprint(robot: _robot.Robot) -> str:
+    """
+    Fingerprint of the geometry of a robot
+
+    The fingerprint covers everything kinematics and structure matrices
+    depend on i.e., frame anchors with their pulleys, platform anchors and
+    motion patterns, and kinematic chains. Unlike `hash(robot)`, it is equal
+    for equal robots and changes whenever the robot is modified.
+
+    Parameters
+    ----------
+    robot : Robot
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal digest.
+    """
+    # rotations enter through their stored quaternions which is much cheaper
+    # than their rotation matrices
+    values = []
+    for anchor in robot.frame.anchors:
+        values.extend(anchor.linear.position.tolist())
+        values.extend(anchor.angular.quaternion.tolist())
+        pulley = anchor.pulley
+        if pulley is not None:
+            values.append(pulley.radius)
+            values.extend(pulley.angular.quaternion.tolist())
+        else:
+            values.append(_np.nan)
+
+    for platform in robot.platforms:
+        values.append(platform.motion_pattern.dof_translation)
+        values.append(platform.motion_pattern.dof_rotation)
+        for anchor in platform.anchors:
+            values.extend(anchor.linear.position.tolist())
+
+    for kc in robot.kinematic_chains:
+        values.extend((kc.frame_anchor,
+                       kc.platform,
+                       kc.platform_anchor,
+                       kc.cable))
+
+    return hashlib.blake2b(_np.asarray(values, dtype=float).tobytes(),
+                           digest_size=16).hexdigest()
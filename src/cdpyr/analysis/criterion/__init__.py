@@ -1,7 +1,11 @@
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
+        'BatchContext',
         'CableLength',
+        'Collision',
+        'Composite',
+        'Context',
         'Interference',
         'Singularities',
         'WrenchClosure',
@@ -9,6 +13,9 @@ __all__ = [
 ]
 
 from cdpyr.analysis.criterion.cable_length import CableLength
+from cdpyr.analysis.criterion.collision import Collision
+from cdpyr.analysis.criterion.composite import Composite
+from cdpyr.analysis.criterion.context import BatchContext, Context
 from cdpyr.analysis.criterion.interference import Interference
 from cdpyr.analysis.criterion.singularities import Singularities
 from cdpyr.analysis.criterion.wrench_closure import WrenchClosure
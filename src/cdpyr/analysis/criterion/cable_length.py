@@ -9,7 +9,8 @@ __all__ = [
 
 import numpy as _np
 
-from cdpyr.analysis.criterion import criterion as _criterion
+from cdpyr.analysis.criterion import context as _context, \
+    criterion as _criterion
 from cdpyr.analysis.kinematics import kinematics as _kinematics
 from cdpyr.exceptions import InvalidPoseException
 from cdpyr.motion import pose as _pose
@@ -52,9 +53,10 @@ class CableLength(_criterion.Criterion):
     def _evaluate(self,
                   robot: _robot.Robot,
                   pose: _pose.Pose,
+                  context: _context.Context,
                   **kwargs):
         try:
-            kinematics = self.kinematics.backward(robot, pose)
+            kinematics = context.kinematics(self.kinematics)
         except Exception:
             raise InvalidPoseException(
                 f'Error solving the inverse kinematics at pose {pose}')
@@ -1,28 +1,191 @@
 from __future__ import annotations
 
-from cdpyr.analysis.criterion import criterion as _criterion
+from typing import Optional, Sequence
+
+import numpy as _np
+
+from cdpyr.analysis.criterion import context as _context, \
+    criterion as _criterion
 from cdpyr.analysis.kinematics import kinematics as _kinematics
 from cdpyr.exceptions import InvalidPoseException
+from cdpyr.geometry import bvh as _bvh, primitive as _geometry
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Num, Vector
 
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 
 
 class Collision(_criterion.Criterion):
+    """
+    Collision of cables with the platform's geometry and with obstacles
+    fixed to the frame.
+
+    Obstacles are given in world coordinates and organized in a bounding
+    volume hierarchy, the platform geometry is given in platform
+    coordinates. Cables attached to the surface of a geometry only collide
+    if they pass through its interior.
+    """
+
     kinematics: _kinematics.Algorithm
+    platform: bool
+    tolerance: Num
+    _obstacles: _bvh.BoundingVolumeHierarchy
 
-    def __init__(self, kinematics: _kinematics.Algorithm, **kwargs):
+    def __init__(self,
+                 kinematics: _kinematics.Algorithm,
+                 obstacles: Optional[Sequence[_geometry.Primitive]] = None,
+                 platform: bool = True,
+                 tolerance: Num = 1e-9,
+                 **kwargs):
         super().__init__(**kwargs)
         self.kinematics = kinematics
+        self.obstacles = obstacles or []
+        self.platform = platform
+        self.tolerance = tolerance
+
+    @property
+    def obstacles(self):
+        return self._obstacles
+
+    @obstacles.setter
+    def obstacles(self,
+                  obstacles: Sequence[_geometry.Primitive]):
+        if not isinstance(obstacles, _bvh.BoundingVolumeHierarchy):
+            obstacles = _bvh.BoundingVolumeHierarchy(obstacles)
+        self._obstacles = obstacles
+
+    @obstacles.deleter
+    def obstacles(self):
+        del self._obstacles
+
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix] = None,
+                       chunk_size: int = 2 ** 14,
+                       context: Optional[_context.BatchContext] = None,
+                       **kwargs) -> Vector:
+        """
+        Check many poses for collisions at once
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to check the poses of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+        chunk_size : int
+            Number of poses evaluated at once to limit memory consumption.
+        context : BatchContext
+            Optional context of the poses to take the cable segments from.
+
+        Returns
+        -------
+        valid : Vector
+            `(K,)` boolean array that is `True` for every collision-free
+            pose.
+        """
+        return ~self.collisions(robot,
+                                positions,
+                                dcms,
+                                chunk_size,
+                                context,
+                                **kwargs).any(axis=1)
+
+    def collisions(self,
+                   robot: _robot.Robot,
+                   positions: Matrix,
+                   dcms: Optional[Matrix] = None,
+                   chunk_size: int = 2 ** 14,
+                   context: Optional[_context.BatchContext] = None,
+                   **kwargs) -> Matrix:
+        """
+        Check every cable of many poses for collisions
+
+        Returns
+        -------
+        collisions : Matrix
+            `(K, M)` boolean array that is `True` for every cable colliding
+            with the platform or any obstacle.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        num_poses = positions.shape[0]
+        if dcms is None:
+            dcms = _np.broadcast_to(_np.eye(3), (num_poses, 3, 3))
+        dcms = _np.asarray(dcms, dtype=float)
+        chunk_size = max(int(chunk_size), 1)
+
+        collisions = _np.zeros((num_poses, robot.num_kinematic_chains),
+                               dtype=bool)
+        # cable segments shared with other criteria
+        if context is not None:
+            segments = context.segments(self.kinematics)
+
+        for start in range(0, num_poses, chunk_size):
+            index = slice(start, min(start + chunk_size, num_poses))
+            if context is not None:
+                anchors, leaves = (each[index] for each in segments)
+            else:
+                anchors, leaves = self.kinematics.segments_batch(
+                        robot,
+                        positions[index],
+                        dcms[index],
+                        **kwargs)
+            collisions[index] = self._collisions(robot,
+                                                 positions[index],
+                                                 dcms[index],
+                                                 anchors,
+                                                 leaves)
+
+        return collisions
+
+    def _collisions(self,
+                    robot: _robot.Robot,
+                    positions: Matrix,
+                    dcms: Matrix,
+                    anchors: Matrix,
+                    leaves: Matrix):
+        collisions = _np.zeros(anchors.shape[0:2], dtype=bool)
+
+        # cables against obstacles in world coordinates
+        if len(self._obstacles):
+            collisions |= self._obstacles.intersects(anchors,
+                                                     leaves,
+                                                     self.tolerance)
+
+        # cables against the platform in platform coordinates
+        geometry = robot.platforms[0].geometry if self.platform else None
+        if geometry is not None:
+            position = positions[:, None, :]
+            collisions |= geometry.intersects(
+                    _np.einsum('nji,nmj->nmi', dcms, anchors - position),
+                    _np.einsum('nji,nmj->nmi', dcms, leaves - position),
+                    self.tolerance)
+
+        return collisions
 
     def _evaluate(self,
                   robot: _robot.Robot,
                   pose: _pose.Pose,
+                  context: _context.Context,
                   **kwargs):
-        raise InvalidPoseException(
-                'feature not implemented') from NotImplementedError()
+        pos, rot = pose.position
+
+        collisions = self._collisions(
+                robot,
+                _np.asarray(pos, dtype=float)[None, :],
+                _np.asarray(rot, dtype=float)[None, :, :],
+                *context.segments(self.kinematics))[0, :]
+
+        if collisions.any():
+            raise InvalidPoseException(
+                    f'invalid pose found. cables of kinematic chains '
+                    f'{_np.flatnonzero(collisions).tolist()} collide')
 
 
 __all__ = [
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Composite',
+]
+
+from collections import abc
+from typing import Optional, Sequence
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.analysis.criterion import context as _context, \
+    criterion as _criterion
+from cdpyr.exceptions import InvalidPoseException
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Vector
+
+
+class Composite(_criterion.Criterion, abc.Sequence):
+    """
+    Pipeline of criteria that must all be fulfilled by a pose.
+
+    All criteria evaluate the pose on the same `Context` such that the
+    inverse kinematics, the structure matrix, and the force distribution are
+    each calculated at most once per pose. Criteria are evaluated in the
+    given order and evaluation stops at the first criterion the pose fails,
+    so cheap and restrictive criteria should come first.
+    """
+
+    _criteria: Sequence[_criterion.Criterion]
+
+    def __init__(self,
+                 criteria: Sequence[_criterion.Criterion],
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.criteria = criteria
+
+    @property
+    def criteria(self):
+        return self._criteria
+
+    @criteria.setter
+    def criteria(self, criteria: Sequence[_criterion.Criterion]):
+        self._criteria = list(criteria)
+
+    @criteria.deleter
+    def criteria(self):
+        del self._criteria
+
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix] = None,
+                       **kwargs) -> Vector:
+        """
+        Check many poses against all criteria at once
+
+        Criteria providing an `evaluate_batch` method are evaluated on all
+        poses at once with one `BatchContext` shared across these criteria,
+        all other criteria pose by pose with contexts shared across these
+        criteria. Batch contexts reuse the results of per-pose contexts, so
+        the inverse kinematics and the structure matrices are calculated at
+        most once per pose. Every criterion is only evaluated on the poses
+        that passed all previous criteria.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to check the poses of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+
+        Returns
+        -------
+        valid : Vector
+            `(K,)` boolean array that is `True` for every pose fulfilling
+            all criteria.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        num_poses = positions.shape[0]
+        if dcms is None:
+            dcms = _np.broadcast_to(_np.eye(3), (num_poses, 3, 3))
+        dcms = _np.asarray(dcms, dtype=float)
+
+        valid = _np.ones(num_poses, dtype=bool)
+        contexts = {}
+        batch = None
+        batch_index = None
+        # whether per-pose contexts were created since the last batch
+        stale = False
+        for criterion in self._criteria:
+            remaining = _np.flatnonzero(valid)
+            if not remaining.size:
+                break
+
+            try:
+                evaluate_batch = criterion.evaluate_batch
+            except AttributeError:
+                stale = True
+                for index in remaining:
+                    try:
+                        context = contexts[index]
+                    except KeyError:
+                        context = _context.Context(
+                                robot,
+                                _pose.Pose(positions[index], dcms[index]),
+                                self._profile)
+                        contexts[index] = context
+
+                    try:
+                        criterion.evaluate(robot,
+                                           context.pose,
+                                           context=context)
+                    except InvalidPoseException:
+                        valid[index] = False
+            else:
+                # the batch context only ever shrinks to the poses still
+                # remaining, keeping everything calculated for them so far
+                if batch is None:
+                    batch = _context.BatchContext(
+                            robot,
+                            positions[remaining],
+                            dcms[remaining],
+                            [contexts.get(index) for index in remaining],
+                            self._profile)
+                elif stale or batch_index.size != remaining.size:
+                    batch = batch.subset(
+                            _np.isin(batch_index, remaining),
+                            [contexts.get(index) for index in remaining])
+                batch_index = remaining
+                stale = False
+
+                valid[remaining] = evaluate_batch(robot,
+                                                  batch.positions,
+                                                  batch.dcms,
+                                                  context=batch,
+                                                  **kwargs)
+
+        return valid
+
+    def _evaluate(self,
+                  robot: _robot.Robot,
+                  pose: _pose.Pose,
+                  context: _context.Context,
+                  **kwargs):
+        # the first failing criterion raises and thus short-circuits all
+        # remaining ones
+        for criterion in self._criteria:
+            criterion.evaluate(robot, pose, context=context, **kwargs)
+
+    def __getitem__(self, index: int):
+        return self._criteria[index]
+
+    def __len__(self):
+        return len(self._criteria)
+
+    __repr__ = make_repr(
+            'criteria',
+    )
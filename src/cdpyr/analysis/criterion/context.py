@@ -0,0 +1,502 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'BatchContext',
+        'Context',
+]
+
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.analysis.force_distribution import force_distribution as \
+    _force_distribution
+from cdpyr.analysis.structure_matrix import (
+    calculator as _calculator,
+    structure_matrix as _structure_matrix,
+)
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Vector
+
+if TYPE_CHECKING:
+    from cdpyr.analysis import profile as _profile_
+    from cdpyr.analysis.kinematics import kinematics as _kinematics_
+    from cdpyr.motion import pose as _pose_
+
+
+class Context(object):
+    """
+    Intermediate results of analyzing one pose of a robot shared between
+    criteria.
+
+    Every result is calculated lazily on first request and then reused, so
+    that e.g., the inverse kinematics are solved only once for all criteria
+    evaluating the same pose. Results are shared between all criteria using
+    the very same kinematics algorithm.
+
+    Given a profile, every calculation is timed as its own stage and every
+    reuse of a result is counted as a context hit.
+    """
+
+    _robot: _robot.Robot
+    _pose: _pose_.Pose
+    _kinematics: Dict[Hashable, Tuple[Any, _kinematics_.Result]]
+    _segments: Dict[Hashable, Tuple[Any, Tuple[Matrix, Matrix]]]
+    _structure_matrices: Dict[Hashable, Tuple[Any, _structure_matrix.Result]]
+    _forces: Dict[Hashable, _force_distribution.Result]
+    _gravitational_wrench: Vector
+    _profile: Optional[_profile_.Profile]
+
+    def __init__(self,
+                 robot: _robot.Robot,
+                 pose: _pose_.Pose,
+                 profile: Optional[_profile_.Profile] = None):
+        self._robot = robot
+        self._pose = pose
+        self._profile = profile
+        self._kinematics = {}
+        self._segments = {}
+        self._structure_matrices = {}
+        self._forces = {}
+        self._gravitational_wrench = None
+
+    @property
+    def robot(self):
+        return self._robot
+
+    @property
+    def pose(self):
+        return self._pose
+
+    @property
+    def profile(self):
+        return self._profile
+
+    @property
+    def gravitational_wrench(self):
+        if self._gravitational_wrench is None:
+            self._gravitational_wrench = self._robot.gravitational_wrench(
+                    self._pose)
+
+        return self._gravitational_wrench
+
+    def kinematics(self,
+                   algorithm: _kinematics_.Algorithm) -> _kinematics_.Result:
+        """
+        Inverse kinematics of the pose
+
+        Parameters
+        ----------
+        algorithm : kinematics.Algorithm
+            Algorithm to solve the inverse kinematics with.
+
+        Returns
+        -------
+        kinematics : kinematics.Result
+        """
+        # results are keyed by the algorithm's identity, which is kept alive
+        # alongside the result so its id cannot be reused
+        key = id(algorithm)
+        try:
+            _, result = self._kinematics[key]
+        except KeyError:
+            result = self._calculate('kinematics',
+                                     algorithm.backward,
+                                     self._robot,
+                                     self._pose)
+            self._kinematics[key] = (algorithm, result)
+        else:
+            self._hit()
+
+        return result
+
+    def segments(self,
+                 algorithm: _kinematics_.Algorithm) -> Tuple[Matrix, Matrix]:
+        """
+        Straight cable segments of the pose in world coordinates
+
+        Returns
+        -------
+        anchors, leaves : Matrix
+            `(1, M, 3)` arrays of platform anchors and cable leave points
+            as returned by `kinematics.Algorithm.segments_batch`.
+        """
+        key = id(algorithm)
+        try:
+            _, result = self._segments[key]
+        except KeyError:
+            kinematics = self.kinematics(algorithm)
+            position, dcm = self._pose.position
+            result = self._calculate(
+                    'segments',
+                    algorithm.segments_batch,
+                    self._robot,
+                    _np.asarray(position, dtype=float)[None, :],
+                    _np.asarray(dcm, dtype=float)[None, :, :],
+                    lengths=kinematics.workspace_length[None, :],
+                    directions=kinematics.directions[None, :, :])
+            self._segments[key] = (algorithm, result)
+        else:
+            self._hit()
+
+        return result
+
+    def structure_matrix(self,
+                         calculator: _calculator.Calculator) -> \
+            _structure_matrix.Result:
+        """
+        Structure matrix of the pose
+
+        Parameters
+        ----------
+        calculator : structure_matrix.Calculator
+            Calculator to evaluate the structure matrix with. Its inverse
+            kinematics are taken from `kinematics`.
+
+        Returns
+        -------
+        structure_matrix : structure_matrix.Result
+        """
+        key = _structure_matrix_key(self._robot, calculator)
+        try:
+            _, result = self._structure_matrices[key]
+        except KeyError:
+            kinematics = self.kinematics(calculator.kinematics)
+            result = self._calculate('structure_matrix',
+                                     calculator.evaluate,
+                                     self._robot,
+                                     self._pose,
+                                     kinematics=kinematics)
+            self._structure_matrices[key] = (calculator.kinematics, result)
+        else:
+            self._hit()
+
+        return result
+
+    def forces(self,
+               algorithm: _force_distribution.Algorithm,
+               wrench: Vector) -> _force_distribution.Result:
+        """
+        Cable force distribution of the pose
+
+        Parameters
+        ----------
+        algorithm : force_distribution.Algorithm
+            Force distribution algorithm to evaluate. Its structure matrix is
+            taken from `structure_matrix`.
+        wrench : Vector
+            Wrench to distribute onto the cables.
+
+        Returns
+        -------
+        forces : force_distribution.Result
+        """
+        wrench = _np.asarray(wrench, dtype=float)
+        # force limits may differ between instances, so results are only
+        # shared by the very same algorithm
+        key = (id(algorithm), wrench.tobytes())
+        try:
+            result = self._forces[key]
+        except KeyError:
+            structure_matrix = self.structure_matrix(algorithm.calculator)
+            result = self._calculate('force_distribution',
+                                     algorithm.evaluate,
+                                     self._robot,
+                                     self._pose,
+                                     wrench,
+                                     structure_matrix=structure_matrix)
+            self._forces[key] = result
+        else:
+            self._hit()
+
+        return result
+
+    def _calculate(self, stage: str, function: Callable, *args, **kwargs):
+        if self._profile is None:
+            return function(*args, **kwargs)
+
+        self._profile.context_misses += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._profile.add(stage, time.perf_counter() - start)
+
+    def _hit(self):
+        if self._profile is not None:
+            self._profile.context_hits += 1
+
+    __repr__ = make_repr(
+            'robot',
+            'pose',
+    )
+
+
+class BatchContext(object):
+    """
+    Intermediate results of analyzing many poses of a robot shared between
+    criteria evaluating them at once.
+
+    Like `Context`, but every result is an array stacked along the poses.
+    Results are taken from the given per-pose contexts if all of them
+    already hold it, and otherwise calculated for all poses at once. A
+    `subset` of the poses keeps all results calculated so far.
+    """
+
+    _robot: _robot.Robot
+    _positions: Matrix
+    _dcms: Matrix
+    _contexts: Sequence[Optional[Context]]
+    _kinematics: Dict[Hashable, Tuple[Any, Tuple[Matrix, Matrix]]]
+    _segments: Dict[Hashable, Tuple[Any, Tuple[Matrix, Matrix]]]
+    _structure_matrices: Dict[Hashable, Tuple[Any, Matrix]]
+    _profile: Optional[_profile_.Profile]
+
+    def __init__(self,
+                 robot: _robot.Robot,
+                 positions: Matrix,
+                 dcms: Optional[Matrix] = None,
+                 contexts: Optional[Sequence[Optional[Context]]] = None,
+                 profile: Optional[_profile_.Profile] = None):
+        """
+        Parameters
+        ----------
+        robot : Robot
+            Robot to analyze.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+        contexts : Sequence[Context]
+            Optional per-pose contexts of the `K` poses, `None` for poses
+            without one, whose results are reused.
+        profile : Profile
+            Optional profile to time calculations and count hits with.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        if dcms is None:
+            dcms = _np.broadcast_to(_np.eye(3), (positions.shape[0], 3, 3))
+        self._robot = robot
+        self._positions = positions
+        self._dcms = _np.asarray(dcms, dtype=float)
+        self._contexts = list(contexts) \
+            if contexts is not None \
+            else [None] * positions.shape[0]
+        self._profile = profile
+        self._kinematics = {}
+        self._segments = {}
+        self._structure_matrices = {}
+
+    @property
+    def robot(self):
+        return self._robot
+
+    @property
+    def positions(self):
+        return self._positions
+
+    @property
+    def dcms(self):
+        return self._dcms
+
+    @property
+    def profile(self):
+        return self._profile
+
+    def __len__(self):
+        return self._positions.shape[0]
+
+    def subset(self,
+               index: Vector,
+               contexts: Optional[Sequence[Optional[Context]]] = None) -> \
+            BatchContext:
+        """
+        Context of a subset of the poses keeping all calculated results
+
+        Parameters
+        ----------
+        index : Vector
+            Boolean mask or integer indices of the poses to keep.
+        contexts : Sequence[Context]
+            Optional per-pose contexts of the kept poses. Defaults to the
+            current contexts of these poses.
+
+        Returns
+        -------
+        context : BatchContext
+        """
+        index = _np.flatnonzero(index) \
+            if _np.asarray(index).dtype == bool \
+            else _np.asarray(index, dtype=int)
+        if contexts is None:
+            contexts = [self._contexts[each] for each in index]
+
+        subset = BatchContext(self._robot,
+                              self._positions[index],
+                              self._dcms[index],
+                              contexts,
+                              self._profile)
+        for name in ('_kinematics', '_segments', '_structure_matrices'):
+            getattr(subset, name).update(
+                    (key, (instance, _take(result, index)))
+                    for key, (instance, result) in getattr(self, name).items())
+
+        return subset
+
+    def kinematics(self,
+                   algorithm: _kinematics_.Algorithm) -> Tuple[Matrix, Matrix]:
+        """
+        Inverse kinematics of all poses
+
+        Parameters
+        ----------
+        algorithm : kinematics.Algorithm
+            Algorithm to solve the inverse kinematics with.
+
+        Returns
+        -------
+        lengths, directions : Matrix
+            `(K, M)` and `(K, M, NL)` arrays of workspace cable lengths and
+            cable directions as returned by
+            `kinematics.Algorithm.backward_batch`.
+        """
+        key = id(algorithm)
+        try:
+            _, result = self._kinematics[key]
+        except KeyError:
+            seeds = self._seeds('_kinematics', key)
+            if seeds is not None:
+                result = (_np.stack([each.workspace_length for each in seeds]),
+                          _np.stack([each.directions for each in seeds]))
+            else:
+                result = self._calculate('kinematics',
+                                         algorithm.backward_batch,
+                                         self._robot,
+                                         self._positions,
+                                         self._dcms)
+                # buffered arrays are overwritten by the next evaluation
+                if algorithm.buffer is not None:
+                    result = tuple(each.copy() for each in result)
+            self._kinematics[key] = (algorithm, result)
+        else:
+            self._hit()
+
+        return result
+
+    def segments(self,
+                 algorithm: _kinematics_.Algorithm) -> Tuple[Matrix, Matrix]:
+        """
+        Straight cable segments of all poses in world coordinates
+
+        Returns
+        -------
+        anchors, leaves : Matrix
+            `(K, M, 3)` arrays of platform anchors and cable leave points
+            as returned by `kinematics.Algorithm.segments_batch`.
+        """
+        key = id(algorithm)
+        try:
+            _, result = self._segments[key]
+        except KeyError:
+            lengths, directions = self.kinematics(algorithm)
+            result = self._calculate('segments',
+                                     algorithm.segments_batch,
+                                     self._robot,
+                                     self._positions,
+                                     self._dcms,
+                                     lengths=lengths,
+                                     directions=directions)
+            self._segments[key] = (algorithm, result)
+        else:
+            self._hit()
+
+        return result
+
+    def structure_matrices(self,
+                           calculator: _calculator.Calculator) -> Matrix:
+        """
+        Structure matrices of all poses
+
+        Parameters
+        ----------
+        calculator : structure_matrix.Calculator
+            Calculator to evaluate the structure matrices with. Its inverse
+            kinematics are taken from `kinematics`.
+
+        Returns
+        -------
+        matrices : Matrix
+            `(K, N, M)` array of stacked structure matrices.
+        """
+        key = _structure_matrix_key(self._robot, calculator)
+        try:
+            _, result = self._structure_matrices[key]
+        except KeyError:
+            seeds = self._seeds('_structure_matrices', key)
+            if seeds is not None:
+                result = _np.stack([each.matrix for each in seeds])
+            else:
+                _, directions = self.kinematics(calculator.kinematics)
+                result = self._calculate('structure_matrix',
+                                         calculator.evaluate_batch,
+                                         self._robot,
+                                         self._positions,
+                                         self._dcms,
+                                         directions=directions)
+                if calculator.buffer is not None:
+                    result = result.copy()
+            self._structure_matrices[key] = (calculator.kinematics, result)
+        else:
+            self._hit()
+
+        return result
+
+    def _seeds(self, name: str, key: Hashable):
+        # results of the per-pose contexts if every pose has one
+        seeds = []
+        for context in self._contexts:
+            try:
+                _, result = getattr(context, name)[key]
+            except (AttributeError, KeyError):
+                return None
+            seeds.append(result)
+
+        return seeds if seeds else None
+
+    _calculate = Context._calculate
+
+    _hit = Context._hit
+
+    __repr__ = make_repr(
+            'robot',
+            'positions',
+    )
+
+
+def _take(result, index: Vector):
+    if isinstance(result, tuple):
+        return tuple(_take(each, index) for each in result)
+
+    return result[index]
+
+
+def _structure_matrix_key(robot: _robot.Robot,
+                          calculator: _calculator.Calculator):
+    # structure matrices depend on the kinematics algorithm and the
+    # (stateless) structure matrix algorithm of the platform's motion pattern
+    return (id(calculator.kinematics),
+            type(calculator.resolver[robot.platforms[0].motion_pattern]))
@@ -6,19 +6,53 @@ __all__ = [
         'Criterion',
 ]
 
+import time
 from abc import abstractmethod
+from typing import Optional, TYPE_CHECKING
 
 from cdpyr.analysis import evaluator as _evaluator
+from cdpyr.analysis.criterion import context as _context
+from cdpyr.exceptions import InvalidPoseException
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
 
+if TYPE_CHECKING:
+    from cdpyr.analysis import profile as _profile_
+
 
 class Criterion(_evaluator.PoseEvaluator):
+    _profile: Optional[_profile_.Profile]
+
+    def __init__(self,
+                 profile: Optional[_profile_.Profile] = None,
+                 **kwargs):
+        """
+        Parameters
+        ----------
+        profile : Profile
+            Optional profile to record timings of evaluations in. Contexts
+            created by the criterion record their stages into it, too.
+        """
+        super().__init__(**kwargs)
+        self._profile = profile
+
+    @property
+    def profile(self):
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: Optional[_profile_.Profile]):
+        self._profile = profile
+
+    @profile.deleter
+    def profile(self):
+        self._profile = None
 
     def evaluate(self,
                  robot: _robot.Robot,
                  pose: _pose.Pose,
                  *args,
+                 context: Optional[_context.Context] = None,
                  **kwargs):
         """
         Public method to evaluate the pose criterion
@@ -27,6 +61,10 @@ class Criterion(_evaluator.PoseEvaluator):
         ----------
         robot
         pose
+        context : Context
+            Intermediate results of the pose shared with other criteria. A
+            fresh context is used if not given. The evaluation is timed into
+            the context's profile.
         kwargs
 
         Returns
@@ -39,8 +77,22 @@ class Criterion(_evaluator.PoseEvaluator):
                     'Workspace criteria are currently not implemented for '
                     'robots with more than one platform.')
 
+        if context is None:
+            context = _context.Context(robot, pose, self._profile)
+
         # pass down to the criterion's actual evaluation implementation
-        return self._evaluate(robot, pose, **kwargs)
+        profile = context.profile
+        if profile is None:
+            return self._evaluate(robot, pose, context=context, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return self._evaluate(robot, pose, context=context, **kwargs)
+        except InvalidPoseException:
+            profile.reject(self.name)
+            raise
+        finally:
+            profile.add(f'criterion.{self.name}', time.perf_counter() - start)
 
     @property
     def name(self):
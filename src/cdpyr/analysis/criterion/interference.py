@@ -6,67 +6,313 @@ __all__ = [
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 
+from typing import Optional
+
 import numpy as _np
 
-from cdpyr.analysis.criterion import criterion as _criterion
+from cdpyr.analysis.criterion import context as _context, \
+    criterion as _criterion
 from cdpyr.analysis.kinematics import kinematics as _kinematics
 from cdpyr.exceptions import InvalidPoseException
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Interference(_criterion.Criterion):
+    """
+    Cable-cable interference i.e., check that the straight cable segments
+    between cable leave point and platform anchor keep a minimum distance
+    from each other.
+
+    Cables of kinematic chains that share a frame anchor or a platform
+    anchor touch by construction and are not checked against each other.
+    """
+
     kinematics: _kinematics.Algorithm
+    clearance: Num
+    prune: bool
 
-    def __init__(self, kinematics: _kinematics.Algorithm, **kwargs):
+    def __init__(self,
+                 kinematics: _kinematics.Algorithm,
+                 clearance: Num = 0.0,
+                 prune: bool = True,
+                 **kwargs):
         super().__init__(**kwargs)
         self.kinematics = kinematics
+        self.clearance = clearance
+        self.prune = prune
+
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix] = None,
+                       chunk_size: int = 2 ** 14,
+                       context: Optional[_context.BatchContext] = None,
+                       **kwargs) -> Vector:
+        """
+        Check many poses for cable-cable interference at once
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to check the poses of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+        chunk_size : int
+            Number of poses evaluated at once to limit memory consumption.
+        context : BatchContext
+            Optional context of the poses to take the cable segments from.
+
+        Returns
+        -------
+        valid : Vector
+            `(K,)` boolean array that is `True` for every pose in which all
+            cables keep at least `clearance` distance from each other.
+        """
+        # any pair further apart than the clearance cannot invalidate a
+        # pose, so its exact distance is not needed
+        distances = self.distances(robot,
+                                   positions,
+                                   dcms,
+                                   cutoff=self.clearance if self.prune else
+                                   None,
+                                   chunk_size=chunk_size,
+                                   context=context,
+                                   **kwargs)
+
+        return (distances > self.clearance).all(axis=1)
+
+    def minimum_distance(self,
+                         robot: _robot.Robot,
+                         positions: Matrix,
+                         dcms: Optional[Matrix] = None,
+                         chunk_size: int = 2 ** 14,
+                         **kwargs) -> Vector:
+        """
+        Minimum distance between any two cables for many poses
+
+        Returns
+        -------
+        distance : Vector
+            `(K,)` array of the smallest distance between any pair of cables.
+            Poses without any pair of cables to check have infinite
+            distance.
+        """
+        distances = self.distances(robot,
+                                   positions,
+                                   dcms,
+                                   chunk_size=chunk_size,
+                                   **kwargs)
+
+        if not distances.shape[1]:
+            return _np.full(distances.shape[0], _np.inf)
+
+        return distances.min(axis=1)
+
+    def distances(self,
+                  robot: _robot.Robot,
+                  positions: Matrix,
+                  dcms: Optional[Matrix] = None,
+                  cutoff: Optional[Num] = None,
+                  chunk_size: int = 2 ** 14,
+                  context: Optional[_context.BatchContext] = None,
+                  **kwargs) -> Matrix:
+        """
+        Distances between all pairs of cables for many poses
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to check the poses of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+        cutoff : Num
+            If given, pairs of cables whose axis-aligned bounding boxes are
+            further apart than `cutoff` are not evaluated exactly and are
+            reported with infinite distance.
+        chunk_size : int
+            Number of poses evaluated at once to limit memory consumption.
+        context : BatchContext
+            Optional context of the poses to take the cable segments from.
+
+        Returns
+        -------
+        distances : Matrix
+            `(K, P)` array of distances between the `P` pairs of cables
+            given by `pairs(robot)`.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        num_poses = positions.shape[0]
+        if dcms is None:
+            dcms = _np.broadcast_to(_np.eye(3), (num_poses, 3, 3))
+        dcms = _np.asarray(dcms, dtype=float)
+        chunk_size = max(int(chunk_size), 1)
+
+        first, second = self.pairs(robot)
+        distances = _np.full((num_poses, first.size), _np.inf)
+        if not first.size:
+            return distances
+
+        # cable segments shared with other criteria
+        if context is not None:
+            segments = context.segments(self.kinematics)
+
+        for start in range(0, num_poses, chunk_size):
+            index = slice(start, min(start + chunk_size, num_poses))
+            if context is not None:
+                anchors, leaves = (each[index] for each in segments)
+            else:
+                anchors, leaves = self.kinematics.segments_batch(
+                        robot,
+                        positions[index],
+                        dcms[index],
+                        **kwargs)
+            distances[index] = _segment_distances(anchors[:, first, :],
+                                                  leaves[:, first, :],
+                                                  anchors[:, second, :],
+                                                  leaves[:, second, :],
+                                                  cutoff)
+
+        return distances
+
+    @staticmethod
+    def pairs(robot: _robot.Robot):
+        """
+        Indices of the pairs of kinematic chains checked for interference
+
+        Returns
+        -------
+        first, second : Vector
+            `(P,)` arrays of kinematic chain indices with `first < second`.
+        """
+        first, second = _np.triu_indices(robot.num_kinematic_chains, k=1)
+
+        # chains sharing an anchor touch by construction
+        kcs = robot.kinematic_chains
+        frame_anchors = _np.asarray(
+                [robot.frame.anchors[kc.frame_anchor].linear.position
+                 for kc in kcs])
+        platform_anchors = _np.asarray(
+                [robot.platforms[kc.platform].anchors[
+                     kc.platform_anchor].linear.position
+                 for kc in kcs])
+        platforms = _np.asarray([kc.platform for kc in kcs])
+        shared_frame = _np.isclose(frame_anchors[first],
+                                   frame_anchors[second]).all(axis=1)
+        shared_platform = (platforms[first] == platforms[second]) \
+                          & _np.isclose(platform_anchors[first],
+                                        platform_anchors[second]).all(axis=1)
+        distinct = ~(shared_frame | shared_platform)
+
+        return first[distinct], second[distinct]
 
     def _evaluate(self,
                   robot: _robot.Robot,
                   pose: _pose.Pose,
+                  context: _context.Context,
                   **kwargs):
-        # solve the inverse kinematics
-        kinematics_solution = self.kinematics.backward(robot, pose)
-
-        # get all leave points
-        leave_points = kinematics_solution.leave_points
-
-        # position and orientation of the robot
-        pos, rot = pose.position
-
-        # local sorted platform anchors
-        platform_anchors = _np.vstack([robot.platforms[kc.platform].anchors[
-                                           kc.platform_anchor].linear.position
-                                       for kc in robot.kinematic_chains]).T
-
-        # global sorted platform anchors
-        platform_anchors = pos[:, None] + rot.dot(platform_anchors)
-
-        # build a list of line segments composed of [leave, platform]
-        line_segments = list(zip(leave_points.T, platform_anchors.T))
-
-        # pick one cable to test against the others
-        for this_idx in range(len(line_segments)):
-            this_segment = line_segments[this_idx]
-            # just check the remaining cables
-            for that_idx in range(this_idx + 1, len(line_segments)):
-                that_segment = line_segments[that_idx]
-                # build array of segments
-                segments = _np.vstack((this_segment[1] - this_segment[0],
-                                       that_segment[0] - that_segment[1])).T
-                # calculate common point
-                common = that_segment[0] - this_segment[0]
-                # solve to see if there's a common value for lambda
-                try:
-                    lbda, res, rank, s = _np.linalg.lstsq(segments, common,
-                                                          rcond=None)
-                    print(lbda)
-
-                    if _np.logical_and(0 <= lbda, lbda <= 1).all():
-                        raise InvalidPoseException(
-                                f'invalid pose found. cables of kinematic '
-                                f'chains {this_idx} and {that_idx} collide')
-                except _np.linalg.LinAlgError as e:
-                    # valid pose, just move on
-                    pass
+        anchors, leaves = context.segments(self.kinematics)
+        first, second = self.pairs(robot)
+
+        distances = _segment_distances(anchors[0, first, :],
+                                       leaves[0, first, :],
+                                       anchors[0, second, :],
+                                       leaves[0, second, :],
+                                       self.clearance if self.prune else None)
+
+        colliding = _np.flatnonzero(distances <= self.clearance)
+        if colliding.size:
+            raise InvalidPoseException(
+                    f'invalid pose found. cables of kinematic chains '
+                    f'{first[colliding[0]]} and {second[colliding[0]]} '
+                    f'collide')
+
+
+def _segment_distances(start_first: Matrix,
+                       end_first: Matrix,
+                       start_second: Matrix,
+                       end_second: Matrix,
+                       cutoff: Optional[Num] = None):
+    """
+    Closed-form distance between pairs of line segments.
+
+    Parameters
+    ----------
+    start_first, end_first : Matrix
+        `(..., 3)` arrays of start and end points of the first segments.
+    start_second, end_second : Matrix
+        `(..., 3)` arrays of start and end points of the second segments.
+    cutoff : Num
+        If given, segments whose bounding boxes are further apart than
+        `cutoff` are not evaluated and have infinite distance.
+
+    Returns
+    -------
+    distances : Matrix
+        `(...)` array of distances.
+    """
+    shape = start_first.shape[:-1]
+    distances = _np.full(shape, _np.inf)
+
+    # prune pairs by the distance of their axis-aligned bounding boxes
+    if cutoff is not None:
+        gap = _np.maximum(
+                _np.maximum(_np.minimum(start_second, end_second)
+                            - _np.maximum(start_first, end_first),
+                            _np.minimum(start_first, end_first)
+                            - _np.maximum(start_second, end_second)),
+                0.0)
+        candidates = _np.einsum('...i,...i->...', gap, gap) <= cutoff ** 2
+        start_first = start_first[candidates]
+        end_first = end_first[candidates]
+        start_second = start_second[candidates]
+        end_second = end_second[candidates]
+    else:
+        candidates = Ellipsis
+
+    # closest points of `p1 + s d1` and `p2 + t d2` for `s, t` in `[0, 1]`
+    # following Ericson.2005
+    d1 = end_first - start_first
+    d2 = end_second - start_second
+    r = start_first - start_second
+    a = _np.einsum('...i,...i->...', d1, d1)
+    e = _np.einsum('...i,...i->...', d2, d2)
+    b = _np.einsum('...i,...i->...', d1, d2)
+    c = _np.einsum('...i,...i->...', d1, r)
+    f = _np.einsum('...i,...i->...', d2, r)
+    eps = _np.finfo(float).eps
+    safe_a = _np.where(a > eps, a, 1.0)
+    safe_e = _np.where(e > eps, e, 1.0)
+
+    # parameter on the first segment for (non-)parallel segments
+    denominator = a * e - b ** 2
+    parallel = denominator <= eps * a * e
+    s = _np.where(parallel,
+                  0.0,
+                  _np.clip((b * f - c * e)
+                           / _np.where(parallel, 1.0, denominator), 0, 1))
+
+    # parameter on the second segment and re-clamping of the first
+    t = (b * s + f) / safe_e
+    s = _np.where(t < 0, _np.clip(-c / safe_a, 0, 1), s)
+    s = _np.where(t > 1, _np.clip((b - c) / safe_a, 0, 1), s)
+    t = _np.clip(t, 0, 1)
+
+    # degenerate segments collapse to points
+    s = _np.where(a > eps, s, 0.0)
+    t = _np.where(e > eps, t, 0.0)
+    t = _np.where((a <= eps) & (e > eps), _np.clip(f / safe_e, 0, 1), t)
+    s = _np.where((a > eps) & (e <= eps), _np.clip(-c / safe_a, 0, 1), s)
+
+    difference = r + s[..., None] * d1 - t[..., None] * d2
+    distances[candidates] = _np.sqrt(
+            _np.einsum('...i,...i->...', difference, difference))
+
+    return distances
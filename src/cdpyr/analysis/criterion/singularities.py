@@ -7,33 +7,226 @@ __all__ = [
         'Singularities',
 ]
 
-from cdpyr.analysis.criterion import criterion as _criterion
+from typing import Optional
+
+import numpy as _np
+
+from cdpyr.analysis.criterion import context as _context, \
+    criterion as _criterion
 from cdpyr.analysis.kinematics import kinematics as _kinematics
 from cdpyr.analysis.structure_matrix import calculator as _structure_matrix
 from cdpyr.exceptions import InvalidPoseException
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Singularities(_criterion.Criterion):
     _kinematics: _kinematics.Algorithm
     _structure_matrix: _structure_matrix.Calculator
 
-    def __init__(self, kinematics: _kinematics.Algorithm, **kwargs):
+    def __init__(self,
+                 kinematics: _kinematics.Algorithm,
+                 tolerance: Optional[Num] = None,
+                 **kwargs):
         super().__init__(**kwargs)
         self._kinematics = kinematics
         self._structure_matrix = _structure_matrix.Calculator(self._kinematics)
+        self.tolerance = tolerance
 
     @property
     def kinematics(self):
         return self._kinematics
 
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix] = None,
+                       chunk_size: int = 2 ** 16,
+                       context: Optional[_context.BatchContext] = None,
+                       **kwargs) -> Vector:
+        """
+        Check many poses for singularities at once
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to check the poses of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+        chunk_size : int
+            Number of poses evaluated at once to limit memory consumption.
+        context : BatchContext
+            Optional context of the poses to take the structure matrices
+            from.
+
+        Returns
+        -------
+        valid : Vector
+            `(K,)` boolean array that is `True` for every pose whose
+            structure matrix has full row rank.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        valid = _np.zeros(positions.shape[0], dtype=bool)
+
+        # fewer cables than degrees of freedom can never be of full row rank
+        num_rows, num_columns = self._matrix_size(robot)
+        if num_columns < num_rows:
+            return valid
+
+        for index, matrices in self._matrices(robot,
+                                              positions,
+                                              dcms,
+                                              chunk_size,
+                                              context,
+                                              **kwargs):
+            # with `s_1 >= ... >= s_n` the singular values of `A`, we have
+            # `det(A A^T) = prod(s_i^2)` and `s_1^2 <= trace(A A^T)`, so
+            # `s_n^2 >= det(A A^T) / trace(A A^T)^(n - 1)` is a cheap lower
+            # bound of the smallest singular value
+            gram = _np.matmul(matrices, matrices.transpose((0, 2, 1)))
+            trace = _np.trace(gram, axis1=1, axis2=2)
+            bound = _np.linalg.det(gram) \
+                    / _np.maximum(trace, 1e-300) ** (num_rows - 1)
+            tolerance = self._tolerance(_np.sqrt(trace), num_columns)
+            chunk = bound > tolerance ** 2
+
+            # check the remaining poses properly
+            if not chunk.all():
+                values = _np.linalg.svd(matrices[~chunk], compute_uv=False)
+                chunk[~chunk] = values[:, -1] > self._tolerance(
+                        values[:, 0],
+                        num_columns)
+
+            valid[index] = chunk
+
+        return valid
+
+    def conditioning(self,
+                     robot: _robot.Robot,
+                     positions: Matrix,
+                     dcms: Optional[Matrix] = None,
+                     chunk_size: int = 2 ** 16,
+                     **kwargs) -> Vector:
+        """
+        Smallest singular value of the structure matrix of many poses
+
+        The smallest singular value is a continuous measure of the distance
+        to the next singularity and can e.g., drive adaptive refinement of
+        workspace grids.
+
+        Returns
+        -------
+        sigma : Vector
+            `(K,)` array of smallest singular values.
+        """
+        return self.singular_values(robot,
+                                    positions,
+                                    dcms,
+                                    chunk_size,
+                                    **kwargs)[:, -1]
+
+    def singular_values(self,
+                        robot: _robot.Robot,
+                        positions: Matrix,
+                        dcms: Optional[Matrix] = None,
+                        chunk_size: int = 2 ** 16,
+                        **kwargs) -> Matrix:
+        """
+        Singular values of the structure matrix of many poses
+
+        Returns
+        -------
+        values : Matrix
+            `(K, min(N, M))` array of singular values in descending order.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        values = _np.empty((positions.shape[0],
+                            min(self._matrix_size(robot))))
+
+        for index, matrices in self._matrices(robot,
+                                              positions,
+                                              dcms,
+                                              chunk_size,
+                                              **kwargs):
+            values[index] = self._singular_values(matrices)
+
+        return values
+
+    def _matrices(self,
+                  robot: _robot.Robot,
+                  positions: Matrix,
+                  dcms: Optional[Matrix],
+                  chunk_size: int,
+                  context: Optional[_context.BatchContext] = None,
+                  **kwargs):
+        # structure matrices shared with other criteria
+        if context is not None:
+            yield slice(None), context.structure_matrices(
+                    self._structure_matrix)
+            return
+
+        if dcms is not None:
+            dcms = _np.asarray(dcms, dtype=float)
+        num_poses = positions.shape[0]
+        chunk_size = max(int(chunk_size), 1)
+
+        for start in range(0, num_poses, chunk_size):
+            index = slice(start, min(start + chunk_size, num_poses))
+            yield index, self._structure_matrix.evaluate_batch(
+                    robot,
+                    positions[index],
+                    dcms[index] if dcms is not None else None,
+                    **kwargs)
+
+    def _tolerance(self, largest: Vector, num_columns: int):
+        # same rank tolerance as `numpy.linalg.matrix_rank` unless given
+        if self.tolerance is not None:
+            return _np.full_like(largest, self.tolerance)
+
+        return largest * num_columns * _np.finfo(float).eps
+
+    @staticmethod
+    def _singular_values(matrices: Matrix):
+        # singular values of `A` are the square roots of the eigenvalues of
+        # the smaller of `A A^T` and `A^T A` which is much cheaper than a
+        # full SVD of every matrix
+        transposed = matrices.transpose((0, 2, 1))
+        if matrices.shape[1] <= matrices.shape[2]:
+            gram = _np.matmul(matrices, transposed)
+        else:
+            gram = _np.matmul(transposed, matrices)
+        eigenvalues = _np.linalg.eigvalsh(gram)[:, ::-1]
+        values = _np.sqrt(_np.maximum(eigenvalues, 0.0))
+
+        # squaring loses precision for ill-conditioned matrices, so fall
+        # back to a proper SVD for all (rare) nearly singular ones
+        poor = eigenvalues[:, -1] < 1e-8 * eigenvalues[:, 0]
+        if poor.any():
+            values[poor] = _np.linalg.svd(matrices[poor], compute_uv=False)
+
+        return values
+
+    @staticmethod
+    def _matrix_size(robot: _robot.Robot):
+        return robot.platforms[0].dof, robot.num_kinematic_chains
+
     def _evaluate(self,
                   robot: _robot.Robot,
                   pose: _pose.Pose,
+                  context: _context.Context,
                   **kwargs):
         # according to Pott.2018, a pose is singular if the structure
         # matrix's rank is smaller than the number of degrees of freedom
         # i.e., the structure matrix's number of rows
-        if self._structure_matrix.evaluate(robot, pose).is_singular:
+        # the rank follows from the structure matrix's shared SVD
+        structure_matrix = context.structure_matrix(self._structure_matrix)
+        matrix = structure_matrix.matrix
+        values = structure_matrix.singular_values
+        rank = (values > self._tolerance(values[0:1],
+                                         max(matrix.shape))).sum()
+        if rank < matrix.shape[0]:
             raise InvalidPoseException('structure matrix is singuar')
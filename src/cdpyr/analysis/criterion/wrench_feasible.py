@@ -10,7 +10,8 @@ from typing import Optional, Union
 
 import numpy as _np
 
-from cdpyr.analysis.criterion import criterion as _criterion
+from cdpyr.analysis.criterion import context as _context, \
+    criterion as _criterion
 from cdpyr.analysis.force_distribution import force_distribution as \
     _force_distribution
 from cdpyr.exceptions import InvalidPoseException
@@ -56,17 +57,18 @@ class WrenchFeasible(_criterion.Criterion):
     def _evaluate(self,
                   robot: _robot.Robot,
                   pose: _pose.Pose,
+                  context: _context.Context,
                   **kwargs):
         try:
             # determine the gravitational wrench
-            wrenches = robot.gravitational_wrench(pose)[:, _np.newaxis]
+            wrenches = context.gravitational_wrench[:, _np.newaxis]
 
             # if other wrenches are given, we will add them to the
             # gravitational wrench
             if self._wrench is not None:
                 wrenches = _np.hstack((wrenches, wrenches + self._wrench)).T
 
-            [self.force_distribution.evaluate(robot, pose, wrench)
+            [context.forces(self.force_distribution, wrench)
              for wrench in wrenches.T]
         except Exception as e:
             raise InvalidPoseException('pose is not wrench feasible.') from e
@@ -1,12 +1,22 @@
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
+        'AdvancedClosedForm',
+        'Barycentric',
         'ClosedForm',
         'ClosedFormImproved',
         'Dykstra',
+        'QuadraticProgram',
+        'Redundancy',
 ]
 
+from cdpyr.analysis.force_distribution.advanced_closed_form import \
+    AdvancedClosedForm
+from cdpyr.analysis.force_distribution.barycentric import Barycentric
 from cdpyr.analysis.force_distribution.closed_form import ClosedForm
 from cdpyr.analysis.force_distribution.closed_form_improved import \
     ClosedFormImproved
 from cdpyr.analysis.force_distribution.dykstra import Dykstra
+from cdpyr.analysis.force_distribution.quadratic_program import \
+    QuadraticProgram
+from cdpyr.analysis.force_distribution.redundancy import Redundancy
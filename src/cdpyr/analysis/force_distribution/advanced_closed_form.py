@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'AdvancedClosedForm',
+]
+
+from typing import List
+
+import numpy as _np
+
+from cdpyr.analysis.force_distribution import redundancy as _redundancy
+from cdpyr.typing import Matrix, Vector
+
+
+class AdvancedClosedForm(_redundancy.Redundancy):
+    """
+    Force distribution closest to the mean of the force limits for robots
+    with a redundancy of one or two.
+
+    This is the closed-form solution whenever that is valid. Otherwise, it
+    is the point of the interval or polygon of valid force distributions
+    closest to the closed-form solution, so unlike `ClosedFormImproved`, it
+    is found whenever any valid force distribution exists.
+    """
+
+    def _select(self,
+                particular: Matrix,
+                kernel: Matrix,
+                starts: Matrix,
+                ends: Matrix,
+                valid: Matrix,
+                force_min: Vector,
+                force_max: Vector,
+                tolerance: Vector):
+        # closed-form solution in kernel coordinates, which the orthonormal
+        # kernel makes the closest point to the mean force
+        target = _np.einsum('kir,ki->kr',
+                            kernel,
+                            0.5 * (force_min + force_max) - particular)
+        forces = particular + _np.einsum('kir,kr->ki', kernel, target)
+        inside = _np.all((forces >= force_min - tolerance)
+                         & (forces <= force_max + tolerance), axis=1)
+
+        # otherwise, the closest point is on the closest edge
+        edges = ends - starts
+        length = _np.einsum('ker,ker->ke', edges, edges)
+        position = _np.clip(_np.einsum('ker,ker->ke',
+                                       target[:, None, :] - starts,
+                                       edges)
+                            / _np.where(length == 0.0, 1.0, length),
+                            0.0,
+                            1.0)
+        closest = starts + position[:, :, None] * edges
+        offset = target[:, None, :] - closest
+        distance = _np.where(valid,
+                             _np.einsum('ker,ker->ke', offset, offset),
+                             _np.inf)
+        nearest = _np.take_along_axis(
+                closest,
+                _np.argmin(distance, axis=1)[:, None, None],
+                axis=1)[:, 0, :]
+
+        return _np.where(inside[:, None], target, nearest)
+
+    def _select_one(self,
+                    particular: Vector,
+                    kernel: Matrix,
+                    lower: List[float],
+                    upper: List[float],
+                    force_min: Vector,
+                    force_max: Vector):
+        # closed-form solution in kernel coordinates, which needs no vertices
+        # when it is valid
+        target = kernel.T.dot(0.5 * (force_min + force_max) - particular)
+        if all(low <= value <= up
+               for low, value, up in zip(lower,
+                                         kernel.dot(target).tolist(),
+                                         upper)):
+            return tuple(target.tolist())
+
+        vertices = self._vertices(kernel, lower, upper)
+        if not vertices:
+            return None
+
+        # otherwise, the closest point of the interval
+        if len(vertices[0]) == 1:
+            return min(max(target[0], vertices[0][0]), vertices[1][0]),
+
+        # or of the polygon's edges
+        tx, ty = target.tolist()
+        nearest, distance = vertices[0], _np.inf
+        for (xs, ys), (xe, ye) in zip(vertices, vertices[1:] + vertices[0:1]):
+            dx, dy = xe - xs, ye - ys
+            length = dx * dx + dy * dy
+            position = min(max(((tx - xs) * dx + (ty - ys) * dy) / length,
+                               0.0),
+                           1.0) if length > 0.0 else 0.0
+            x, y = xs + position * dx, ys + position * dy
+            if (tx - x) ** 2 + (ty - y) ** 2 < distance:
+                nearest, distance = (x, y), (tx - x) ** 2 + (ty - y) ** 2
+
+        return nearest
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Barycentric',
+]
+
+from typing import List
+
+import numpy as _np
+
+from cdpyr.analysis.force_distribution import redundancy as _redundancy
+from cdpyr.typing import Matrix, Vector
+
+
+class Barycentric(_redundancy.Redundancy):
+    """
+    Force distribution at the centroid of all valid force distributions of
+    robots with a redundancy of one or two, which is the solution farthest
+    from the force limits on average and changes continuously with the pose.
+    """
+
+    def _select(self,
+                particular: Matrix,
+                kernel: Matrix,
+                starts: Matrix,
+                ends: Matrix,
+                valid: Matrix,
+                force_min: Vector,
+                force_max: Vector,
+                tolerance: Vector):
+        midpoints = 0.5 * (starts + ends)
+
+        # centroid of the interval
+        if starts.shape[2] == 1:
+            return midpoints[:, 0, :]
+
+        # mean of the edges' midpoints as origin for numerical stability
+        count = valid.sum(axis=1)[:, None]
+        origin = _np.einsum('ke,ker->kr', valid, midpoints) / count
+        starts = starts - origin[:, None, :]
+        ends = ends - origin[:, None, :]
+
+        # centroid of the polygon from its counterclockwise edges
+        cross = _np.where(valid,
+                          starts[:, :, 0] * ends[:, :, 1]
+                          - starts[:, :, 1] * ends[:, :, 0],
+                          0.0)
+        area = 0.5 * cross.sum(axis=1)
+        centroid = _np.einsum('ke,ker->kr', cross, starts + ends) \
+                   / (6.0 * _np.where(area == 0.0, 1.0, area))[:, None]
+
+        # degenerate polygons i.e., points and segments, fall back to the
+        # mean of their edges' midpoints
+        scale = _np.abs(_np.where(valid[:, :, None], starts, 0.0)).max(
+                axis=(1, 2))
+        degenerate = area <= 1e-12 * _np.maximum(scale, 1.0) ** 2
+
+        return origin + _np.where(degenerate[:, None], 0.0, centroid)
+
+    def _select_one(self,
+                    particular: Vector,
+                    kernel: Matrix,
+                    lower: List[float],
+                    upper: List[float],
+                    force_min: Vector,
+                    force_max: Vector):
+        vertices = self._vertices(kernel, lower, upper)
+        if not vertices:
+            return None
+
+        # centroid of the interval
+        if len(vertices[0]) == 1:
+            return 0.5 * (vertices[0][0] + vertices[1][0]),
+
+        # centroid of the polygon relative to its first vertex
+        x0, y0 = vertices[0]
+        points = [(x - x0, y - y0) for x, y in vertices]
+        area = cx = cy = 0.0
+        for (xs, ys), (xe, ye) in zip(points, points[1:] + points[0:1]):
+            cross = xs * ye - ys * xe
+            area += cross
+            cx += cross * (xs + xe)
+            cy += cross * (ys + ye)
+        area *= 0.5
+
+        # degenerate polygons i.e., points and segments, fall back to the
+        # mean of their vertices
+        scale = max(max(abs(x), abs(y)) for x, y in points)
+        if area <= 1e-12 * max(scale, 1.0) ** 2:
+            return (x0 + sum(x for x, _ in points) / len(points),
+                    y0 + sum(y for _, y in points) / len(points))
+
+        return x0 + cx / (6.0 * area), y0 + cy / (6.0 * area)
@@ -6,9 +6,13 @@ __all__ = [
         'ClosedForm',
 ]
 
+from typing import Optional
+
 import numpy as _np
 
 from cdpyr.analysis.force_distribution import force_distribution as _algorithm
+from cdpyr.analysis.structure_matrix import structure_matrix as \
+    _structure_matrix
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
 from cdpyr.typing import Matrix, Vector
@@ -23,16 +27,51 @@ class ClosedForm(_algorithm.Algorithm):
                   wrench: Vector,
                   force_min: Vector,
                   force_max: Vector,
+                  decomposition: Optional[_structure_matrix.Result] = None,
                   **kwargs):
         # if the structure matrix is square, we can just return the straight
         # forward solution to A.T * x = -w
         if structure_matrix.shape[0] == structure_matrix.shape[1]:
             distribution = _np.linalg.solve(structure_matrix, -wrench)
         else:
+            # reuse the pseudo-inverse of the structure matrix's result
+            if decomposition is not None:
+                pinv = decomposition.pinv
+            else:
+                pinv = _np.linalg.pinv(structure_matrix)
             # mean force values
             force_mean = 0.5 * (force_max + force_min)
             # and distribution
-            distribution = force_mean - _np.linalg.pinv(structure_matrix).dot(
+            distribution = force_mean - pinv.dot(
                     wrench + structure_matrix.dot(force_mean))
 
         return _algorithm.Result(self, pose, distribution, wrench)
+
+    def _evaluate_batch(self,
+                        robot: _robot.Robot,
+                        structure_matrices: Matrix,
+                        wrenches: Matrix,
+                        force_min: Vector,
+                        force_max: Vector,
+                        **kwargs):
+        # square structure matrices have exactly one solution
+        if structure_matrices.shape[1] == structure_matrices.shape[2]:
+            return super()._evaluate_batch(robot,
+                                           structure_matrices,
+                                           wrenches,
+                                           force_min,
+                                           force_max,
+                                           **kwargs)
+
+        _, pinvs = _structure_matrix.decompose(structure_matrices)
+        force_mean = 0.5 * (force_max + force_min)
+        forces = force_mean - _np.einsum(
+                'kij,kj->ki',
+                pinvs,
+                wrenches + _np.einsum('kij,j->ki',
+                                      structure_matrices,
+                                      force_mean))
+
+        # the closed form does not check the force limits, so every pose is
+        # feasible
+        return forces, _np.ones(structure_matrices.shape[0], dtype=bool)
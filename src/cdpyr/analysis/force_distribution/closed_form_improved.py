@@ -30,82 +30,149 @@ class ClosedFormImproved(_algorithm.Algorithm):
             distribution = _np.linalg.solve(structure_matrix, -wrench)
         # non-square structure matrix case
         else:
-            def solve_and_reduce(_structure_matrix,
-                                 _force_min,
-                                 _force_max,
-                                 _wrench):
-                # solve the closed form for the given distribution
-                distribution = self._closed_form(_structure_matrix,
-                                                 0.5 * (
-                                                         _force_min +
-                                                         _force_max),
-                                                 _wrench)
-
-                # logical indices where forces are below and above limits
-                violated_below: Vector = distribution < _force_min
-                violated_above: Vector = distribution > _force_max
-                # logical indices where forces limits violated
-                violated: Vector = _np.logical_or(violated_below,
-                                                  violated_above)
-                # logical indices where force limits are valid
-                valid: Vector = _np.logical_not(violated)
-
-                # if all forces are valid, return the calculated distribution
-                if valid.all():
-                    return distribution
-
-                # check if we can continue projecting the cable force onto
-                # the wrench or not
-                if _structure_matrix.shape[0] == _structure_matrix.shape[1]:
-                    raise ArithmeticError('Cannot reduce forces any more.')
-
-                # calculate the amount of violation
-                violated_amount = _np.zeros_like(distribution)
-                if violated_below.any():
-                    violated_amount[violated_below] = _force_min[
-                                                          violated_below] - \
-                                                      distribution[
-                                                          violated_below]
-                if violated_above.any():
-                    violated_amount[violated_above] = distribution[
-                                                          violated_above] - \
-                                                      _force_max[violated_above]
-
-                # linear index of force to reduce
-                reduce = _np.argmax(_np.abs(violated_amount))
-                # logical indices of forces to keep
-                keep = _np.ones_like(valid, dtype=_np.bool)
-                keep[reduce] = not keep[reduce]
-
-                # determine the invalid force's value i.e., either minimum or
-                # maximum force
-                if violated_below[reduce]:
-                    invalid_force = force_min[reduce]
-                else:
-                    invalid_force = force_max[reduce]
-
-                # build new force distribution
-                new_distribution = _np.zeros_like(distribution)
-                new_distribution[reduce] = invalid_force
-                new_distribution[keep] = solve_and_reduce(
-                        _structure_matrix[:, keep],
-                        _force_min[keep],
-                        _force_max[keep],
-                        _wrench + _structure_matrix[:, reduce] * invalid_force)
-
-                return new_distribution
-
-            distribution = solve_and_reduce(structure_matrix,
-                                            force_min,
-                                            force_max,
-                                            wrench)
+            distribution, feasible = self._reduce(
+                    _np.asarray(structure_matrix, dtype=float)[None, :, :],
+                    _np.asarray(wrench, dtype=float)[None, :],
+                    force_min,
+                    force_max)
+
+            if not feasible[0]:
+                raise ArithmeticError('Cannot reduce forces any more.')
+
+            distribution = distribution[0, :]
 
         return _algorithm.Result(self, pose, distribution, wrench)
 
-    def _closed_form(self,
-                     structure_matrix: Matrix,
-                     force_mean: Vector,
-                     wrench: Vector):
-        # return a quick form of the closed form
-        return force_mean - _np.linalg.pinv(structure_matrix).dot(
-                wrench + structure_matrix.dot(force_mean))
+    def _evaluate_batch(self,
+                        robot: _robot.Robot,
+                        structure_matrices: Matrix,
+                        wrenches: Matrix,
+                        force_min: Vector,
+                        force_max: Vector,
+                        **kwargs):
+        # square structure matrices have exactly one solution
+        if structure_matrices.shape[1] == structure_matrices.shape[2]:
+            forces = _np.full(structure_matrices.shape[0:3:2], _np.nan)
+            feasible = _np.ones(structure_matrices.shape[0], dtype=bool)
+            try:
+                forces[:] = _np.linalg.solve(structure_matrices,
+                                             -wrenches[:, :, None])[:, :, 0]
+            except _np.linalg.LinAlgError:
+                return super()._evaluate_batch(robot,
+                                               structure_matrices,
+                                               wrenches,
+                                               force_min,
+                                               force_max,
+                                               **kwargs)
+
+            return forces, feasible
+
+        return self._reduce(structure_matrices, wrenches, force_min, force_max)
+
+    def _reduce(self,
+                structure_matrices: Matrix,
+                wrenches: Matrix,
+                force_min: Vector,
+                force_max: Vector):
+        """
+        Closed-form force distribution with iterative reduction of violated
+        forces for many poses at once.
+
+        Every iteration solves the closed form of all poses not yet done
+        for their free cables. Of every pose violating the force limits,
+        the cable with the largest violation is fixed at the violated limit
+        and removed from the free cables. A pose is done once its
+        distribution is valid or, as failure, once its remaining free
+        cables form a square system.
+
+        Parameters
+        ----------
+        structure_matrices : Matrix
+            `(K, N, M)` array of structure matrices.
+        wrenches : Matrix
+            `(K, N)` array of wrenches.
+        force_min : Vector
+            `(M,)` array of minimum forces.
+        force_max : Vector
+            `(M,)` array of maximum forces.
+
+        Returns
+        -------
+        forces : Matrix
+            `(K, M)` array of forces, `NaN` for poses without a valid force
+            distribution.
+        feasible : Vector
+            `(K,)` boolean array that is `True` for every pose with a valid
+            force distribution.
+        """
+        num_poses, num_dof, num_cables = structure_matrices.shape
+        force_mean = 0.5 * (force_min + force_max)
+
+        forces = _np.full((num_poses, num_cables), _np.nan)
+        feasible = _np.zeros(num_poses, dtype=bool)
+        # cables with a force still to determine and forces of fixed cables
+        free = _np.ones((num_poses, num_cables), dtype=bool)
+        fixed = _np.zeros((num_poses, num_cables))
+        # indices of poses still to determine
+        active = _np.arange(num_poses)
+
+        while active.size:
+            is_free = free[active]
+            fixed_forces = fixed[active]
+            # zeroing the columns of fixed cables makes their rows of the
+            # pseudo-inverse zero, too, and otherwise equals the
+            # pseudo-inverse of only the free cables' columns
+            matrices = structure_matrices[active] * is_free[:, None, :]
+
+            # wrench to be compensated by the free cables
+            wrench = wrenches[active] + _np.einsum(
+                    'kij,kj->ki', structure_matrices[active], fixed_forces)
+
+            # solve the closed form for the free cables
+            distribution = force_mean - self._pinv_dot(
+                    matrices,
+                    wrench + matrices.dot(force_mean))
+            distribution = _np.where(is_free, distribution, fixed_forces)
+
+            # forces violating their limits
+            violated_below = is_free & (distribution < force_min)
+            violated_above = is_free & (distribution > force_max)
+            violated = violated_below | violated_above
+
+            # poses with valid forces are done
+            valid = ~violated.any(axis=1)
+            forces[active[valid]] = distribution[valid]
+            feasible[active[valid]] = True
+
+            # poses that cannot reduce any more forces failed
+            square = is_free.sum(axis=1) == num_dof
+            reduce = ~valid & ~square
+
+            # fix the force violating its limits the most at that limit
+            amount = _np.where(violated_below,
+                               force_min - distribution,
+                               _np.where(violated_above,
+                                         distribution - force_max,
+                                         0.0))[reduce]
+            cable = _np.argmax(_np.abs(amount), axis=1)
+            poses = active[reduce]
+            below = violated_below[reduce][_np.arange(poses.size), cable]
+            free[poses, cable] = False
+            fixed[poses, cable] = _np.where(below,
+                                            force_min[cable],
+                                            force_max[cable])
+
+            active = poses
+
+        return forces, feasible
+
+    @staticmethod
+    def _pinv_dot(matrices: Matrix, vectors: Matrix):
+        # with full row rank, `pinv(A) b = A^T (A A^T)^-1 b` which is much
+        # cheaper than the SVD of every matrix
+        gram = _np.matmul(matrices, matrices.transpose((0, 2, 1)))
+        try:
+            solution = _np.linalg.solve(gram, vectors[:, :, None])[:, :, 0]
+            return _np.einsum('kji,kj->ki', matrices, solution)
+        except _np.linalg.LinAlgError:
+            return _np.einsum('kij,kj->ki', _np.linalg.pinv(matrices), vectors)
@@ -6,12 +6,15 @@ __all__ = [
         'Dykstra',
 ]
 
-from typing import Union
+from typing import Optional, Union
 
 import numpy as _np
 
+from cdpyr.analysis import buffer as _buffer
 from cdpyr.analysis.force_distribution import force_distribution as _algorithm
 from cdpyr.analysis.kinematics import kinematics as _kinematics
+from cdpyr.analysis.structure_matrix import structure_matrix as \
+    _structure_matrix
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
 from cdpyr.typing import Matrix, Num, Vector
@@ -45,6 +48,7 @@ class Dykstra(_algorithm.Algorithm):
                   wrench: Vector,
                   force_min: Vector,
                   force_max: Vector,
+                  decomposition: Optional[_structure_matrix.Result] = None,
                   **kwargs):
         # if the structure matrix is square, we can just return the straight
         # forward solution to A.T * x = -w
@@ -66,46 +70,66 @@ class Dykstra(_algorithm.Algorithm):
             # initialize loop variables
             converged = False
             kiter = 1
-            eye = _np.eye(num_cables)
-
-            # pseude-inverse of structure matrix
-            structurematrix_pinv = _np.linalg.pinv(structure_matrix)
+            buffer = self.buffer
+
+            # pseude-inverse of structure matrix, reused from the structure
+            # matrix's result if possible
+            if decomposition is not None:
+                structurematrix_pinv = decomposition.pinv
+            else:
+                structurematrix_pinv = _np.linalg.pinv(structure_matrix)
+
+            # projection onto the solutions of `A f = -w` as `P f - A^+ w`,
+            # which does not change over the iterations
+            projector = _buffer.empty(buffer,
+                                      (self, 'projector'),
+                                      (num_cables, num_cables))
+            _np.dot(structurematrix_pinv, structure_matrix, out=projector)
+            _np.negative(projector, out=projector)
+            projector.flat[::num_cables + 1] += 1.0
+            offset = _buffer.empty(buffer, (self, 'offset'), (num_cables,))
+            _np.dot(structurematrix_pinv, wrench, out=offset)
+
+            # iterates and their updates swap their arrays every iteration
+            shape = (num_cables,)
+            projection_a = _buffer.empty(buffer, (self, 'a'), shape)
+            projection_a_new = _buffer.empty(buffer, (self, 'a_new'), shape)
+            projection_c = _buffer.empty(buffer, (self, 'c'), shape)
+            projection_c_new = _buffer.empty(buffer, (self, 'c_new'), shape)
+            difference = _buffer.empty(buffer, (self, 'difference'), shape)
 
             # initial projection before loop starts
-            projection_c = projection_a = 0.5 * (
-                    force_min + force_max) * _np.ones(
-                    num_cables)
+            _np.add(force_min, force_max, out=projection_c)
+            projection_c *= 0.5
+            projection_a[:] = projection_c
 
             # actual loop
             while not converged:
                 # first projection step
-                projection_a_new = (
-                                           eye
-                                           - structurematrix_pinv.dot(
-                                           structure_matrix)
-                                   ).dot(projection_c) \
-                                   - structurematrix_pinv.dot(wrench)
+                _np.dot(projector, projection_c, out=projection_a_new)
+                projection_a_new -= offset
 
                 # project down onto force limit boundaries
-                projection_c_new = _np.minimum(
-                        _np.maximum(projection_c, force_min),
-                        force_max
-                )
+                _np.maximum(projection_c, force_min, out=projection_c_new)
+                _np.minimum(projection_c_new, force_max, out=projection_c_new)
 
                 # check for break conditions
-                if _np.linalg.norm(projection_c_new - projection_c,
-                                   _np.inf) < eps_convergence:
+                if _inf_distance(projection_c_new,
+                                 projection_c,
+                                 difference) < eps_convergence:
                     converged = True
-                elif _np.linalg.norm(projection_a_new - projection_a,
-                                     _np.inf) < eps_convergence:
+                elif _inf_distance(projection_a_new,
+                                   projection_a,
+                                   difference) < eps_convergence:
                     converged = True
-                elif _np.linalg.norm(projection_a_new - projection_c_new,
-                                     _np.inf) < eps_projection:
+                elif _inf_distance(projection_a_new,
+                                   projection_c_new,
+                                   difference) < eps_projection:
                     converged = True
 
                 # iteration update
-                projection_a = projection_a_new
-                projection_c = projection_c_new
+                projection_a, projection_a_new = projection_a_new, projection_a
+                projection_c, projection_c_new = projection_c_new, projection_c
 
                 # and finally increase iteration counter
                 kiter += 1
@@ -121,3 +145,11 @@ class Dykstra(_algorithm.Algorithm):
                 distribution = projection_a
 
         return _algorithm.Result(self, pose, distribution, wrench)
+
+
+def _inf_distance(a: Vector, b: Vector, out: Vector):
+    # infinity norm of `a - b` without allocating its difference
+    _np.subtract(a, b, out=out)
+    _np.abs(out, out=out)
+
+    return out.max()
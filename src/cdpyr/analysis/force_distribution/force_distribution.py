@@ -8,15 +8,22 @@ __all__ = [
 ]
 
 from abc import abstractmethod
-from typing import Union
+from typing import Optional, Tuple, Union
 
 import numpy as _np
 from magic_repr import make_repr
 
 from cdpyr import validator as _validator
-from cdpyr.analysis import evaluator as _evaluator, result as _result
+from cdpyr.analysis import (
+    buffer as _buffer,
+    evaluator as _evaluator,
+    result as _result,
+)
 from cdpyr.analysis.kinematics import kinematics as _kinematics
-from cdpyr.analysis.structure_matrix import calculator as _structure_matrix
+from cdpyr.analysis.structure_matrix import (
+    calculator as _structure_matrix,
+    structure_matrix as _structure_matrix_,
+)
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
 from cdpyr.typing import Matrix, Num, Vector
@@ -31,12 +38,27 @@ class Algorithm(_evaluator.PoseEvaluator):
                  kinematics: _kinematics.Algorithm,
                  force_minimum: Union[Num, Vector],
                  force_maximum: Union[Num, Vector],
+                 buffer: Optional[_buffer.Buffer] = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self._structure_matrix = _structure_matrix.Calculator(kinematics)
+        self._structure_matrix = _structure_matrix.Calculator(kinematics,
+                                                              buffer=buffer)
         self.force_minimum = force_minimum
         self.force_maximum = force_maximum
 
+    @property
+    def buffer(self):
+        # shared with the structure matrix calculator
+        return self._structure_matrix.buffer
+
+    @buffer.setter
+    def buffer(self, buffer: Optional[_buffer.Buffer]):
+        self._structure_matrix.buffer = buffer
+
+    @property
+    def calculator(self):
+        return self._structure_matrix
+
     @property
     def force_maximum(self):
         return self._force_maximum
@@ -78,6 +100,8 @@ class Algorithm(_evaluator.PoseEvaluator):
                  pose: _pose.Pose,
                  wrench: Vector,
                  *args,
+                 structure_matrix: Optional[
+                     _structure_matrix_.Result] = None,
                  **kwargs) -> Result:
         if robot.num_platforms > 1:
             raise NotImplementedError(
@@ -89,18 +113,116 @@ class Algorithm(_evaluator.PoseEvaluator):
         # parse force limits
         force_min, force_max = self._parse_force_limits(robot)
 
-        # get the structure matrix for the current pose
-        structure_matrix = self._structure_matrix.evaluate(robot, pose)
+        # get the structure matrix for the current pose unless given
+        if structure_matrix is None:
+            structure_matrix = self._structure_matrix.evaluate(robot, pose)
 
-        # pass down to actual implementation
+        # pass down to actual implementation together with the structure
+        # matrix's result such that its decomposition is shared
         return self._evaluate(robot,
                               pose,
                               structure_matrix.matrix,
                               wrench,
                               force_min,
                               force_max,
+                              decomposition=structure_matrix,
                               **kwargs)
 
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix],
+                       wrenches: Matrix,
+                       structure_matrices: Optional[Matrix] = None,
+                       chunk_size: int = 2 ** 14,
+                       out: Optional[Tuple[Matrix, Vector]] = None,
+                       **kwargs) -> Tuple[Matrix, Vector]:
+        """
+        Evaluate the force distributions of many poses at once
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to evaluate the force distributions of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose if `None`.
+        wrenches : Matrix
+            `(K, N)` array of wrenches per pose or `(N,)` wrench for all
+            poses.
+        structure_matrices : Matrix
+            Optional `(K, N, M)` array of already evaluated structure
+            matrices.
+        chunk_size : int
+            Number of poses evaluated at once to limit memory consumption.
+        out : Tuple[Matrix, Vector]
+            Optional `(K, M)` float and `(K,)` boolean arrays to write the
+            forces and feasibility into. Taken from the buffer if not given
+            and the algorithm has one.
+
+        Returns
+        -------
+        forces : Matrix
+            `(K, M)` array of cable forces, `NaN` for poses without a valid
+            force distribution.
+        feasible : Vector
+            `(K,)` boolean array that is `True` for every pose with a valid
+            force distribution.
+        """
+        if robot.num_platforms > 1:
+            raise NotImplementedError(
+                    'Force distributions are currently not implemented for '
+                    'robots with more than one platform.'
+            )
+
+        positions = _np.asarray(positions, dtype=float)
+        num_poses = positions.shape[0]
+        if dcms is not None:
+            dcms = _np.asarray(dcms, dtype=float)
+        wrenches = _np.asarray(wrenches, dtype=float)
+        chunk_size = max(int(chunk_size), 1)
+
+        # parse force limits
+        force_min, force_max = self._parse_force_limits(robot)
+
+        num_cables = robot.num_kinematic_chains
+        if out is None:
+            buffer = self.buffer
+            out = (_buffer.empty(buffer,
+                                 (self, 'forces'),
+                                 (num_poses, num_cables)),
+                   _buffer.empty(buffer,
+                                 (self, 'feasible'),
+                                 (num_poses,),
+                                 dtype=bool))
+        forces, feasible = out
+        forces.fill(_np.nan)
+        feasible.fill(False)
+
+        for start in range(0, num_poses, chunk_size):
+            index = slice(start, min(start + chunk_size, num_poses))
+            if structure_matrices is None:
+                matrices = self._structure_matrix.evaluate_batch(
+                        robot,
+                        positions[index],
+                        dcms[index] if dcms is not None else None)
+            else:
+                matrices = _np.asarray(structure_matrices[index], dtype=float)
+            chunk = _np.broadcast_to(
+                    wrenches[index] if wrenches.ndim == 2 else wrenches,
+                    matrices.shape[0:2])
+
+            forces[index], feasible[index] = self._evaluate_batch(robot,
+                                                                  matrices,
+                                                                  chunk,
+                                                                  force_min,
+                                                                  force_max,
+                                                                  **kwargs)
+
+        return forces, feasible
+
     @abstractmethod
     def _evaluate(self,
                   robot: _robot.Robot,
@@ -112,6 +234,33 @@ class Algorithm(_evaluator.PoseEvaluator):
                   **kwargs) -> Result:
         raise NotImplementedError()
 
+    def _evaluate_batch(self,
+                        robot: _robot.Robot,
+                        structure_matrices: Matrix,
+                        wrenches: Matrix,
+                        force_min: Vector,
+                        force_max: Vector,
+                        **kwargs) -> Tuple[Matrix, Vector]:
+        # fallback for algorithms without a vectorized implementation
+        forces = _np.full(structure_matrices.shape[0:3:2], _np.nan)
+        feasible = _np.zeros(structure_matrices.shape[0], dtype=bool)
+        for index, (matrix, wrench) in enumerate(zip(structure_matrices,
+                                                     wrenches)):
+            try:
+                forces[index] = self._evaluate(robot,
+                                               None,
+                                               matrix,
+                                               wrench,
+                                               force_min,
+                                               force_max,
+                                               **kwargs).forces
+            except (ArithmeticError, _np.linalg.LinAlgError):
+                pass
+            else:
+                feasible[index] = True
+
+        return forces, feasible
+
     def _parse_force_limits(self, robot: _robot.Robot):
         # get configure force limits
         force_min = self._force_minimum
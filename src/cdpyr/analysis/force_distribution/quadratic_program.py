@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'QuadraticProgram',
+]
+
+from typing import Optional, Tuple, Union
+
+import numpy as _np
+
+from cdpyr.analysis.force_distribution import force_distribution as _algorithm
+from cdpyr.analysis.kinematics import kinematics as _kinematics
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Num, Vector
+
+
+class QuadraticProgram(_algorithm.Algorithm):
+    """
+    Force distribution optimal in the 2-norm under box constraints i.e.,
+    the solution of
+
+        min 1/2 || f - f_ref ||^2  s.t.  A f = -w,  f_min <= f <= f_max
+
+    solved with the alternating direction method of multipliers (ADMM) for
+    many poses at once and polished by solving the equality-constrained
+    problem on the detected set of active force limits. The penalty `rho` is
+    only the initial value and adapted per pose, and infeasible poses are
+    detected through a certificate of infeasibility rather than by running
+    out of iterations.
+
+    With `warm_start`, every evaluation starts from the solution of the
+    previous one. Consecutive samples of a trajectory mostly share their set
+    of active force limits, in which case the solution is found by a single
+    solve without any ADMM iterations.
+    """
+
+    force_reference: Optional[Vector]
+    rho: Num
+    maximum_iterations: int
+    tolerance: Num
+    warm_start: bool
+    _previous: Optional[Tuple[Matrix, Matrix]]
+
+    def __init__(self,
+                 kinematics: _kinematics.Algorithm,
+                 force_minimum: Union[Num, Vector],
+                 force_maximum: Union[Num, Vector],
+                 force_reference: Optional[Union[Num, Vector]] = None,
+                 rho: Num = 1.0,
+                 max_iterations: int = 2000,
+                 tolerance: Num = 1e-6,
+                 warm_start: bool = True,
+                 **kwargs):
+        super().__init__(kinematics=kinematics,
+                         force_minimum=force_minimum,
+                         force_maximum=force_maximum,
+                         **kwargs)
+        self.force_reference = force_reference
+        self.rho = rho
+        self.maximum_iterations = max_iterations
+        self.tolerance = tolerance
+        self.warm_start = warm_start
+        self._previous = None
+
+    def reset(self):
+        """
+        Forget the previous solution used for warm starts
+        """
+        self._previous = None
+
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix],
+                       wrenches: Matrix,
+                       structure_matrices: Optional[Matrix] = None,
+                       chunk_size: int = 2 ** 14,
+                       initial: Optional[Matrix] = None,
+                       **kwargs) -> Tuple[Matrix, Vector]:
+        """
+        Evaluate the force distributions of many poses at once
+
+        Parameters
+        ----------
+        initial : Matrix
+            Optional `(K, M)` array of forces to start from. Defaults to
+            the previous solution if `warm_start` is enabled and it has the
+            same shape.
+
+        See Also
+        --------
+        force_distribution.Algorithm.evaluate_batch
+        """
+        if initial is None:
+            return super().evaluate_batch(robot,
+                                          positions,
+                                          dcms,
+                                          wrenches,
+                                          structure_matrices,
+                                          chunk_size,
+                                          **kwargs)
+
+        # split initial forces into the same chunks as the poses
+        num_poses = _np.shape(positions)[0]
+        initial = _np.broadcast_to(_np.asarray(initial, dtype=float),
+                                   (num_poses, robot.num_kinematic_chains))
+        wrenches = _np.asarray(wrenches, dtype=float)
+        chunk_size = max(int(chunk_size), 1)
+        forces = []
+        feasible = []
+        for start in range(0, num_poses, chunk_size):
+            index = slice(start, min(start + chunk_size, num_poses))
+            chunk = super().evaluate_batch(
+                    robot,
+                    positions[index],
+                    dcms[index] if dcms is not None else None,
+                    wrenches[index] if wrenches.ndim == 2 else wrenches,
+                    structure_matrices[index]
+                    if structure_matrices is not None else None,
+                    chunk_size,
+                    initial=initial[index],
+                    **kwargs)
+            forces.append(chunk[0])
+            feasible.append(chunk[1])
+
+        return _np.concatenate(forces), _np.concatenate(feasible)
+
+    def _evaluate(self,
+                  robot: _robot.Robot,
+                  pose: _pose.Pose,
+                  structure_matrix: Matrix,
+                  wrench: Vector,
+                  force_min: Vector,
+                  force_max: Vector,
+                  **kwargs):
+        forces, feasible = self._evaluate_batch(
+                robot,
+                _np.asarray(structure_matrix, dtype=float)[None, :, :],
+                _np.asarray(wrench, dtype=float)[None, :],
+                force_min,
+                force_max,
+                **kwargs)
+
+        if not feasible[0]:
+            raise ArithmeticError(
+                    'Could not find a valid force distribution within the '
+                    'force limits.')
+
+        return _algorithm.Result(self, pose, forces[0, :], wrench)
+
+    def _evaluate_batch(self,
+                        robot: _robot.Robot,
+                        structure_matrices: Matrix,
+                        wrenches: Matrix,
+                        force_min: Vector,
+                        force_max: Vector,
+                        initial: Optional[Matrix] = None,
+                        **kwargs):
+        num_poses, num_dof, num_cables = structure_matrices.shape
+        force_min = _np.asarray(force_min, dtype=float)
+        force_max = _np.asarray(force_max, dtype=float)
+        reference = _np.broadcast_to(
+                _np.asarray(self.force_reference
+                            if self.force_reference is not None else 0.0,
+                            dtype=float),
+                (num_cables,))
+
+        # start from the given or from the previous solution
+        duals = None
+        if initial is None and self.warm_start and self._previous is not None \
+                and self._previous[0].shape == (num_poses, num_cables):
+            initial, duals = self._previous
+        if initial is not None:
+            initial = _np.broadcast_to(_np.asarray(initial, dtype=float),
+                                       (num_poses, num_cables))
+
+        forces = _np.full((num_poses, num_cables), _np.nan)
+        feasible = _np.zeros(num_poses, dtype=bool)
+        remaining = _np.arange(num_poses)
+
+        # the previous active set is often still optimal, in which case a
+        # single solve yields the exact solution
+        if initial is not None:
+            lower, upper = self._active_set(initial, force_min, force_max)
+            solution, optimal = self._polish(structure_matrices,
+                                             wrenches,
+                                             reference,
+                                             force_min,
+                                             force_max,
+                                             lower,
+                                             upper)
+            forces[optimal] = solution[optimal]
+            feasible[optimal] = True
+            remaining = _np.flatnonzero(~optimal)
+
+        if remaining.size:
+            solution, converged, admm_duals = self._admm(
+                    structure_matrices[remaining],
+                    wrenches[remaining],
+                    reference,
+                    force_min,
+                    force_max,
+                    initial[remaining] if initial is not None else None,
+                    duals[remaining] if duals is not None else None)
+
+            # polish the approximate solutions, which yields the exact
+            # solution even for poses not converged if their active set is
+            # already correct
+            lower, upper = self._active_set(solution, force_min, force_max)
+            polished, optimal = self._polish(structure_matrices[remaining],
+                                             wrenches[remaining],
+                                             reference,
+                                             force_min,
+                                             force_max,
+                                             lower,
+                                             upper)
+            solution = _np.where(optimal[:, None], polished, solution)
+            converged |= optimal
+            forces[remaining[converged]] = solution[converged]
+            feasible[remaining[converged]] = True
+        else:
+            admm_duals = None
+
+        # remember the solution for warm-starting the next evaluation
+        if self.warm_start:
+            previous_duals = _np.zeros((num_poses, num_cables))
+            if admm_duals is not None:
+                previous_duals[remaining] = admm_duals
+            self._previous = (_np.where(feasible[:, None],
+                                        forces,
+                                        _np.clip(reference,
+                                                 force_min,
+                                                 force_max)),
+                              previous_duals)
+
+        return forces, feasible
+
+    def _admm(self,
+              structure_matrices: Matrix,
+              wrenches: Matrix,
+              reference: Vector,
+              force_min: Vector,
+              force_max: Vector,
+              initial: Optional[Matrix] = None,
+              duals: Optional[Matrix] = None):
+        """
+        ADMM iterations on the splitting `x = z` with `x` on the affine set
+        `A x = -w` and `z` inside the box of force limits.
+
+        Every few iterations, the active sets of the iterates are polished
+        and poses whose polished solution is optimal are done. Poses proven
+        to be infeasible are done, too.
+
+        Returns
+        -------
+        forces : Matrix
+            `(K, M)` array of iterates `z` inside the force limits, or of the
+            optimal solution for converged poses.
+        converged : Vector
+            `(K,)` boolean array of poses whose residuals are below the
+            tolerance or whose polished solution is optimal.
+        duals : Matrix
+            `(K, M)` array of dual variables of the force limits.
+        """
+        num_poses, num_dof, num_cables = structure_matrices.shape
+
+        # factorization of the projection onto the affine set, reused over
+        # all iterations: `x - P (A x + w)` with `P = A^T (A A^T)^-1`
+        gram = _np.matmul(structure_matrices,
+                          structure_matrices.transpose((0, 2, 1)))
+        try:
+            projection = _np.matmul(structure_matrices.transpose((0, 2, 1)),
+                                    _np.linalg.inv(gram))
+        except _np.linalg.LinAlgError:
+            projection = _np.linalg.pinv(structure_matrices)
+
+        z = _np.clip(initial if initial is not None else
+                     _np.broadcast_to(reference, (num_poses, num_cables)),
+                     force_min,
+                     force_max).copy()
+        # penalty parameter per pose, which the projection does not depend
+        # on so it can be adapted without refactoring
+        rho = _np.full((num_poses, 1), float(self.rho))
+        # scaled dual variables
+        u = duals / rho if duals is not None else _np.zeros_like(z)
+
+        converged = _np.zeros(num_poses, dtype=bool)
+        active = _np.arange(num_poses)
+        for iteration in range(self.maximum_iterations):
+            matrices = structure_matrices[active]
+            z_active = z[active]
+            u_active = u[active]
+            rho_active = rho[active]
+
+            # projection onto the affine set
+            x = (reference + rho_active * (z_active - u_active)) \
+                / (1.0 + rho_active)
+            x -= _np.einsum('kij,kj->ki',
+                            projection[active],
+                            _np.einsum('kij,kj->ki', matrices, x)
+                            + wrenches[active])
+
+            # projection onto the box
+            z_new = _np.clip(x + u_active, force_min, force_max)
+            u[active] = u_active + x - z_new
+            z[active] = z_new
+
+            # primal and dual residuals relative to the forces' magnitude
+            scale = _np.maximum(_np.abs(x).max(axis=1),
+                                _np.abs(z_new).max(axis=1))
+            threshold = self.tolerance * _np.maximum(scale, 1.0)
+            primal = _np.abs(x - z_new).max(axis=1)
+            dual = rho_active[:, 0] * _np.abs(z_new - z_active).max(axis=1)
+            done = (primal <= threshold) & (dual <= threshold)
+
+            if iteration % 10 == 9:
+                # the active set is usually found long before the residuals
+                # are small
+                lower, upper = self._active_set(z_new, force_min, force_max)
+                polished, optimal = self._polish(matrices,
+                                                 wrenches[active],
+                                                 reference,
+                                                 force_min,
+                                                 force_max,
+                                                 lower,
+                                                 upper)
+                z[active[optimal]] = polished[optimal]
+                done |= optimal
+
+                # on infeasible poses, `x - z` converges to the shortest
+                # vector between affine set and box, so it separates both
+                # and proves infeasibility without running all iterations
+                infeasible = self._separates(matrices,
+                                             wrenches[active],
+                                             projection[active],
+                                             x - z_new,
+                                             force_min,
+                                             force_max)
+                converged[active[done]] = True
+                done |= infeasible
+
+                # balance primal and dual residuals, rescaling the scaled
+                # duals such that the unscaled ones remain unchanged
+                factor = _np.sqrt(_np.maximum(primal, 1e-300)
+                                  / _np.maximum(dual, 1e-300))
+                factor = _np.clip(factor, 1e-3, 1e3)
+                adapt = ((factor > 5.0) | (factor < 0.2))[:, None]
+                factor = _np.where(adapt, factor[:, None], 1.0)
+                factor = _np.clip(rho_active * factor, 1e-6, 1e6) \
+                         / rho_active
+                rho[active] = rho_active * factor
+                u[active] = u[active] / factor
+            else:
+                converged[active[done]] = True
+
+            active = active[~done]
+            if not active.size:
+                break
+
+        return z, converged, rho * u
+
+    @staticmethod
+    def _separates(structure_matrices: Matrix,
+                   wrenches: Matrix,
+                   projection: Matrix,
+                   directions: Matrix,
+                   force_min: Vector,
+                   force_max: Vector):
+        """
+        Check for certificates of infeasibility
+
+        Every `lambda` with `c = A^T lambda` for which `c^T f` over the box
+        of force limits does not contain `-lambda^T w` proves `A f = -w` to
+        have no solution inside the force limits (Farkas' lemma). `lambda` is
+        chosen such that `c` is the projection of `directions` onto the row
+        space of `A`.
+
+        Returns
+        -------
+        infeasible : Vector
+            `(K,)` boolean array of poses proven to be infeasible.
+        """
+        multipliers = _np.einsum('kji,kj->ki', projection, directions)
+        normals = _np.einsum('kij,ki->kj', structure_matrices, multipliers)
+        offsets = -_np.einsum('ki,ki->k', multipliers, wrenches)
+
+        # range of `c^T f` over the box, ignoring zero components which
+        # would otherwise yield `0 * inf`
+        with _np.errstate(invalid='ignore'):
+            low = _np.where(normals > 0, normals * force_min,
+                            _np.where(normals < 0, normals * force_max, 0.0))
+            high = _np.where(normals > 0, normals * force_max,
+                             _np.where(normals < 0, normals * force_min, 0.0))
+        low = low.sum(axis=1)
+        high = high.sum(axis=1)
+
+        with _np.errstate(invalid='ignore'):
+            margin = 1e-9 * _np.maximum(_np.abs(offsets),
+                                        _np.maximum(_np.abs(low),
+                                                    _np.abs(high)))
+
+        return (offsets < low - margin) | (offsets > high + margin)
+
+    @staticmethod
+    def _active_set(forces: Matrix, force_min: Vector, force_max: Vector):
+        margin = 1e-6 * _np.maximum(force_max - force_min, 1.0)
+        margin = _np.where(_np.isfinite(margin), margin, 1e-6)
+
+        return forces <= force_min + margin, forces >= force_max - margin
+
+    @staticmethod
+    def _polish(structure_matrices: Matrix,
+                wrenches: Matrix,
+                reference: Vector,
+                force_min: Vector,
+                force_max: Vector,
+                lower: Matrix,
+                upper: Matrix):
+        """
+        Exact solution for given sets of active force limits
+
+        Returns
+        -------
+        forces : Matrix
+            `(K, M)` array of forces.
+        optimal : Vector
+            `(K,)` boolean array of poses for which the forces satisfy the
+            KKT conditions i.e., are the optimal solution.
+        """
+        num_poses, num_dof, num_cables = structure_matrices.shape
+        lower = lower & ~upper
+        free = ~(lower | upper)
+
+        # fix active forces at their limits
+        fixed = _np.where(lower, force_min, _np.where(upper, force_max, 0.0))
+        matrices = structure_matrices * free[:, None, :]
+        rhs = -wrenches - _np.einsum('kij,kj->ki', structure_matrices, fixed)
+
+        # free forces `f = r - A^T nu` with `A A^T nu = A r - b`
+        gram = _np.matmul(matrices, matrices.transpose((0, 2, 1)))
+        residual = _np.einsum('kij,j->ki', matrices, reference) - rhs
+        # keep singular systems (fewer free forces than degrees of freedom)
+        # solvable and reject them through the equality check below
+        singular = _np.abs(_np.linalg.det(gram)) <= 1e-12 * _np.maximum(
+                _np.trace(gram, axis1=1, axis2=2), 1e-300) ** num_dof
+        gram[singular] += _np.eye(num_dof)
+        nu = _np.linalg.solve(gram, residual[:, :, None])[:, :, 0]
+        forces = _np.where(free,
+                           reference - _np.einsum('kij,ki->kj', matrices, nu),
+                           fixed)
+
+        # KKT conditions of the box constraints
+        gradient = forces - reference \
+                   + _np.einsum('kij,ki->kj', structure_matrices, nu)
+        scale = _np.maximum(_np.abs(forces).max(axis=1), 1.0)[:, None]
+        tolerance = 1e-8 * scale
+        optimal = ~singular \
+                  & _np.all(~free | ((forces >= force_min - tolerance)
+                                     & (forces <= force_max + tolerance)),
+                            axis=1) \
+                  & _np.all(~lower | (gradient >= -tolerance), axis=1) \
+                  & _np.all(~upper | (gradient <= tolerance), axis=1) \
+                  & _np.all(_np.abs(
+                _np.einsum('kij,kj->ki', structure_matrices, forces)
+                + wrenches) <= tolerance, axis=1)
+
+        return _np.clip(forces, force_min, force_max), optimal
@@ -0,0 +1,551 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Redundancy',
+]
+
+import math
+from abc import abstractmethod
+from typing import List, Optional, Tuple
+
+import numpy as _np
+
+from cdpyr.analysis.force_distribution import force_distribution as _algorithm
+from cdpyr.analysis.structure_matrix import structure_matrix as \
+    _structure_matrix
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Vector
+
+# largest bound of the condition number of Gram matrices solved directly,
+# which loses at most six digits of the structure matrix's precision
+_CONDITION = 1e6
+
+
+class Redundancy(_algorithm.Algorithm):
+    """
+    Base class of geometric force distributions for robots with a degree of
+    redundancy `r = m - n` of one or two.
+
+    All solutions of `A f = -w` are `f = f_p + H l` with the particular
+    solution `f_p` and the orthonormal kernel `H` of the structure matrix, so
+    the force limits confine `l` to an interval (`r = 1`) or a convex polygon
+    (`r = 2`). Its edges are found analytically without any iteration and
+    for many poses at once, or for a single pose by clipping on plain floats,
+    from which subclasses pick one point.
+    """
+
+    def _evaluate(self,
+                  robot: _robot.Robot,
+                  pose: _pose.Pose,
+                  structure_matrix: Matrix,
+                  wrench: Vector,
+                  force_min: Vector,
+                  force_max: Vector,
+                  decomposition: Optional[_structure_matrix.Result] = None,
+                  **kwargs):
+        structure_matrix = _np.asarray(structure_matrix, dtype=float)
+        wrench = _np.asarray(wrench, dtype=float)
+        self._check_redundancy(structure_matrix.shape)
+
+        particular, kernel, regular = self._decompose_one(structure_matrix,
+                                                          wrench,
+                                                          decomposition)
+        forces = self._solve_one(particular, kernel, force_min, force_max) \
+            if regular \
+            else None
+
+        if forces is None:
+            raise ArithmeticError(
+                    'Could not find a valid force distribution within the '
+                    'force limits.')
+
+        return _algorithm.Result(self, pose, forces, wrench)
+
+    def _evaluate_batch(self,
+                        robot: _robot.Robot,
+                        structure_matrices: Matrix,
+                        wrenches: Matrix,
+                        force_min: Vector,
+                        force_max: Vector,
+                        **kwargs):
+        self._check_redundancy(structure_matrices.shape[1:])
+        particular, kernel, regular = self._decompose(structure_matrices,
+                                                      wrenches)
+
+        return self._solve(particular, kernel, regular, force_min, force_max)
+
+    def _check_redundancy(self, shape: Tuple[int, int]):
+        num_redundancy = shape[1] - shape[0]
+        if num_redundancy not in (0, 1, 2):
+            raise NotImplementedError(
+                    f'{self.__class__.__name__} is only implemented for a '
+                    f'redundancy of at most 2, but the robot has a redundancy '
+                    f'of {num_redundancy}.')
+
+    def _solve(self,
+               particular: Matrix,
+               kernel: Matrix,
+               regular: Vector,
+               force_min: Vector,
+               force_max: Vector):
+        num_poses, num_cables, num_redundancy = kernel.shape
+        force_min = _np.asarray(force_min, dtype=float)
+        force_max = _np.asarray(force_max, dtype=float)
+        # tolerance of the force limits
+        tolerance = 1e-9 * _np.maximum(_np.maximum(_np.abs(force_min),
+                                                   _np.abs(force_max)),
+                                       1.0)
+
+        # redundancy zero has exactly one solution to check
+        if num_redundancy == 0:
+            forces = particular
+            feasible = regular & _np.all(
+                    (forces >= force_min - tolerance)
+                    & (forces <= force_max + tolerance), axis=1)
+        else:
+            starts, ends, valid = self._edges(particular,
+                                              kernel,
+                                              force_min,
+                                              force_max,
+                                              tolerance)
+            feasible = regular & valid.any(axis=1)
+
+            coordinates = _np.zeros((num_poses, num_redundancy))
+            if feasible.any():
+                coordinates[feasible] = self._select(particular[feasible],
+                                                     kernel[feasible],
+                                                     starts[feasible],
+                                                     ends[feasible],
+                                                     valid[feasible],
+                                                     force_min,
+                                                     force_max,
+                                                     tolerance)
+            forces = particular + _np.einsum('kij,kj->ki',
+                                             kernel,
+                                             coordinates)
+
+        forces = _np.where(feasible[:, None],
+                           _np.clip(forces, force_min, force_max),
+                           _np.nan)
+
+        return forces, feasible
+
+    def _solve_one(self,
+                   particular: Vector,
+                   kernel: Matrix,
+                   force_min: Vector,
+                   force_max: Vector) -> Optional[Vector]:
+        """
+        Force distribution of a single pose
+
+        Like `_solve` for one pose, but on plain floats, which for a single
+        pose is much cheaper than the vectorized edges of `_edges`.
+
+        Returns
+        -------
+        forces : Vector
+            `(M,)` array of forces or `None` if there is no valid force
+            distribution.
+        """
+        num_redundancy = kernel.shape[1]
+        force_min = _np.asarray(force_min, dtype=float)
+        force_max = _np.asarray(force_max, dtype=float)
+        # bounds of `H l` with the tolerance of the force limits
+        lower, upper = [], []
+        for low, up, value in zip(force_min.tolist(),
+                                  force_max.tolist(),
+                                  particular.tolist()):
+            tolerance = 1e-9 * max(abs(low), abs(up), 1.0)
+            lower.append(low - tolerance - value)
+            upper.append(up + tolerance - value)
+
+        if num_redundancy == 0:
+            if not all(low <= 0.0 <= up for low, up in zip(lower, upper)):
+                return None
+            return _np.minimum(_np.maximum(particular, force_min), force_max)
+
+        coordinates = self._select_one(particular,
+                                       kernel,
+                                       lower,
+                                       upper,
+                                       force_min,
+                                       force_max)
+        if coordinates is None:
+            return None
+
+        # `numpy.clip` costs more than the rest of a single pose
+        return _np.minimum(
+                _np.maximum(particular + kernel.dot(coordinates), force_min),
+                force_max)
+
+    @abstractmethod
+    def _select_one(self,
+                    particular: Vector,
+                    kernel: Matrix,
+                    lower: List[float],
+                    upper: List[float],
+                    force_min: Vector,
+                    force_max: Vector) -> Optional[Tuple[float, ...]]:
+        """
+        Select the solution of a single pose from its set of valid solutions
+
+        Parameters
+        ----------
+        particular : Vector
+            `(M,)` array of the particular solution.
+        kernel : Matrix
+            `(M, R)` array of the orthonormal kernel.
+        lower : List[float]
+            Lower bounds of `H l` i.e., the minimum forces less the particular
+            solution and the tolerance.
+        upper : List[float]
+            Upper bounds of `H l` i.e., the maximum forces less the particular
+            solution plus the tolerance.
+        force_min : Vector
+            `(M,)` array of minimum forces.
+        force_max : Vector
+            `(M,)` array of maximum forces.
+
+        Returns
+        -------
+        coordinates : Tuple[float, ...]
+            Kernel coordinates of the solution or `None` if there is no valid
+            solution.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _vertices(kernel: Matrix,
+                  lower: List[float],
+                  upper: List[float]) -> List[Tuple[float, ...]]:
+        """
+        Vertices of the set of valid kernel coordinates of a single pose
+
+        Returns
+        -------
+        vertices : List[Tuple[float, ...]]
+            Lower and upper bound of the interval for `R = 1` or the vertices
+            of the polygon counterclockwise for `R = 2`, empty if there is no
+            valid solution.
+        """
+        if kernel.shape[1] == 1:
+            return _interval(kernel[:, 0].tolist(), lower, upper)
+
+        return _polygon(kernel.tolist(), lower, upper)
+
+    @abstractmethod
+    def _select(self,
+                particular: Matrix,
+                kernel: Matrix,
+                starts: Matrix,
+                ends: Matrix,
+                valid: Matrix,
+                force_min: Vector,
+                force_max: Vector,
+                tolerance: Vector) -> Matrix:
+        """
+        Select the solution of every pose from its set of valid solutions
+
+        Parameters
+        ----------
+        particular : Matrix
+            `(K, M)` array of particular solutions.
+        kernel : Matrix
+            `(K, M, R)` array of orthonormal kernels.
+        starts, ends : Matrix
+            `(K, E, R)` arrays of start and end points of the edges of the
+            sets of valid kernel coordinates as returned by `_edges`.
+        valid : Matrix
+            `(K, E)` boolean array of nonempty edges.
+        force_min : Vector
+            `(M,)` array of minimum forces.
+        force_max : Vector
+            `(M,)` array of maximum forces.
+        tolerance : Vector
+            `(M,)` array of tolerances of the force limits.
+
+        Returns
+        -------
+        coordinates : Matrix
+            `(K, R)` array of kernel coordinates of the solutions.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _decompose_one(
+            structure_matrix: Matrix,
+            wrench: Vector,
+            decomposition: Optional[_structure_matrix.Result] = None) \
+            -> Tuple[Vector, Matrix, bool]:
+        """
+        Particular solution and kernel of a single structure matrix
+
+        Same as `_decompose` on plain two-dimensional arrays, which saves the
+        overhead of the batched operations for a single pose, and which
+        reuses the SVD of the given decomposition if the structure matrix is
+        ill-conditioned.
+
+        Returns
+        -------
+        particular : Vector
+            `(M,)` array of the minimum-norm solution of `A f = -w`.
+        kernel : Matrix
+            `(M, M - N)` array of the orthonormal kernel.
+        regular : bool
+            `True` if the structure matrix has full rank.
+        """
+        num_dof, num_cables = structure_matrix.shape
+
+        # `S = (A A^T)^-1 A` gives `tr((A A^T)^-1) = |S|^2` as `S S^T` is the
+        # inverse, and `tr(A A^T) = |A|^2`
+        try:
+            solution = _np.linalg.solve(structure_matrix.dot(structure_matrix.T),
+                                        structure_matrix)
+        except _np.linalg.LinAlgError:
+            conditioned = False
+        else:
+            conditioned = (solution * solution).sum() \
+                          * (structure_matrix * structure_matrix).sum() \
+                          < _CONDITION
+
+        if not conditioned:
+            if decomposition is not None:
+                kernel, pinv, rank = decomposition.kernel, \
+                                     decomposition.pinv, \
+                                     decomposition.rank
+            else:
+                kernels, pinvs, ranks = _structure_matrix.decompose(
+                        structure_matrix[None, :, :],
+                        return_rank=True)
+                kernel, pinv, rank = kernels[0], pinvs[0], ranks[0]
+            # kernels of rank-deficient matrices are larger and unused
+            return -pinv.dot(wrench), \
+                   kernel[:, 0:num_cables - num_dof], \
+                   rank == num_dof
+
+        # pivoted Gram-Schmidt of the projector's columns as in `_decompose`
+        # but on plain floats, deflating only the columns it picks
+        projector = (-structure_matrix.T.dot(solution)).tolist()
+        diagonal = [1.0 + projector[i][i] for i in range(num_cables)]
+        bases = []
+        for _ in range(num_cables - num_dof):
+            pivot = max(range(num_cables), key=diagonal.__getitem__)
+            column = projector[pivot]
+            for other in bases:
+                column = [value - other[pivot] * previous
+                          for value, previous in zip(column, other)]
+            scale = 1.0 / math.sqrt(diagonal[pivot])
+            basis = [scale * value for value in column]
+            basis[pivot] += scale
+            bases.append(basis)
+            diagonal = [value - entry * entry
+                        for value, entry in zip(diagonal, basis)]
+        kernel = _np.array(bases).T
+
+        return -solution.T.dot(wrench), kernel, True
+
+    @staticmethod
+    def _decompose(structure_matrices: Matrix, wrenches: Matrix) \
+            -> Tuple[Matrix, Matrix, Vector]:
+        """
+        Particular solutions and kernels of the structure matrices
+
+        Well-conditioned structure matrices are solved through the inverse of
+        their Gram matrix `A A^T`, whose projector `I - A^T (A A^T)^-1 A`
+        onto the kernel yields an orthonormal kernel by pivoted Gram-Schmidt
+        of its columns. All other structure matrices are decomposed by their
+        SVD through `structure_matrix.decompose`, so they agree with
+        `structure_matrix.Result` on the rank of every matrix.
+
+        Returns
+        -------
+        particular : Matrix
+            `(K, M)` array of minimum-norm solutions of `A f = -w`.
+        kernel : Matrix
+            `(K, M, M - N)` array of orthonormal kernels.
+        regular : Vector
+            `(K,)` boolean array of poses with full-rank structure matrices.
+        """
+        num_poses, num_dof, num_cables = structure_matrices.shape
+        wrenches = _np.broadcast_to(wrenches, (num_poses, num_dof))
+        transposed = structure_matrices.transpose((0, 2, 1))
+        gram = _np.matmul(structure_matrices, transposed)
+
+        # the traces bound the condition number of the Gram matrix by
+        # `tr(G) tr(G^-1)`, so only those far from the rank tolerance are
+        # solved through it
+        try:
+            inverse = _np.linalg.inv(gram)
+        except _np.linalg.LinAlgError:
+            conditioned = _np.zeros(num_poses, dtype=bool)
+        else:
+            traces = _np.einsum('kii->k', inverse)
+            conditioned = (traces > 0.0) \
+                          & (traces * _np.einsum('kii->k', gram)
+                             < _CONDITION)
+
+        num_redundancy = num_cables - num_dof
+        particular = _np.empty((num_poses, num_cables))
+        kernel = _np.empty((num_poses, num_cables, num_redundancy))
+        regular = conditioned.copy()
+
+        if conditioned.any():
+            solution = _np.matmul(inverse[conditioned],
+                                  structure_matrices[conditioned])
+            particular[conditioned] = -_np.einsum('kji,kj->ki',
+                                                  solution,
+                                                  wrenches[conditioned])
+            projector = -_np.matmul(transposed[conditioned], solution)
+            projector += _np.eye(num_cables)
+            # every column of the projector lies in the kernel, the one of
+            # largest norm is the best conditioned to extend the basis with
+            for column in range(num_redundancy):
+                diagonal = _np.einsum('kii->ki', projector)
+                pivot = _np.argmax(diagonal, axis=1)[:, None]
+                basis = _np.take_along_axis(projector,
+                                            pivot[:, None, :],
+                                            axis=2)[:, :, 0] \
+                        / _np.sqrt(_np.take_along_axis(diagonal, pivot, 1))
+                kernel[conditioned, :, column] = basis
+                projector -= basis[:, :, None] * basis[:, None, :]
+
+        ill = ~conditioned
+        if ill.any():
+            kernels, pinvs, ranks = _structure_matrix.decompose(
+                    structure_matrices[ill],
+                    return_rank=True)
+            particular[ill] = -_np.einsum('kij,kj->ki', pinvs, wrenches[ill])
+            regular[ill] = ranks == num_dof
+            # kernels of rank-deficient matrices are larger and unused
+            kernel[ill] = kernels[:, :, 0:num_redundancy]
+
+        return particular, kernel, regular
+
+    @staticmethod
+    def _edges(particular: Matrix,
+               kernel: Matrix,
+               force_min: Vector,
+               force_max: Vector,
+               tolerance: Vector) -> Tuple[Matrix, Matrix, Matrix]:
+        """
+        Edges of the sets of kernel coordinates within the force limits
+
+        With the kernel coordinates `l`, the force limits are the half-spaces
+        `G l <= g` with `G = [H; -H]` and `g = [f_max - f_p; f_p - f_min]`.
+        For `R = 1`, their intersection is one interval. For `R = 2`, every
+        boundary line clipped by all other half-spaces is one edge of the
+        polygon, which requires no vertex enumeration and no sorting.
+
+        Returns
+        -------
+        starts, ends : Matrix
+            `(K, E, R)` arrays of start and end points of the edges, with
+            the edges of polygons running counterclockwise.
+        valid : Matrix
+            `(K, E)` boolean array of nonempty edges.
+        """
+        num_poses, num_cables, num_redundancy = kernel.shape
+
+        normals = _np.concatenate((kernel, -kernel), axis=1)
+        # offsets relaxed by the tolerance of the force limits
+        tolerance = _np.concatenate((tolerance, tolerance))
+        offsets = _np.concatenate((force_max - particular,
+                                   particular - force_min), axis=1) \
+                  + tolerance
+
+        # the interval follows from all limits at once
+        if num_redundancy == 1:
+            normals = normals[:, :, 0]
+            parallel = _np.abs(normals) <= 1e-12
+            with _np.errstate(divide='ignore', invalid='ignore'):
+                bounds = offsets / normals
+            starts = _np.where(normals < 0, bounds, -_np.inf)
+            starts[parallel] = -_np.inf
+            ends = _np.where(normals > 0, bounds, _np.inf)
+            ends[parallel] = _np.inf
+            starts = starts.max(axis=1)[:, None, None]
+            ends = ends.min(axis=1)[:, None, None]
+            valid = _np.all(~parallel | (offsets >= 0.0), axis=1)[:, None] \
+                    & (starts[:, :, 0] <= ends[:, :, 0])
+
+            return starts, ends, valid
+
+        # points of the boundary lines closest to the origin and directions
+        # running counterclockwise as the normals point outward
+        norms = _np.einsum('kir,kir->ki', normals, normals)
+        degenerate = norms <= 1e-24
+        norms[degenerate] = 1.0
+        points = normals * (offsets / norms)[:, :, None]
+        directions = _np.stack((-normals[:, :, 1], normals[:, :, 0]), axis=2)
+
+        # clip line `i` at every half-space `j`
+        rates = _np.matmul(directions, normals.transpose((0, 2, 1)))
+        slack = offsets[:, None, :] \
+                - _np.matmul(points, normals.transpose((0, 2, 1)))
+        parallel = _np.abs(rates) <= 1e-12
+        rates[parallel] = 1.0
+        bounds = slack / rates
+        low = _np.where((rates < 0) & ~parallel, bounds, -_np.inf).max(axis=2)
+        high = _np.where((rates > 0) & ~parallel, bounds, _np.inf).min(axis=2)
+        # every line is parallel to itself, so parallel half-spaces must
+        # only contain the line up to round-off
+        valid = ~degenerate & (low <= high) \
+                & _np.all(~parallel | (slack >= -tolerance), axis=2)
+
+        low = _np.where(valid, low, 0.0)[:, :, None]
+        high = _np.where(valid, high, 0.0)[:, :, None]
+
+        return points + low * directions, points + high * directions, valid
+
+
+def _interval(kernel: List[float], lower: List[float], upper: List[float]):
+    # bounds of `l` with `lower <= h l <= upper` for every cable
+    start, end = -_np.inf, _np.inf
+    for h, low, up in zip(kernel, lower, upper):
+        if abs(h) <= 1e-12:
+            if low > 0.0 or up < 0.0:
+                return []
+        elif h > 0.0:
+            start, end = max(start, low / h), min(end, up / h)
+        else:
+            start, end = max(start, up / h), min(end, low / h)
+
+    return [(start,), (end,)] if start <= end else []
+
+
+def _polygon(kernel: List[List[float]],
+             lower: List[float],
+             upper: List[float]):
+    # clip the box enclosing all solutions, as the orthonormal kernel gives
+    # `l = H^T (f - f_p)`, at the half-planes `h l <= upper` and
+    # `-h l <= -lower` of every cable
+    x0 = y0 = x1 = y1 = 0.0
+    for (h0, h1), low, up in zip(kernel, lower, upper):
+        x0, x1 = x0 + min(h0 * low, h0 * up), x1 + max(h0 * low, h0 * up)
+        y0, y1 = y0 + min(h1 * low, h1 * up), y1 + max(h1 * low, h1 * up)
+    vertices = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+    for (h0, h1), low, up in zip(kernel, lower, upper):
+        for n0, n1, offset in ((h0, h1, up), (-h0, -h1, -low)):
+            slacks = [n0 * x + n1 * y - offset for x, y in vertices]
+            if max(slacks) <= 0.0:
+                continue
+            clipped = []
+            previous, slack_previous = vertices[-1], slacks[-1]
+            for vertex, slack in zip(vertices, slacks):
+                # add the crossing of the edge with the boundary line
+                if (slack <= 0.0) != (slack_previous <= 0.0):
+                    t = slack_previous / (slack_previous - slack)
+                    clipped.append(
+                            (previous[0] + t * (vertex[0] - previous[0]),
+                             previous[1] + t * (vertex[1] - previous[1])))
+                if slack <= 0.0:
+                    clipped.append(vertex)
+                previous, slack_previous = vertex, slack
+            vertices = clipped
+            if not vertices:
+                return []
+
+    return vertices
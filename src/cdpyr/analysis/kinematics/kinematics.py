@@ -8,14 +8,18 @@ __all__ = [
 ]
 
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Optional, Tuple, Union
 
 import numpy as _np
 from magic_repr import make_repr
 from scipy import optimize
 
 import cdpyr.numpy.linalg
-from cdpyr.analysis import result as _result
+from cdpyr.analysis import (
+    buffer as _buffer,
+    cache as _cache,
+    result as _result,
+)
 from cdpyr.kinematics.transformation import angular as _angular
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import robot as _robot
@@ -23,9 +27,16 @@ from cdpyr.typing import Matrix, Vector
 
 
 class Algorithm(ABC):
+    cache: Optional[_cache.Cache]
+    buffer: Optional[_buffer.Buffer]
 
-    def __init__(self, **kwargs):
+    def __init__(self,
+                 cache: Optional[_cache.Cache] = None,
+                 buffer: Optional[_buffer.Buffer] = None,
+                 **kwargs):
         self._forward_last_direction = None
+        self.cache = cache
+        self.buffer = buffer
 
     @abstractmethod
     def _vector_loop(self,
@@ -44,10 +55,27 @@ class Algorithm(ABC):
                     'Kinematics are currently not implemented for robots with '
                     'more than one platform.'
             )
+
+        # reuse results of equal poses if caching is enabled, which must not
+        # share arrays of the buffer
+        if self.cache is not None and not kwargs:
+            return self.cache.get(
+                    self.cache.key(robot, pose, self.__class__, 'backward'),
+                    lambda: self._backward(robot, pose))
+
+        return self._backward(robot, pose, buffer=self.buffer, **kwargs)
+
+    def _backward(self,
+                  robot: _robot.Robot,
+                  pose: _pose.Pose,
+                  buffer: Optional[_buffer.Buffer] = None,
+                  **kwargs) -> Result:
         # solve the vector loop and obtain solution
-        lengths, directions, leaves, swivel, *rem = self._vector_loop(robot,
-                                                                      pose,
-                                                                      **kwargs)
+        lengths, directions, leaves, swivel, *rem = self._vector_loop(
+                robot,
+                pose,
+                buffer=buffer,
+                **kwargs)
         try:
             wrap, *rem = rem
         except ValueError:
@@ -66,7 +94,170 @@ class Algorithm(ABC):
                       directions=directions,
                       leave_points=leaves,
                       swivel=swivel,
-                      wrap=wrap)
+                      wrap=wrap,
+                      buffer=buffer)
+
+    def backward_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Matrix,
+                       out: Optional[Tuple[Matrix, Matrix]] = None,
+                       joints: Optional[Matrix] = None,
+                       **kwargs) -> Tuple[Matrix, Matrix]:
+        """
+        Solve the inverse kinematics of many poses at once without creating
+        intermediate `Pose` and `Result` objects.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to solve the inverse kinematics for.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices.
+        out : Tuple[Matrix, Matrix]
+            Optional `(K, M)` and `(K, M, 3)` arrays to write the lengths and
+            the unstripped directions into. Taken from the buffer if not
+            given and the algorithm has one.
+        joints : Matrix
+            Optional `(K, M)` array to write the joint lengths into i.e.,
+            the workspace lengths plus the lengths wrapped onto pulleys.
+
+        Returns
+        -------
+        lengths : Matrix
+            `(K, M)` array of cable lengths in the workspace i.e.,
+            between cable leave point and platform anchor.
+        directions : Matrix
+            `(K, M, NL)` array of unit cable directions stripped to the
+            robot's number of linear degrees of freedom `NL`.
+        """
+        if robot.num_platforms > 1:
+            raise NotImplementedError(
+                    'Kinematics are currently not implemented for robots with '
+                    'more than one platform.'
+            )
+
+        positions = _np.asarray(positions, dtype=float)
+        dcms = _np.asarray(dcms, dtype=float)
+
+        if out is None and self.buffer is not None:
+            num_poses = positions.shape[0]
+            num_cables = robot.num_kinematic_chains
+            out = (self.buffer.array((self, 'lengths_batch'),
+                                     (num_poses, num_cables)),
+                   self.buffer.array((self, 'directions_batch'),
+                                     (num_poses, num_cables, 3)))
+
+        lengths, directions = self._vector_loop_batch(robot,
+                                                      positions,
+                                                      dcms,
+                                                      out=out,
+                                                      buffer=self.buffer,
+                                                      joints=joints,
+                                                      **kwargs)
+
+        # number of linear degrees of freedom
+        num_linear, _ = robot.num_dimensionality
+
+        return lengths, directions[:, :, 0:num_linear]
+
+    def segments_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Matrix,
+                       lengths: Optional[Matrix] = None,
+                       directions: Optional[Matrix] = None,
+                       **kwargs) -> Tuple[Matrix, Matrix]:
+        """
+        Straight cable segments in the workspace of many poses at once
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to solve the inverse kinematics for.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices.
+        lengths : Matrix
+            Optional `(K, M)` array of workspace cable lengths of an already
+            solved inverse kinematics. Must be given together with
+            `directions`.
+        directions : Matrix
+            Optional `(K, M, NL)` array of cable directions of an already
+            solved inverse kinematics.
+
+        Returns
+        -------
+        anchors : Matrix
+            `(K, M, 3)` array of platform anchors in world coordinates.
+        leaves : Matrix
+            `(K, M, 3)` array of cable leave points in world coordinates.
+        """
+        positions = _np.asarray(positions, dtype=float)
+        dcms = _np.asarray(dcms, dtype=float)
+
+        # workspace lengths and directions of all cables
+        if lengths is None or directions is None:
+            lengths, directions = self.backward_batch(robot,
+                                                      positions,
+                                                      dcms,
+                                                      **kwargs)
+        lengths = _np.asarray(lengths, dtype=float)
+        directions = _np.asarray(directions, dtype=float)
+
+        # pad directions of planar robots to spatial coordinates
+        num = directions.shape[2]
+        if num < 3:
+            directions = _np.pad(directions, ((0, 0), (0, 0), (0, 3 - num)))
+
+        # global platform anchors
+        platform_anchors = _np.asarray(
+                [robot.platforms[kc.platform].anchors[
+                     kc.platform_anchor].linear.position
+                 for kc in robot.kinematic_chains])
+        anchors = positions[:, None, :] \
+                  + _np.einsum('nij,mj->nmi', dcms, platform_anchors)
+
+        return anchors, anchors + lengths[:, :, None] * directions
+
+    def _vector_loop_batch(self,
+                           robot: _robot.Robot,
+                           positions: Matrix,
+                           dcms: Matrix,
+                           out: Optional[Tuple[Matrix, Matrix]] = None,
+                           buffer: Optional[_buffer.Buffer] = None,
+                           joints: Optional[Matrix] = None,
+                           **kwargs) -> Tuple[Matrix, Matrix]:
+        # fallback for algorithms without a vectorized vector loop
+        lengths = []
+        directions = []
+        for index, (position, dcm) in enumerate(zip(positions, dcms)):
+            length, direction, *_ = self._vector_loop(
+                    robot,
+                    _pose.Pose(position, dcm),
+                    **kwargs)
+            length = _np.asarray(length)
+            if joints is not None:
+                joints[index] = length if length.ndim == 1 \
+                    else length.sum(axis=1)
+            # only keep the workspace part of `[workspace, pulley]` lengths
+            lengths.append(length if length.ndim == 1 else length[:, 0])
+            directions.append(direction)
+
+        lengths = _np.asarray(lengths)
+        directions = _np.asarray(directions)
+        if out is None:
+            return lengths, directions
+
+        # directions may lack spatial dimensions of planar robots
+        out[0][...] = lengths
+        out[1][...] = 0.0
+        out[1][:, :, 0:directions.shape[2]] = directions
+
+        return out
 
     def forward(self,
                 robot: _robot.Robot,
@@ -104,7 +295,7 @@ class Algorithm(ABC):
             initial_estimate = self._pose_estimate(robot, joints)
 
         # a pose estimate
-        x_pose = _pose.ZeroPose
+        x_pose = _pose.Pose()
 
         # extract forward kinematics goal function from the kwargs, or default
         # to our own implementation
@@ -152,6 +343,115 @@ class Algorithm(ABC):
                           directions=last_direction,
                           leave_points=frame_anchors)
 
+    def forward_batch(self,
+                      robot: _robot.Robot,
+                      joints: Matrix,
+                      x0: Optional[Vector] = None,
+                      warm_start: bool = True,
+                      **kwargs) -> Tuple[Matrix, Matrix, Vector]:
+        """
+        Solve the forward kinematics of many samples of joint lengths at once
+        e.g., of a recording
+
+        Unlike `forward`, no `Pose` or `Result` objects are created and the
+        goal function writes into arrays allocated once. With `warm_start`,
+        every sample starts from the solution of the previous one, which
+        converges in few iterations for joint lengths changing continuously
+        over time. Samples without a solution, or with `NaN` joint lengths,
+        are `NaN` in all returned arrays and do not affect the start of the
+        next sample.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to solve the forward kinematics for.
+        joints : Matrix
+            `(K, M)` array of joint lengths i.e., workspace lengths plus
+            lengths wrapped onto pulleys.
+        x0 : Vector
+            Optional `(6,)` initial estimate of position and `xyz` Euler
+            angles of the first sample. Defaults to the estimate from the
+            joint lengths.
+        warm_start : bool
+            Whether to start every sample from the previous solution rather
+            than from `x0` or the estimate from its joint lengths.
+        kwargs
+            Additional keyword arguments to `scipy.optimize.least_squares`.
+
+        Returns
+        -------
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices.
+        residuals : Vector
+            `(K,)` array of root mean square joint length errors of the
+            solutions.
+        """
+        if robot.num_platforms > 1:
+            raise NotImplementedError(
+                    'Kinematics are currently not implemented for robots with '
+                    'more than one platform.'
+            )
+
+        joints = _np.atleast_2d(_np.asarray(joints, dtype=float))
+        num_samples, num_cables = joints.shape
+
+        positions = _np.full((num_samples, 3), _np.nan)
+        dcms = _np.full((num_samples, 3, 3), _np.nan)
+        residuals = _np.full((num_samples,), _np.nan)
+
+        # arrays of the one pose the goal function evaluates
+        position = _np.zeros((1, 3))
+        dcm = _np.eye(3)[None, :, :].copy()
+        lengths = _np.zeros((1, num_cables))
+        directions = _np.zeros((1, num_cables, 3))
+        estimates = _np.zeros((1, num_cables))
+
+        def goal_function(x: Vector, target: Vector):
+            position[0] = x[0:3]
+            _euler_dcm(x[3:6], dcm[0])
+            self.backward_batch(robot,
+                                position,
+                                dcm,
+                                out=(lengths, directions),
+                                joints=estimates)
+
+            # return error as (l^2 - l(x)^2)
+            return target ** 2 - estimates[0] ** 2
+
+        estimate = None
+        for k, target in enumerate(joints):
+            if _np.isnan(target).any():
+                continue
+
+            if estimate is None or not warm_start:
+                estimate = x0 \
+                    if x0 is not None \
+                    else self._pose_estimate(robot, target)
+
+            result: optimize.OptimizeResult
+            result = optimize.least_squares(goal_function,
+                                            estimate,
+                                            args=(target,),
+                                            **kwargs)
+            if result.success is not True:
+                continue
+
+            final = result.x.copy()
+            # make sure rotation is limited to [0, 2*pi)
+            final[3:6] = _np.fmod(final[3:6], 2 * _np.pi)
+            positions[k] = final[0:3]
+            _euler_dcm(final[3:6], dcms[k])
+            # joint length errors from the errors of squared lengths
+            errors = target - _np.sqrt(_np.maximum(target ** 2 - result.fun,
+                                                   0.0))
+            residuals[k] = _np.sqrt(_np.mean(errors ** 2))
+
+            estimate = result.x
+
+        return positions, dcms, residuals
+
     direct = forward
 
     inverse = backward
@@ -207,8 +507,12 @@ class Algorithm(ABC):
         pose.angular = _angular.Angular(sequence='xyz', euler=x[3:6])
 
         # solve the vector loop and obtain solution
-        estim_lengths, directions, *_ = self._vector_loop(robot, pose)
-        estim_lengths = _np.sum(estim_lengths, axis=1)
+        estim_lengths, directions, *_ = self._vector_loop(robot,
+                                                          pose,
+                                                          buffer=self.buffer)
+        # joint lengths of `[workspace, pulley]` lengths
+        if estim_lengths.ndim > 1:
+            estim_lengths = _np.sum(estim_lengths, axis=1)
 
         # number of linear degrees of freedom
         num_linear, _ = robot.num_dimensionality
@@ -224,6 +528,26 @@ class Algorithm(ABC):
     __repr__ = make_repr()
 
 
+def _euler_dcm(euler: Vector, out: Matrix):
+    # rotation matrix of extrinsic `xyz` Euler angles like `Angular(
+    # sequence='xyz', euler=euler).dcm`, written into `out` without creating an
+    # `Angular` object
+    sa, sb, sc = _np.sin(euler)
+    ca, cb, cc = _np.cos(euler)
+
+    out[0, 0] = cb * cc
+    out[0, 1] = sa * sb * cc - ca * sc
+    out[0, 2] = ca * sb * cc + sa * sc
+    out[1, 0] = cb * sc
+    out[1, 1] = sa * sb * sc + ca * cc
+    out[1, 2] = ca * sb * sc - sa * cc
+    out[2, 0] = - sb
+    out[2, 1] = sa * cb
+    out[2, 2] = ca * cb
+
+    return out
+
+
 class Result(_result.PoseResult, _result.RobotResult, _result.PlottableResult):
     """
 
@@ -268,6 +592,11 @@ class Result(_result.PoseResult, _result.RobotResult, _result.PlottableResult):
     `(M,)` of wrap angles of each pulley
     """
 
+    _buffer: Optional[_buffer.Buffer]
+    """
+    Buffer the arrays of the result were written into, if any
+    """
+
     def __init__(self,
                  algorithm: Algorithm,
                  robot: _robot.Robot,
@@ -277,9 +606,11 @@ class Result(_result.PoseResult, _result.RobotResult, _result.PlottableResult):
                  leave_points: Matrix = None,
                  swivel: Vector = None,
                  wrap: Vector = None,
+                 buffer: Optional[_buffer.Buffer] = None,
                  **kwargs):
         super().__init__(pose=pose, robot=robot, **kwargs)
         self._algorithm = algorithm
+        self._buffer = buffer
         lengths = _np.asarray(lengths)
         self._lengths = lengths if lengths.ndim == 2 else lengths[:, None]
         self._directions = _np.asarray(directions)
@@ -386,38 +717,59 @@ class Result(_result.PoseResult, _result.RobotResult, _result.PlottableResult):
         """
 
         if self._leave_points is None:
-            # init output
-            points = _np.zeros((3, self._robot.num_kinematic_chains))
-
-            # unit vector along the first axis in 3D
-            evec_x = cdpyr.numpy.linalg.evec3_1()
-
-            # loop over each kinematic chain
+            buffer = self._buffer
+            num_chains = self._robot.num_kinematic_chains
+
+            # init output with the frame anchor positions and gather the
+            # rotations and radii of all pulleys
+            points = _buffer.empty(buffer,
+                                   (self._algorithm, 'leave_points'),
+                                   (3, num_chains))
+            rotations = _buffer.empty(buffer,
+                                      (self._algorithm, 'pulley_rotations'),
+                                      (num_chains, 3, 3))
+            radii = _buffer.empty(buffer,
+                                  (self._algorithm, 'pulley_radii'),
+                                  (num_chains, 1))
             for index_chain, chain in enumerate(self._robot.kinematic_chains):
-                # get frame anchor, platform, platform anchor, and cable
                 frame_anchor = self._robot.frame.anchors[chain.frame_anchor]
-                # platform = self._robot.platforms[chain.platform]
-                # platform_anchor = platform.anchors[chain.platform_anchor]
-                # cable = self._robot.cables[chain.cable]
-
-                # calculate corrected cable leave point
                 points[:, index_chain] = frame_anchor.linear.position
-                try:
-                    # pre-calculate wrap and swivel rotation matrix
-                    wrap_dcm = _angular.Angular.rotation_y(
-                            self._wrap[index_chain]).dcm
-                    swivel_dcm = _angular.Angular.rotation_z(
-                            self._swivel[index_chain]).dcm
-                    pulley_dcm = frame_anchor.pulley.dcm
-                    anchor_dcm = frame_anchor.dcm
-
-                    # append the correction along the pulley to the original
-                    # frame anchor position
-                    points[:, index_chain] += anchor_dcm.dot(pulley_dcm.dot(
-                            swivel_dcm.dot(((_np.eye(3) - wrap_dcm).dot(
-                                    frame_anchor.pulley.radius * evec_x)))))
-                except (TypeError, ValueError, KeyError) as e:
-                    pass
+                pulley = frame_anchor.pulley
+                if pulley is None:
+                    rotations[index_chain] = 0.0
+                    radii[index_chain] = 0.0
+                else:
+                    _np.dot(frame_anchor.dcm,
+                            pulley.dcm,
+                            out=rotations[index_chain])
+                    radii[index_chain] = pulley.radius
+
+            # append the correction along the pulleys to the original frame
+            # anchor positions i.e., `R_z(swivel) (I - R_y(wrap)) r e_x` in
+            # pulley coordinates
+            if self._wrap is not None and self._swivel is not None:
+                correction = _buffer.empty(buffer,
+                                           (self._algorithm, 'leave_offsets'),
+                                           (num_chains, 3))
+                _np.cos(self._wrap, out=correction[:, 0])
+                _np.subtract(1.0, correction[:, 0], out=correction[:, 0])
+                _np.sin(self._swivel, out=correction[:, 1])
+                _np.multiply(correction[:, 1],
+                             correction[:, 0],
+                             out=correction[:, 1])
+                _np.cos(self._swivel, out=correction[:, 2])
+                _np.multiply(correction[:, 0],
+                             correction[:, 2],
+                             out=correction[:, 0])
+                _np.sin(self._wrap, out=correction[:, 2])
+                _np.multiply(correction, radii, out=correction)
+
+                # rotate into world coordinates
+                world = _buffer.empty(buffer,
+                                      (self._algorithm, 'leave_corrections'),
+                                      (num_chains, 3, 1))
+                _np.matmul(rotations, correction[:, :, None], out=world)
+                _np.add(points, world[:, :, 0].T, out=points)
 
             self._leave_points = points
 
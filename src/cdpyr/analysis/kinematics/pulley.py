@@ -6,8 +6,11 @@ __all__ = [
         'Pulley',
 ]
 
+from typing import Optional, Tuple
+
 import numpy as _np
 
+from cdpyr.analysis import buffer as _buffer
 from cdpyr.analysis.kinematics import kinematics as _algorithm
 from cdpyr.kinematics.transformation import angular as _angular
 from cdpyr.motion import pose as _pose
@@ -19,6 +22,7 @@ from cdpyr.robot import (
     pulley as _pulley,
     robot as _robot,
 )
+from cdpyr.typing import Matrix
 
 
 class Pulley(_algorithm.Algorithm):
@@ -125,3 +129,130 @@ class Pulley(_algorithm.Algorithm):
         leave_points = _np.asarray(cable_leave_points)
 
         return lengths, directions, leave_points, swivel, wrap
+
+    def _vector_loop_batch(self,
+                           robot: _robot.Robot,
+                           positions: Matrix,
+                           dcms: Matrix,
+                           out: Optional[Tuple[Matrix, Matrix]] = None,
+                           buffer: Optional[_buffer.Buffer] = None,
+                           joints: Optional[Matrix] = None,
+                           **kwargs):
+        num_poses = positions.shape[0]
+        num_cables = robot.num_kinematic_chains
+        frame_anchors, platform_anchors, rotations, radii = self._pulleys(
+                robot,
+                buffer)
+
+        if out is None:
+            out = (_np.empty((num_poses, num_cables)),
+                   _np.empty((num_poses, num_cables, 3)))
+        lengths, directions = out
+
+        def scratch(name: str, shape: Tuple[int, ...]):
+            return _buffer.empty(buffer, (self, name), shape)
+
+        # frame anchor to platform (negative of conventional vector loop)
+        frame_to_platform = scratch('frame_to_platform',
+                                    (num_poses, num_cables, 3))
+        _np.matmul(platform_anchors,
+                   dcms.transpose((0, 2, 1)),
+                   out=frame_to_platform)
+        frame_to_platform += positions[:, None, :]
+        frame_to_platform -= frame_anchors
+
+        # pulley to platform
+        pulley_to_platform = scratch('pulley_to_platform',
+                                     (num_poses, num_cables, 3))
+        _np.einsum('mji,kmj->kmi',
+                   rotations,
+                   frame_to_platform,
+                   out=pulley_to_platform)
+        x = pulley_to_platform[:, :, 0]
+        y = pulley_to_platform[:, :, 1]
+        z = pulley_to_platform[:, :, 2]
+
+        # angle of swivel
+        swivel = scratch('swivel', (num_poses, num_cables))
+        _np.arctan2(y, x, out=swivel)
+
+        # the platform relative to the roller center is `[rho - r, 0, z]` in
+        # cable coordinates with the distance `rho` from the pulley axis
+        radial = scratch('radial', (num_poses, num_cables))
+        _np.hypot(x, y, out=radial)
+        radial -= radii
+
+        # length of cable in workspace
+        square = scratch('square', (num_poses, num_cables))
+        _np.multiply(radial, radial, out=lengths)
+        _np.multiply(z, z, out=square)
+        lengths += square
+        _np.multiply(radii, radii, out=square)
+        lengths -= square
+        _np.sqrt(lengths, out=lengths)
+
+        # the cable leave point solves `[[r, l], [-l, r]] p = [rho - r, z]`,
+        # whose positive determinant does not change its angle
+        wrap = scratch('wrap', (num_poses, num_cables))
+        _np.multiply(lengths, radial, out=wrap)
+        _np.multiply(radii, z, out=square)
+        wrap += square
+        _np.multiply(radii, radial, out=radial)
+        _np.multiply(lengths, z, out=square)
+        radial -= square
+        # angle of wrap from the "unwrapped angle"
+        _np.arctan2(wrap, radial, out=wrap)
+        _np.subtract(_np.pi, wrap, out=wrap)
+
+        # length of cable on the roller
+        if joints is not None:
+            _np.multiply(radii, wrap, out=joints)
+            joints += lengths
+
+        # cable leave point `R_z(swivel) (I - R_y(wrap)) r e_x` in pulley
+        # coordinates
+        leave = scratch('leave', (num_poses, num_cables, 3))
+        _np.cos(wrap, out=square)
+        _np.subtract(1.0, square, out=square)
+        _np.cos(swivel, out=leave[:, :, 0])
+        leave[:, :, 0] *= square
+        _np.sin(swivel, out=leave[:, :, 1])
+        leave[:, :, 1] *= square
+        _np.sin(wrap, out=leave[:, :, 2])
+        leave *= radii[:, None]
+
+        # directions from the platform anchors to the cable leave points
+        _np.einsum('mij,kmj->kmi', rotations, leave, out=directions)
+        directions -= frame_to_platform
+        directions /= lengths[:, :, None]
+
+        return lengths, directions
+
+    def _pulleys(self,
+                 robot: _robot.Robot,
+                 buffer: Optional[_buffer.Buffer] = None
+                 ) -> Tuple[Matrix, Matrix, Matrix, Matrix]:
+        # frame anchors, platform anchors, rotations from pulley to world
+        # coordinates, and pulley radii of all kinematic chains
+        num_cables = robot.num_kinematic_chains
+        frame_anchors = _buffer.empty(buffer,
+                                      (self, 'frame_anchors'),
+                                      (num_cables, 3))
+        platform_anchors = _buffer.empty(buffer,
+                                         (self, 'platform_anchors'),
+                                         (num_cables, 3))
+        rotations = _buffer.empty(buffer,
+                                  (self, 'rotations'),
+                                  (num_cables, 3, 3))
+        radii = _buffer.empty(buffer, (self, 'radii'), (num_cables,))
+        for index, kc in enumerate(robot.kinematic_chains):
+            frame_anchor = robot.frame.anchors[kc.frame_anchor]
+            frame_anchors[index] = frame_anchor.linear.position
+            platform_anchors[index] = robot.platforms[kc.platform].anchors[
+                kc.platform_anchor].linear.position
+            _np.dot(frame_anchor.angular.dcm,
+                    frame_anchor.pulley.dcm,
+                    out=rotations[index])
+            radii[index] = frame_anchor.pulley.radius
+
+        return frame_anchors, platform_anchors, rotations, radii
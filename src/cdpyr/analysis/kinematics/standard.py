@@ -6,14 +6,17 @@ __all__ = [
         'Standard',
 ]
 
+from typing import Optional, Tuple
+
 import numpy as _np
 from scipy import optimize
 
+from cdpyr.analysis import buffer as _buffer
 from cdpyr.analysis.kinematics import kinematics as _algorithm
 from cdpyr.kinematics.transformation import angular as _angular
 from cdpyr.motion import pose as _pose
-from cdpyr.robot import kinematicchain as _kinematic_chain, robot as _robot
-from cdpyr.typing import Vector
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Vector
 
 
 class Standard(_algorithm.Algorithm):
@@ -182,43 +185,108 @@ class Standard(_algorithm.Algorithm):
     #                              swivel=swivel,
     #                              leave_points=leaves)
 
-    def _vector_loop(self, robot: _robot.Robot, pose: _pose.Pose):
-        # number of linear degrees of freedom
-        num_linear, _ = robot.num_dimensionality
-        # cable vector
-        cables = []  # _np.zeros((num_kinchains, num_linear))
-        # cable leave points
-        leaves = []  # _np.zeros((num_kinchains, num_linear))
-
-        # loop over each kinematic chain
-        kc: _kinematic_chain.KinematicChain
-        for idxkc, kc in enumerate(robot.kinematic_chains):
-            # extract frame anchor, platform, and platform anchor
-            fanchor = robot.frame.anchors[kc.frame_anchor].linear.position
-            platform = robot.platforms[kc.platform]
-            panchor = platform.anchors[kc.platform_anchor].linear.position
-
-            # store frame anchor point as cable leave point
-            leaves.append(fanchor)
-
-            # read platform position and orientation
-            pos, rot = pose.position
+    def _vector_loop(self,
+                     robot: _robot.Robot,
+                     pose: _pose.Pose,
+                     buffer: Optional[_buffer.Buffer] = None,
+                     **kwargs):
+        num_cables = robot.num_kinematic_chains
+        # frame anchors are the cable leave points
+        leaves, platform_anchors = self._anchors(robot, buffer)
 
-            # write vector loop
-            cables.append(fanchor - (pos + rot.dot(panchor)))
+        # read platform position and orientation
+        pos, rot = pose.position
 
-        # ensure cables is a numpy array from this point on
-        cables = _np.asarray(cables)
+        # write vector loop of all kinematic chains at once
+        cables = _buffer.empty(buffer, (self, 'cables'), (num_cables, 3))
+        _np.dot(platform_anchors, rot.T, out=cables)
+        cables += pos
+        _np.subtract(leaves, cables, out=cables)
 
         # cable lengths
-        lengths = _np.linalg.norm(cables, axis=1)
-
-        # determine cable directions and set any division by zero to 0
-        directions = cables / lengths[:, None]
-        directions[_np.isclose(lengths, 0), :] = 0
+        lengths = _buffer.empty(buffer, (self, 'lengths'), (num_cables,))
+        _np.einsum('mi,mi->m', cables, cables, out=lengths)
+        _np.sqrt(lengths, out=lengths)
+
+        # determine cable directions and set any division by zero to 0 (same
+        # absolute tolerance as `numpy.isclose`)
+        nonzero = _buffer.empty(buffer,
+                                (self, 'nonzero'),
+                                (num_cables, 1),
+                                dtype=bool)
+        _np.greater(lengths[:, None], 1e-8, out=nonzero)
+        directions = _buffer.empty(buffer,
+                                   (self, 'directions'),
+                                   (num_cables, 3))
+        directions.fill(0.0)
+        _np.divide(cables, lengths[:, None], out=directions, where=nonzero)
 
         # cable swivel angles
-        swivel = _np.arctan2(-directions[:, 1], -directions[:, 0])
+        _np.negative(directions, out=cables)
+        swivel = _buffer.empty(buffer, (self, 'swivel'), (num_cables,))
+        _np.arctan2(cables[:, 1], cables[:, 0], out=swivel)
 
         # return lengths li, directions ui, and leaves ai
-        return lengths, directions, _np.asarray(leaves), swivel
+        return lengths, directions, leaves, swivel
+
+    def _vector_loop_batch(self,
+                           robot: _robot.Robot,
+                           positions: Matrix,
+                           dcms: Matrix,
+                           out: Optional[Tuple[Matrix, Matrix]] = None,
+                           buffer: Optional[_buffer.Buffer] = None,
+                           joints: Optional[Matrix] = None,
+                           **kwargs):
+        num_poses = positions.shape[0]
+        num_cables = robot.num_kinematic_chains
+        # frame and platform anchors of all kinematic chains
+        frame_anchors, platform_anchors = self._anchors(robot, buffer)
+
+        if out is None:
+            out = (_np.empty((num_poses, num_cables)),
+                   _np.empty((num_poses, num_cables, 3)))
+        lengths, cables = out
+
+        # vector loop of all poses at once
+        _np.matmul(platform_anchors, dcms.transpose((0, 2, 1)), out=cables)
+        cables += positions[:, None, :]
+        _np.subtract(frame_anchors[None, :, :], cables, out=cables)
+
+        # cable lengths
+        _np.einsum('nmi,nmi->nm', cables, cables, out=lengths)
+        _np.sqrt(lengths, out=lengths)
+        # without pulleys, joint lengths are workspace lengths
+        if joints is not None:
+            _np.copyto(joints, lengths)
+
+        # determine cable directions in place and set any division by zero
+        # to 0 (same absolute tolerance as `numpy.isclose`)
+        nonzero = _buffer.empty(buffer,
+                                (self, 'nonzero_batch'),
+                                (num_poses, num_cables, 1),
+                                dtype=bool)
+        _np.greater(lengths[:, :, None], 1e-8, out=nonzero)
+        _np.divide(cables, lengths[:, :, None], out=cables, where=nonzero)
+        _np.multiply(cables, nonzero, out=cables)
+
+        return lengths, cables
+
+    def _anchors(self,
+                 robot: _robot.Robot,
+                 buffer: Optional[_buffer.Buffer] = None
+                 ) -> Tuple[Matrix, Matrix]:
+        # frame and platform anchors of all kinematic chains
+        num_cables = robot.num_kinematic_chains
+        frame_anchors = _buffer.empty(buffer,
+                                      (self, 'frame_anchors'),
+                                      (num_cables, 3))
+        platform_anchors = _buffer.empty(buffer,
+                                         (self, 'platform_anchors'),
+                                         (num_cables, 3))
+        for index, kc in enumerate(robot.kinematic_chains):
+            frame_anchors[index] = \
+                robot.frame.anchors[kc.frame_anchor].linear.position
+            platform_anchors[index] = robot.platforms[kc.platform].anchors[
+                kc.platform_anchor].linear.position
+
+        return frame_anchors, platform_anchors
@@ -1,2 +1,9 @@
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Catenary',
+        'Elastic',
+]
+
+from cdpyr.analysis.kinetostatics.catenary import Catenary
+from cdpyr.analysis.kinetostatics.elastic import Elastic
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Catenary',
+]
+
+import numpy as _np
+
+from cdpyr.analysis.kinetostatics import kinetostatics as _algorithm
+from cdpyr.typing import Matrix
+
+
+class Catenary(_algorithm.Algorithm):
+    """
+    Kinetostatics of sagging, elastic cables using the elastic catenary of
+    Irvine.1981.
+
+    Every cable introduces two additional unknowns, the horizontal and
+    vertical force components `(H, V)` at its frame anchor, and two
+    additional equations relating these forces to the horizontal and
+    vertical span of the cable. Cables without mass degrade gracefully to
+    straight elastic cables.
+    """
+
+    # relative sag `w * L0 / |F|` below which the straight-cable limit of the
+    # catenary equations is used to avoid numeric cancellation
+    _threshold_sag = 1e-6
+
+    def _cables(self,
+                model: _algorithm._Model,
+                lengths: Matrix,
+                cables: Matrix,
+                anchors: Matrix,
+                unknowns: Matrix):
+        num, num_cables = lengths.shape
+        upward = self._upward(model)
+
+        # horizontal and vertical span of each cable
+        span_vertical = _np.einsum('nmi,i->nm', cables, upward)
+        horizontal = cables - span_vertical[:, :, None] * upward
+        span_horizontal = _np.linalg.norm(horizontal, axis=2)
+        safe_horizontal = _np.maximum(span_horizontal, 1e-12)
+        direction = horizontal / safe_horizontal[:, :, None]
+
+        # cable weight per unit length and compliance
+        weight = model.linear_density * _np.linalg.norm(model.gravity)
+        compliance = 1.0 / model.axial_stiffness
+        h, v = unknowns[:, 0:num_cables], unknowns[:, num_cables:]
+        vm = v - weight * lengths
+        t = _np.hypot(h, v)
+        tm = _np.hypot(h, vm)
+
+        # elastic catenary equations and their derivatives
+        sagging = weight * lengths > self._threshold_sag * t
+        w = _np.where(sagging, weight, 1.0)
+        asinh = _np.arcsinh(v / h) - _np.arcsinh(vm / h)
+        ratio = v / t - vm / tm
+        inverse = 1.0 / t - 1.0 / tm
+        x_model = _np.where(
+                sagging,
+                h * lengths * compliance + h / w * asinh,
+                h * lengths * (compliance + 1.0 / t))
+        z_model = _np.where(
+                sagging,
+                v * lengths * compliance
+                - weight * lengths ** 2 * compliance / 2.0
+                + (t - tm) / w,
+                v * lengths * (compliance + 1.0 / t))
+        dx_dh = _np.where(
+                sagging,
+                lengths * compliance + (asinh - ratio) / w,
+                lengths * (compliance + 1.0 / t - h ** 2 / t ** 3))
+        dx_dv = _np.where(
+                sagging,
+                h / w * inverse,
+                -h * v * lengths / t ** 3)
+        dz_dv = _np.where(
+                sagging,
+                lengths * compliance + ratio / w,
+                lengths * (compliance + 1.0 / t - v ** 2 / t ** 3))
+        dz_dh = dx_dv
+
+        # cable forces acting on the platform
+        forces = h[:, :, None] * direction + vm[:, :, None] * upward
+
+        # derivative of the forces with respect to the cable vector at
+        # constant `(H, V)`
+        projection = _np.eye(3) - _np.outer(upward, upward)
+        stiffness = (h / safe_horizontal)[:, :, None, None] \
+                    * (projection[None, None, :, :]
+                       - _np.einsum('nmi,nmj->nmij', direction, direction))
+
+        # residual of the catenary equations
+        equations = _np.concatenate((x_model - span_horizontal,
+                                     z_model - span_vertical), axis=1)
+
+        # derivative of the catenary equations with respect to `(dr, dphi)`
+        # where `d(span) = -e . (dr - [q]_x dphi)`
+        skew_anchors = _algorithm._skew(anchors)
+        upwards = _np.broadcast_to(upward, direction.shape)
+        jac_equations = _np.concatenate((
+                _np.concatenate((
+                        direction,
+                        -_np.einsum('nmi,nmij->nmj', direction, skew_anchors),
+                ), axis=2),
+                _np.concatenate((
+                        upwards,
+                        -_np.einsum('nmi,nmij->nmj', upwards, skew_anchors),
+                ), axis=2),
+        ), axis=1)
+
+        # derivative of equilibrium and catenary equations with respect to
+        # `(H, V)`
+        jac_unknowns = _np.zeros((num, 6 + 2 * num_cables, 2 * num_cables))
+        jac_unknowns[:, 0:3, 0:num_cables] = direction.transpose((0, 2, 1))
+        jac_unknowns[:, 0:3, num_cables:] = upwards.transpose((0, 2, 1))
+        jac_unknowns[:, 3:6, 0:num_cables] = _np.cross(
+                anchors, direction).transpose((0, 2, 1))
+        jac_unknowns[:, 3:6, num_cables:] = _np.cross(
+                anchors, upwards).transpose((0, 2, 1))
+        diagonal = _np.arange(num_cables)
+        jac_unknowns[:, 6 + diagonal, diagonal] = dx_dh
+        jac_unknowns[:, 6 + diagonal, num_cables + diagonal] = dx_dv
+        jac_unknowns[:, 6 + num_cables + diagonal, diagonal] = dz_dh
+        jac_unknowns[:, 6 + num_cables + diagonal, num_cables + diagonal] = \
+            dz_dv
+
+        return forces, stiffness, equations, jac_equations, jac_unknowns
+
+    def _constrain(self, model: _algorithm._Model, unknowns: Matrix):
+        # horizontal forces must remain positive
+        num_cables = model.num_cables
+        unknowns[:, 0:num_cables] = _np.maximum(unknowns[:, 0:num_cables],
+                                                1e-12)
+
+        return unknowns
+
+    def _initial_unknowns(self,
+                          model: _algorithm._Model,
+                          lengths: Matrix,
+                          position: Matrix,
+                          dcm: Matrix):
+        upward = self._upward(model)
+        weight = model.linear_density * _np.linalg.norm(model.gravity)
+
+        # straight cable geometry
+        anchors = _np.einsum('nij,mj->nmi', dcm, model.platform_anchors)
+        cables = model.frame_anchors[None, :, :] \
+                 - position[:, None, :] \
+                 - anchors
+        directions = cables / _np.linalg.norm(cables, axis=2)[:, :, None]
+
+        # minimum-norm force distribution of straight cables against gravity
+        structure = _np.concatenate((directions,
+                                     _np.cross(anchors, directions)),
+                                    axis=2).transpose((0, 2, 1))
+        cog = _np.einsum('nij,j->ni', dcm, model.center_of_gravity)
+        gravity = _np.concatenate((
+                _np.broadcast_to(model.gravity_force, cog.shape),
+                _np.cross(cog, model.gravity_force),
+        ), axis=1)
+        index = model.dof_index
+        forces = -_np.einsum('nij,nj->ni',
+                             _np.linalg.pinv(structure[:, index, :]),
+                             gravity[:, index])
+        forces = _np.maximum(forces,
+                             1e-2 * (1.0 + _np.linalg.norm(
+                                     model.gravity_force)))
+
+        # decompose into horizontal force and vertical force at the frame
+        vertical = _np.einsum('nmi,i->nm', directions, upward)
+        horizontal = _np.sqrt(_np.maximum(1.0 - vertical ** 2, 0.0))
+
+        return _np.concatenate((
+                _np.maximum(forces * horizontal, 1e-6 * forces),
+                forces * vertical + weight * lengths,
+        ), axis=1)
+
+    def _forces(self,
+                model: _algorithm._Model,
+                lengths: Matrix,
+                position: Matrix,
+                dcm: Matrix,
+                unknowns: Matrix):
+        anchors = _np.einsum('nij,mj->nmi', dcm, model.platform_anchors)
+        cables = model.frame_anchors[None, :, :] \
+                 - position[:, None, :] \
+                 - anchors
+
+        forces, *_ = self._cables(model, lengths, cables, anchors, unknowns)
+
+        return forces
+
+    @staticmethod
+    def _upward(model: _algorithm._Model):
+        gravity = _np.linalg.norm(model.gravity)
+        if _np.isclose(gravity, 0):
+            return _np.asarray([0.0, 0.0, 1.0])
+
+        return -model.gravity / gravity
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Elastic',
+]
+
+import numpy as _np
+
+from cdpyr.analysis.kinetostatics import kinetostatics as _algorithm
+from cdpyr.typing import Matrix
+
+
+class Elastic(_algorithm.Algorithm):
+    """
+    Kinetostatics of massless, linear elastic cables i.e., straight cables
+    following Hooke's law that cannot transmit compressive forces.
+    """
+
+    def _model(self, robot):
+        model = super()._model(robot)
+
+        if not _np.isfinite(model.axial_stiffness).all():
+            raise ValueError(
+                    'Elastic kinetostatics require a finite axial stiffness '
+                    'for every cable. Please set the cables\' elasticities '
+                    'and diameters, or pass `axial_stiffness` explicitly.')
+
+        return model
+
+    def _cables(self,
+                model: _algorithm._Model,
+                lengths: Matrix,
+                cables: Matrix,
+                anchors: Matrix,
+                unknowns: Matrix):
+        num = lengths.shape[0]
+
+        # current cable lengths and directions
+        distance = _np.linalg.norm(cables, axis=2)
+        directions = cables / distance[:, :, None]
+
+        # cable stiffness `k = E * A / L0` and (tensile only) cable force
+        spring = model.axial_stiffness[None, :] / lengths
+        taut = distance > lengths
+        tension = _np.where(taut, spring * (distance - lengths), 0.0)
+        forces = tension[:, :, None] * directions
+
+        # derivative of each force vector with respect to its cable vector
+        outer = _np.einsum('nmi,nmj->nmij', directions, directions)
+        stiffness = (taut * spring)[:, :, None, None] * outer \
+                    + (tension / distance)[:, :, None, None] \
+                    * (_np.eye(3)[None, None, :, :] - outer)
+
+        return forces, \
+               stiffness, \
+               _np.zeros((num, 0)), \
+               _np.zeros((num, 0, 6)), \
+               _np.zeros((num, 6, 0))
+
+    def _initial_unknowns(self,
+                          model: _algorithm._Model,
+                          lengths: Matrix,
+                          position: Matrix,
+                          dcm: Matrix):
+        return _np.zeros((lengths.shape[0], 0))
+
+    def _forces(self,
+                model: _algorithm._Model,
+                lengths: Matrix,
+                position: Matrix,
+                dcm: Matrix,
+                unknowns: Matrix):
+        anchors = _np.einsum('nij,mj->nmi', dcm, model.platform_anchors)
+        cables = model.frame_anchors[None, :, :] \
+                 - position[:, None, :] \
+                 - anchors
+
+        forces, *_ = self._cables(model, lengths, cables, anchors, unknowns)
+
+        return forces
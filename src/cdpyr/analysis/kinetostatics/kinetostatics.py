@@ -0,0 +1,949 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Algorithm',
+        'BatchResult',
+        'Result',
+]
+
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.analysis import result as _result
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix, Num, Vector
+
+
+class Algorithm(ABC):
+    """
+    Base class for kinetostatic solvers i.e., algorithms that determine the
+    platform pose and the cable forces simultaneously for given unstrained
+    cable lengths.
+
+    All solvers share a batched Levenberg-Marquardt iteration over an
+    arbitrary number of independent problems. Rotations are updated
+    multiplicatively through rotation-vector increments so that the analytic
+    Jacobians of the concrete models can be written with respect to `(dr,
+    dphi)` in world coordinates.
+    """
+
+    _axial_stiffness: Optional[Vector]
+    _linear_density: Optional[Vector]
+    maximum_iterations: int
+    tolerance: float
+
+    def __init__(self,
+                 axial_stiffness: Optional[Union[Num, Vector]] = None,
+                 linear_density: Optional[Union[Num, Vector]] = None,
+                 max_iterations: int = 100,
+                 tolerance: float = 1e-9,
+                 **kwargs):
+        super().__init__()
+        self.axial_stiffness = axial_stiffness
+        self.linear_density = linear_density
+        self.maximum_iterations = max_iterations
+        self.tolerance = tolerance
+
+    @property
+    def axial_stiffness(self):
+        return self._axial_stiffness
+
+    @axial_stiffness.setter
+    def axial_stiffness(self, stiffness: Optional[Union[Num, Vector]]):
+        self._axial_stiffness = _np.asarray(stiffness, dtype=float) \
+            if stiffness is not None else None
+
+    @axial_stiffness.deleter
+    def axial_stiffness(self):
+        del self._axial_stiffness
+
+    @property
+    def linear_density(self):
+        return self._linear_density
+
+    @linear_density.setter
+    def linear_density(self, density: Optional[Union[Num, Vector]]):
+        self._linear_density = _np.asarray(density, dtype=float) \
+            if density is not None else None
+
+    @linear_density.deleter
+    def linear_density(self):
+        del self._linear_density
+
+    def evaluate(self,
+                 robot: _robot.Robot,
+                 lengths: Vector,
+                 x0: Optional[_pose.Pose] = None,
+                 wrench: Optional[Vector] = None,
+                 **kwargs) -> Result:
+        """
+        Solve the kinetostatic problem for a single set of unstrained cable
+        lengths.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to solve the kinetostatics for.
+        lengths : Vector
+            `(M,)` vector of unstrained cable lengths.
+        x0 : Pose
+            Initial pose estimate. If not given, the pose is estimated from
+            the forward kinematics of straight, inelastic cables.
+        wrench : Vector
+            `(N,)` external wrench acting on the platform in addition to
+            gravity, given in the platform's degrees of freedom.
+
+        Returns
+        -------
+        result : Result
+            Kinetostatic equilibrium of the platform.
+        """
+        result = self.evaluate_batch(robot,
+                                     _np.asarray(lengths)[None, :],
+                                     x0=x0,
+                                     wrench=wrench,
+                                     **kwargs)
+
+        if not result.success[0]:
+            raise ValueError(
+                    'Unable to solve the kinetostatics for the given cable '
+                    'lengths. Please check if your inputs are correct and '
+                    'then run again. You may also pass a better initial '
+                    'estimate through `x0`.')
+
+        return result[0]
+
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       lengths: Matrix,
+                       x0: Optional[Union[_pose.Pose,
+                                          Sequence[_pose.Pose],
+                                          BatchResult]] = None,
+                       wrench: Optional[Union[Vector, Matrix]] = None,
+                       **kwargs) -> BatchResult:
+        """
+        Solve the kinetostatic problem for a batch of unstrained cable
+        lengths at once. All problems are iterated simultaneously and each
+        problem stops iterating as soon as it converged.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to solve the kinetostatics for.
+        lengths : Matrix
+            `(K, M)` array of unstrained cable lengths.
+        x0 : Pose | Sequence[Pose] | BatchResult
+            Initial estimate, either one pose used for all problems,
+            one pose per problem, or the result of a previous solve which
+            also initializes all internal unknowns (warm start).
+        wrench : Vector | Matrix
+            `(N,)` or `(K, N)` external wrench acting on the platform in
+            addition to gravity.
+
+        Returns
+        -------
+        result : BatchResult
+        """
+        return self._evaluate_batch(self._model(robot),
+                                    robot,
+                                    _np.atleast_2d(
+                                            _np.asarray(lengths, dtype=float)),
+                                    x0,
+                                    wrench)
+
+    def _evaluate_batch(self,
+                        model: _Model,
+                        robot: _robot.Robot,
+                        lengths: Matrix,
+                        x0: Optional[Union[_pose.Pose,
+                                           Sequence[_pose.Pose],
+                                           BatchResult]] = None,
+                        wrench: Optional[Union[Vector, Matrix]] = None):
+        num = lengths.shape[0]
+
+        # initial state of all problems
+        position, dcm, unknowns = self._initial_state(model, lengths, x0)
+
+        # external wrench in full spatial coordinates
+        external = _np.zeros((num, 6))
+        if wrench is not None:
+            wrench = _np.asarray(wrench, dtype=float)
+            external[:, model.dof_index] = wrench \
+                if wrench.ndim == 2 else wrench[None, :]
+
+        # scale tolerance by the magnitude of the acting wrenches
+        scale = 1.0 \
+                + _np.linalg.norm(model.gravity_force) \
+                + _np.linalg.norm(external, axis=1)
+
+        def residual(index, position_, dcm_, unknowns_):
+            return self._residual(model, lengths[index], external[index],
+                                  position_, dcm_, unknowns_)
+
+        # warm-started problems are close to the solution so they start out
+        # as (almost) undamped Gauss-Newton iterations
+        damping = 1e-9 if isinstance(x0, BatchResult) else 1e-3
+
+        position, dcm, unknowns, residuals, iterations, success = \
+            self._solve(model, residual, position, dcm, unknowns, scale,
+                        damping)
+
+        return BatchResult(self,
+                           robot,
+                           lengths,
+                           position,
+                           dcm,
+                           self._forces(model, lengths, position, dcm,
+                                        unknowns),
+                           unknowns,
+                           residuals,
+                           iterations,
+                           success)
+
+    def evaluate_path(self,
+                      robot: _robot.Robot,
+                      lengths: Matrix,
+                      x0: Optional[Union[_pose.Pose, BatchResult]] = None,
+                      wrench: Optional[Union[Vector, Matrix]] = None,
+                      chunk_size: int = 1,
+                      **kwargs) -> BatchResult:
+        """
+        Solve the kinetostatic problem along a path of unstrained cable
+        lengths by warm-starting each sample from the solution of its
+        predecessor.
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to solve the kinetostatics for.
+        lengths : Matrix
+            `(K, M)` array of unstrained cable lengths ordered along the path.
+        x0 : Pose | BatchResult
+            Initial estimate of the first sample.
+        wrench : Vector | Matrix
+            `(N,)` or `(K, N)` external wrench acting on the platform.
+        chunk_size : int
+            Number of consecutive samples solved as one batch. All samples of
+            a chunk are warm-started from the last solution of the previous
+            chunk, so larger chunks trade quality of the initial estimate
+            for vectorization. Defaults to `1` i.e., strictly sequential.
+
+        Returns
+        -------
+        result : BatchResult
+        """
+        model = self._model(robot)
+        lengths = _np.atleast_2d(_np.asarray(lengths, dtype=float))
+        num = lengths.shape[0]
+        chunk_size = max(int(chunk_size), 1)
+
+        if wrench is not None:
+            wrench = _np.asarray(wrench, dtype=float)
+            if wrench.ndim == 1:
+                wrench = _np.repeat(wrench[None, :], num, axis=0)
+
+        # solve first sample cold (or from the user's estimate)
+        chunks = [self._evaluate_batch(model,
+                                       robot,
+                                       lengths[0:1, :],
+                                       x0,
+                                       wrench[0:1, :]
+                                       if wrench is not None else None)]
+
+        for start in range(1, num, chunk_size):
+            stop = min(start + chunk_size, num)
+            # warm start every sample of this chunk from the last solution
+            previous = chunks[-1][-1:].repeat(stop - start)
+            chunks.append(self._evaluate_batch(model,
+                                               robot,
+                                               lengths[start:stop, :],
+                                               previous,
+                                               wrench[start:stop, :]
+                                               if wrench is not None else
+                                               None))
+
+        return BatchResult.concatenate(chunks)
+
+    def _model(self, robot: _robot.Robot) -> _Model:
+        if robot.num_platforms > 1:
+            raise NotImplementedError(
+                    'Kinetostatics are currently not implemented for robots '
+                    'with more than one platform.'
+            )
+
+        return _Model(robot, self._axial_stiffness, self._linear_density)
+
+    def _initial_state(self,
+                       model: _Model,
+                       lengths: Matrix,
+                       x0: Optional[Union[_pose.Pose,
+                                          Sequence[_pose.Pose],
+                                          BatchResult]]):
+        num = lengths.shape[0]
+
+        # warm start from a previous result and predict the change of pose
+        # from the change of unstrained cable lengths through one
+        # Gauss-Newton step of the geometric forward kinematics
+        if isinstance(x0, BatchResult):
+            if len(x0) == 1 and num > 1:
+                x0 = x0.repeat(num)
+            _, jacobian = self._geometric_residual(model,
+                                                   x0.lengths,
+                                                   x0.positions,
+                                                   x0.dcms)
+            step = _np.einsum('nij,nj->ni',
+                              _np.linalg.pinv(jacobian),
+                              lengths - x0.lengths)
+            return self._update(model,
+                                x0.positions,
+                                x0.dcms,
+                                x0.unknowns.copy(),
+                                _np.concatenate(
+                                        (step,
+                                         _np.zeros_like(x0.unknowns)),
+                                        axis=1))
+
+        if x0 is None:
+            position, dcm = self._pose_estimate(model, lengths)
+        elif isinstance(x0, _pose.Pose):
+            position = _np.repeat(
+                    _np.asarray(x0.linear.position, dtype=float)[None, :],
+                    num, axis=0)
+            dcm = _np.repeat(
+                    _np.asarray(x0.angular.dcm, dtype=float)[None, :, :],
+                    num, axis=0)
+        else:
+            position = _np.asarray([p.linear.position for p in x0],
+                                   dtype=float)
+            dcm = _np.asarray([p.angular.dcm for p in x0], dtype=float)
+
+        return position, dcm, self._initial_unknowns(model,
+                                                     lengths,
+                                                     position,
+                                                     dcm)
+
+    def _pose_estimate(self, model: _Model, lengths: Matrix):
+        num = lengths.shape[0]
+
+        # refine the bounding box estimate by solving the purely geometric
+        # forward kinematics of straight cables with the unstrained lengths
+        return self._geometric(model,
+                               lengths,
+                               self._position_estimate(model, lengths),
+                               _np.repeat(_np.eye(3)[None, :, :], num,
+                                          axis=0))
+
+    def _geometric(self,
+                   model: _Model,
+                   lengths: Matrix,
+                   position: Matrix,
+                   dcm: Matrix):
+        num = lengths.shape[0]
+
+        def residual(index, position_, dcm_, unknowns_):
+            return self._geometric_residual(model,
+                                            lengths[index],
+                                            position_,
+                                            dcm_)
+
+        position, dcm, *_ = self._solve(model,
+                                        residual,
+                                        position,
+                                        dcm,
+                                        _np.zeros((num, 0)),
+                                        1.0 + lengths.max(axis=1))
+
+        return position, dcm
+
+    @staticmethod
+    def _geometric_residual(model: _Model,
+                            lengths: Matrix,
+                            position: Matrix,
+                            dcm: Matrix):
+        anchors = _np.einsum('nij,mj->nmi', dcm, model.platform_anchors)
+        cables = model.frame_anchors[None, :, :] \
+                 - position[:, None, :] \
+                 - anchors
+        distance = _np.linalg.norm(cables, axis=2)
+        directions = cables / distance[:, :, None]
+
+        # d(l) = -u . (dr - [q]_x dphi)
+        jacobian = _np.concatenate((
+                -directions,
+                _np.einsum('nmi,nmij->nmj', directions, _skew(anchors)),
+        ), axis=2)
+
+        return distance - lengths, jacobian[:, :, model.dof_index]
+
+    @staticmethod
+    def _position_estimate(model: _Model, lengths: Matrix):
+        # center of the bounding box of all spheres around the frame anchors
+        # with radius of cable length plus platform anchor distance
+        radius = lengths + _np.linalg.norm(model.platform_anchors, axis=1)
+        low = _np.max(model.frame_anchors[None, :, :] - radius[:, :, None],
+                      axis=1)
+        high = _np.min(model.frame_anchors[None, :, :] + radius[:, :, None],
+                       axis=1)
+
+        position = _np.zeros((lengths.shape[0], 3))
+        position[:, model.translation_index] = 0.5 * (high + low)[:,
+                                                     model.translation_index]
+
+        # suspended robots have (almost) coplanar frame anchors, so the box
+        # center lies in the anchor plane and the geometric forward
+        # kinematics may converge to the solution mirrored against gravity.
+        # Move the estimate halfway towards the lower bound of the box
+        gravity = _np.linalg.norm(model.gravity)
+        if not _np.isclose(gravity, 0):
+            upward = -model.gravity / gravity
+            heights = model.frame_anchors.dot(upward)
+            if _np.ptp(heights) < 0.1 * _np.mean(lengths):
+                center = position.dot(upward)
+                bottom = _np.max(heights[None, :] - radius, axis=1)
+                position += (0.5 * (bottom - center))[:, None] * upward[None, :]
+
+        return position
+
+    def _solve(self,
+               model: _Model,
+               residual: Callable,
+               position: Matrix,
+               dcm: Matrix,
+               unknowns: Matrix,
+               scale: Vector,
+               damping: float = 1e-3):
+        num = position.shape[0]
+        tol = self.tolerance * scale
+        everything = _np.arange(num)
+
+        iterations = _np.zeros(num, dtype=int)
+        damping = _np.full(num, damping)
+        factor = _np.full(num, 2.0)
+
+        values, jacobian = residual(everything, position, dcm, unknowns)
+        norm = _np.linalg.norm(values, axis=1)
+        success = norm <= tol
+        stalled = _np.zeros(num, dtype=bool)
+
+        for _ in range(self.maximum_iterations):
+            active = _np.flatnonzero(~(success | stalled))
+            if not active.size:
+                break
+
+            iterations[active] += 1
+
+            # damped normal equations of all active problems
+            jac = jacobian[active]
+            jtj = _np.einsum('nki,nkj->nij', jac, jac)
+            jtr = _np.einsum('nki,nk->ni', jac, values[active])
+            diagonal = _np.arange(jtj.shape[1])
+            lhs = jtj.copy()
+            lhs[:, diagonal, diagonal] += damping[active, None] \
+                                          * (jtj[:, diagonal, diagonal]
+                                             + 1e-12)
+            try:
+                step = -_np.linalg.solve(lhs, jtr[:, :, None])[:, :, 0]
+            except _np.linalg.LinAlgError:
+                step = -_np.einsum('nij,nj->ni', _np.linalg.pinv(lhs), jtr)
+
+            # trial state
+            t_position, t_dcm, t_unknowns = self._update(model,
+                                                         position[active],
+                                                         dcm[active],
+                                                         unknowns[active],
+                                                         step)
+            t_values, t_jacobian = residual(active,
+                                            t_position,
+                                            t_dcm,
+                                            t_unknowns)
+            t_norm = _np.linalg.norm(t_values, axis=1)
+
+            # gain ratio of actual over predicted reduction
+            predicted = 0.5 * _np.einsum(
+                    'ni,ni->n',
+                    step,
+                    damping[active, None]
+                    * (jtj[:, diagonal, diagonal] + 1e-12)
+                    * step - jtr)
+            gain = 0.5 * (norm[active] ** 2 - t_norm ** 2) \
+                   / _np.maximum(predicted, 1e-300)
+
+            # accept improving steps and relax damping, otherwise increase
+            # damping (Nielsen.1999)
+            improved = _np.isfinite(t_norm) & (t_norm < norm[active])
+            accept = active[improved]
+            position[accept] = t_position[improved]
+            dcm[accept] = t_dcm[improved]
+            unknowns[accept] = t_unknowns[improved]
+            values[accept] = t_values[improved]
+            jacobian[accept] = t_jacobian[improved]
+            norm[accept] = t_norm[improved]
+            damping[accept] = _np.maximum(
+                    damping[accept] * _np.maximum(
+                            1.0 / 3.0,
+                            1.0 - (2.0 * gain[improved] - 1.0) ** 3),
+                    1e-15)
+            factor[accept] = 2.0
+            reject = active[~improved]
+            damping[reject] = damping[reject] * factor[reject]
+            factor[reject] = factor[reject] * 2.0
+
+            # converged or stalled problems
+            success = norm <= tol
+            stalled = damping > 1e12
+
+        return position, dcm, unknowns, norm, iterations, success
+
+    def _update(self,
+                model: _Model,
+                position: Matrix,
+                dcm: Matrix,
+                unknowns: Matrix,
+                step: Matrix):
+        num = step.shape[0]
+        ndof = model.dof_index.size
+
+        # scatter the reduced pose step into `(dr, dphi)`
+        full = _np.zeros((num, 6))
+        full[:, model.dof_index] = step[:, 0:ndof]
+
+        position = position + full[:, 0:3]
+        dcm = _np.einsum('nij,njk->nik', _rodrigues(full[:, 3:6]), dcm)
+        unknowns = self._constrain(model, unknowns + step[:, ndof:])
+
+        return position, dcm, unknowns
+
+    def _constrain(self, model: _Model, unknowns: Matrix):
+        return unknowns
+
+    def _residual(self,
+                  model: _Model,
+                  lengths: Matrix,
+                  external: Matrix,
+                  position: Matrix,
+                  dcm: Matrix,
+                  unknowns: Matrix):
+        # platform anchors in world orientation and cable vectors
+        anchors = _np.einsum('nij,mj->nmi', dcm, model.platform_anchors)
+        cables = model.frame_anchors[None, :, :] \
+                 - position[:, None, :] \
+                 - anchors
+
+        # per-model cable forces, their stiffness with respect to the
+        # platform anchor position, and additional model equations
+        forces, stiffness, equations, jac_equations, jac_unknowns = \
+            self._cables(model, lengths, cables, anchors, unknowns)
+
+        # gravitational wrench in world coordinates
+        cog = _np.einsum('nij,j->ni', dcm, model.center_of_gravity)
+        gravity = model.gravity_force
+
+        # equilibrium of all forces and torques
+        equilibrium = _np.empty((lengths.shape[0], 6))
+        equilibrium[:, 0:3] = forces.sum(axis=1) + gravity + external[:, 0:3]
+        equilibrium[:, 3:6] = _np.cross(anchors, forces).sum(axis=1) \
+                              + _np.cross(cog, gravity) \
+                              + external[:, 3:6]
+
+        # jacobian of the equilibrium with respect to `(dr, dphi)`
+        skew_anchors = _skew(anchors)
+        jac_pose = _np.empty((lengths.shape[0], 6, 6))
+        jac_pose[:, 0:3, 0:3] = -stiffness.sum(axis=1)
+        jac_pose[:, 0:3, 3:6] = _np.einsum('nmij,nmjk->nik',
+                                           stiffness,
+                                           skew_anchors)
+        jac_pose[:, 3:6, 0:3] = -_np.einsum('nmij,nmjk->nik',
+                                            skew_anchors,
+                                            stiffness)
+        jac_pose[:, 3:6, 3:6] = _np.einsum('nmij,nmjk->nik',
+                                           _skew(forces),
+                                           skew_anchors) \
+                                + _np.einsum('nmij,nmjk,nmkl->nil',
+                                             skew_anchors,
+                                             stiffness,
+                                             skew_anchors) \
+                                + _np.einsum('ij,njk->nik',
+                                             _skew(gravity),
+                                             _skew(cog))
+
+        # reduce to the platform's degrees of freedom
+        index = model.dof_index
+        residual = _np.concatenate((equilibrium[:, index], equations), axis=1)
+        jacobian = _np.concatenate((
+                _np.concatenate((jac_pose[:, index[:, None], index[None, :]],
+                                 jac_unknowns[:, 0:6, :][:, index, :]),
+                                axis=2),
+                _np.concatenate((jac_equations[:, :, index],
+                                 jac_unknowns[:, 6:, :]),
+                                axis=2),
+        ), axis=1)
+
+        return residual, jacobian
+
+    @abstractmethod
+    def _cables(self,
+                model: _Model,
+                lengths: Matrix,
+                cables: Matrix,
+                anchors: Matrix,
+                unknowns: Matrix) -> Tuple[Matrix, Matrix, Matrix, Matrix,
+                                           Matrix]:
+        """
+        Evaluate the cable model
+
+        Parameters
+        ----------
+        model : _Model
+        lengths : Matrix
+            `(K, M)` unstrained cable lengths.
+        cables : Matrix
+            `(K, M, 3)` vectors from platform anchor to frame anchor.
+        anchors : Matrix
+            `(K, M, 3)` platform anchors in world orientation.
+        unknowns : Matrix
+            `(K, U)` model-specific additional unknowns.
+
+        Returns
+        -------
+        forces : Matrix
+            `(K, M, 3)` cable forces acting on the platform.
+        stiffness : Matrix
+            `(K, M, 3, 3)` derivative of each cable force with respect to
+            its cable vector at constant unknowns.
+        equations : Matrix
+            `(K, U)` residual of the model-specific equations.
+        jac_equations : Matrix
+            `(K, U, 6)` derivative of `equations` with respect to `(dr,
+            dphi)`.
+        jac_unknowns : Matrix
+            `(K, 6 + U, U)` derivative of the equilibrium and of the
+            model-specific equations with respect to the unknowns.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _initial_unknowns(self,
+                          model: _Model,
+                          lengths: Matrix,
+                          position: Matrix,
+                          dcm: Matrix) -> Matrix:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _forces(self,
+                model: _Model,
+                lengths: Matrix,
+                position: Matrix,
+                dcm: Matrix,
+                unknowns: Matrix) -> Matrix:
+        raise NotImplementedError()
+
+    __repr__ = make_repr(
+            'axial_stiffness',
+            'linear_density',
+            'maximum_iterations',
+            'tolerance',
+    )
+
+
+class Result(_result.PoseResult, _result.RobotResult):
+    _algorithm: Algorithm
+    _forces: Vector
+    _lengths: Vector
+    _residual: float
+    _iterations: int
+
+    def __init__(self,
+                 algorithm: Algorithm,
+                 robot: _robot.Robot,
+                 pose: _pose.Pose,
+                 lengths: Vector,
+                 forces: Matrix,
+                 residual: float,
+                 iterations: int,
+                 **kwargs):
+        super().__init__(pose=pose, robot=robot, **kwargs)
+        self._algorithm = algorithm
+        self._lengths = _np.asarray(lengths)
+        self._forces = _np.asarray(forces)
+        self._residual = residual
+        self._iterations = iterations
+
+    @property
+    def algorithm(self):
+        return self._algorithm
+
+    @property
+    def forces(self):
+        """
+        `(M,)` magnitude of the cable forces at the platform anchors
+        """
+        return _np.linalg.norm(self._forces, axis=1)
+
+    @property
+    def force_vectors(self):
+        """
+        `(M, 3)` cable forces acting on the platform anchors
+        """
+        return self._forces
+
+    @property
+    def iterations(self):
+        return self._iterations
+
+    @property
+    def lengths(self):
+        return self._lengths
+
+    @property
+    def residual(self):
+        return self._residual
+
+    __repr__ = make_repr(
+            'algorithm',
+            'pose',
+            'lengths',
+            'forces',
+            'residual',
+    )
+
+
+class BatchResult(_result.RobotResult):
+    _algorithm: Algorithm
+    _lengths: Matrix
+    _positions: Matrix
+    _dcms: Matrix
+    _forces: Matrix
+    _unknowns: Matrix
+    _residuals: Vector
+    _iterations: Vector
+    _success: Vector
+
+    def __init__(self,
+                 algorithm: Algorithm,
+                 robot: _robot.Robot,
+                 lengths: Matrix,
+                 positions: Matrix,
+                 dcms: Matrix,
+                 forces: Matrix,
+                 unknowns: Matrix,
+                 residuals: Vector,
+                 iterations: Vector,
+                 success: Vector,
+                 **kwargs):
+        super().__init__(robot=robot, **kwargs)
+        self._algorithm = algorithm
+        self._lengths = lengths
+        self._positions = positions
+        self._dcms = dcms
+        self._forces = forces
+        self._unknowns = unknowns
+        self._residuals = residuals
+        self._iterations = iterations
+        self._success = success
+
+    @staticmethod
+    def concatenate(results: Sequence[BatchResult]):
+        first = results[0]
+        return BatchResult(
+                first.algorithm,
+                first.robot,
+                *(_np.concatenate([getattr(r, f) for r in results], axis=0)
+                  for f in ('_lengths', '_positions', '_dcms', '_forces',
+                            '_unknowns', '_residuals', '_iterations',
+                            '_success')))
+
+    @property
+    def algorithm(self):
+        return self._algorithm
+
+    @property
+    def dcms(self):
+        return self._dcms
+
+    @property
+    def force_vectors(self):
+        return self._forces
+
+    @property
+    def forces(self):
+        return _np.linalg.norm(self._forces, axis=2)
+
+    @property
+    def iterations(self):
+        return self._iterations
+
+    @property
+    def lengths(self):
+        return self._lengths
+
+    @property
+    def positions(self):
+        return self._positions
+
+    @property
+    def residuals(self):
+        return self._residuals
+
+    @property
+    def success(self):
+        return self._success
+
+    @property
+    def unknowns(self):
+        return self._unknowns
+
+    def repeat(self, num: int):
+        return BatchResult(
+                self._algorithm,
+                self._robot,
+                *(_np.repeat(getattr(self, f), num, axis=0)
+                  for f in ('_lengths', '_positions', '_dcms', '_forces',
+                            '_unknowns', '_residuals', '_iterations',
+                            '_success')))
+
+    def to_poselist(self):
+        return _pose.PoseList(_pose.Pose(p, d) for p, d in
+                              zip(self._positions, self._dcms))
+
+    def __len__(self):
+        return self._lengths.shape[0]
+
+    def __iter__(self):
+        return (self[idx] for idx in range(len(self)))
+
+    def __getitem__(self, idx: Union[int, slice]):
+        if isinstance(idx, slice):
+            return BatchResult(
+                    self._algorithm,
+                    self._robot,
+                    *(getattr(self, f)[idx]
+                      for f in ('_lengths', '_positions', '_dcms', '_forces',
+                                '_unknowns', '_residuals', '_iterations',
+                                '_success')))
+
+        return Result(self._algorithm,
+                      self._robot,
+                      _pose.Pose(self._positions[idx], self._dcms[idx]),
+                      self._lengths[idx],
+                      self._forces[idx],
+                      self._residuals[idx],
+                      self._iterations[idx])
+
+    __repr__ = make_repr(
+            'algorithm',
+            'positions',
+            'forces',
+            'success',
+    )
+
+
+class _Model(object):
+    """
+    Flattened, array-based snapshot of all robot quantities the kinetostatic
+    solvers need
+    """
+
+    def __init__(self,
+                 robot: _robot.Robot,
+                 axial_stiffness: Optional[Vector] = None,
+                 linear_density: Optional[Vector] = None):
+        index_platform = 0
+        platform = robot.platforms[index_platform]
+        chains = robot.kinematic_chains.with_platform(index_platform)
+        num = len(chains)
+
+        self.frame_anchors = _np.asarray(
+                [robot.frame.anchors[kc.frame_anchor].linear.position
+                 for kc in chains], dtype=float)
+        self.platform_anchors = _np.asarray(
+                [platform.anchors[kc.platform_anchor].linear.position
+                 for kc in chains], dtype=float)
+
+        # gravity as spatial vector (scalar gravity acts along the last
+        # translational degree of freedom)
+        gravity = _np.zeros(3)
+        gravity[0:platform.dof_translation] = platform.motion_pattern.gravity(
+                robot.gravity)
+        self.gravity = gravity
+        self.gravity_force = _np.asarray(platform.inertia.linear,
+                                         dtype=float).dot(gravity)
+        self.center_of_gravity = _np.pad(
+                _np.asarray(platform.center_of_gravity, dtype=float),
+                (0, 3 - _np.asarray(platform.center_of_gravity).size))
+
+        # translational and rotational degrees of freedom of the platform
+        self.translation_index = _np.arange(platform.dof_translation)
+        rotation_index = {
+                0: [],
+                1: [2],
+                2: [0, 1],
+                3: [0, 1, 2],
+        }[platform.dof_rotation]
+        self.dof_index = _np.hstack((self.translation_index,
+                                     3 + _np.asarray(rotation_index,
+                                                     dtype=int))).astype(int)
+
+        # axial stiffness `E * A` of each cable
+        if axial_stiffness is None:
+            axial_stiffness = []
+            for kc in chains:
+                cable = robot.cables[kc.cable]
+                elasticities = cable.elasticities
+                modulus = _np.asarray(elasticities).ravel()[0] \
+                    if elasticities is not None else _np.inf
+                axial_stiffness.append(
+                        modulus * _np.pi * (cable.diameter ** 2) / 4.0
+                        if cable.diameter else _np.inf)
+        self.axial_stiffness = _np.broadcast_to(
+                _np.asarray(axial_stiffness, dtype=float), (num,)).copy()
+
+        # mass per unit length of each cable; unset densities count as
+        # massless cables
+        if linear_density is None:
+            linear_density = [robot.cables[kc.cable].density
+                              for kc in chains]
+        linear_density = _np.broadcast_to(
+                _np.asarray(linear_density, dtype=float), (num,)).copy()
+        linear_density[~_np.isfinite(linear_density)] = 0.0
+        self.linear_density = linear_density
+
+    @property
+    def num_cables(self):
+        return self.frame_anchors.shape[0]
+
+
+def _skew(vectors: Matrix):
+    """
+    Batched skew-symmetric cross-product matrices of `(..., 3)` vectors
+    """
+    vectors = _np.asarray(vectors)
+    skew = _np.zeros(vectors.shape + (3,))
+    skew[..., 0, 1] = -vectors[..., 2]
+    skew[..., 0, 2] = vectors[..., 1]
+    skew[..., 1, 0] = vectors[..., 2]
+    skew[..., 1, 2] = -vectors[..., 0]
+    skew[..., 2, 0] = -vectors[..., 1]
+    skew[..., 2, 1] = vectors[..., 0]
+
+    return skew
+
+
+def _rodrigues(rotvec: Matrix):
+    """
+    Batched rotation matrices of `(K, 3)` rotation vectors
+    """
+    angle = _np.linalg.norm(rotvec, axis=1)
+    safe = _np.where(angle > 0, angle, 1.0)
+    skew = _skew(rotvec / safe[:, None])
+    sin = _np.sin(angle)[:, None, None]
+    cos = _np.cos(angle)[:, None, None]
+
+    return _np.eye(3)[None, :, :] + sin * skew \
+           + (1 - cos) * _np.einsum('nij,njk->nik', skew, skew)
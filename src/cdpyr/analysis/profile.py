@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Profile',
+        'caches',
+]
+
+import contextlib
+import time
+from typing import Dict, Iterable, List
+
+from magic_repr import make_repr
+
+from cdpyr.analysis import cache as _cache
+
+
+class Profile(object):
+    """
+    Per-stage counters and cumulative timings of an analysis.
+
+    Stages are timed exclusively where they are calculated i.e., the
+    `kinematics`, `segments`, `structure_matrix`, and `force_distribution`
+    stages of a pose's context each only count their own calculation, while
+    pose generation is timed as `poses`. Criteria are timed inclusively as
+    `criterion.<name>` and thus contain the stages they trigger.
+
+    Pass an instance as `profile` to a workspace algorithm or criterion to
+    opt in. Without a profile, no timer is read and no counter is
+    incremented. A profile accumulates over all evaluations until `reset`.
+    """
+
+    poses: int
+    invalid: int
+    comparisons: int
+    early_exits: int
+    cache_hits: int
+    cache_misses: int
+    context_hits: int
+    context_misses: int
+    _counts: Dict[str, int]
+    _times: Dict[str, float]
+    _rejections: Dict[str, int]
+
+    def __init__(self):
+        self.reset()
+
+    @property
+    def counts(self):
+        """
+        Number of calculations per stage
+        """
+        return dict(self._counts)
+
+    @property
+    def times(self):
+        """
+        Cumulative seconds per stage
+        """
+        return dict(self._times)
+
+    @property
+    def rejections(self):
+        """
+        Number of poses each criterion found invalid
+        """
+        return dict(self._rejections)
+
+    @property
+    def early_exit_rate(self):
+        """
+        Fraction of coordinates whose comparator returned before checking
+        all poses of the archetype
+        """
+        return self.early_exits / self.comparisons if self.comparisons \
+            else 0.0
+
+    @property
+    def invalid_rate(self):
+        return self.invalid / self.poses if self.poses else 0.0
+
+    @property
+    def cache_hit_rate(self):
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    @property
+    def context_hit_rate(self):
+        total = self.context_hits + self.context_misses
+        return self.context_hits / total if total else 0.0
+
+    def add(self, stage: str, seconds: float, count: int = 1):
+        """
+        Add a timing to a stage
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        seconds : float
+            Duration of the stage in seconds.
+        count : int
+            Number of calculations the duration covers.
+        """
+        self._counts[stage] = self._counts.get(stage, 0) + count
+        self._times[stage] = self._times.get(stage, 0.0) + seconds
+
+    def reject(self, criterion: str):
+        self._rejections[criterion] = self._rejections.get(criterion, 0) + 1
+
+    @contextlib.contextmanager
+    def stage(self, stage: str):
+        """
+        Time the enclosed block as one calculation of `stage`
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    @contextlib.contextmanager
+    def track(self, caches: Iterable[_cache.Cache]):
+        """
+        Count the hits and misses of `caches` within the enclosed block
+        """
+        caches = list(caches)
+        before = [(cache.hits, cache.misses) for cache in caches]
+        try:
+            yield self
+        finally:
+            for cache, (hits, misses) in zip(caches, before):
+                self.cache_hits += cache.hits - hits
+                self.cache_misses += cache.misses - misses
+
+    def merge(self, other: Profile):
+        """
+        Add all counters and timings of another profile e.g., of a worker
+        process
+        """
+        for stage, seconds in other._times.items():
+            self.add(stage, seconds, other._counts[stage])
+        for criterion, count in other._rejections.items():
+            self._rejections[criterion] = \
+                self._rejections.get(criterion, 0) + count
+        self.poses += other.poses
+        self.invalid += other.invalid
+        self.comparisons += other.comparisons
+        self.early_exits += other.early_exits
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.context_hits += other.context_hits
+        self.context_misses += other.context_misses
+
+    def reset(self):
+        self.poses = 0
+        self.invalid = 0
+        self.comparisons = 0
+        self.early_exits = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.context_hits = 0
+        self.context_misses = 0
+        self._counts = {}
+        self._times = {}
+        self._rejections = {}
+
+    __repr__ = make_repr(
+            'poses',
+            'invalid',
+            'early_exit_rate',
+            'cache_hit_rate',
+            'context_hit_rate',
+            'times',
+    )
+
+
+def caches(*objects) -> List[_cache.Cache]:
+    """
+    Caches used by analysis objects e.g., the kinematics of a criterion
+
+    Parameters
+    ----------
+    objects
+        Criteria, algorithms, or sequences thereof to search.
+
+    Returns
+    -------
+    caches : List[Cache]
+        Every cache found once.
+    """
+    found = []
+    seen = set()
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, _cache.Cache):
+            found.append(obj)
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        # only descend into analysis objects and not e.g., robots
+        elif type(obj).__module__.startswith('cdpyr.analysis'):
+            try:
+                stack.extend(vars(obj).values())
+            except TypeError:
+                pass
+
+    return found
@@ -3,6 +3,8 @@ __email__ = "p.tempel@tudelft.nl"
 
 __all__ = [
         'Calculator',
+        'decompose',
 ]
 
 from cdpyr.analysis.structure_matrix.calculator import Calculator
+from cdpyr.analysis.structure_matrix.structure_matrix import decompose
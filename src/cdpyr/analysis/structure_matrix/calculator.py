@@ -6,11 +6,14 @@ __all__ = [
         'Calculator',
 ]
 
-from typing import AnyStr, Dict
+from typing import AnyStr, Dict, Optional, TYPE_CHECKING
 
 import numpy as _np
 
-from cdpyr.analysis import evaluator as _evaluator
+from cdpyr.analysis import (
+    buffer as _buffer,
+    evaluator as _evaluator,
+)
 from cdpyr.analysis.kinematics import kinematics as _kinematics
 from cdpyr.analysis.structure_matrix import (
     motion_pattern_1r2t as _structure_matrix_1r2t,
@@ -23,18 +26,28 @@ from cdpyr.analysis.structure_matrix import (
 )
 from cdpyr.motion import pattern as _pattern, pose as _pose
 from cdpyr.robot import robot as _robot
+from cdpyr.typing import Matrix
+
+if TYPE_CHECKING:
+    from cdpyr.analysis import cache as _cache_
 
 
 class Calculator(_evaluator.PoseEvaluator):
     kinematics: _kinematics.Algorithm
     resolver: Dict[AnyStr, _structure_matrix.Algorithm]
+    _cache: Optional[_cache_.Cache]
+    _buffer: Optional[_buffer.Buffer]
 
     def __init__(self,
                  kinematics: _kinematics.Algorithm,
                  resolver: Dict[AnyStr, _structure_matrix.Algorithm] = None,
+                 cache: Optional[_cache_.Cache] = None,
+                 buffer: Optional[_buffer.Buffer] = None,
                  **kwargs):
         super().__init__(**kwargs)
         self.kinematics = kinematics
+        self.cache = cache
+        self.buffer = buffer
         if resolver is None:
             resolver = {
                     _pattern.MP_1T:
@@ -52,10 +65,43 @@ class Calculator(_evaluator.PoseEvaluator):
             }
         self.resolver = resolver
 
+    @property
+    def cache(self):
+        # share the cache of the kinematics unless given explicitly
+        if self._cache is None:
+            return getattr(self.kinematics, 'cache', None)
+
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[_cache_.Cache]):
+        self._cache = cache
+
+    @cache.deleter
+    def cache(self):
+        del self._cache
+
+    @property
+    def buffer(self):
+        # share the buffer of the kinematics unless given explicitly
+        if self._buffer is None:
+            return getattr(self.kinematics, 'buffer', None)
+
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer: Optional[_buffer.Buffer]):
+        self._buffer = buffer
+
+    @buffer.deleter
+    def buffer(self):
+        del self._buffer
+
     def evaluate(self,
                  robot: _robot.Robot,
                  pose: _pose.Pose,
                  *args,
+                 kinematics: Optional[_kinematics.Result] = None,
                  **kwargs) -> _structure_matrix.Result:
         if robot.num_platforms > 1:
             raise NotImplementedError(
@@ -63,8 +109,27 @@ class Calculator(_evaluator.PoseEvaluator):
                     'robots with more than one platform.'
             )
 
-        # solve inverse kinematics
-        kinematics = self.kinematics.backward(robot, pose)
+        # reuse results of equal poses if caching is enabled, which must not
+        # share arrays of the buffer
+        cache = self.cache
+        if cache is not None:
+            return cache.get(
+                    cache.key(robot,
+                              pose,
+                              self.kinematics.__class__,
+                              'structure_matrix'),
+                    lambda: self._evaluate(robot, pose, kinematics))
+
+        return self._evaluate(robot, pose, kinematics, self.buffer)
+
+    def _evaluate(self,
+                  robot: _robot.Robot,
+                  pose: _pose.Pose,
+                  kinematics: Optional[_kinematics.Result] = None,
+                  buffer: Optional[_buffer.Buffer] = None):
+        # solve inverse kinematics unless already solved
+        if kinematics is None:
+            kinematics = self.kinematics.backward(robot, pose)
 
         # platform index (to fake the `for platform` loop)
         platform_index = 0
@@ -74,5 +139,90 @@ class Calculator(_evaluator.PoseEvaluator):
 
         return self.resolver[platform.motion_pattern].evaluate(
                 pose,
-                platform.bi[[kc.platform_anchor for kc in robot.kinematic_chains.with_platform(platform_index)], :],
-                kinematics.directions)
+                self._platform_anchors(robot, platform_index, buffer),
+                kinematics.directions,
+                buffer=buffer)
+
+    def evaluate_batch(self,
+                       robot: _robot.Robot,
+                       positions: Matrix,
+                       dcms: Optional[Matrix] = None,
+                       out: Optional[Matrix] = None,
+                       directions: Optional[Matrix] = None,
+                       **kwargs) -> Matrix:
+        """
+        Evaluate the structure matrices of many poses at once
+
+        Parameters
+        ----------
+        robot : Robot
+            Robot to evaluate the structure matrices of.
+        positions : Matrix
+            `(K, 3)` array of platform positions.
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices. Defaults to the
+            identity for every pose.
+        out : Matrix
+            Optional `(K, N, M)` array to write the structure matrices into.
+            Taken from the buffer if not given and the calculator has one.
+        directions : Matrix
+            Optional `(K, M, NL)` array of cable directions of an already
+            solved inverse kinematics.
+
+        Returns
+        -------
+        matrices : Matrix
+            `(K, N, M)` array of stacked structure matrices, `out` if given.
+        """
+        if robot.num_platforms > 1:
+            raise NotImplementedError(
+                    'Structure matrices are currently not implemented for '
+                    'robots with more than one platform.'
+            )
+
+        positions = _np.asarray(positions, dtype=float)
+        if dcms is None:
+            dcms = _np.broadcast_to(_np.eye(3), (positions.shape[0], 3, 3))
+        dcms = _np.asarray(dcms, dtype=float)
+
+        # solve inverse kinematics of all poses unless already solved
+        if directions is None:
+            _, directions = self.kinematics.backward_batch(robot,
+                                                           positions,
+                                                           dcms,
+                                                           **kwargs)
+
+        # platform index (to fake the `for platform` loop)
+        platform_index = 0
+
+        # get the current  platform
+        platform = robot.platforms[platform_index]
+
+        buffer = self.buffer
+        if out is None and buffer is not None:
+            out = buffer.array((self, 'matrices'),
+                               (positions.shape[0],
+                                platform.dof,
+                                directions.shape[1]))
+
+        return self.resolver[platform.motion_pattern].evaluate_batch(
+                dcms,
+                self._platform_anchors(robot, platform_index, buffer),
+                directions,
+                out=out,
+                buffer=buffer)
+
+    def _platform_anchors(self,
+                          robot: _robot.Robot,
+                          platform_index: int,
+                          buffer: Optional[_buffer.Buffer] = None) -> Matrix:
+        # platform anchors of the platform's kinematic chains in order
+        platform = robot.platforms[platform_index]
+        kcs = robot.kinematic_chains.with_platform(platform_index)
+        anchors = _buffer.empty(buffer,
+                                (self, 'platform_anchors'),
+                                (len(kcs), 3))
+        for index, kc in enumerate(kcs):
+            anchors[index] = platform.anchors[kc.platform_anchor].linear.position
+
+        return anchors
@@ -6,8 +6,11 @@ __all__ = [
         'MotionPattern1R2T',
 ]
 
+from typing import Optional
+
 import numpy as _np
 
+from cdpyr.analysis import buffer as _buffer
 from cdpyr.analysis.structure_matrix import structure_matrix as _algorithm
 from cdpyr.motion import pose as _pose
 from cdpyr.typing import Matrix, Vector
@@ -18,15 +21,46 @@ class MotionPattern1R2T(_algorithm.Algorithm):
     def _evaluate(self,
                   pose: _pose.Pose,
                   platform_anchors: Vector,
-                  directions: Matrix):
-        return _np.hstack((
-                directions,
-                pose.angular.dcm.dot(
-                        _np.cross(
-                                platform_anchors,
-                                directions,
-                                axis=1).transpose()
-                )[2, :, None])).transpose()
+                  directions: Matrix,
+                  buffer: Optional[_buffer.Buffer] = None):
+        num_cables, num_linear = _np.shape(directions)
+        out = _buffer.empty(buffer,
+                            (self, 'matrix'),
+                            (1, num_linear + 1, num_cables))
+
+        return self._evaluate_batch(
+                _np.asarray(pose.angular.dcm, dtype=float)[None, :, :],
+                _np.asarray(platform_anchors, dtype=float),
+                _np.asarray(directions, dtype=float)[None, :, :],
+                out=out,
+                buffer=buffer)[0]
+
+    def _evaluate_batch(self,
+                        dcms: Matrix,
+                        platform_anchors: Matrix,
+                        directions: Matrix,
+                        out: Optional[Matrix] = None,
+                        buffer: Optional[_buffer.Buffer] = None):
+        num_poses, num_cables, num_linear = directions.shape
+        if out is None:
+            out = _np.empty((num_poses, num_linear + 1, num_cables))
+
+        # translational rows are the cable directions and rotational rows
+        # their moments about the platform anchors
+        _np.copyto(out[:, 0:num_linear, :], directions.transpose((0, 2, 1)))
+        _algorithm.moments(dcms[:, 2:3, :],
+                           platform_anchors,
+                           directions,
+                           out[:, num_linear:, :],
+                           _buffer.empty(buffer,
+                                         (self, 'cross'),
+                                         (num_poses, num_cables, 3)),
+                           _buffer.empty(buffer,
+                                         (self, 'skew'),
+                                         (num_cables * num_linear,
+                                          num_cables * 3)))
+
+        return out
 
     def _derivative(self,
                     pose: _pose.Pose,
@@ -6,6 +6,11 @@ __all__ = [
         'MotionPattern1T',
 ]
 
+from typing import Optional
+
+import numpy as _np
+
+from cdpyr.analysis import buffer as _buffer
 from cdpyr.analysis.structure_matrix import structure_matrix as _algorithm
 from cdpyr.motion import pose as _pose
 from cdpyr.typing import Matrix, Vector
@@ -16,9 +21,23 @@ class MotionPattern1T(_algorithm.Algorithm):
     def _evaluate(self,
                   pose: _pose.Pose,
                   platform_anchors: Vector,
-                  directions: Matrix):
+                  directions: Matrix,
+                  buffer: Optional[_buffer.Buffer] = None):
         return directions[:, 0:1].transpose()
 
+    def _evaluate_batch(self,
+                        dcms: Matrix,
+                        platform_anchors: Matrix,
+                        directions: Matrix,
+                        out: Optional[Matrix] = None,
+                        buffer: Optional[_buffer.Buffer] = None):
+        matrices = directions[:, :, 0:1].transpose((0, 2, 1))
+        if out is None:
+            return matrices
+
+        _np.copyto(out, matrices)
+        return out
+
     def _derivative(self,
                     pose: _pose.Pose,
                     platform_anchors: Vector,
@@ -5,16 +5,21 @@ __email__ = "p.tempel@tudelft.nl"
 __all__ = [
         'Algorithm',
         'Result',
+        'decompose',
+        'moments',
 ]
 
 from abc import abstractmethod
-from typing import Union
+from typing import Optional, Tuple, Union
 
 import numpy as _np
 from magic_repr import make_repr
-from scipy.linalg import null_space
 
-from cdpyr.analysis import evaluator as _evaluator, result as _result
+from cdpyr.analysis import (
+    buffer as _buffer,
+    evaluator as _evaluator,
+    result as _result,
+)
 from cdpyr.motion import pose as _pose
 from cdpyr.typing import Matrix, Vector
 
@@ -24,8 +29,45 @@ class Algorithm(_evaluator.Evaluator):
     def evaluate(self,
                  pose: _pose.Pose,
                  platform_anchors: Vector,
-                 directions: Matrix) -> Result:
-        return Result(pose, self._evaluate(pose, platform_anchors, directions))
+                 directions: Matrix,
+                 buffer: Optional[_buffer.Buffer] = None) -> Result:
+        return Result(pose, self._evaluate(pose,
+                                           platform_anchors,
+                                           directions,
+                                           buffer=buffer))
+
+    def evaluate_batch(self,
+                       dcms: Matrix,
+                       platform_anchors: Matrix,
+                       directions: Matrix,
+                       out: Optional[Matrix] = None,
+                       buffer: Optional[_buffer.Buffer] = None) -> Matrix:
+        """
+        Evaluate the structure matrices of many poses at once
+
+        Parameters
+        ----------
+        dcms : Matrix
+            `(K, 3, 3)` array of platform rotation matrices.
+        platform_anchors : Matrix
+            `(M, 3)` array of platform anchors in platform coordinates.
+        directions : Matrix
+            `(K, M, NL)` array of unit cable directions.
+        out : Matrix
+            Optional `(K, N, M)` array to write the structure matrices into.
+        buffer : Buffer
+            Optional buffer to take intermediate arrays from.
+
+        Returns
+        -------
+        matrices : Matrix
+            `(K, N, M)` array of structure matrices, `out` if given.
+        """
+        return self._evaluate_batch(_np.asarray(dcms),
+                                    _np.asarray(platform_anchors),
+                                    _np.asarray(directions),
+                                    out=out,
+                                    buffer=buffer)
 
     def derivative(self,
                    pose: _pose.Pose,
@@ -37,9 +79,27 @@ class Algorithm(_evaluator.Evaluator):
     def _evaluate(self,
                   pose: _pose.Pose,
                   platform_anchors: Vector,
-                  directions: Matrix) -> Result:
+                  directions: Matrix,
+                  buffer: Optional[_buffer.Buffer] = None) -> Result:
         raise NotImplementedError()
 
+    def _evaluate_batch(self,
+                        dcms: Matrix,
+                        platform_anchors: Matrix,
+                        directions: Matrix,
+                        out: Optional[Matrix] = None,
+                        buffer: Optional[_buffer.Buffer] = None) -> Matrix:
+        # fallback for motion patterns without a vectorized implementation
+        matrices = _np.asarray([self._evaluate(_pose.Pose(dcm=dcm),
+                                               platform_anchors,
+                                               direction)
+                                for dcm, direction in zip(dcms, directions)])
+        if out is None:
+            return matrices
+
+        out[...] = matrices
+        return out
+
     @abstractmethod
     def _derivative(self,
                     pose: _pose.Pose,
@@ -52,6 +112,7 @@ class Result(_result.PoseResult):
     _matrix: Matrix
     _kernel: Matrix
     _pinv: Matrix
+    _svd: Optional[Tuple[Matrix, Vector, Matrix, int]]
 
     def __init__(self,
                  pose: _pose.Pose,
@@ -61,6 +122,7 @@ class Result(_result.PoseResult):
         self._matrix = matrix.matrix if isinstance(matrix, Result) else matrix
         self._kernel = None
         self._pinv = None
+        self._svd = None
 
     @property
     def inv(self):
@@ -71,12 +133,13 @@ class Result(_result.PoseResult):
         # according to Pott.2018, a pose is singular if the structure
         # matrix's rank is smaller than the number of degrees of freedom
         # i.e., the structure matrix's number of rows
-        return _np.linalg.matrix_rank(self._matrix) >= self._matrix.shape[0]
+        return self.rank < self._matrix.shape[0]
 
     @property
     def kernel(self):
         if self._kernel is None:
-            self._kernel = null_space(self._matrix)
+            _, _, vh, rank = self.svd
+            self._kernel = vh[rank:, :].T
 
         return self._kernel
 
@@ -95,15 +158,165 @@ class Result(_result.PoseResult):
     @property
     def pinv(self):
         if self._pinv is None:
-            if self._matrix.shape[0] == self._matrix.shape[1]:
-                self._pinv = _np.linalg.inv(self._matrix)
-            else:
-                self._pinv = _np.linalg.pinv(self._matrix)
+            u, s, vh, rank = self.svd
+            self._pinv = _np.dot(vh[:rank, :].T / s[:rank],
+                                 u[:, :rank].T)
 
         return self._pinv
 
+    @property
+    def rank(self):
+        return self.svd[3]
+
+    @property
+    def singular_values(self):
+        return self.svd[1]
+
+    @property
+    def svd(self):
+        """
+        Full singular value decomposition `A = U diag(s) V^H` with the
+        numerical rank, computed once and shared by `kernel`, `pinv`, and
+        `is_singular`
+
+        Returns
+        -------
+        u : Matrix
+        s : Vector
+        vh : Matrix
+        rank : int
+        """
+        if self._svd is None:
+            matrix = _np.asarray(self._matrix)
+            u, s, vh = _np.linalg.svd(matrix, full_matrices=True)
+            rank = int((s > _tolerance(s[0] if s.size else 0.0,
+                                       matrix.shape)).sum())
+            self._svd = (u, s, vh, rank)
+
+        return self._svd
+
     __repr__ = make_repr(
             'pose',
             'matrix',
             'kernel',
     )
+
+
+def decompose(matrices: Matrix, return_rank: bool = False) -> \
+        Union[Tuple[Matrix, Matrix], Tuple[Matrix, Matrix, Vector]]:
+    """
+    Kernels and pseudo-inverses of many structure matrices from one SVD each
+
+    Parameters
+    ----------
+    matrices : Matrix
+        `(K, N, M)` array of structure matrices.
+    return_rank : bool
+        If `True`, also return the numerical ranks with the same tolerance
+        as `Result.rank`.
+
+    Returns
+    -------
+    kernels : Matrix
+        `(K, M, M - N)` array of orthonormal kernels. For matrices not of
+        full row rank, these span only part of the actual kernel.
+    pinvs : Matrix
+        `(K, M, N)` array of pseudo-inverses, which ignore singular values
+        below the rank tolerance just like `Result.pinv`.
+    ranks : Vector
+        `(K,)` array of numerical ranks, only returned if `return_rank` is
+        `True`.
+    """
+    matrices = _np.asarray(matrices, dtype=float)
+    num_poses, num_rows, num_columns = matrices.shape
+    u, s, vh = _np.linalg.svd(matrices, full_matrices=True)
+
+    # reciprocal singular values, zero for those below the rank tolerance
+    tolerance = _tolerance(s[:, 0:1] if s.size else _np.zeros((num_poses, 1)),
+                           matrices.shape[1:])
+    reciprocal = _np.zeros_like(s)
+    nonzero = s > tolerance
+    _np.divide(1.0, s, out=reciprocal, where=nonzero)
+
+    rank = min(num_rows, num_columns)
+    kernels = vh[:, rank:, :].transpose((0, 2, 1))
+    pinvs = _np.matmul(vh[:, :rank, :].transpose((0, 2, 1))
+                       * reciprocal[:, None, :],
+                       u[:, :, :rank].transpose((0, 2, 1)))
+
+    if return_rank:
+        return kernels, pinvs, nonzero.sum(axis=1)
+
+    return kernels, pinvs
+
+
+def moments(dcms: Matrix,
+            platform_anchors: Matrix,
+            directions: Matrix,
+            out: Matrix,
+            cross: Optional[Matrix] = None,
+            skew: Optional[Matrix] = None) -> Matrix:
+    """
+    Rotational rows `R (b_i x u_i)` of many structure matrices at once
+
+    Fused kernel writing into preallocated arrays: the cross products of
+    all cables are one matrix product of the flattened directions with the
+    block-diagonal skew-symmetric matrices of the platform anchors, and
+    are rotated by one batched product, so nothing but the optional `cross`
+    and `skew` buffers is allocated. Both products run in BLAS which is
+    considerably faster than `np.cross` or `np.einsum` on the short rows of
+    one pose.
+
+    Parameters
+    ----------
+    dcms : Matrix
+        `(K, NR, 3)` array of the rows of the platform rotation matrices
+        that enter the structure matrix.
+    platform_anchors : Matrix
+        `(M, 3)` array of platform anchors in platform coordinates.
+    directions : Matrix
+        `(K, M, NL)` array of unit cable directions with `NL` being 2 for
+        planar and 3 for spatial robots.
+    out : Matrix
+        `(K, NR, M)` array to write the rotational rows into.
+    cross : Matrix
+        Optional C-contiguous `(K, M, 3)` array to hold the cross products.
+    skew : Matrix
+        Optional C-contiguous `(M * NL, M * 3)` array to hold the
+        block-diagonal skew-symmetric matrices.
+
+    Returns
+    -------
+    out : Matrix
+    """
+    num_poses, num_cables, num_linear = directions.shape
+    if cross is None:
+        cross = _np.empty((num_poses, num_cables, 3))
+    if skew is None:
+        skew = _np.empty((num_cables * num_linear, num_cables * 3))
+
+    # `u^T [b]_x^T` of every cable on the diagonal, planar directions have
+    # no z-component
+    skew.fill(0.0)
+    blocks = _np.einsum('ijik->ijk',
+                        skew.reshape((num_cables, num_linear, num_cables, 3)))
+    anchor_x, anchor_y, anchor_z = _np.asarray(platform_anchors,
+                                               dtype=float).T
+    blocks[:, 0, 1] = anchor_z
+    _np.negative(anchor_y, out=blocks[:, 0, 2])
+    _np.negative(anchor_z, out=blocks[:, 1, 0])
+    blocks[:, 1, 2] = anchor_x
+    if num_linear == 3:
+        blocks[:, 2, 0] = anchor_y
+        _np.negative(anchor_x, out=blocks[:, 2, 1])
+
+    _np.matmul(directions.reshape((num_poses, num_cables * num_linear)),
+               skew,
+               out=cross.reshape((num_poses, num_cables * 3)))
+
+    return _np.matmul(dcms, cross.transpose((0, 2, 1)), out=out)
+
+
+def _tolerance(largest, shape):
+    # same rank tolerance as `scipy.linalg.null_space`
+    return largest * max(shape) * _np.finfo(float).eps
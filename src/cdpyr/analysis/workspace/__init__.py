@@ -7,6 +7,8 @@ __all__ = [
         'HullResult',
         'Grid',
         'GridResult',
+        'store',
+        'Store',
 ]
 
 from cdpyr.analysis.workspace import grid, hull
@@ -18,3 +20,5 @@ from cdpyr.analysis.workspace.hull import (
     Algorithm as Hull,
     Result as HullResult,
 )
+from cdpyr.analysis.workspace import store
+from cdpyr.analysis.workspace.store import Store
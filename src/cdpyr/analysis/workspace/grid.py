@@ -16,6 +16,7 @@ import numpy as _np
 from joblib import delayed, Parallel
 from scipy.spatial import Delaunay as _Delaunay
 
+from cdpyr.analysis import profile as _profile
 from cdpyr.analysis.archetype import archetype as _archetype
 from cdpyr.analysis.criterion import criterion as _criterion
 from cdpyr.analysis.workspace import workspace as _workspace
@@ -112,27 +113,40 @@ class Algorithm(_workspace.Algorithm):
 
     def _evaluate(self, robot: _robot.Robot, *args, **kwargs) -> 'Result':
 
-        # quicker look ups
-        archetype_ = self._archetype
-        comparator_ = archetype_.comparator
-        criterion_ = self._criterion
+        profile = kwargs.pop('profile', None)
 
         # parallelized evaluation
         if kwargs.pop('parallel', False):
             n_jobs = kwargs.pop('n_jobs', multiprocessing.cpu_count())
+            profiled = profile is not None
 
             def _check__coordinate_parallel(r, c):
-                return c, self._check__coordinate(r, c)
+                if not profiled:
+                    return c, self._check_coordinate(r, c), None
 
-            coordinates, flags = list(zip(
+                # workers profile into their own profile which is merged
+                # afterwards
+                p = _profile.Profile()
+                with p.track(_profile.caches(self._criterion)):
+                    flag = self._check_coordinate(r, c, p)
+                return c, flag, p
+
+            coordinates, flags, profiles = list(zip(
                     *Parallel(n_jobs=n_jobs, **kwargs)(
                             ( delayed(_check__coordinate_parallel)(robot, c)
                               for c in self.coordinates() )
                     )
             ))
+            if profile is not None:
+                for p in profiles:
+                    profile.merge(p)
         # non-parallelized, fancy list comprehension
         else:
-            coordinates, flags = list(zip(*((coordinate, self._check__coordinate(robot, coordinate)) for coordinate in self.coordinates())))
+            coordinates, flags = list(zip(
+                    *((coordinate,
+                       self._check_coordinate(robot, coordinate, profile))
+                      for coordinate in self.coordinates())
+            ))
 
         # return the tuple of poses that were evaluated
         return Result(
@@ -143,17 +157,6 @@ class Algorithm(_workspace.Algorithm):
                 flags
         )
 
-    def _check__coordinate(self,
-                            robot: _robot.Robot,
-                            coordinate: _np.ndarray,
-                            ):
-        # quicker look ups
-        archetype_ = self._archetype
-        comparator_ = archetype_.comparator
-        criterion_ = self._criterion
-
-        return comparator_(self._check_pose(robot, pose, criterion_) for pose in archetype_.poses(coordinate))
-
 
 class Result(_workspace.Result, abc.Collection):
     _coordinates: Matrix
@@ -8,11 +8,12 @@ __all__ = [
 ]
 
 import multiprocessing
-from typing import Union
+from typing import Optional, Union
 
 import numpy as _np
 from joblib import delayed, Parallel
 
+from cdpyr.analysis import profile as _profile
 from cdpyr.analysis.archetype import archetype as _archetype
 from cdpyr.analysis.criterion import criterion as _criterion
 from cdpyr.analysis.workspace import workspace as _workspace
@@ -79,22 +80,31 @@ class Algorithm(_workspace.Algorithm):
         min_step = 0.5 ** self.maximum_halvings
         max_iters = self.maximum_iterations
 
+        profile = kwargs.pop('profile', None)
+
         # parallelized code of hull method
         if kwargs.pop('parallel', False):
             n_jobs = kwargs.pop('n_jobs', multiprocessing.cpu_count())
             vertices = Parallel(n_jobs=n_jobs, **kwargs)(
-                    delayed(self.__check_direction)(robot,
-                                                    direction,
-                                                    min_step,
-                                                    max_iters)
+                    delayed(self.__check_direction_parallel)(robot,
+                                                             direction,
+                                                             min_step,
+                                                             max_iters,
+                                                             profile
+                                                             is not None)
                     for direction in search_directions)
+            if profile is not None:
+                vertices, profiles = zip(*vertices)
+                for p in profiles:
+                    profile.merge(p)
         # non-parallelized, list-comprehension code of hull method
         else:
             vertices = list(
                     self.__check_direction(robot,
                                            direction,
                                            min_step,
-                                           max_iters)
+                                           max_iters,
+                                           profile)
                     for direction in search_directions)
 
         # return the hull result object
@@ -104,11 +114,30 @@ class Algorithm(_workspace.Algorithm):
                       vertices,
                       faces)
 
+    def __check_direction_parallel(self,
+                                   robot,
+                                   direction: Vector,
+                                   min_step: float,
+                                   max_iters: int,
+                                   profiled: bool):
+        if not profiled:
+            return self.__check_direction(robot, direction, min_step,
+                                          max_iters)
+
+        # workers profile into their own profile which is merged afterwards
+        profile = _profile.Profile()
+        with profile.track(_profile.caches(self._criterion)):
+            vertex = self.__check_direction(robot, direction, min_step,
+                                            max_iters, profile)
+
+        return vertex, profile
+
     def __check_direction(self,
                           robot,
                           direction: Vector,
                           min_step: float,
-                          max_iters: int):
+                          max_iters: int,
+                          profile: Optional[_profile.Profile] = None):
         # step length along this coordinate
         step_length = 1
 
@@ -119,11 +148,6 @@ class Algorithm(_workspace.Algorithm):
         # init the current coordinate
         coordinate = self._center
 
-        # quicker look ups
-        archetype_ = self._archetype
-        comparator_ = archetype_.comparator
-        criterion_ = self._criterion
-
         # as long as the step size isn't too small
         while step_length >= min_step and kiter <= max_iters:
             # calculate a trial coordinate along the search direction with
@@ -132,8 +156,7 @@ class Algorithm(_workspace.Algorithm):
 
             # check if any/all pose(s) are valid according to the criterion's
             # comparator
-            if comparator_(self._check_pose(robot, pose, criterion_)
-                           for pose in archetype_.poses(coordinate_trial)):
+            if self._check_coordinate(robot, coordinate_trial, profile):
                 coordinate = coordinate_trial
             # one or all pose(s) are invalid, so reduce step size
             else:
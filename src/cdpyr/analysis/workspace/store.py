@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'describe',
+        'dump',
+        'key',
+        'load',
+        'Store',
+]
+
+import copy
+import hashlib
+import inspect
+import json
+import os
+import pathlib as _pl
+import types
+from typing import AnyStr, Callable, Optional, Union
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.analysis import cache as _cache
+from cdpyr.analysis.workspace import workspace as _workspace
+from cdpyr.helper.resolve import full_classname as fcn
+from cdpyr.robot import robot as _robot
+from cdpyr.stream import parser as _parser, stream as _stream
+
+# version of the stored description, results of other versions are rebuilt
+VERSION = 1
+
+# attributes of algorithms that do not change their results, including
+# state they update while evaluating like warm starts
+RUNTIME = ('buffer', 'cache', 'forward_last_direction', 'index_vertex',
+           'previous', 'profile', 'store')
+
+
+def describe(o):
+    """
+    Description of an algorithm and all its parameters
+
+    Objects are described by their class and their attributes, recursively,
+    such that equal configurations of workspace algorithms, archetypes, and
+    criteria have equal descriptions. Attributes that only hold runtime
+    state like caches, buffers, or profiles are left out.
+
+    Parameters
+    ----------
+    o : object
+        Object to describe e.g., a workspace algorithm.
+
+    Returns
+    -------
+    description : object
+        JSON-serializable description.
+    """
+    return _describe(o, set())
+
+
+def key(algorithm: _workspace.Algorithm, robot: _robot.Robot) -> str:
+    """
+    Content address of the workspace of a robot
+
+    Parameters
+    ----------
+    algorithm : Algorithm
+        Workspace algorithm with its archetype and criterion.
+    robot : Robot
+        Robot whose workspace is determined.
+
+    Returns
+    -------
+    key : str
+        Hexadecimal digest of the algorithm's description and the robot's
+        fingerprint.
+    """
+    return _key(describe(algorithm), _cache.fingerprint(robot))
+
+
+def dump(file: Union[AnyStr, _pl.Path],
+         result: _workspace.Result,
+         robot: Optional[_robot.Robot] = None):
+    """
+    Write a grid or hull workspace result to an NPZ archive
+
+    Coordinates and flags, or vertices and faces, are stored as binary
+    arrays. The description of the algorithm, its archetype and criterion,
+    and the robot's fingerprint are written alongside them and available
+    from `meta` of the loaded result. The given result is left untouched.
+
+    Parameters
+    ----------
+    file : AnyStr | Path
+        Path of the archive.
+    result : Result
+        Result of a grid or hull workspace algorithm.
+    robot : Robot
+        Optional robot the result was determined for.
+    """
+    if result.algorithm is not None:
+        description = describe(result.algorithm)
+        fingerprint = _cache.fingerprint(robot) \
+            if robot is not None \
+            else None
+        result = copy.copy(result)
+        result.meta = {
+                'version':   VERSION,
+                'key':       _key(description, fingerprint)
+                             if fingerprint is not None
+                             else None,
+                'robot':     fingerprint,
+                'algorithm': description,
+        }
+
+    with open(file, 'wb') as f:
+        _stream.Stream(_parser.Npz()).dump(f, result)
+
+
+def load(file: Union[AnyStr, _pl.Path],
+         mmap_mode: Optional[str] = 'r') -> _workspace.Result:
+    """
+    Load a grid or hull workspace result from an NPZ archive
+
+    Parameters
+    ----------
+    file : AnyStr | Path
+        Path of the archive.
+    mmap_mode : str
+        Mode to memory-map arrays with, see `numpy.memmap`. `None` reads
+        arrays into memory. Defaults to `'r'`.
+
+    Returns
+    -------
+    result : Result
+        Result without algorithm, archetype, and criterion, whose
+        description is available from `result.meta`.
+    """
+    with open(file, 'rb') as f:
+        return _stream.Stream(_parser.Npz()).load(f, mmap_mode=mmap_mode)
+
+
+class Store(object):
+    """
+    Content-addressed store of workspace results in a directory
+
+    Results are stored under the key of their algorithm and robot, so a
+    workspace is determined only once for any configuration of algorithm,
+    archetype, criterion, and robot and loaded from the store afterwards.
+    Pass an instance as `store` to a workspace algorithm to opt in.
+    """
+
+    directory: _pl.Path
+    mmap_mode: Optional[str]
+    hits: int
+    misses: int
+
+    def __init__(self,
+                 directory: Union[AnyStr, _pl.Path],
+                 mmap_mode: Optional[str] = 'r'):
+        """
+        Parameters
+        ----------
+        directory : AnyStr | Path
+            Directory to store results in. Created if it does not exist.
+        mmap_mode : str
+            Mode to memory-map arrays of stored results with, see
+            `numpy.memmap`. Defaults to `'r'`.
+        """
+        self.directory = _pl.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.mmap_mode = mmap_mode
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> _pl.Path:
+        return self.directory / f'{key}.{_parser.Npz.EXT}'
+
+    def get(self,
+            algorithm: _workspace.Algorithm,
+            robot: _robot.Robot,
+            factory: Callable[[], _workspace.Result]) -> _workspace.Result:
+        """
+        Stored result of an algorithm's workspace of a robot if there is
+        one, otherwise store and return `factory()`
+
+        Parameters
+        ----------
+        algorithm : Algorithm
+            Workspace algorithm with its archetype and criterion.
+        robot : Robot
+            Robot whose workspace is determined.
+        factory : Callable
+            Function without arguments determining the workspace on a miss.
+
+        Returns
+        -------
+        result : Result
+        """
+        description = describe(algorithm)
+        digest = _key(description, _cache.fingerprint(robot))
+        file = self.path(digest)
+
+        try:
+            result = load(file, self.mmap_mode)
+        except (OSError, ValueError, KeyError):
+            result = None
+        if result is not None and (result.meta or {}).get('key') == digest:
+            self.hits += 1
+            # stored results were determined by an equal algorithm
+            result._algorithm = algorithm
+            result._archetype = algorithm.archetype
+            result._criterion = algorithm.criterion
+            return result
+
+        self.misses += 1
+        result = factory()
+
+        # write to a temporary file first so that no partial results are
+        # ever loaded
+        tmpfile = file.with_name(f'{file.name}.{os.getpid()}.tmp')
+        dump(tmpfile, result, robot)
+        os.replace(tmpfile, file)
+
+        return result
+
+    def clear(self):
+        for file in self.directory.glob(f'*.{_parser.Npz.EXT}'):
+            file.unlink()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: str):
+        return self.path(key).is_file()
+
+    def __len__(self):
+        return sum(1 for _ in self.directory.glob(f'*.{_parser.Npz.EXT}'))
+
+    __repr__ = make_repr(
+            'directory',
+            'hits',
+            'misses',
+    )
+
+
+def _key(description, fingerprint: str) -> str:
+    data = json.dumps({
+            'version':   VERSION,
+            'algorithm': description,
+            'robot':     fingerprint,
+    }, sort_keys=True)
+
+    return hashlib.blake2b(data.encode(), digest_size=20).hexdigest()
+
+
+def _describe(o, seen: set):
+    if o is None or isinstance(o, (bool, int, float, str)):
+        return o
+    if isinstance(o, _np.generic):
+        return o.item()
+    if isinstance(o, _np.ndarray):
+        return o.tolist()
+    if isinstance(o, (list, tuple)):
+        return [_describe(each, seen) for each in o]
+    if isinstance(o, dict):
+        return {str(k): _describe(v, seen) for k, v in o.items()}
+    # methods are described by their function and the object bound to
+    if inspect.ismethod(o):
+        return {'method': _describe(o.__func__, seen),
+                'self':   _describe(o.__self__, seen)}
+    # classes and functions are described by their names, unless they share
+    # their name with others like lambdas and functions defined inside other
+    # functions, which are described by their code and the values they use
+    if hasattr(o, '__qualname__'):
+        name = f'{getattr(o, "__module__", None)}.{o.__qualname__}'
+        if '<' not in o.__qualname__ or id(o) in seen:
+            return name
+        if not isinstance(o, types.FunctionType):
+            raise ValueError(f'Cannot describe `{name}` as it has no stable '
+                             f'identity.')
+        seen = seen | {id(o)}
+        return {'function': name,
+                'code':     _code(o.__code__),
+                'defaults': _describe(o.__defaults__, seen),
+                'closure':  [_describe(cell.cell_contents, seen)
+                             for cell in o.__closure__ or ()]}
+
+    # objects referencing each other are only described once
+    if id(o) in seen:
+        return {'class': fcn(o)}
+    seen = seen | {id(o)}
+
+    try:
+        items = sorted(vars(o).items())
+    except TypeError:
+        return {'class': fcn(o), 'repr': repr(o)}
+
+    return {'class':      fcn(o),
+            'attributes': {name.lstrip('_'): _describe(value, seen)
+                           for name, value in items
+                           if name.lstrip('_') not in RUNTIME}}
+
+
+def _code(code: types.CodeType) -> str:
+    # code objects nested in constants have no stable representation
+    digest = hashlib.blake2b(code.co_code, digest_size=20)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        digest.update((_code(const)
+                       if isinstance(const, types.CodeType)
+                       else repr(const)).encode())
+
+    return digest.hexdigest()
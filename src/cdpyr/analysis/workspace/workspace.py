@@ -7,27 +7,64 @@ __all__ = [
         'Result',
 ]
 
+import contextlib
+import time
 from abc import abstractmethod
+from typing import Optional, TYPE_CHECKING
 
-from cdpyr.analysis import evaluator as _evaluator, result as _result
+from cdpyr.analysis import (
+    evaluator as _evaluator,
+    profile as _profile_,
+    result as _result,
+)
 from cdpyr.analysis.archetype import archetype as _archetype_
-from cdpyr.analysis.criterion import criterion as _criterion_
+from cdpyr.analysis.criterion import (
+    context as _context,
+    criterion as _criterion_,
+)
 from cdpyr.robot import robot as _robot
 from cdpyr.motion import pose as _pose
 from cdpyr.exceptions import InvalidPoseException
+from cdpyr.typing import Vector
+
+if TYPE_CHECKING:
+    from cdpyr.analysis.workspace import store as _store_
 
 
 class Algorithm(_evaluator.RobotEvaluator):
     _archetype: _archetype_.Archetype
     _criterion: _criterion_.Criterion
+    _profile: Optional[_profile_.Profile]
+    _store: Optional[_store_.Store]
 
     def __init__(self,
                  archetype: _archetype_.Archetype,
                  criterion: _criterion_.Criterion,
+                 profile: Optional[_profile_.Profile] = None,
+                 store: Optional[_store_.Store] = None,
                  **kwargs):
+        """
+        Parameters
+        ----------
+        archetype : Archetype
+            Archetype of the workspace.
+        criterion : Criterion
+            Criterion poses of the workspace must fulfill.
+        profile : Profile
+            Optional profile to record the number of evaluated poses,
+            early exits of the archetype's comparator, cache hits, and
+            timings of pose generation and of all stages of the criterion
+            in. The profile is also available from the result.
+        store : Store
+            Optional store to load the result from if the workspace was
+            determined before for an equal algorithm and robot, and to store
+            it in otherwise.
+        """
         super().__init__(**kwargs)
         self._archetype = archetype
         self._criterion = criterion
+        self._profile = profile
+        self._store = store
 
     @property
     def archetype(self):
@@ -37,16 +74,72 @@ class Algorithm(_evaluator.RobotEvaluator):
     def criterion(self):
         return self._criterion
 
+    @property
+    def profile(self):
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: Optional[_profile_.Profile]):
+        self._profile = profile
+
+    @profile.deleter
+    def profile(self):
+        self._profile = None
+
+    @property
+    def store(self):
+        return self._store
+
+    @store.setter
+    def store(self, store: Optional[_store_.Store]):
+        self._store = store
+
+    @store.deleter
+    def store(self):
+        self._store = None
+
     def evaluate(self,
                  robot: _robot.Robot,
                  *args,
                  parallel=None,
                  **kwargs) -> Result:
+        if self._store is not None:
+            return self._store.get(
+                    self,
+                    robot,
+                    lambda: self._evaluate_robot(robot,
+                                                 *args,
+                                                 parallel=parallel,
+                                                 **kwargs))
+
+        return self._evaluate_robot(robot, *args, parallel=parallel, **kwargs)
+
+    def _evaluate_robot(self,
+                        robot: _robot.Robot,
+                        *args,
+                        parallel=None,
+                        **kwargs) -> Result:
         try:
             # update keyword arguments with the `parallel` keyword
             kwargs.update({'parallel': parallel})
-            # evaluate the workspace
-            return self._evaluate(robot, *args, **kwargs)
+            caches = _profile_.caches(self._criterion)
+            with contextlib.ExitStack() as stack:
+                # the robot does not change while evaluating its workspace,
+                # so fingerprint it only once for all caches
+                for cache in caches:
+                    stack.enter_context(cache.pin(robot))
+
+                # evaluate the workspace
+                profile = self._profile
+                if profile is None:
+                    return self._evaluate(robot, *args, **kwargs)
+
+                with profile.track(caches), profile.stage('workspace'):
+                    result = self._evaluate(robot, *args, profile=profile,
+                                            **kwargs)
+                result.profile = profile
+
+                return result
         except Exception as e:
             raise RuntimeError('Could not determine workspace.') from e
 
@@ -57,14 +150,68 @@ class Algorithm(_evaluator.RobotEvaluator):
                   **kwargs) -> Result:
         raise NotImplementedError()
 
+    def _check_coordinate(self,
+                          robot: _robot.Robot,
+                          coordinate: Vector,
+                          profile: Optional[_profile_.Profile] = None):
+        # quicker look ups
+        archetype_ = self._archetype
+        comparator_ = archetype_.comparator
+        criterion_ = self._criterion
+
+        if profile is None:
+            return comparator_(self._check_pose(robot, pose, criterion_)
+                               for pose in archetype_.poses(coordinate))
+
+        start = time.perf_counter()
+        poses = iter(archetype_.poses(coordinate))
+        profile.add('poses', time.perf_counter() - start, 0)
+        # whether the comparator checked all poses of the coordinate
+        exhausted = False
+
+        def flags():
+            nonlocal exhausted
+            while True:
+                start = time.perf_counter()
+                try:
+                    pose = next(poses)
+                except StopIteration:
+                    profile.add('poses', time.perf_counter() - start, 0)
+                    exhausted = True
+                    return
+                profile.add('poses', time.perf_counter() - start)
+                yield self._check_pose(robot, pose, criterion_, profile)
+
+        flag = comparator_(flags())
+        profile.comparisons += 1
+        # comparators deciding on the last pose do not ask for another one,
+        # so only an unchecked pose left makes an early exit
+        if not exhausted:
+            start = time.perf_counter()
+            remaining = next(poses, None) is not None
+            profile.add('poses', time.perf_counter() - start, 0)
+            if remaining:
+                profile.early_exits += 1
+
+        return flag
+
     @staticmethod
     def _check_pose(robot: _robot.Robot,
                     pose: _pose.Pose,
-                    criterion: _criterion_.Criterion):
+                    criterion: _criterion_.Criterion,
+                    profile: Optional[_profile_.Profile] = None):
+        if profile is None:
+            context = None
+        else:
+            profile.poses += 1
+            context = _context.Context(robot, pose, profile)
+
         try:
-            criterion.evaluate(robot, pose)
+            criterion.evaluate(robot, pose, context=context)
         except InvalidPoseException:
             flag = False
+            if profile is not None:
+                profile.invalid += 1
         else:
             flag = True
 
@@ -77,6 +224,8 @@ class Result(_result.PlottableResult):
     _criterion: _criterion_.Criterion
     _surface_area: float
     _volume: float
+    meta: Optional[dict]
+    profile: Optional[_profile_.Profile]
 
     def __init__(self,
                  algorithm: Algorithm,
@@ -88,6 +237,8 @@ class Result(_result.PlottableResult):
         self._criterion = criterion
         self._surface_area = None
         self._volume = None
+        self.meta = None
+        self.profile = None
 
     @property
     def algorithm(self):
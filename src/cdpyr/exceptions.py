@@ -3,9 +3,14 @@ from __future__ import annotations
 __author__ = 'Philipp Tempel'
 __email__ = 'p.tempel@tudelft.nl'
 __all__ = [
+        'DeadlineExceededWarning',
         'InvalidPoseException',
 ]
 
 
 class InvalidPoseException(BaseException):
     pass
+
+
+class DeadlineExceededWarning(RuntimeWarning):
+    pass
@@ -1,6 +1,7 @@
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
+        'BoundingVolumeHierarchy',
         'Cuboid',
         'Cylinder',
         'Ellipsoid',
@@ -9,6 +10,7 @@ __all__ = [
         'Tube',
 ]
 
+from cdpyr.geometry.bvh import BoundingVolumeHierarchy
 from cdpyr.geometry.cuboid import Cuboid
 from cdpyr.geometry.cylinder import Cylinder
 from cdpyr.geometry.ellipsoid import Ellipsoid
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'BoundingVolumeHierarchy',
+]
+
+from collections import abc
+from typing import Sequence
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.geometry import primitive as _geometry
+from cdpyr.typing import Matrix, Num, Vector
+
+
+class BoundingVolumeHierarchy(abc.Sequence):
+    """
+    Binary tree of axis-aligned bounding boxes over a set of geometry
+    primitives to quickly find the primitives a line segment may intersect.
+    """
+
+    _primitives: Sequence[_geometry.Primitive]
+    """
+    Primitives sorted such that every leaf holds a contiguous range of them
+    """
+    _lower: Matrix
+    """
+    `(B, 3)` array of lower corners of all nodes' boxes
+    """
+    _upper: Matrix
+    """
+    `(B, 3)` array of upper corners of all nodes' boxes
+    """
+    _children: Matrix
+    """
+    `(B, 2)` array of left and right child of every node, `-1` for leaves
+    """
+    _ranges: Matrix
+    """
+    `(B, 2)` array of `[start, stop)` of primitives of every leaf
+    """
+    leaf_size: int
+
+    def __init__(self,
+                 primitives: Sequence[_geometry.Primitive],
+                 leaf_size: int = 2):
+        self.leaf_size = max(int(leaf_size), 1)
+        self._build(list(primitives))
+
+    @property
+    def bounding_box(self):
+        if not self._primitives:
+            return _np.full((2, 3), _np.nan)
+
+        return _np.stack((self._lower[0], self._upper[0]))
+
+    @property
+    def depth(self):
+        depth = _np.zeros(self.num_nodes, dtype=int)
+        for node in range(self.num_nodes):
+            for child in self._children[node]:
+                if child >= 0:
+                    depth[child] = depth[node] + 1
+
+        return int(depth.max(initial=0)) + 1 if self.num_nodes else 0
+
+    @property
+    def num_nodes(self):
+        return self._lower.shape[0]
+
+    @property
+    def primitives(self):
+        return self._primitives
+
+    def candidates(self, starts: Matrix, ends: Matrix):
+        """
+        Find all pairs of segments and primitives whose bounding boxes are
+        intersected by the segment.
+
+        Parameters
+        ----------
+        starts : Matrix
+            `(N, 3)` array of start points of the segments.
+        ends : Matrix
+            `(N, 3)` array of end points of the segments.
+
+        Returns
+        -------
+        segments, primitives : Vector
+            `(C,)` arrays of indices of segments and of primitives in
+            `self.primitives`.
+        """
+        starts = _np.asarray(starts, dtype=float)
+        ends = _np.asarray(ends, dtype=float)
+        found_segments = []
+        found_primitives = []
+
+        if not self._primitives:
+            return _np.zeros(0, dtype=int), _np.zeros(0, dtype=int)
+
+        # inverse directions for the slab test, where segments parallel to
+        # a slab produce infinite or NaN parameters which `fmin` and `fmax`
+        # ignore such that the test stays conservative
+        with _np.errstate(divide='ignore'):
+            inverse = 1.0 / (ends - starts)
+
+        # traverse the tree breadth-first for all segments at once where the
+        # frontier is a list of `(segment, node)` pairs still to check
+        segments = _np.arange(starts.shape[0])
+        nodes = _np.zeros_like(segments)
+        while segments.size:
+            origin = starts[segments]
+            scale = inverse[segments]
+            with _np.errstate(invalid='ignore'):
+                low = (self._lower[nodes] - origin) * scale
+                high = (self._upper[nodes] - origin) * scale
+            entry = _np.fmax.reduce(_np.fmin(low, high), axis=1, initial=0.0)
+            leave = _np.fmin.reduce(_np.fmax(low, high), axis=1, initial=1.0)
+            hit = entry <= leave
+            segments, nodes = segments[hit], nodes[hit]
+
+            # expand leaves into all their primitives
+            leaf = self._children[nodes, 0] < 0
+            start, stop = self._ranges[nodes[leaf]].T
+            count = stop - start
+            found_segments.append(_np.repeat(segments[leaf], count))
+            found_primitives.append(
+                    _np.repeat(start - _np.cumsum(count) + count, count)
+                    + _np.arange(count.sum()))
+
+            # descend into both children of inner nodes
+            segments = _np.repeat(segments[~leaf], 2)
+            nodes = self._children[nodes[~leaf]].ravel()
+
+        return _np.concatenate(found_segments), \
+               _np.concatenate(found_primitives)
+
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9) -> Vector:
+        """
+        Check line segments for intersection with any primitive
+
+        Parameters
+        ----------
+        starts : Matrix
+            `(..., 3)` array of start points of the segments.
+        ends : Matrix
+            `(..., 3)` array of end points of the segments.
+        tolerance : Num
+            Minimum fraction of a segment that must lie inside a primitive
+            to count as intersection.
+
+        Returns
+        -------
+        intersects : Vector
+            `(...)` boolean array.
+        """
+        starts = _np.asarray(starts, dtype=float)
+        ends = _np.asarray(ends, dtype=float)
+        shape = starts.shape[:-1]
+        starts = starts.reshape((-1, 3))
+        ends = ends.reshape((-1, 3))
+
+        intersects = _np.zeros(starts.shape[0], dtype=bool)
+        segments, primitives = self.candidates(starts, ends)
+
+        # exact tests vectorized over all candidate segments per primitive
+        order = _np.argsort(primitives, kind='stable')
+        segments, primitives = segments[order], primitives[order]
+        unique, first = _np.unique(primitives, return_index=True)
+        for primitive, index in zip(unique,
+                                    _np.split(segments, first[1:])):
+            index = index[~intersects[index]]
+            if index.size:
+                intersects[index] = self._primitives[primitive].intersects(
+                        starts[index], ends[index], tolerance)
+
+        return intersects.reshape(shape)
+
+    def _build(self, primitives: Sequence[_geometry.Primitive]):
+        boxes = _np.asarray([primitive.bounding_box
+                             for primitive in primitives]).reshape((-1, 2, 3))
+        centers = boxes.mean(axis=1)
+
+        lower = []
+        upper = []
+        children = []
+        ranges = []
+        order = []
+
+        # iterative top-down construction splitting at the median of the
+        # longest axis of the boxes' centers
+        stack = [(_np.arange(len(primitives)), -1, 0)]
+        while stack and len(primitives):
+            members, parent, side = stack.pop()
+            node = len(lower)
+            lower.append(boxes[members, 0, :].min(axis=0))
+            upper.append(boxes[members, 1, :].max(axis=0))
+            children.append([-1, -1])
+            ranges.append([0, 0])
+            if parent >= 0:
+                children[parent][side] = node
+
+            if members.size <= self.leaf_size:
+                ranges[node] = [len(order), len(order) + members.size]
+                order.extend(members.tolist())
+                continue
+
+            axis = _np.argmax(_np.ptp(centers[members], axis=0))
+            sort = members[_np.argsort(centers[members, axis],
+                                       kind='stable')]
+            half = sort.size // 2
+            stack.append((sort[half:], node, 1))
+            stack.append((sort[:half], node, 0))
+
+        self._primitives = [primitives[index] for index in order]
+        self._lower = _np.asarray(lower, dtype=float).reshape((-1, 3))
+        self._upper = _np.asarray(upper, dtype=float).reshape((-1, 3))
+        self._children = _np.asarray(children, dtype=int).reshape((-1, 2))
+        self._ranges = _np.asarray(ranges, dtype=int).reshape((-1, 2))
+
+    def __getitem__(self, index: int):
+        return self._primitives[index]
+
+    def __len__(self):
+        return len(self._primitives)
+
+    __repr__ = make_repr(
+            'primitives',
+            'leaf_size',
+    )
@@ -9,8 +9,8 @@ __all__ = [
 import numpy as _np
 from magic_repr import make_repr
 
-from cdpyr.geometry.primitive import Primitive
-from cdpyr.typing import Num, Vector
+from cdpyr.geometry.primitive import Primitive, _overlap, _slab
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Cuboid(Primitive):
@@ -30,6 +30,12 @@ class Cuboid(Primitive):
     def centroid(self):
         return self.center
 
+    @property
+    def bounding_box(self):
+        half = 0.5 * _np.asarray((self.width, self.depth, self.height))
+
+        return _np.stack((self._center - half, self._center + half))
+
     @property
     def faces(self):
         return _np.asarray(((2, 1, 0),
@@ -46,6 +52,16 @@ class Cuboid(Primitive):
                             (6, 7, 3),
                             ))
 
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9):
+        lower, upper = self.bounding_box
+
+        return _overlap(*_slab(_np.asarray(starts), _np.asarray(ends),
+                               lower, upper),
+                        tolerance)
+
     @property
     def surface_area(self):
         # more readable access to often used variables
@@ -11,8 +11,8 @@ from typing import Union
 import numpy as _np
 from magic_repr import make_repr
 
-from cdpyr.geometry.primitive import Primitive
-from cdpyr.typing import Num, Vector
+from cdpyr.geometry.primitive import Primitive, _overlap, _quadric, _slab
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Cylinder(Primitive):
@@ -61,6 +61,35 @@ class Cylinder(Primitive):
     def centroid(self):
         return self.center
 
+    @property
+    def bounding_box(self):
+        half = _np.asarray((self._radius[0], self._radius[1],
+                            0.5 * self.height))
+
+        return _np.stack((self._center - half, self._center + half))
+
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9):
+        return _overlap(*self._interval(_np.asarray(starts),
+                                        _np.asarray(ends)),
+                        tolerance)
+
+    def _interval(self, starts: Matrix, ends: Matrix):
+        starts = starts - self._center
+        ends = ends - self._center
+
+        # scaling the cross-section into the unit circle and intersecting
+        # with the slab of the cylinder's height
+        radial = _quadric(starts[..., 0:2] / self._radius,
+                          ends[..., 0:2] / self._radius)
+        half = 0.5 * self.height
+        axial = _slab(starts[..., 2:3], ends[..., 2:3], -half, half)
+
+        return _np.maximum(radial[0], axial[0]), \
+               _np.minimum(radial[1], axial[1])
+
     @property
     def surface_area(self):
         # extract semi-major and semi-minor axis lengths
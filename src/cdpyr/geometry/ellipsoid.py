@@ -12,7 +12,7 @@ import numpy as _np
 from magic_repr import make_repr
 
 from cdpyr.geometry import primitive as _geometry
-from cdpyr.typing import Num, Vector
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Ellipsoid(_geometry.Primitive):
@@ -41,6 +41,31 @@ class Ellipsoid(_geometry.Primitive):
     def centroid(self):
         return self.center
 
+    @property
+    def bounding_box(self):
+        return _np.stack((self._center - self._extent,
+                          self._center + self._extent))
+
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9):
+        # ellipsoidal tori are checked conservatively against their
+        # enclosing sphere, proper ellipsoids are scaled into the unit ball
+        return _geometry._overlap(*_geometry._quadric(
+                (_np.asarray(starts) - self._center) / self._extent,
+                (_np.asarray(ends) - self._center) / self._extent),
+                                  tolerance)
+
+    @property
+    def _extent(self):
+        # radii of proper ellipsoids or, for ellipsoidal tori, those of the
+        # sphere enclosing the ellipsoid revolved about its axis
+        if self.axis:
+            return _np.full(3, _np.abs(self.axis) + _np.max(self._radius))
+
+        return self._radius
+
     @property
     def diameters(self):
         return 2 * self._radius
@@ -14,7 +14,13 @@ from magic_repr import make_repr
 
 from cdpyr.geometry import primitive as _geometry
 from cdpyr.geometry._subdivision import subdivide
-from cdpyr.typing import Matrix, Vector
+from cdpyr.typing import Matrix, Num, Vector
+
+# directions of rays cast to test if points are inside a polyhedron, chosen
+# to not be parallel to any axis or diagonal
+_RAYS = _np.asarray([[0.5773, 0.5774, 0.5775],
+                     [-0.6123, 0.3191, 0.7233],
+                     [0.2842, -0.8417, 0.4591]])
 
 
 class Polyhedron(_geometry.Primitive, abc.Collection):
@@ -133,6 +139,11 @@ class Polyhedron(_geometry.Primitive, abc.Collection):
         return _np.sum(triangle_surfaces[:, None] * triangle_centroids,
                        axis=0) / _np.sum(triangle_surfaces, axis=0)
 
+    @property
+    def bounding_box(self):
+        return _np.stack((self._vertices.min(axis=0),
+                          self._vertices.max(axis=0)))
+
     @property
     def faces(self):
         return self._faces
@@ -173,6 +184,70 @@ class Polyhedron(_geometry.Primitive, abc.Collection):
         return _np.abs(
                 _np.sum((a - d) * _np.cross(b - d, c - d, axis=1), axis=1)) / 6
 
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9):
+        starts = _np.asarray(starts, dtype=float)
+        ends = _np.asarray(ends, dtype=float)
+        shape = starts.shape[:-1]
+        starts = starts.reshape((-1, 3))
+        ends = ends.reshape((-1, 3))
+
+        # segments crossing the surface of the polyhedron
+        crossing = self._crossings(starts,
+                                   ends - starts,
+                                   tolerance,
+                                   1.0 - tolerance) > 0
+
+        # segments completely inside the (closed) polyhedron have an odd
+        # number of crossings of any ray cast from their midpoint. a ray
+        # through an edge or vertex shared by several triangles is counted
+        # more than once, so the majority of three rays decides
+        midpoints = 0.5 * (starts + ends)
+        votes = sum(self._crossings(midpoints,
+                                    _np.broadcast_to(ray, starts.shape),
+                                    0.0,
+                                    _np.inf) % 2
+                    for ray in _RAYS)
+        inside = votes >= 2
+
+        return (crossing | inside).reshape(shape)
+
+    def _crossings(self,
+                   origins: Matrix,
+                   directions: Matrix,
+                   lower: Num,
+                   upper: Num):
+        # number of crossings of rays `o + t d` for `t` in `(lower, upper)`
+        # with all triangles following Moeller.1997
+        a = self._vertices[self._faces[:, 0], :]
+        edge_first = self._vertices[self._faces[:, 1], :] - a
+        edge_second = self._vertices[self._faces[:, 2], :] - a
+
+        num = origins.shape[0]
+        counts = _np.zeros(num, dtype=int)
+        # limit the size of the `(N, F, 3)` intermediate arrays
+        chunk = max(2 ** 20 // max(a.shape[0], 1), 1)
+        for start in range(0, num, chunk):
+            index = slice(start, min(start + chunk, num))
+            d = directions[index, None, :]
+            p = _np.cross(d, edge_second[None, :, :])
+            determinant = _np.einsum('nfi,fi->nf', p, edge_first)
+            valid = _np.abs(determinant) > 1e-12
+            inverse = 1.0 / _np.where(valid, determinant, 1.0)
+            r = origins[index, None, :] - a[None, :, :]
+            u = _np.einsum('nfi,nfi->nf', r, p) * inverse
+            q = _np.cross(r, edge_first[None, :, :])
+            v = _np.einsum('nfi,nfi->nf', d, q) * inverse
+            t = _np.einsum('nfi,fi->nf', q, edge_second) * inverse
+            hits = valid \
+                   & (u >= 0) & (v >= 0) & (u + v <= 1) \
+                   & (t > lower) & (t < upper)
+            counts[index] = hits.sum(axis=1)
+
+        return counts
+
     def split(self, depth: int = None):
         """
         Split the current polyhedron into a higher dimensional polyhedron
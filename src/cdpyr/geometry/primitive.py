@@ -12,7 +12,7 @@ import numpy as _np
 from magic_repr import make_repr
 
 from cdpyr.base import Object
-from cdpyr.typing import Vector
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Primitive(Object, ABC):
@@ -99,6 +99,44 @@ class Primitive(Object, ABC):
     def center(self):
         del self._center
 
+    @property
+    def bounding_box(self):
+        """
+        Axis-aligned bounding box of the geometry
+
+        Returns
+        -------
+        box : Matrix
+            `(2, 3)` array of the lower and upper corner of the box.
+        """
+        raise NotImplementedError()
+
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9):
+        """
+        Check line segments for intersection with the interior of the
+        geometry. Segments merely touching the geometry's surface e.g.,
+        cables attached to it, do not intersect.
+
+        Parameters
+        ----------
+        starts : Matrix
+            `(..., 3)` array of start points of the segments.
+        ends : Matrix
+            `(..., 3)` array of end points of the segments.
+        tolerance : Num
+            Minimum fraction of a segment that must lie inside the geometry
+            to count as intersection.
+
+        Returns
+        -------
+        intersects : Vector
+            `(...)` boolean array.
+        """
+        raise NotImplementedError()
+
     @property
     def faces(self):
         raise NotImplementedError()
@@ -139,3 +177,53 @@ class Primitive(Object, ABC):
             'surface',
             'volume',
     )
+
+
+def _slab(starts: Matrix, ends: Matrix, lower: Matrix, upper: Matrix):
+    """
+    Parameter interval `[entry, exit]` of segments `s + t (e - s)` inside
+    axis-aligned boxes. Empty intervals have `entry > exit`.
+    """
+    directions = ends - starts
+    with _np.errstate(divide='ignore', invalid='ignore'):
+        low = (lower - starts) / directions
+        high = (upper - starts) / directions
+    # segments parallel to a slab are either always or never inside of it
+    parallel = directions == 0
+    inside = (lower < starts) & (starts < upper)
+    low = _np.where(parallel, _np.where(inside, -_np.inf, _np.inf), low)
+    high = _np.where(parallel, _np.where(inside, _np.inf, -_np.inf), high)
+
+    return _np.minimum(low, high).max(axis=-1), \
+           _np.maximum(low, high).min(axis=-1)
+
+
+def _quadric(starts: Matrix, ends: Matrix):
+    """
+    Parameter interval `[entry, exit]` of segments `s + t (e - s)` inside
+    the unit ball. Empty intervals have `entry > exit`.
+    """
+    directions = ends - starts
+    a = _np.einsum('...i,...i->...', directions, directions)
+    b = _np.einsum('...i,...i->...', directions, starts)
+    c = _np.einsum('...i,...i->...', starts, starts) - 1.0
+    discriminant = b ** 2 - a * c
+    root = _np.sqrt(_np.maximum(discriminant, 0.0))
+    safe = _np.where(a > 0, a, 1.0)
+    entry = _np.where(discriminant > 0, (-b - root) / safe, _np.inf)
+    leave = _np.where(discriminant > 0, (-b + root) / safe, -_np.inf)
+
+    # degenerate segments are points that may lie inside the ball
+    point = a <= 0
+    entry = _np.where(point, _np.where(c < 0, -_np.inf, _np.inf), entry)
+    leave = _np.where(point, _np.where(c < 0, _np.inf, -_np.inf), leave)
+
+    return entry, leave
+
+
+def _overlap(entry: Vector, leave: Vector, tolerance: Num):
+    """
+    Check if the parameter interval `[entry, exit]` overlaps with the
+    segment's interval `[0, 1]` by more than `tolerance`.
+    """
+    return _np.minimum(leave, 1.0) - _np.maximum(entry, 0.0) > tolerance
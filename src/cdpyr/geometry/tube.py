@@ -11,8 +11,8 @@ from typing import Union
 import numpy as _np
 
 from cdpyr.geometry import cylinder as _cylinder
-from cdpyr.geometry.primitive import Primitive
-from cdpyr.typing import Num, Vector
+from cdpyr.geometry.primitive import Primitive, _overlap
+from cdpyr.typing import Matrix, Num, Vector
 
 
 class Tube(Primitive):
@@ -44,6 +44,34 @@ class Tube(Primitive):
     def centroid(self):
         return self._center
 
+    @property
+    def bounding_box(self):
+        return self._outer.bounding_box + self._center
+
+    def intersects(self,
+                   starts: Matrix,
+                   ends: Matrix,
+                   tolerance: Num = 1e-9):
+        starts = _np.asarray(starts) - self._center
+        ends = _np.asarray(ends) - self._center
+
+        # part of the segment inside the outer cylinder, clipped to the
+        # segment
+        entry, leave = self._outer._interval(starts, ends)
+        entry, leave = _np.maximum(entry, 0.0), _np.minimum(leave, 1.0)
+
+        # remove the part inside the inner cylinder which may split the
+        # interval into a part before and one after the hole
+        hole_entry, hole_leave = self._inner._interval(starts, ends)
+        hole = hole_entry < hole_leave
+
+        return _np.where(hole,
+                         _overlap(entry, _np.minimum(leave, hole_entry),
+                                  tolerance)
+                         | _overlap(_np.maximum(entry, hole_leave), leave,
+                                    tolerance),
+                         _overlap(entry, leave, tolerance))
+
     @property
     def height(self):
         return self._inner.height
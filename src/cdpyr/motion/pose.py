@@ -12,7 +12,7 @@ __all__ = [
 
 import itertools
 from collections import UserList
-from typing import AnyStr, Iterable, Optional, Sequence, Tuple, Union
+from typing import AnyStr, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 import numpy as np_
 from magic_repr import make_repr
@@ -372,13 +372,13 @@ class PoseGenerator(object):
         # convert all into numpy arrays
         start = np_.asarray(start)
         end = np_.asarray(end)
-        steps = np_.asarray(steps, dtype=np_.int)
+        steps = np_.asarray(steps, dtype=int)
         if start.ndim == 0:
             start = np_.asarray([start])
         if end.ndim == 0:
             end = np_.asarray([end])
         if steps.ndim == 0:
-            steps = np_.asarray([steps], dtype=np_.int)
+            steps = np_.asarray([steps], dtype=int)
 
         # count the number of dimensions
         num_position = start.size
@@ -459,13 +459,13 @@ class PoseGenerator(object):
         # convert all into numpy arrays
         start = np_.asarray(start)
         end = np_.asarray(end)
-        steps = np_.asarray(steps, dtype=np_.int)
+        steps = np_.asarray(steps, dtype=int)
         if start.ndim == 0:
             start = np_.asarray([start])
         if end.ndim == 0:
             end = np_.asarray([end])
         if steps.ndim == 0:
-            steps = np_.asarray([steps], dtype=np_.int)
+            steps = np_.asarray([steps], dtype=int)
 
         # count the number of dimensions
         num_euler = start.size
@@ -512,7 +512,140 @@ class PoseGenerator(object):
 
 
 class PoseList(UserList, Object):
+    """
+    List of poses that may be backed by one array per state of all poses
+
+    Pose lists created from arrays, as loaded by binary parsers, create their
+    poses only once they are first accessed and return their arrays as
+    `columns` without touching any pose. Once the poses were created, the
+    arrays are dropped since the poses may be changed.
+    """
     data: Sequence[Pose]
+    _data: Optional[Sequence[Pose]] = None
+    _columns: Optional[Dict[str, Matrix]] = None
+
+    # columns of every state of all poses and their widths
+    _COLUMNS = (
+            ('time', 1),
+            ('position', 3),
+            ('velocity', 3),
+            ('acceleration', 3),
+            ('quaternion', 4),
+            ('angular_velocity', 3),
+            ('angular_acceleration', 3),
+    )
+
+    @staticmethod
+    def from_columns(time: Vector,
+                     position: Matrix,
+                     velocity: Matrix,
+                     acceleration: Matrix,
+                     quaternion: Matrix,
+                     angular_velocity: Matrix,
+                     angular_acceleration: Matrix):
+        """
+        Create a pose list from one array per state with one row per pose
+        without copying the arrays e.g., from memory-mapped arrays
+
+        Parameters
+        ----------
+        time : Vector
+            `(N,)` array of times.
+        position : Matrix
+            `(N, 3)` array of positions.
+        velocity : Matrix
+            `(N, 3)` array of linear velocities.
+        acceleration : Matrix
+            `(N, 3)` array of linear accelerations.
+        quaternion : Matrix
+            `(N, 4)` array of quaternions of the orientations.
+        angular_velocity : Matrix
+            `(N, 3)` array of angular velocities.
+        angular_acceleration : Matrix
+            `(N, 3)` array of angular accelerations.
+
+        Returns
+        -------
+        poses : PoseList
+            Pose list whose poses are created on first access.
+        """
+        arrays = (time,
+                  position,
+                  velocity,
+                  acceleration,
+                  quaternion,
+                  angular_velocity,
+                  angular_acceleration)
+        poses = PoseList()
+        poses._columns = {
+                name: np_.asarray(array, dtype=float).reshape(
+                        (-1,) if width == 1 else (-1, width))
+                for (name, width), array in zip(PoseList._COLUMNS, arrays)
+        }
+        poses._data = None
+
+        return poses
+
+    @property
+    def columns(self) -> Dict[str, Matrix]:
+        """
+        One array per state of all poses with one row per pose by name of the
+        state, in which orientations are given as quaternions
+        """
+        if self._columns is not None:
+            return dict(self._columns)
+
+        poses = self.data
+        linears = [pose.linear for pose in poses]
+        angulars = [pose.angular for pose in poses]
+
+        def column(objects, attribute, width):
+            # one concatenation of all vectors is cheaper than stacking them
+            return np_.concatenate(
+                    [getattr(each, attribute) for each in objects]
+                    or [np_.empty((0,))]).reshape((-1, width))
+
+        return {
+                'time':                 np_.fromiter(
+                        (pose.time for pose in poses),
+                        float,
+                        len(poses)),
+                'position':             column(linears, 'position', 3),
+                'velocity':             column(linears, 'velocity', 3),
+                'acceleration':         column(linears, 'acceleration', 3),
+                'quaternion':           column(angulars, 'quaternion', 4),
+                'angular_velocity':     column(angulars,
+                                               'angular_velocity', 3),
+                'angular_acceleration': column(angulars,
+                                               'angular_acceleration', 3),
+        }
+
+    @property
+    def data(self):
+        # poses of array-backed lists are created on first access, after
+        # which they may be changed, so the arrays are out of date
+        if self._data is None:
+            columns, self._columns = self._columns, None
+            self._data = [
+                    Pose(time=time,
+                         linear=_linear.Linear(position,
+                                               velocity,
+                                               acceleration),
+                         angular=_angular.Angular(
+                                 quaternion=quaternion,
+                                 angular_velocity=angular_velocity,
+                                 angular_acceleration=angular_acceleration))
+                    for time, position, velocity, acceleration, quaternion,
+                        angular_velocity, angular_acceleration
+                    in zip(*(columns[name] for name, _ in self._COLUMNS))
+            ] if columns is not None else []
+
+        return self._data
+
+    @data.setter
+    def data(self, data: Sequence[Pose]):
+        self._data = data
+        self._columns = None
 
     @property
     def acceleration(self):
@@ -555,6 +688,13 @@ class PoseList(UserList, Object):
 
         return all(this == that for this, that in zip(self, other))
 
+    def __len__(self):
+        # array-backed lists know their length without creating any pose
+        if self._columns is not None:
+            return len(self._columns['time'])
+
+        return len(self.data)
+
     def __ne__(self, other):
         return not self == other
 
@@ -0,0 +1,9 @@
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Latency',
+        'Loop',
+]
+
+from cdpyr.realtime.latency import Latency
+from cdpyr.realtime.loop import Loop
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Latency',
+]
+
+import math
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr.typing import Num
+
+
+class Latency(object):
+    """
+    Histogram of latencies with logarithmically spaced bins.
+
+    Recording a latency only increments one preallocated counter, so it can
+    be done on every cycle of a real-time loop. Percentiles are accurate to
+    the width of one bin i.e., about 12 % with the default of 20 bins per
+    decade, while the maximum and mean are exact.
+    """
+
+    minimum: float
+    maximum: float
+    bins_per_decade: int
+    count: int
+    max: float
+    total: float
+    _counts: _np.ndarray
+
+    def __init__(self,
+                 minimum: Num = 1e-7,
+                 maximum: Num = 10.0,
+                 bins_per_decade: int = 20):
+        """
+        Parameters
+        ----------
+        minimum : Num
+            Smallest latency in seconds resolved by the histogram. Smaller
+            latencies are counted in the first bin.
+        maximum : Num
+            Largest latency in seconds resolved by the histogram. Larger
+            latencies are counted in the last bin.
+        bins_per_decade : int
+            Number of bins per factor of ten.
+        """
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+        self.bins_per_decade = int(bins_per_decade)
+        num_bins = int(math.ceil(math.log10(self.maximum / self.minimum)
+                                 * self.bins_per_decade))
+        self._counts = _np.zeros(max(num_bins, 1), dtype=_np.int64)
+        self.reset()
+
+    @property
+    def counts(self):
+        return self._counts
+
+    @property
+    def edges(self):
+        """
+        `(B + 1,)` array of bin edges in seconds
+        """
+        return self.minimum * 10.0 ** (_np.arange(self._counts.size + 1)
+                                       / self.bins_per_decade)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def p50(self):
+        return self.percentile(50.0)
+
+    @property
+    def p99(self):
+        return self.percentile(99.0)
+
+    def record(self, latency: float):
+        """
+        Count one latency
+
+        Parameters
+        ----------
+        latency : float
+            Latency in seconds.
+        """
+        if latency > self.minimum:
+            index = int(math.log10(latency / self.minimum)
+                        * self.bins_per_decade)
+            if index >= self._counts.size:
+                index = self._counts.size - 1
+        else:
+            index = 0
+        self._counts[index] += 1
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    def percentile(self, q: Num):
+        """
+        Upper edge of the bin containing the `q`-th percentile, but at most
+        the largest recorded latency. Percentiles in the last bin are the
+        largest recorded latency.
+
+        Parameters
+        ----------
+        q : Num
+            Percentile in `[0, 100]`.
+
+        Returns
+        -------
+        latency : float
+            Latency in seconds, `0.0` if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(int(math.ceil(q / 100.0 * self.count)), 1)
+        index = int(_np.searchsorted(_np.cumsum(self._counts), rank))
+
+        if index >= self._counts.size - 1:
+            return self.max
+
+        return min(float(self.edges[index + 1]), self.max)
+
+    def reset(self):
+        self._counts.fill(0)
+        self.count = 0
+        self.max = 0.0
+        self.total = 0.0
+
+    __repr__ = make_repr(
+            'count',
+            'p50',
+            'p99',
+            'max',
+    )
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Loop',
+]
+
+import copy
+import time
+import warnings
+from typing import Optional, Tuple
+
+import numpy as _np
+from magic_repr import make_repr
+
+from cdpyr import exceptions as _exceptions
+from cdpyr.analysis import buffer as _buffer
+from cdpyr.analysis.force_distribution import \
+    force_distribution as _force_distribution
+from cdpyr.analysis.kinematics import kinematics as _kinematics
+from cdpyr.realtime import latency as _latency
+from cdpyr.robot import robot as _robot
+from cdpyr.typing import Num, Vector
+
+
+class Loop(object):
+    """
+    Preconfigured evaluation of joint lengths and cable forces for real-time
+    control loops.
+
+    The loop binds a snapshot of the robot, a kinematics algorithm, and a
+    force distribution into one callable taking plain arrays. Inputs,
+    outputs, and the arrays of the kinematics and the structure matrix are
+    allocated once on construction and every call only writes into them,
+    so these steps create no `Pose` or `Result` objects. The force
+    distribution writes its forces into the loop's arrays, too, but no
+    algorithm runs without allocating: the vectorized ones, such as
+    `ClosedFormImproved` or `Barycentric`, create their intermediate arrays
+    on every call, and those without a vectorized implementation, such as
+    `Dykstra`, additionally create one `Result` per call. The latency of
+    every call is recorded and compared against the deadline.
+
+    Returned arrays are overwritten by the next call, so copy them if they
+    need to persist.
+    """
+
+    deadline: float
+    latency: _latency.Latency
+    overruns: int
+    _robot: _robot.Robot
+    _kinematics: _kinematics.Algorithm
+    _force_distribution: _force_distribution.Algorithm
+
+    def __init__(self,
+                 robot: _robot.Robot,
+                 kinematics: _kinematics.Algorithm,
+                 force_distribution: _force_distribution.Algorithm,
+                 deadline: Num = 1e-3,
+                 latency: Optional[_latency.Latency] = None):
+        """
+        Parameters
+        ----------
+        robot : Robot
+            Robot to evaluate. Later modifications of it do not affect the
+            loop.
+        kinematics : Algorithm
+            Kinematics algorithm to solve the inverse kinematics with.
+        force_distribution : Algorithm
+            Force distribution algorithm to evaluate cable forces with.
+        deadline : Num
+            Latency budget of one call in seconds. Defaults to one
+            millisecond i.e., a 1 kHz loop.
+        latency : Latency
+            Optional histogram to record the latencies in.
+        """
+        if robot.num_platforms > 1:
+            raise NotImplementedError(
+                    'Real-time loops are currently not implemented for robots '
+                    'with more than one platform.'
+            )
+
+        self._robot = copy.deepcopy(robot)
+        self._buffer = _buffer.Buffer()
+        # own copy of the kinematics that writes into the loop's buffer and
+        # does not construct cache keys
+        self._kinematics = copy.copy(kinematics)
+        self._kinematics.cache = None
+        self._kinematics.buffer = self._buffer
+        self._force_distribution = force_distribution
+        self.deadline = float(deadline)
+        self.latency = latency if latency is not None else _latency.Latency()
+        self.overruns = 0
+
+        platform = self._robot.platforms[0]
+        kcs = self._robot.kinematic_chains.with_platform(0)
+        num_cables = len(kcs)
+        self._pattern = force_distribution.calculator.resolver[
+            platform.motion_pattern]
+        self._platform_anchors = _np.asarray(
+                [platform.anchors[kc.platform_anchor].linear.position
+                 for kc in kcs],
+                dtype=float)
+
+        # inputs and outputs of one pose
+        self._positions = _np.zeros((1, 3))
+        self._dcms = _np.eye(3)[None, :, :].copy()
+        self._wrenches = _np.zeros((1, platform.dof))
+        self._lengths = _np.zeros((1, num_cables))
+        self._directions = _np.zeros((1, num_cables, 3))
+        self._joints = _np.zeros((1, num_cables))
+        self._matrices = _np.zeros((1, platform.dof, num_cables))
+        self._forces = _np.zeros((1, num_cables))
+        self._feasible = _np.zeros((1,), dtype=bool)
+
+        # evaluate once to allocate all buffers and forget its latency
+        self._evaluate()
+        self.reset()
+
+    @property
+    def robot(self):
+        return self._robot
+
+    @property
+    def kinematics(self):
+        return self._kinematics
+
+    @property
+    def force_distribution(self):
+        return self._force_distribution
+
+    @property
+    def feasible(self):
+        """
+        Whether the last call found a valid force distribution
+        """
+        return bool(self._feasible[0])
+
+    def __call__(self,
+                 position: Vector,
+                 quaternion: Vector,
+                 wrench: Vector) -> Tuple[Vector, Vector]:
+        """
+        Joint lengths and cable forces of one pose
+
+        Parameters
+        ----------
+        position : Vector
+            `(3,)` array of the platform position.
+        quaternion : Vector
+            `(4,)` array of the platform orientation as quaternion in
+            scalar-last notation.
+        wrench : Vector
+            `(N,)` array of the wrench acting on the platform.
+
+        Returns
+        -------
+        joints : Vector
+            `(M,)` array of joint lengths i.e., workspace lengths plus lengths
+            wrapped onto pulleys.
+        forces : Vector
+            `(M,)` array of cable forces, `NaN` if there is no valid force
+            distribution.
+        """
+        start = time.perf_counter()
+
+        self._positions[0] = position
+        _dcm(quaternion, self._dcms[0])
+        self._wrenches[0] = wrench
+        self._evaluate()
+
+        elapsed = time.perf_counter() - start
+        self.latency.record(elapsed)
+        if elapsed > self.deadline:
+            self.overruns += 1
+
+        return self._joints[0], self._forces[0]
+
+    def check(self, percentile: Num = 99.0) -> bool:
+        """
+        Check the recorded latencies against the deadline
+
+        Warns with a `DeadlineExceededWarning` if the `percentile`-th
+        percentile or the maximum latency exceed the deadline.
+
+        Parameters
+        ----------
+        percentile : Num
+            Percentile of latencies that must meet the deadline.
+
+        Returns
+        -------
+        ok : bool
+            `True` if the percentile and maximum latency meet the deadline.
+        """
+        latency = self.latency.percentile(percentile)
+        if latency <= self.deadline and self.latency.max <= self.deadline:
+            return True
+
+        warnings.warn(_exceptions.DeadlineExceededWarning(
+                f'{self.overruns} of {self.latency.count} calls exceeded the '
+                f'deadline of {self.deadline * 1e6:.1f} us with a '
+                f'{percentile:g}th percentile latency of {latency * 1e6:.1f} '
+                f'us and a maximum latency of {self.latency.max * 1e6:.1f} '
+                f'us.'))
+
+        return False
+
+    def reset(self):
+        self.latency.reset()
+        self.overruns = 0
+
+    def _evaluate(self):
+        _, directions = self._kinematics.backward_batch(
+                self._robot,
+                self._positions,
+                self._dcms,
+                out=(self._lengths, self._directions),
+                joints=self._joints)
+        self._pattern.evaluate_batch(self._dcms,
+                                     self._platform_anchors,
+                                     directions,
+                                     out=self._matrices,
+                                     buffer=self._buffer)
+        self._force_distribution.evaluate_batch(
+                self._robot,
+                self._positions,
+                self._dcms,
+                self._wrenches,
+                structure_matrices=self._matrices,
+                out=(self._forces, self._feasible))
+
+    __repr__ = make_repr(
+            'deadline',
+            'latency',
+            'overruns',
+    )
+
+
+def _dcm(quaternion: Vector, out: _np.ndarray):
+    # rotation matrix of a scalar-last quaternion like `Angular.dcm`, written
+    # into `out` without creating an `Angular` object
+    x, y, z, w = quaternion
+    norm = x * x + y * y + z * z + w * w
+    x2 = x * x / norm
+    y2 = y * y / norm
+    z2 = z * z / norm
+    w2 = w * w / norm
+    xy = x * y / norm
+    zw = z * w / norm
+    xz = x * z / norm
+    yw = y * w / norm
+    yz = y * z / norm
+    xw = x * w / norm
+
+    out[0, 0] = x2 - y2 - z2 + w2
+    out[0, 1] = 2 * (xy - zw)
+    out[0, 2] = 2 * (xz + yw)
+    out[1, 0] = 2 * (xy + zw)
+    out[1, 1] = - x2 + y2 - z2 + w2
+    out[1, 2] = 2 * (yz - xw)
+    out[2, 0] = 2 * (xz - yw)
+    out[2, 1] = 2 * (yz + xw)
+    out[2, 2] = - x2 - y2 + z2 + w2
+
+    return out
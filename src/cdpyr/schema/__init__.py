@@ -3,6 +3,7 @@ from __future__ import annotations
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
+        'analysis',
         'geometry',
         'fields',
         'kinematics',
@@ -11,4 +12,12 @@ __all__ = [
         'robot',
 ]
 
-from cdpyr.schema import fields, geometry, kinematics, mechanics, motion, robot
+from cdpyr.schema import (
+    analysis,
+    fields,
+    geometry,
+    kinematics,
+    mechanics,
+    motion,
+    robot,
+)
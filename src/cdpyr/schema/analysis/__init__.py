@@ -0,0 +1,7 @@
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'workspace',
+]
+
+from cdpyr.schema.analysis import workspace
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'GridResultSchema',
+        'HullResultSchema',
+]
+
+from marshmallow import fields, post_load
+
+from cdpyr.analysis.workspace import grid as _grid, hull as _hull
+from cdpyr.schema import fields as custom_fields
+from cdpyr.schema.schema import Schema
+
+
+class GridResultSchema(Schema):
+    coordinates = custom_fields.numpy.Numpy(
+            required=True
+    )
+    flags = custom_fields.numpy.Numpy(
+            required=True
+    )
+    meta = fields.Dict(
+            missing=None
+    )
+
+    __model__ = _grid.Result
+
+    @post_load
+    def make_object(self, data, **kwargs):
+        meta = data.pop('meta', None)
+        # algorithm, archetype, and criterion are only described in `meta`
+        result = self.__model__(None, None, None, **data)
+        result.meta = meta
+
+        return result
+
+
+class HullResultSchema(Schema):
+    vertices = custom_fields.numpy.Numpy(
+            required=True
+    )
+    faces = custom_fields.numpy.Numpy(
+            required=True
+    )
+    meta = fields.Dict(
+            missing=None
+    )
+
+    __model__ = _hull.Result
+
+    @post_load
+    def make_object(self, data, **kwargs):
+        meta = data.pop('meta', None)
+        # algorithm, archetype, and criterion are only described in `meta`
+        result = self.__model__(None, None, None, **data)
+        result.meta = meta
+
+        return result
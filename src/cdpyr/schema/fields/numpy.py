@@ -12,12 +12,21 @@ from marshmallow import fields
 
 
 class Numpy(fields.Field):
+    """
+    Field of numpy arrays and scalars
+
+    Arrays are serialized into nested lists unless the schema's context has
+    `arrays` set, in which case they are passed on as they are e.g., to a
+    binary parser storing their buffers directly.
+    """
 
     def _serialize(self, value, attr, obj, **kwargs):
         if value is None:
             return ''
         elif value is np_.nan:
             return 'nan'
+        elif isinstance(value, np_.ndarray) and self.context.get('arrays'):
+            return value
 
         try:
             return value.tolist()
@@ -25,7 +34,9 @@ class Numpy(fields.Field):
             return value
 
     def _deserialize(self, value, attr, data, **kwargs):
-        if value == '':
+        if isinstance(value, np_.ndarray):
+            return value
+        elif value == '':
             return None
         elif value == 'nan':
             return np_.nan
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'loader',
+]
+
+import math
+from collections import abc
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from marshmallow import EXCLUDE, fields, INCLUDE, Schema
+from marshmallow.decorators import POST_LOAD, PRE_LOAD
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing as missing_
+
+# compiled loaders by schema class and the options they were compiled with
+_LOADERS: Dict[Tuple[Hashable, ...], Callable[[Any], Any]] = {}
+
+
+def loader(schema: Schema) -> Callable[[Any], Any]:
+    """
+    Compiled loader of a marshmallow schema
+
+    The loader deserializes data like `schema.load(data)` does, but
+    resolves fields, nested schemas, and their hooks only once per schema
+    class instead of on every call. Fields with validators or of types
+    other than nested schemas, lists, tuples, floats, and strings are
+    deserialized by the fields themselves.
+
+    Parameters
+    ----------
+    schema : Schema
+        Schema to compile the loader of.
+
+    Returns
+    -------
+    loader : Callable
+        Function that takes the serialized data and returns the loaded
+        object. Raises `ValidationError` for invalid data.
+    """
+    return _loader(schema, schema.partial, schema.unknown)
+
+
+def _loader(schema: Schema, partial, unknown: str):
+    key = (type(schema),
+           bool(schema.many),
+           _hashable(partial),
+           unknown,
+           _hashable(schema.only),
+           _hashable(schema.exclude))
+    try:
+        return _LOADERS[key]
+    except KeyError:
+        pass
+
+    # store a placeholder first so self-referencing schemas resolve to the
+    # loader that is being compiled
+    compiled = None
+
+    def load(data):
+        return compiled(data)
+
+    _LOADERS[key] = load
+    compiled = _compile_schema(schema, partial, unknown)
+    _LOADERS[key] = compiled
+
+    return compiled
+
+
+def _compile_schema(schema: Schema, partial, unknown: str):
+    many = bool(schema.many)
+    partial_names = partial \
+        if isinstance(partial, abc.Collection) and not isinstance(partial, str) \
+        else None
+    members = []
+    for name, field in schema.load_fields.items():
+        # missing fields are left out if the schema loads partially
+        skip = partial is True \
+               or (partial_names is not None and name in partial_names)
+        members.append((field.data_key or name,
+                        name,
+                        field.attribute or name,
+                        _compile_field(field, name, _sub_partial(partial, name)),
+                        field,
+                        skip))
+    keys = frozenset(key for key, *_ in members)
+    pre_load = _hooks(schema, PRE_LOAD)
+    post_load = _hooks(schema, POST_LOAD)
+
+    def load_one(data):
+        if not isinstance(data, abc.Mapping):
+            raise ValidationError('Invalid input type.')
+
+        result = {}
+        for key, name, attribute, deserialize, field, skip in members:
+            value = data.get(key, missing_)
+            if value is missing_ and skip:
+                continue
+            try:
+                # the field itself takes care of missing and null values
+                value = field.deserialize(value, name, data) \
+                    if value is missing_ or value is None \
+                    else deserialize(value, name, data)
+            except ValidationError as error:
+                raise ValidationError({key: error.messages}) from None
+            if value is not missing_:
+                result[attribute] = value
+
+        if unknown != EXCLUDE:
+            others = data.keys() - keys
+            if others and unknown == INCLUDE:
+                result.update((key, data[key]) for key in others)
+            elif others:
+                raise ValidationError({key: ['Unknown field.']
+                                       for key in others})
+
+        return result
+
+    def load(data):
+        original = data
+        data = _invoke(pre_load, data, many, original, partial)
+        if many:
+            if isinstance(data, (str, bytes, abc.Mapping)):
+                raise ValidationError('Invalid input type.')
+            result = [load_one(each) for each in data]
+        else:
+            result = load_one(data)
+
+        return _invoke(post_load, result, many, original, partial)
+
+    return load
+
+
+def _hooks(schema: Schema, tag: str):
+    # processors of the given tag as bound methods and whether they receive
+    # all objects at once and the original data, read from the configuration
+    # marshmallow's decorators attach to them. hooks receiving all objects
+    # run first when loading
+    hooks = []
+    for pass_many in (True, False):
+        for name in dir(type(schema)):
+            config = getattr(getattr(type(schema), name, None),
+                             '__marshmallow_hook__',
+                             None)
+            if not config or (tag, pass_many) not in config:
+                continue
+            hooks.append((getattr(schema, name),
+                          pass_many,
+                          config[(tag, pass_many)].get('pass_original',
+                                                       False)))
+
+    return tuple(hooks)
+
+
+def _invoke(hooks, data, many: bool, original, partial):
+    for hook, pass_many, pass_original in hooks:
+        if many and not pass_many:
+            data = [hook(each, origin, many=many, partial=partial)
+                    if pass_original
+                    else hook(each, many=many, partial=partial)
+                    for each, origin in zip(data, original)]
+        elif pass_original:
+            data = hook(data, original, many=many, partial=partial)
+        else:
+            data = hook(data, many=many, partial=partial)
+
+    return data
+
+
+def _sub_partial(partial, name: str):
+    # names of nested fields to load partially are prefixed with the name
+    # of their parent field
+    if isinstance(partial, abc.Collection) and not isinstance(partial, str):
+        prefix = f'{name}.'
+        return tuple(each[len(prefix):]
+                     for each in partial
+                     if each.startswith(prefix))
+
+    return partial
+
+
+def _hashable(value):
+    if isinstance(value, abc.Collection) and not isinstance(value, str):
+        return frozenset(value)
+
+    return value
+
+
+def _compile_field(field: fields.Field, name: str, partial):
+    # fields with validators take care of themselves
+    if field.validators:
+        return _generic(field, name)
+
+    if isinstance(field, fields.Nested):
+        nested = field.schema
+        if field.many and not nested.many:
+            nested = type(nested)(many=True)
+        load = _loader(nested,
+                       nested.partial if partial is None else partial,
+                       field.unknown or nested.unknown)
+        return lambda value, key, data: load(value)
+
+    if isinstance(field, fields.List):
+        inner = _compile_field(field.inner, name, partial)
+
+        def deserialize(value, key, data):
+            if isinstance(value, (str, bytes, abc.Mapping)):
+                raise ValidationError('Not a valid list.')
+            return [inner(each, key, data) for each in value]
+
+        return deserialize
+
+    if isinstance(field, fields.Tuple):
+        inners = tuple(_compile_field(each, name, partial)
+                       for each in field.tuple_fields)
+        num = len(inners)
+
+        def deserialize(value, key, data):
+            if isinstance(value, (str, bytes, abc.Mapping)) \
+                    or len(value) != num:
+                raise ValidationError('Not a valid tuple.')
+            return tuple(inner(each, key, data)
+                         for inner, each in zip(inners, value))
+
+        return deserialize
+
+    if type(field) in (fields.Float, fields.Number):
+        allow_nan = getattr(field, 'allow_nan', True)
+
+        def deserialize(value, key, data):
+            if value is True or value is False:
+                raise ValidationError('Not a valid number.')
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise ValidationError('Not a valid number.')
+            if not allow_nan and not math.isfinite(value):
+                raise ValidationError('Special numeric values (nan or '
+                                      'infinity) are not permitted.')
+            return value
+
+        return deserialize
+
+    if type(field) is fields.String:
+        generic = _generic(field, name)
+        return lambda value, key, data: value \
+            if isinstance(value, str) \
+            else generic(value, key, data)
+
+    return _generic(field, name)
+
+
+def _generic(field: fields.Field, name: str):
+    return lambda value, key, data: field.deserialize(value, name, data)
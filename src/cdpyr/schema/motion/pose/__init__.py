@@ -3,7 +3,8 @@ from __future__ import annotations
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
+        'PoseListSchema',
         'PoseSchema',
 ]
 
-from cdpyr.schema.motion.pose.pose import PoseSchema
+from cdpyr.schema.motion.pose.pose import PoseListSchema, PoseSchema
@@ -3,10 +3,11 @@ from __future__ import annotations
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
+        'PoseListSchema',
         'PoseSchema',
 ]
 
-from marshmallow import fields, post_load
+from marshmallow import fields, post_load, pre_dump
 
 from cdpyr.motion import pose as _pose
 from cdpyr.schema import fields as custom_fields
@@ -39,3 +40,47 @@ class PoseSchema(Schema):
                                    for each in data))
         else:
             return self.__model__(**data)
+
+
+class PoseListSchema(Schema):
+    """
+    Columnar schema of pose lists storing every state of all poses as one
+    array with one row per pose
+    """
+    time = custom_fields.numpy.Numpy(
+            required=True
+    )
+    position = custom_fields.numpy.Numpy(
+            required=True
+    )
+    velocity = custom_fields.numpy.Numpy(
+            required=True
+    )
+    acceleration = custom_fields.numpy.Numpy(
+            required=True
+    )
+    quaternion = custom_fields.numpy.Numpy(
+            required=True
+    )
+    angular_velocity = custom_fields.numpy.Numpy(
+            required=True
+    )
+    angular_acceleration = custom_fields.numpy.Numpy(
+            required=True
+    )
+
+    __model__ = _pose.PoseList
+
+    @pre_dump
+    def make_columns(self, poses, **kwargs):
+        # array-backed pose lists are dumped without touching any pose
+        if not isinstance(poses, _pose.PoseList):
+            poses = _pose.PoseList(poses)
+
+        return poses.columns
+
+    @post_load
+    def make_object(self, data, **kwargs):
+        # poses are only created once they are accessed
+        data.pop('VERSION', None)
+        return self.__model__.from_columns(**data)
@@ -2,12 +2,14 @@ __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
 __all__ = [
         'Json',
+        'Npz',
         'Wcrfx',
         'Xml',
         'Yaml',
 ]
 
 from cdpyr.stream.parser.json import Json
+from cdpyr.stream.parser.npz import Npz
 from cdpyr.stream.parser.wcrfx import Wcrfx
 from cdpyr.stream.parser.xml import Xml
 from cdpyr.stream.parser.yaml import Yaml
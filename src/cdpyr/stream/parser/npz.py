@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Npz',
+]
+
+import io
+import json
+import os
+import struct
+import zipfile
+from collections import OrderedDict
+from typing import AnyStr, BinaryIO, Dict, List, Mapping, Optional, Union
+
+import numpy as _np
+
+from cdpyr.stream.parser import parser as _parser
+
+
+class Npz(_parser.Parser):
+    """
+    Binary parser of NumPy NPZ archives
+
+    Numpy arrays are stored uncompressed and without being copied as `.npy`
+    members of the archive, everything else as one JSON member, so archives
+    can also be opened with `numpy.load`. Arrays of archives loaded from
+    files on disk are memory-mapped i.e., they are only read from disk on
+    access.
+    """
+    EXT = 'npz'
+
+    BINARY = True
+
+    # name of the archive member of everything but the arrays
+    TREE = 'tree.json'
+
+    # key of references to arrays in the tree
+    ARRAY = '__array__'
+
+    def dumps(self, d: Union[OrderedDict, Mapping], *args, **kwargs) -> bytes:
+        f = io.BytesIO()
+        self.dump(f, d, *args, **kwargs)
+
+        return f.getvalue()
+
+    def loads(self, s: bytes, *args, **kwargs) -> Union[OrderedDict, Mapping]:
+        return self._read(io.BytesIO(s), None, None)
+
+    def dump(self,
+             f: BinaryIO,
+             d: Union[OrderedDict, Mapping],
+             *args,
+             **kwargs):
+        arrays = []
+        tree = self._encode(d, arrays)
+
+        with zipfile.ZipFile(f, 'w', zipfile.ZIP_STORED,
+                             allowZip64=True) as archive:
+            archive.writestr(self.TREE, json.dumps(tree))
+            for idx, array in enumerate(arrays):
+                with archive.open(f'{idx}.npy', 'w',
+                                  force_zip64=True) as member:
+                    _write_array(member, array)
+
+    def load(self,
+             f: BinaryIO,
+             *args,
+             mmap_mode: Optional[str] = 'r',
+             **kwargs) -> Union[OrderedDict, Mapping]:
+        """
+        Load data from a file-like object of an archive
+
+        Parameters
+        ----------
+        f : BinaryIO
+            A file-like object opened in binary mode.
+        mmap_mode : str
+            Mode to memory-map arrays with if `f` is a file on disk, see
+            `numpy.memmap`. `None` reads arrays into memory. Defaults to
+            `'r'`.
+
+        Returns
+        -------
+        d : OrderedDict | Mapping
+            Loaded data with arrays in place of their references.
+        """
+        path = getattr(f, 'name', None)
+        if not mmap_mode \
+                or not isinstance(path, (str, bytes, os.PathLike)) \
+                or not os.path.isfile(path):
+            path = None
+
+        return self._read(f, path, mmap_mode)
+
+    def _read(self,
+              f: BinaryIO,
+              path: Optional[AnyStr],
+              mmap_mode: Optional[str]):
+        with zipfile.ZipFile(f, 'r') as archive:
+            arrays = {}
+            for info in archive.infolist():
+                if info.filename == self.TREE:
+                    continue
+                if path is not None \
+                        and info.compress_type == zipfile.ZIP_STORED:
+                    arrays[info.filename] = _map_array(path, info, mmap_mode)
+                else:
+                    with archive.open(info) as member:
+                        arrays[info.filename] = _np.lib.format.read_array(
+                                member)
+
+            return json.loads(archive.read(self.TREE),
+                              object_pairs_hook=lambda pairs: self._decode(
+                                      pairs, arrays))
+
+    def _encode(self, o, arrays: List[_np.ndarray]):
+        if isinstance(o, _np.ndarray):
+            arrays.append(o)
+            return {self.ARRAY: f'{len(arrays) - 1}.npy'}
+        if isinstance(o, _np.generic):
+            return o.item()
+        if isinstance(o, Mapping):
+            return OrderedDict((k, self._encode(v, arrays))
+                               for k, v in o.items())
+        if isinstance(o, (list, tuple)):
+            return [self._encode(v, arrays) for v in o]
+
+        return o
+
+    def _decode(self, pairs, arrays: Dict[str, _np.ndarray]):
+        if len(pairs) == 1 and pairs[0][0] == self.ARRAY:
+            return arrays[pairs[0][1]]
+
+        return OrderedDict(pairs)
+
+
+def _write_array(f: BinaryIO, array: _np.ndarray):
+    array = _np.ascontiguousarray(array)
+    if array.dtype.hasobject:
+        raise ValueError('Arrays of objects cannot be stored.')
+
+    _np.lib.format.write_array_header_1_0(
+            f, _np.lib.format.header_data_from_array_1_0(array))
+    # write the array's buffer itself rather than a copy of it
+    if array.size:
+        f.write(array.reshape(-1).view(_np.uint8).data)
+
+
+def _map_array(path: AnyStr, info: zipfile.ZipInfo, mmap_mode: str):
+    with open(path, 'rb') as f:
+        # the member's data starts after its local header, which has a
+        # fixed size plus the lengths of its file name and extra field
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = _np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = \
+                _np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = \
+                _np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    # empty arrays cannot be memory-mapped
+    if not _np.prod(shape, dtype=int):
+        return _np.empty(shape, dtype=dtype)
+
+    return _np.memmap(path,
+                      dtype=dtype,
+                      mode=mmap_mode,
+                      offset=offset,
+                      shape=shape,
+                      order='F' if fortran_order else 'C')
@@ -8,7 +8,7 @@ __all__ = [
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import AnyStr, Mapping, Union
+from typing import AnyStr, IO, Mapping, Union
 
 from cdpyr.base import Object
 from cdpyr.robot.robot_component import RobotComponent
@@ -17,9 +17,21 @@ from cdpyr.robot.robot_component import RobotComponent
 class Parser(Object, ABC):
     EXT = ''
 
+    # whether dumps are tagged with the type of the dumped object
+    TAGGED = True
+
+    # whether the format is binary and stores numpy arrays as they are
+    BINARY = False
+
     def kwargs(self, o: RobotComponent, **kwargs):
         return kwargs
 
+    def dump(self, f: IO, d: Union[OrderedDict, Mapping], *args, **kwargs):
+        f.write(self.dumps(d, *args, **kwargs))
+
+    def load(self, f: IO, *args, **kwargs) -> Union[OrderedDict, Mapping]:
+        return self.loads(f.read(), *args, **kwargs)
+
     @abstractmethod
     def dumps(self, d: Union[OrderedDict, Mapping], *args, **kwargs) -> AnyStr:
         raise NotImplementedError()
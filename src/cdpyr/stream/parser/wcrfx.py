@@ -7,11 +7,13 @@ __all__ = [
 ]
 
 import functools
+import io
 import itertools
 import operator
 import re
 from collections import OrderedDict
-from typing import AnyStr, Iterable, Mapping, Sequence, Tuple, Union
+from typing import AnyStr, IO, Iterable, Iterator, Mapping, Sequence, Union
+from xml.etree import ElementTree
 
 import fastnumbers
 import numpy as _np
@@ -34,42 +36,38 @@ def dict_get(m: Mapping, k: Iterable, *args):
 class Wcrfx(parser.Parser):
     EXT = 'wcrfx'
 
+    # the file format is foreign and has no place for type tags
+    TAGGED = False
+
     VERSION = '0.31'
 
+    # attributes with numeric values
+    NUMERIC = frozenset((
+            'id', 'x', 'y', 'z',
+            'a11', 'a12', 'a13', 'a21', 'a22', 'a23', 'a31', 'a32', 'a33',
+            'Ixx', 'Ixy', 'Ixz', 'Iyx', 'Iyy', 'Iyz', 'Izx', 'Izy', 'Izz',
+            'radius', 'elasticity', 'mass', 'weight', 'max_length', 'damping',
+    ))
+
+    # attributes of anchors and their defaults, position first and then the
+    # direction cosine matrix row by row
+    ANCHOR = tuple(itertools.chain(
+            ((c, 0.0) for c in 'xyz'),
+            ((f'a{r}{c}', 1.0 if r == c else 0.0) for r in (1, 2, 3) for c in
+             (1, 2, 3)),
+    ))
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._PROCESSORS = {
-                'root':        {'dump': self._process_dump_robot},
-                'robot':       {'dump': self._process_dump_robot},
-                'models':      {'load': self._process_load_models},
-                '@id':         {'load': self._process_load_numeric},
-                '@x':          {'load': self._process_load_numeric},
-                '@y':          {'load': self._process_load_numeric},
-                '@z':          {'load': self._process_load_numeric},
-                '@a11':        {'load': self._process_load_numeric},
-                '@a12':        {'load': self._process_load_numeric},
-                '@a13':        {'load': self._process_load_numeric},
-                '@a21':        {'load': self._process_load_numeric},
-                '@a22':        {'load': self._process_load_numeric},
-                '@a23':        {'load': self._process_load_numeric},
-                '@a31':        {'load': self._process_load_numeric},
-                '@a32':        {'load': self._process_load_numeric},
-                '@a33':        {'load': self._process_load_numeric},
-                '@Ixx':        {'load': self._process_load_numeric},
-                '@Ixy':        {'load': self._process_load_numeric},
-                '@Ixz':        {'load': self._process_load_numeric},
-                '@Iyx':        {'load': self._process_load_numeric},
-                '@Iyy':        {'load': self._process_load_numeric},
-                '@Iyz':        {'load': self._process_load_numeric},
-                '@Izx':        {'load': self._process_load_numeric},
-                '@Izy':        {'load': self._process_load_numeric},
-                '@Izz':        {'load': self._process_load_numeric},
-                '@radius':     {'load': self._process_load_numeric},
-                '@elasticity': {'load': self._process_load_numeric},
-                '@mass':       {'load': self._process_load_numeric},
-                '@weight':     {'load': self._process_load_numeric},
-                '@max_length': {'load': self._process_load_numeric},
-                '@damping':    {'load': self._process_load_numeric},
+                'root':          {'dump': self._process_dump_robot},
+                'robot':         {'dump': self._process_dump_robot,
+                                  'load': self._process_load_robot},
+                'chain':         {'load': self._process_load_chain},
+                'base':          {'load': self._process_load_base},
+                'platform':      {'load': self._process_load_platform},
+                'inertiatensor': {'load': self._process_load_inertiatensor},
+                'cable':         {'load': self._process_load_cable},
         }
 
     def kwargs(self, o: RobotComponent, **kwargs):
@@ -83,23 +81,84 @@ class Wcrfx(parser.Parser):
                 short_empty_elements=True)
 
     def loads(self, s: AnyStr, *args, **kwargs) -> Union[OrderedDict, Mapping]:
-        # first, parse from XML to dictionary
-        d = xmltodict.parse(s,
-                            force_list=('dcm', 'angular', 'linear', 'position'),
-                            postprocessor=self._process_load)
-        # then, since there always must be a root object in XML, we will
-        # strip this off the dictionary from here
-        return d[list(d.keys())[0]]
+        f = io.BytesIO(s) if isinstance(s, bytes) else io.StringIO(s)
+
+        return self.load(f, *args, **kwargs)
+
+    def load(self, f: IO, *args, **kwargs) -> Union[OrderedDict, Mapping]:
+        try:
+            return next(self.iterload(f, *args, **kwargs))
+        except StopIteration:
+            raise ValueError('No models found in WCRFX document.') from None
+
+    def iterload(self, f: IO, *args, **kwargs) -> Iterator[OrderedDict]:
+        """
+        Incrementally load all models from a file-like object
+
+        The document is parsed element by element and each element is
+        discarded once it is closed, so only the current model is kept in
+        memory, no matter how many models or which other data like
+        trajectories an export contains. Numeric attributes are converted
+        as soon as their element is read, those of anchors directly into
+        arrays.
+
+        Parameters
+        ----------
+        f : IO
+            A file-like object that supports :code:`read()`.
+        args
+        kwargs
+
+        Returns
+        -------
+        models : Iterator[OrderedDict]
+            Robot dictionaries of all `models` elements in document order.
+        """
+        path = []
+        elements = []
+        value = None
+
+        for event, element in ElementTree.iterparse(f, ('start', 'end')):
+            if event == 'start':
+                if element.tag == 'models':
+                    value = OrderedDict((
+                            ('robot', OrderedDict((
+                                    ('geometry', OrderedDict((
+                                            ('chain', []),
+                                    ))),
+                                    ('platform', []),
+                            ))),
+                            ('cable', []),
+                    ))
+                elif value is not None:
+                    self._process_load(path, element, value)
+                path.append(element.tag)
+                elements.append(element)
+                continue
+
+            path.pop()
+            elements.pop()
+            if element.tag == 'models' and value is not None:
+                yield self._process_load_models(value)
+                value = None
+
+            # closed elements are not needed anymore, so remove them from
+            # their parent to keep the tree from growing
+            element.clear()
+            if elements:
+                elements[-1].remove(element)
 
     def _process_dump(self, root: str, o: Union[OrderedDict, Mapping]):
         return self._PROCESSORS[root]['dump'](o)
 
-    def _process_load(self, path: Sequence[Tuple[AnyStr, object]], key: str,
-                      value):
+    def _process_load(self, path: Sequence[AnyStr], element: ElementTree.Element,
+                      value: OrderedDict):
         try:
-            return self._PROCESSORS[key]['load'](path, key, value)
-        except KeyError as KeyE:
-            return key, value
+            processor = self._PROCESSORS[element.tag]['load']
+        except KeyError:
+            return
+
+        processor(path, element, value)
 
     def _process_dump_robot(self, o: Union[OrderedDict, Mapping]):
 
@@ -218,12 +277,69 @@ class Wcrfx(parser.Parser):
 
         return xmlo
 
-    def _process_load_numeric(self, path: Sequence[Tuple[AnyStr, object]],
-                              key: str, value: OrderedDict):
-        return key, fastnumbers.fast_real(value)
+    def _process_load_attributes(self, element: ElementTree.Element):
+        return OrderedDict(
+                (f'@{k}', fastnumbers.fast_real(v) if k in self.NUMERIC else v)
+                for k, v in element.attrib.items())
+
+    def _process_load_anchor(self, attributes: Mapping):
+        # convert position and direction cosine matrix at once
+        values = _np.fromiter(
+                (fastnumbers.fast_real(attributes.get(k, d)) for k, d in
+                 self.ANCHOR),
+                dtype=_np.float64, count=len(self.ANCHOR))
+
+        return OrderedDict((
+                ('position', values[0:3]),
+                ('dcm', values[3:12].reshape((3, 3))),
+        ))
 
-    def _process_load_models(self, path: Sequence[Tuple[AnyStr, object]],
-                             key: str, value: OrderedDict):
+    def _process_load_robot(self, path: Sequence[AnyStr],
+                            element: ElementTree.Element, value: OrderedDict):
+        if path[-1:] == ['models']:
+            value['robot'].update(self._process_load_attributes(element))
+
+    def _process_load_chain(self, path: Sequence[AnyStr],
+                            element: ElementTree.Element, value: OrderedDict):
+        if path[-2:] == ['robot', 'geometry']:
+            value['robot']['geometry']['chain'].append(
+                    self._process_load_attributes(element))
+
+    def _process_load_base(self, path: Sequence[AnyStr],
+                           element: ElementTree.Element, value: OrderedDict):
+        if path[-1:] == ['chain']:
+            anchor = self._process_load_anchor(element.attrib)
+            if 'radius' in element.attrib:
+                anchor['pulley'] = OrderedDict((
+                        ('radius', fastnumbers.fast_real(element.get('radius'))),
+                ))
+            value['robot']['geometry']['chain'][-1]['base'] = anchor
+
+    def _process_load_platform(self, path: Sequence[AnyStr],
+                               element: ElementTree.Element,
+                               value: OrderedDict):
+        # `platform` is both a platform of the robot and the platform anchor
+        # of a kinematic chain
+        if path[-1:] == ['chain']:
+            value['robot']['geometry']['chain'][-1]['platform'] = \
+                self._process_load_anchor(element.attrib)
+        elif path[-2:] == ['models', 'robot']:
+            value['robot']['platform'].append(
+                    self._process_load_attributes(element))
+
+    def _process_load_inertiatensor(self, path: Sequence[AnyStr],
+                                    element: ElementTree.Element,
+                                    value: OrderedDict):
+        if path[-2:] == ['robot', 'platform']:
+            value['robot']['platform'][-1]['inertiatensor'] = \
+                self._process_load_attributes(element)
+
+    def _process_load_cable(self, path: Sequence[AnyStr],
+                            element: ElementTree.Element, value: OrderedDict):
+        if path[-1:] == ['models']:
+            value['cable'].append(self._process_load_attributes(element))
+
+    def _process_load_models(self, value: OrderedDict):
         # store new frame anchors, platforms, platform anchors, cables,
         # and chains in these ordered dicts
         robot = OrderedDict((
@@ -253,28 +369,17 @@ class Wcrfx(parser.Parser):
         # loop over all kinematic chains
         for chain in dict_get(value, ('robot', 'geometry', 'chain')):
             # add the frame anchor
-            frame_anchor = OrderedDict((
-                    ('position',
-                     [dict_get(chain, ('base', f'@{c}'), 0.0) for c in 'xyz']),
-                    ('dcm', [[dict_get(chain, ('base', f'@a{r}{c}'),
-                                       1.0 if r == c else 0.0) for c in
-                              (1, 2, 3)] for r in (1, 2, 3)]),
-            ))
-            try:
-                frame_anchor['pulley'] = OrderedDict((
-                        ('radius', dict_get(chain, ('base', '@radius'))),
-                ))
-            except KeyError as ke:
-                pass
+            frame_anchor = dict_get(chain, ('base',), None) \
+                           or self._process_load_anchor({})
             robot['frame']['anchors'].append(frame_anchor)
-            frame_anchor_index = robot['frame']['anchors'].index(frame_anchor)
+            frame_anchor_index = len(robot['frame']['anchors']) - 1
 
             # get the platform or create it
             try:
                 platform_dict = dict_get(value, ('robot', 'platform', int(
                         dict_get(chain, ('@platform_id',))) - 1))
             except (TypeError, KeyError, IndexError):
-                platform_dict = dict_get(value, ('robot', 'platform'))
+                platform_dict = dict_get(value, ('robot', 'platform', 0))
             try:
                 motion_pattern = make_motion_pattern(
                         dict_get(platform_dict, ('@motionpattern',)))
@@ -305,15 +410,9 @@ class Wcrfx(parser.Parser):
                 robot['platforms'].append(platform)
                 platform_index = 0
 
-            # add
-            platform_anchor = OrderedDict((
-                    ('position',
-                     [dict_get(chain, ('platform', f'@{c}'), 0.0) for c in
-                      'xyz']),
-                    ('dcm', [[dict_get(chain, ('platform', f'@a{r}{c}'),
-                                       1.0 if r == c else 0.0) for c in
-                              (1, 2, 3)] for r in (1, 2, 3)]),
-            ))
+            # add the platform anchor
+            platform_anchor = dict_get(chain, ('platform',), None) \
+                              or self._process_load_anchor({})
             robot['platforms'][platform_index]['anchors'].append(
                     platform_anchor)
             platform_anchor_index = len(
@@ -323,7 +422,7 @@ class Wcrfx(parser.Parser):
                 cable_dict = dict_get(value, (
                         'cable', int(dict_get(chain, ('@cable_id',))) - 1))
             except (TypeError, KeyError, IndexError):
-                cable_dict = dict_get(value, ('cable',))
+                cable_dict = dict_get(value, ('cable', 0))
             robot['cables'].append(OrderedDict((
                     ('name', dict_get(cable_dict, ('@name',))),
                     ('modulus', OrderedDict((
@@ -345,4 +444,4 @@ class Wcrfx(parser.Parser):
                     ('cable', cable_index),
             )))
 
-        return key, robot
+        return robot
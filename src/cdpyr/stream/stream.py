@@ -7,19 +7,25 @@ __all__ = [
 ]
 
 from collections import OrderedDict
-from typing import AnyStr, IO
+from typing import AnyStr, IO, Mapping
 
 import cdpyr.schema.robot.anchor
 from cdpyr import motion as _motion, robot as _robot, schema as _schema
+from cdpyr.analysis.workspace import grid as _grid, hull as _hull
 from cdpyr.base import Object
 from cdpyr.helper.resolve import full_classname as fcn
 from cdpyr.robot.robot_component import RobotComponent
+from cdpyr.schema.loader import loader as _loader
 from cdpyr.stream.parser import parser as _parser
 
 
 class Stream(Object):
     parser: _parser.Parser
 
+    # keys of the type discriminator and of the data of lists in tagged dumps
+    TYPE = '__type__'
+    DATA = '__data__'
+
     # define the mapping of object type and marshmallow schemes
     _RESOLVER = {
             fcn(_robot.Cable):
@@ -102,6 +108,34 @@ class Stream(Object):
                 _schema.motion.pattern.PatternSchema(
                         many=False,
                         partial=False),
+            fcn(_grid.Result):
+                _schema.analysis.workspace.GridResultSchema(
+                        many=False,
+                        partial=False),
+            fcn(_hull.Result):
+                _schema.analysis.workspace.HullResultSchema(
+                        many=False,
+                        partial=False),
+    }
+
+    # binary parsers store arrays as they are and pose lists as columns
+    _BINARY_RESOLVER = {
+            **_RESOLVER,
+            fcn(_motion.pose.PoseList):
+                _schema.motion.pose.PoseListSchema(
+                        many=False,
+                        partial=False,
+                        context={'arrays': True}),
+            fcn(_grid.Result):
+                _schema.analysis.workspace.GridResultSchema(
+                        many=False,
+                        partial=False,
+                        context={'arrays': True}),
+            fcn(_hull.Result):
+                _schema.analysis.workspace.HullResultSchema(
+                        many=False,
+                        partial=False,
+                        context={'arrays': True}),
     }
 
     def __init__(self, parser: _parser.Parser, **kwargs):
@@ -114,8 +148,8 @@ class Stream(Object):
         Parameters
         ----------
         f : IO
-            A file-like object that supports :code:`write()` and
-            :code:`writelines()`.
+            A file-like object that supports :code:`write()`, opened in
+            binary mode for binary parsers.
         o : object
             Any object type or robot component object
         args
@@ -128,8 +162,8 @@ class Stream(Object):
 
         # now we should have a `dict`-like object, so we'll just let the
         # explicit parser implementation take care of converting the object into
-        # the correct string-representation
-        f.write(self.dumps(o, *args, **kwargs))
+        # the correct representation
+        self.parser.dump(f, self._encode(o), *args, **kwargs)
 
     def dumps(self, o: RobotComponent, *args, **kwargs):
         """
@@ -146,14 +180,8 @@ class Stream(Object):
         -------
 
         """
-        # first, convert `o` into a dictionary
-        try:
-            o = self._RESOLVER[fcn(o)].dump(o)
-        except KeyError:
-            pass
-
         # let the parser handle turning the dictionary into its representation
-        return self.parser.dumps(o, *args, **kwargs)
+        return self.parser.dumps(self._encode(o), *args, **kwargs)
 
     def load(self, f: IO, *args, **kwargs):
         """
@@ -162,8 +190,8 @@ class Stream(Object):
         Parameters
         ----------
         f : IO
-            A file-like object that supports :code:`read()` and
-            :code:`readlines()`.
+            A file-like object that supports :code:`read()`, opened in
+            binary mode for binary parsers.
         args
         kwargs
 
@@ -172,7 +200,7 @@ class Stream(Object):
         o : object, RobotComponent
             Either an object of built-in type or a RobotComponent object
         """
-        return self.loads(''.join(f.readlines()), *args, **kwargs)
+        return self._decode(self.parser.load(f, *args, **kwargs))
 
     def loads(self, s: AnyStr, *args, **kwargs):
         """
@@ -190,14 +218,48 @@ class Stream(Object):
         """
         # first, let the parser convert the string into a valid python object
         # (dictionary or alike)
-        o = self.parser.loads(s, *args, **kwargs)
+        return self._decode(self.parser.loads(s, *args, **kwargs))
+
+    @property
+    def _resolver(self):
+        return self._BINARY_RESOLVER \
+            if self.parser.BINARY \
+            else self._RESOLVER
+
+    def _encode(self, o):
+        # first, convert `o` into a dictionary and, if the parser supports it,
+        # tag it with its type so it can be loaded without guessing
+        try:
+            c = fcn(o)
+            o = self._resolver[c].dump(o)
+        except KeyError:
+            return o
+
+        if self.parser.TAGGED:
+            o = OrderedDict([(self.TYPE, c), (self.DATA, o)]) \
+                if isinstance(o, list) \
+                else OrderedDict([(self.TYPE, c), *o.items()])
+
+        return o
+
+    def _decode(self, o):
+        # tagged data is loaded directly with the schema of its type
+        if isinstance(o, Mapping) and self.TYPE in o:
+            o = dict(o)
+            c = o.pop(self.TYPE)
+            try:
+                s = self._resolver[c]
+            except KeyError:
+                raise ValueError(f'Unknown type `{c}`.') from None
+
+            return _loader(s)(o.get(self.DATA, []) if s.many else o)
 
-        # then, loop over each mapping and try each one till we have a
-        # successful decoding, then return that result
-        for c, s in self._RESOLVER.items():
+        # otherwise, try each mapping till we have a successful decoding,
+        # then return that result
+        for s in self._resolver.values():
             try:
-                # load data using the Marshmallow schema object
-                o = s.load(o, *args, **kwargs)
+                # load data using the compiled Marshmallow schema
+                return _loader(s)(o)
             except Exception:
                 pass
 
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'dump',
+        'load',
+        'path',
+]
+
+import datetime as _datetime
+import hashlib
+import json
+import pathlib as _pl
+from typing import AnyStr, Optional, Union
+
+import numpy as _np
+import pint as _pint
+
+from cdpyr.stream.twincat import (
+    scope as _tcscope,
+    signal as _tcsignal,
+    units as _tcunits,
+)
+
+# version of the cache layout, caches of other versions are rebuilt
+VERSION = 2
+
+# fields of the scope and signal meta data as passed to their constructors
+SCOPE_META = ('name', 'file', 'start_record', 'end_record')
+SIGNAL_META = ('name', 'net_id', 'port', 'sample_time', 'symbol_based',
+               'symbol_name', 'symbol_comment', 'index_group', 'index_offset',
+               'data_type', 'variable_size', 'offset', 'scale_factor',
+               'bit_mask')
+
+
+def path(file: Union[AnyStr, _pl.Path]) -> _pl.Path:
+    """
+    Directory of the cache of a scope file next to the file itself
+
+    Parameters
+    ----------
+    file : AnyStr | Path
+        Path of the TwinCAT 3 scope CSV file.
+
+    Returns
+    -------
+    path : Path
+        Path of the cache directory e.g., `scope.csv.cache` for `scope.csv`.
+    """
+    file = _pl.Path(file).resolve()
+    return file.with_name(f'{file.name}.cache')
+
+
+def load(file: Union[AnyStr, _pl.Path],
+         delimiter="\t") -> Optional[_tcscope.Scope]:
+    """
+    Load a scope from the cache of its file
+
+    The cache is valid if it was written from a file of the same size and
+    modification time, or, if only the modification time differs, of the
+    same content. The values and samples of signals of the returned scope
+    are read-only views of memory-mapped arrays i.e., they are only read
+    from disk on access.
+
+    Parameters
+    ----------
+    file : AnyStr | Path
+        Path of the TwinCAT 3 scope CSV file.
+    delimiter : str
+        Delimiter of cells of the file.
+
+    Returns
+    -------
+    scope : Scope
+        Scope of the file or `None` if there is no valid cache.
+    """
+    file = _pl.Path(file).resolve()
+    directory = path(file)
+
+    try:
+        with open(directory / 'meta.json', 'r') as f:
+            meta = json.load(f, object_hook=_decode)
+    except (OSError, ValueError):
+        return None
+
+    if meta.get('version') != VERSION or meta.get('delimiter') != delimiter:
+        return None
+
+    stat = file.stat()
+    source = meta['source']
+    if stat.st_size != source['size']:
+        return None
+    if stat.st_mtime_ns != source['mtime']:
+        # file was touched or copied, so only its content tells if the cache
+        # is still valid
+        if _hash(file) != source['hash']:
+            return None
+        source['mtime'] = stat.st_mtime_ns
+        _write_meta(directory, meta)
+
+    try:
+        if meta['shared']:
+            # signals sharing their samples are views of one array of values
+            samples = _load_array(directory / 'samples.npy')
+            values = _load_array(directory / 'values.npy')
+            bounds = _np.cumsum([0] + meta['widths'])
+            signals = _tcsignal.SignalList(
+                    _tcsignal.Signal(samples,
+                                     values[:, start:stop],
+                                     _tcsignal.SignalMeta(**signal))
+                    for signal, start, stop in
+                    zip(meta['signals'], bounds[:-1], bounds[1:]))
+        else:
+            signals = _tcsignal.SignalList(
+                    _tcsignal.Signal.from_array(
+                            _load_array(directory / f'signal_{idx}.npy'),
+                            _tcsignal.SignalMeta(**signal))
+                    for idx, signal in enumerate(meta['signals']))
+    except (OSError, ValueError):
+        return None
+
+    return _tcscope.Scope(signals, _tcscope.ScopeMeta(**meta['scope']))
+
+
+def dump(file: Union[AnyStr, _pl.Path],
+         scope: _tcscope.Scope,
+         delimiter="\t"):
+    """
+    Write the cache of a scope file
+
+    If all signals share their samples, these and the values of all signals
+    are stored as two binary arrays, otherwise every signal's samples and
+    values are stored as one binary array. The scope and signal meta data
+    together with the source file's size, modification time, and hash are
+    stored in a JSON file.
+
+    Parameters
+    ----------
+    file : AnyStr | Path
+        Path of the TwinCAT 3 scope CSV file.
+    scope : Scope
+        Scope parsed from the file.
+    delimiter : str
+        Delimiter of cells of the file.
+    """
+    file = _pl.Path(file).resolve()
+    directory = path(file)
+    directory.mkdir(exist_ok=True)
+
+    # invalidate an existing cache until all arrays are written
+    try:
+        (directory / 'meta.json').unlink()
+    except FileNotFoundError:
+        pass
+
+    shared = scope.signals.values is not None
+    if shared:
+        _np.save(directory / 'samples.npy', scope.signals.samples)
+        _np.save(directory / 'values.npy', scope.signals.values)
+    else:
+        for idx, signal in enumerate(scope.signals):
+            _np.save(directory / f'signal_{idx}.npy',
+                     _np.ascontiguousarray(signal.data, dtype=float))
+
+    stat = file.stat()
+    _write_meta(directory, {
+            'version':   VERSION,
+            'delimiter': delimiter,
+            'source':    {
+                    'size':  stat.st_size,
+                    'mtime': stat.st_mtime_ns,
+                    'hash':  _hash(file),
+            },
+            'shared':    shared,
+            'widths':    [signal.values.shape[1] for signal in scope.signals],
+            'scope':     {key: getattr(scope.meta, key) for key in SCOPE_META},
+            'signals':   [{key: getattr(signal.meta, key)
+                           for key in SIGNAL_META}
+                          for signal in scope.signals],
+    })
+
+
+def _load_array(file: _pl.Path):
+    try:
+        return _np.load(file, mmap_mode='r')
+    # empty arrays cannot be memory-mapped
+    except ValueError:
+        return _np.load(file)
+
+
+def _write_meta(directory: _pl.Path, meta: dict):
+    with open(directory / 'meta.json', 'w') as f:
+        json.dump(meta, f, default=_encode, indent=2)
+
+
+def _hash(file: _pl.Path):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(2 ** 20), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _encode(o):
+    # tag values JSON does not know so they can be decoded again
+    if isinstance(o, _pint.Quantity):
+        return {'__quantity__': [o.magnitude, str(o.units)]}
+    if isinstance(o, _datetime.datetime):
+        return {'__datetime__': o.isoformat()}
+    if isinstance(o, _pl.PurePath):
+        return {'__path__': str(o)}
+
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON '
+                    f'serializable')
+
+
+def _decode(d: dict):
+    if '__quantity__' in d:
+        magnitude, units = d['__quantity__']
+        return _tcunits.ureg.Quantity(magnitude, units)
+    if '__datetime__' in d:
+        return _datetime.datetime.fromisoformat(d['__datetime__'])
+    if '__path__' in d:
+        return _pl.Path(d['__path__'])
+
+    return d
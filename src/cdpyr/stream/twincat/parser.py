@@ -7,11 +7,12 @@ __all__ = [
 ]
 
 import _datetime as _datetime
+import io
 import pathlib as _pl
 import re
 from collections import OrderedDict
 from enum import auto, Enum
-from typing import Any, AnyStr, Dict, List, Tuple, Union
+from typing import Any, AnyStr, Dict, IO, List, Tuple, Union
 
 import case_changer
 import more_itertools
@@ -25,6 +26,9 @@ from cdpyr.typing import Num, Vector
 reg_name_unit = re.compile('^(?P<key>[A-Za-z\_\-]+)(\[(?P<unit>[a-z]+)\])?$')
 # regular expression object to match vector-like names
 reg_signal_name = re.compile('^(?P<name>[a-zA-Z\_\.]+)(\[(?P<index>\d+)\])?$')
+# regular expression object to match the first line after the signal data
+# i.e., the first line not starting with a number
+reg_data_end = re.compile(r'^(?=[^-+.\d])', re.MULTILINE)
 
 
 # callback to parse the "StartRecord" and "EndRecord" header fields
@@ -81,11 +85,32 @@ class Parser(object):
               ParsingState.SIGNAL_DATA,
               ParsingState.EOF,)
 
-    def __init__(self, file: Union[AnyStr, _pl.Path], delimiter="\t"):
+    def __init__(self,
+                 file: Union[AnyStr, _pl.Path],
+                 delimiter="\t",
+                 vectorized: bool = True,
+                 chunk_size: int = 2 ** 24):
+        """
+        Parameters
+        ----------
+        file : AnyStr | Path
+            Path of the TwinCAT 3 scope CSV file.
+        delimiter : str
+            Delimiter of cells of the file.
+        vectorized : bool
+            Whether to read the signal data columnar in chunks with NumPy
+            rather than line by line and cell by cell. Defaults to `True`.
+        chunk_size : int
+            Number of characters of signal data to read and parse at once if
+            `vectorized` is `True`.
+        """
         # file path
         self.file = _pl.Path(file).resolve()
         # file delimiter to use
         self.delimiter = delimiter
+        # read signal data columnar
+        self.vectorized = vectorized
+        self.chunk_size = chunk_size
         # parse data
         self._data = {}
 
@@ -102,40 +127,10 @@ class Parser(object):
         # store processed scope meta data and signals
         self._data = {'meta': dict(), 'signals': OrderedDict()}
 
-        # iterator over all possible states
-        states = iter(self.STATES)
-        # and the current state is the first/next of all possible states
-        state = next(states)
-
-        # loop over the file lines while looking forward into the file
         with open(self.file, 'r') as f:
-            # get current and next line for lookahead of changing state
-            for current_line, next_line in more_itertools.pairwise(f):
-                # strip newline breaks from current and next line
-                current_line = current_line.rstrip("\n")
-                next_line = next_line.rstrip("\n")
-
-                # completely skip empty lines
-                if current_line == '':
-                    continue
-
-                # process the current line depending on what state we are in
-                if state == ParsingState.HEADER:
-                    self._parse_header(current_line)
-                elif state == ParsingState.SIGNAL_META:
-                    self._parse_signal_meta(current_line)
-                elif state == ParsingState.SIGNAL_DATA:
-                    self._parse_signal_data(current_line)
-
-                # if the next line is empty and the current is not,
-                # we advance to the next state
-                if next_line == '' and current_line != '':
-                    state = next(states)
-
-                # we reached the implemented file end, so it's safe to bail
-                # out here
-                if current_line == 'EOF':
-                    break
+            # read all signal data at once from the rest of the file
+            if self._parse_lines(f, self.vectorized):
+                self._read_signal_data(f)
 
         # merge signals with a vector-like name
         self._data['signals'] = self._merge_signals(
@@ -143,6 +138,91 @@ class Parser(object):
 
         return self._data
 
+    def iterparse(self, window: int):
+        """
+        Parse the assigned TwinCAT 3 scope CSV file in windows of samples
+
+        The scope meta data and signal meta data are parsed once, after which
+        the signal data is read in chunks and yielded in windows of `window`
+        samples of all signals. Only the current chunk and window are kept
+        in memory, so files larger than memory can be processed. Signal data
+        is always read columnar.
+
+        Parameters
+        ----------
+        window : int
+            Number of samples per window. The last window may be shorter.
+
+        Yields
+        ------
+        scope : Dict
+            Scope meta data and signals of the samples of the current window
+            with the same structure as returned by `parse`.
+        """
+        if window < 1:
+            raise ValueError('window must be a positive integer.')
+
+        self._data = {'meta': dict(), 'signals': OrderedDict()}
+
+        with open(self.file, 'r') as f:
+            # file without signal data
+            if not self._parse_lines(f, True):
+                return
+
+            signals = tuple(self._data['signals'].values())
+            for data in self._iter_windows(f, window):
+                yield {
+                        'meta':    dict(self._data['meta']),
+                        'signals': self._merge_signals(
+                                self._split_signals(data, signals)),
+                }
+
+    def _parse_lines(self, f: IO, until_data: bool):
+        """
+        Parse the lines of `f` by advancing through the parsing states
+
+        Returns `True` if `until_data` is set and parsing stopped at the
+        beginning of the signal data, `False` otherwise.
+        """
+        # iterator over all possible states
+        states = iter(self.STATES)
+        # and the current state is the first/next of all possible states
+        state = next(states)
+
+        # get current and next line for lookahead of changing state
+        for current_line, next_line in more_itertools.pairwise(f):
+            # strip newline breaks from current and next line
+            current_line = current_line.rstrip("\n")
+            next_line = next_line.rstrip("\n")
+
+            # completely skip empty lines
+            if current_line == '':
+                continue
+
+            # process the current line depending on what state we are in
+            if state == ParsingState.HEADER:
+                self._parse_header(current_line)
+            elif state == ParsingState.SIGNAL_META:
+                self._parse_signal_meta(current_line)
+            elif state == ParsingState.SIGNAL_DATA:
+                self._parse_signal_data(current_line)
+
+            # if the next line is empty and the current is not,
+            # we advance to the next state
+            if next_line == '' and current_line != '':
+                state = next(states)
+
+                # leave the signal data to the caller
+                if state == ParsingState.SIGNAL_DATA and until_data:
+                    return True
+
+            # we reached the implemented file end, so it's safe to bail
+            # out here
+            if current_line == 'EOF':
+                break
+
+        return False
+
     def _parse_header(self, line: str):
         line_data = line.split(self.delimiter)
         key = self._prepare_cell_key(line_data[0])
@@ -221,6 +301,140 @@ class Parser(object):
                 self._data['signals'][idx]['time'] = [key]
                 self._data['signals'][idx]['values'] = [value]
 
+    def _read_signal_data(self, f: IO):
+        """
+        Read the signal data block from the current position of `f` into one
+        `(n_samples, n_columns)` array of samples and values of all signals
+        """
+        num_columns = 2 * len(self._data['signals'])
+        blocks = list(self._iter_data_blocks(f))
+        data = _np.concatenate(blocks) \
+            if blocks \
+            else _np.empty((0, num_columns))
+
+        self._data['signals'] = OrderedDict(enumerate(self._split_signals(
+                data, tuple(self._data['signals'].values()))))
+
+    def _iter_windows(self, f: IO, window: int):
+        # collect blocks until there are enough samples for a window
+        pending = []
+        num_pending = 0
+        for block in self._iter_data_blocks(f):
+            pending.append(block)
+            num_pending += len(block)
+            while num_pending >= window:
+                data = _np.concatenate(pending) \
+                    if len(pending) > 1 \
+                    else pending[0]
+                yield data[:window]
+                pending = [data[window:]]
+                num_pending -= window
+
+        if num_pending:
+            yield _np.concatenate(pending)
+
+    def _iter_data_blocks(self, f: IO):
+        """
+        Iterate over the signal data block from the current position of `f`
+        in `(n, n_columns)` arrays of samples and values of all signals
+
+        The block is read in chunks of complete lines, each of which is
+        parsed at once. Chunks with empty or non-numeric cells, e.g.,
+        from signals with fewer samples, are parsed with `NaN` in place of
+        these cells.
+        """
+        num_columns = 2 * len(self._data['signals'])
+
+        remainder = ''
+        # skip empty lines between signal meta and data
+        leading = True
+        while True:
+            text = f.read(self.chunk_size)
+            eof = text == ''
+            text = remainder + text
+            if leading:
+                text = text.lstrip('\n')
+                leading = text == '' and not eof
+            # only parse complete lines
+            if not eof:
+                cut = text.rfind('\n') + 1
+                text, remainder = text[:cut], text[cut:]
+
+            # chunks of only complete data lines parse in one go, so we only
+            # look for the end of the signal data in chunks that do not
+            block = self._parse_data_block(text, num_columns, False)
+            end = None
+            if block is None:
+                end = reg_data_end.search(text)
+                if end is not None:
+                    text = text[:end.start()]
+                block = self._parse_data_block(text, num_columns)
+
+            if block is not None:
+                yield block
+
+            if eof or end is not None:
+                break
+
+    @staticmethod
+    def _split_signals(data: _np.ndarray, signals: Tuple[Dict[AnyStr, Any]]):
+        """
+        Split samples and values of all signals into one dictionary per
+        signal, dropping samples of signals with fewer samples than others
+        """
+        split = []
+        for idx, signal in enumerate(signals):
+            time = data[:, 2 * idx]
+            values = data[:, 2 * idx + 1]
+            sampled = ~_np.isnan(time)
+            if not sampled.all():
+                time, values = time[sampled], values[sampled]
+            # samples are integer counters
+            if _np.array_equal(time, _np.round(time)):
+                time = time.astype(_np.int64)
+
+            # merging signals renames them, so every split gets its own meta
+            split.append({
+                    'time':   time,
+                    'values': values,
+                    'meta':   dict(signal['meta']),
+            })
+
+        return tuple(split)
+
+    def _parse_data_block(self,
+                          text: str,
+                          num_columns: int,
+                          fallback: bool = True):
+        if not text:
+            return None
+
+        if self.delimiter not in ('\t', ' '):
+            text = text.replace(self.delimiter, '\t')
+
+        # parsing cells separated by any whitespace is fastest, but merges
+        # empty cells, which changes the number of columns, and fails on
+        # invalid ones
+        try:
+            values = _np.loadtxt(io.StringIO(text),
+                                 dtype=float,
+                                 comments=None,
+                                 ndmin=2)
+        except ValueError:
+            values = None
+        if values is not None and values.shape[1] == num_columns:
+            return values
+        if not fallback:
+            return None
+
+        # parse cell by cell and fill in `NaN` for empty and invalid cells
+        values = _np.genfromtxt(io.StringIO(text),
+                                delimiter='\t',
+                                usecols=range(num_columns),
+                                dtype=float)
+
+        return values.reshape((-1, num_columns))
+
     @staticmethod
     def _prepare_cell_key(k: str):
         # remove dashes/hyphens and turn camel case into snake case
@@ -244,35 +458,55 @@ class Parser(object):
                                                         _tcunits.ureg.Quantity,
                                                         Num]],
                                                Vector]]]):
-        # new signals stored in a dict
-        new_signals = {}
-        # loop over every signal
+        # group signals by their name and sort them by their vector index
+        groups = OrderedDict()
+        metas = {}
         for signal in signals:
             # see if signal matches a 'vector'-name identifier
             reg_match = reg_signal_name.match(signal['meta']['name'])
             # get name and index
             name, index = reg_match.group('name'), reg_match.group('index')
-            # append
-            try:
-                new_signals[name]['values'][index] = signal['values']
-            except KeyError:
-                # change signal's original `Name` attribute
-                signal['meta']['name'] = name
-                # also change signal's original `SymbolName` attribute
-                signal['meta']['symbol_name'] = signal['meta'][
-                    'symbol_name'].replace(f'{name}[{index}]', name)
-                # and create a new signal dict
-                new_signals[name] = {
-                        'time':   signal['time'],
-                        'values': OrderedDict({index: signal['values']}),
-                        'meta':   signal['meta']
-                }
+            # the first signal of a name keeps its meta data
+            if name not in metas:
+                metas[name] = (signal['meta'], index)
+            groups.setdefault(name, []).append(
+                    (int(index) if index is not None else -1, signal))
+        for group in groups.values():
+            group.sort(key=lambda indexed: indexed[0])
+
+        ordered = [signal for group in groups.values() for _, signal in group]
+        times = [_np.asarray(signal['time']) for signal in ordered]
+
+        # if all signals share their samples, the values of all signals are
+        # merged into one array at once and every merged signal is a slice of
+        # it
+        if all(time.shape == times[0].shape and time.dtype == times[0].dtype
+               for time in times) \
+                and all(_np.array_equal(time, times[0]) for time in times[1:]):
+            values = _np.column_stack([signal['values'] for signal in ordered])
+            widths = [len(group) for group in groups.values()]
+            bounds = _np.cumsum([0] + widths)
+            merged = [(times[0], values[:, start:stop])
+                      for start, stop in zip(bounds[:-1], bounds[1:])]
+        else:
+            merged = [(_np.asarray(group[0][1]['time']),
+                       _np.column_stack([signal['values']
+                                         for _, signal in group]))
+                      for group in groups.values()]
 
-        # sort vector signals by index
-        for key, signal in new_signals.items():
-            new_signals[key]['values'] = _np.asarray(
-                    [signal['values'][index] for index in
-                     sorted(signal['values'].keys())]).T
+        new_signals = {}
+        for name, (time, values) in zip(groups.keys(), merged):
+            meta, index = metas[name]
+            # change signal's original `Name` attribute
+            meta['name'] = name
+            # also change signal's original `SymbolName` attribute
+            meta['symbol_name'] = meta['symbol_name'].replace(
+                    f'{name}[{index}]', name)
+            new_signals[name] = {
+                    'time':   time,
+                    'values': values,
+                    'meta':   meta,
+            }
 
         # return the squeezed data
         return tuple(new_signals.values())
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'Replay',
+        'Result',
+]
+
+import multiprocessing
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as _np
+from joblib import delayed, Parallel
+from magic_repr import make_repr
+
+from cdpyr.analysis.force_distribution import \
+    force_distribution as _force_distribution
+from cdpyr.analysis.kinematics import kinematics as _kinematics
+from cdpyr.robot import robot as _robot
+from cdpyr.stream.twincat import (
+    resample as _tcresample,
+    scope as _tcscope,
+    signal as _tcsignal,
+)
+from cdpyr.typing import Matrix, Num, Vector
+
+
+class Replay(object):
+    """
+    Replay of measured joint lengths of a scope through the forward
+    kinematics and, optionally, the force distribution.
+
+    Channels of the scope are mapped to the kinematic chains of the robot,
+    scaled and offset into joint lengths, and solved sample by sample with
+    `Algorithm.forward_batch`, where every sample starts from the solution of
+    the previous one. Long recordings can be split into chunks that are
+    solved in parallel, each chunk starting from the estimate of its first
+    sample's joint lengths.
+    """
+
+    robot: _robot.Robot
+    kinematics: _kinematics.Algorithm
+    channels: Union[str, Sequence[Tuple[str, int]]]
+    scale: Union[Num, Vector]
+    offset: Union[Num, Vector]
+    force_distribution: Optional[_force_distribution.Algorithm]
+    wrench: Optional[Union[Vector, Matrix]]
+
+    def __init__(self,
+                 robot: _robot.Robot,
+                 kinematics: _kinematics.Algorithm,
+                 channels: Union[str, Sequence[Tuple[str, int]]],
+                 scale: Union[Num, Vector] = 1.0,
+                 offset: Union[Num, Vector] = 0.0,
+                 force_distribution: Optional[
+                     _force_distribution.Algorithm] = None,
+                 wrench: Optional[Union[Vector, Matrix]] = None):
+        """
+        Parameters
+        ----------
+        robot : Robot
+            Robot the scope was recorded on.
+        kinematics : Algorithm
+            Kinematics algorithm to solve the forward kinematics with.
+        channels : str | Sequence[Tuple[str, int]]
+            Name of one vector signal with one column per kinematic chain, or
+            one `(name, column)` tuple of signal name and column of its
+            values per kinematic chain.
+        scale : Num | Vector
+            Scalar or `(M,)` array to scale the channels' values by e.g., to
+            convert motor positions into joint lengths.
+        offset : Num | Vector
+            Scalar or `(M,)` array to add to the scaled channels' values.
+        force_distribution : Algorithm
+            Optional force distribution algorithm to estimate the cable
+            forces of every reconstructed pose with.
+        wrench : Vector | Matrix
+            `(N,)` wrench for all samples or `(K, N)` wrenches per sample
+            acting on the platform for the force distribution. Defaults to no
+            wrench.
+        """
+        self.robot = robot
+        self.kinematics = kinematics
+        self.channels = channels
+        self.scale = scale
+        self.offset = offset
+        self.force_distribution = force_distribution
+        self.wrench = wrench
+
+    def joints(self,
+               signals: Union[_tcscope.Scope, _tcsignal.SignalList],
+               sample_time: Optional[Num] = None,
+               method: str = 'linear') -> Tuple[Vector, Matrix]:
+        """
+        Joint lengths of the mapped channels of a scope
+
+        Channels of signals that do not share their samples are resampled
+        onto a common time base.
+
+        Parameters
+        ----------
+        signals : Scope | SignalList
+            Scope or signals to take the channels from.
+        sample_time : Num
+            Sample time in seconds to resample channels at. Defaults to the
+            largest sample time of the channels' signals.
+        method : str
+            Method to resample channels with, see `resample.resample`.
+
+        Returns
+        -------
+        time : Vector
+            `(K,)` array of times in seconds.
+        joints : Matrix
+            `(K, M)` array of joint lengths.
+        """
+        if isinstance(signals, _tcscope.Scope):
+            signals = signals.signals
+
+        channels = self.channels
+        names = [channels] \
+            if isinstance(channels, str) \
+            else list(dict.fromkeys(name for name, _ in channels))
+        selected = signals.select(*names)
+        missing = set(names).difference(signal.name for signal in selected)
+        if missing:
+            raise KeyError(f'Scope has no signals {sorted(missing)}.')
+
+        if selected.values is not None and sample_time is None:
+            # shared samples need no resampling
+            seconds = selected[0].sample_time.to('second').magnitude
+            time = selected.samples * seconds
+            values, columns = selected.values, selected.columns
+        else:
+            time, values, columns = _tcresample.align(selected,
+                                                      sample_time,
+                                                      method)
+
+        if isinstance(channels, str):
+            indices = _np.arange(columns[channels].start,
+                                 columns[channels].stop)
+        else:
+            indices = _np.asarray([columns[name].start + column
+                                   for name, column in channels])
+        if len(indices) != self.robot.num_kinematic_chains:
+            raise ValueError(
+                    f'Channels must map to {self.robot.num_kinematic_chains} '
+                    f'kinematic chains, got {len(indices)}.')
+
+        return time, values[:, indices] * self.scale + self.offset
+
+    def evaluate(self,
+                 signals: Union[_tcscope.Scope, _tcsignal.SignalList],
+                 sample_time: Optional[Num] = None,
+                 method: str = 'linear',
+                 **kwargs) -> Result:
+        """
+        Reconstruct the poses and, optionally, cable forces of a recording
+
+        Parameters
+        ----------
+        signals : Scope | SignalList
+            Scope or signals to take the channels from.
+        sample_time : Num
+            Sample time in seconds to resample channels at. Defaults to the
+            largest sample time of the channels' signals.
+        method : str
+            Method to resample channels with, see `resample.resample`.
+        parallel : bool
+            Whether to solve chunks of samples in parallel. Defaults to
+            `False`.
+        n_jobs : int
+            Number of parallel jobs. Defaults to the number of CPUs.
+        chunk_size : int
+            Number of samples per parallel chunk. Defaults to an even split
+            of all samples onto all jobs.
+        kwargs
+            Additional keyword arguments to `Algorithm.forward_batch`.
+
+        Returns
+        -------
+        result : Result
+            Time, joint lengths, poses, and residuals of every sample.
+        """
+        time, joints = self.joints(signals, sample_time, method)
+        num_samples = len(time)
+
+        # parallelized evaluation of chunks of samples
+        if kwargs.pop('parallel', False):
+            n_jobs = kwargs.pop('n_jobs', multiprocessing.cpu_count())
+            chunk_size = kwargs.pop('chunk_size', None) \
+                         or max(1, -(-num_samples // n_jobs))
+            chunks = Parallel(n_jobs=n_jobs)(
+                    delayed(self.kinematics.forward_batch)(
+                            self.robot,
+                            joints[start:start + chunk_size],
+                            **kwargs)
+                    for start in range(0, num_samples, chunk_size))
+            positions, dcms, residuals = (_np.concatenate(arrays)
+                                          for arrays in zip(*chunks))
+        # one warm-started run over all samples
+        else:
+            kwargs.pop('n_jobs', None)
+            kwargs.pop('chunk_size', None)
+            positions, dcms, residuals = self.kinematics.forward_batch(
+                    self.robot,
+                    joints,
+                    **kwargs)
+
+        forces = None
+        feasible = None
+        if self.force_distribution is not None:
+            forces, feasible = self._forces(positions, dcms, residuals)
+
+        return Result(time, joints, positions, dcms, residuals, forces,
+                      feasible)
+
+    def _forces(self, positions: Matrix, dcms: Matrix, residuals: Vector):
+        num_samples = len(positions)
+        platform = self.robot.platforms[0]
+        wrench = _np.zeros((platform.dof,)) \
+            if self.wrench is None \
+            else _np.asarray(self.wrench, dtype=float)
+
+        forces = _np.full((num_samples, self.robot.num_kinematic_chains),
+                          _np.nan)
+        feasible = _np.zeros((num_samples,), dtype=bool)
+
+        # only poses that were solved have forces
+        solved = ~_np.isnan(residuals)
+        if solved.any():
+            forces[solved], feasible[solved] = \
+                self.force_distribution.evaluate_batch(
+                        self.robot,
+                        positions[solved],
+                        dcms[solved],
+                        wrench[solved] if wrench.ndim > 1 else wrench)
+
+        return forces, feasible
+
+    __repr__ = make_repr(
+            'robot',
+            'kinematics',
+            'channels',
+            'force_distribution',
+    )
+
+
+class Result(object):
+    _time: Vector
+    _joints: Matrix
+    _positions: Matrix
+    _dcms: Matrix
+    _residuals: Vector
+    _forces: Optional[Matrix]
+    _feasible: Optional[Vector]
+
+    def __init__(self,
+                 time: Vector,
+                 joints: Matrix,
+                 positions: Matrix,
+                 dcms: Matrix,
+                 residuals: Vector,
+                 forces: Optional[Matrix] = None,
+                 feasible: Optional[Vector] = None):
+        self._time = time
+        self._joints = joints
+        self._positions = positions
+        self._dcms = dcms
+        self._residuals = residuals
+        self._forces = forces
+        self._feasible = feasible
+
+    @property
+    def dcms(self):
+        return self._dcms
+
+    @property
+    def feasible(self):
+        return self._feasible
+
+    @property
+    def forces(self):
+        return self._forces
+
+    @property
+    def joints(self):
+        return self._joints
+
+    @property
+    def positions(self):
+        return self._positions
+
+    @property
+    def residuals(self):
+        return self._residuals
+
+    @property
+    def solved(self):
+        """
+        Boolean array that is `True` for every sample with a solution of the
+        forward kinematics
+        """
+        return ~_np.isnan(self._residuals)
+
+    @property
+    def time(self):
+        return self._time
+
+    def __len__(self):
+        return len(self._time)
+
+    __repr__ = make_repr(
+            'time',
+            'positions',
+            'residuals',
+    )
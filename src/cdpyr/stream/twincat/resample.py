@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+__all__ = [
+        'align',
+        'decimate',
+        'resample',
+        'time_base',
+]
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as _np
+from scipy import signal as _signal
+
+from cdpyr.stream.twincat import signal as _tcsignal
+from cdpyr.typing import Matrix, Num, Vector
+
+# methods to interpolate signals with
+METHODS = ('linear', 'zoh')
+
+
+def time_base(signals: Iterable[_tcsignal.Signal],
+              sample_time: Optional[Num] = None,
+              offsets: Optional[Dict[str, Num]] = None) -> Vector:
+    """
+    Common time base of signals over the interval all signals cover
+
+    Parameters
+    ----------
+    signals : Iterable[Signal]
+        Signals to find the common time base of.
+    sample_time : Num
+        Sample time of the time base in seconds. Defaults to the largest
+        sample time of all signals.
+    offsets : Dict[str, Num]
+        Optional clock offsets in seconds by signal name that are added to
+        the signals' times.
+
+    Returns
+    -------
+    time : Vector
+        `(T,)` array of times in seconds.
+    """
+    signals = list(signals)
+    if not signals:
+        raise ValueError('At least one signal is needed to find a time base.')
+
+    offsets = offsets or {}
+    sample_times = [_seconds(signal) for signal in signals]
+    start = max(signal.samples[0] * dt + offsets.get(signal.name, 0.0)
+                for signal, dt in zip(signals, sample_times))
+    stop = min(signal.samples[-1] * dt + offsets.get(signal.name, 0.0)
+               for signal, dt in zip(signals, sample_times))
+    if stop < start:
+        raise ValueError('Signals do not overlap in time.')
+
+    dt = max(sample_times) if sample_time is None else float(sample_time)
+    # allow for round-off of the last sample
+    num = int(_np.floor((stop - start) / dt + 1e-9)) + 1
+
+    time = start + _np.arange(num) * dt
+
+    # round-off may carry the last time past the end of the shortest signal
+    return _np.minimum(time, stop, out=time)
+
+
+def resample(signal: _tcsignal.Signal,
+             time: Vector,
+             method: str = 'linear',
+             offset: Num = 0.0,
+             out: Optional[Matrix] = None) -> Matrix:
+    """
+    Values of a signal at arbitrary times
+
+    Parameters
+    ----------
+    signal : Signal
+        Signal to resample.
+    time : Vector
+        `(T,)` array of sorted times in seconds to resample at.
+    method : str
+        `'linear'` to interpolate linearly between samples or `'zoh'` to hold
+        the value of the last sample (zero-order hold).
+    offset : Num
+        Clock offset in seconds that is added to the signal's time.
+    out : Matrix
+        Optional `(T, K)` array to write the values into.
+
+    Returns
+    -------
+    values : Matrix
+        `(T, K)` array of values at the given times, `NaN` at times outside
+        of the signal's time.
+    """
+    if method not in METHODS:
+        raise ValueError(f'method must be one of {METHODS}, got {method}.')
+
+    time = _np.asarray(time, dtype=float)
+    values = signal.values
+    samples = signal.samples * _seconds(signal) + offset
+    # duplicate samples span no time to interpolate over, so keep only the
+    # last value of each like the zero-order hold does
+    keep = _np.diff(samples) > 0
+    if not keep.all():
+        keep = _np.append(keep, True)
+        samples, values = samples[keep], values[keep]
+    num_samples = len(samples)
+    if out is None:
+        out = _np.empty((len(time), values.shape[1]))
+
+    # index of the last sample at or before each time
+    idx = _np.searchsorted(samples, time, 'right') - 1
+
+    if method == 'zoh' or num_samples < 2:
+        _np.take(values, _np.clip(idx, 0, num_samples - 1), axis=0, out=out)
+    else:
+        idx = _np.clip(idx, 0, num_samples - 2)
+        left = samples[idx]
+        weight = (time - left) / (samples[idx + 1] - left)
+        lower = values[idx]
+        _np.subtract(values[idx + 1], lower, out=out)
+        out *= weight[:, None]
+        out += lower
+
+    out[(time < samples[0]) | (time > samples[-1])] = _np.nan
+
+    return out
+
+
+def decimate(signal: _tcsignal.Signal, factor: int) -> _tcsignal.Signal:
+    """
+    Decimate a signal with a polyphase anti-aliasing filter
+
+    Parameters
+    ----------
+    signal : Signal
+        Signal to decimate.
+    factor : int
+        Number of samples per retained sample.
+
+    Returns
+    -------
+    signal : Signal
+        Signal of every `factor`-th sample with values low-pass filtered to
+        the new sample rate.
+    """
+    if factor < 1:
+        raise ValueError('factor must be a positive integer.')
+
+    values = _signal.resample_poly(signal.values, 1, factor, axis=0)
+
+    return _tcsignal.Signal(signal.samples[::factor], values, signal.meta)
+
+
+def align(signals: Iterable[_tcsignal.Signal],
+          sample_time: Optional[Num] = None,
+          method: str = 'linear',
+          offsets: Optional[Dict[str, Num]] = None) \
+        -> Tuple[Vector, Matrix, Dict[str, slice]]:
+    """
+    Resample signals of different sample times or clock offsets onto one
+    common time base
+
+    Parameters
+    ----------
+    signals : Iterable[Signal]
+        Signals to align e.g., a `SignalList`.
+    sample_time : Num
+        Sample time of the common time base in seconds. Defaults to the
+        largest sample time of all signals.
+    method : str
+        `'linear'` to interpolate linearly between samples or `'zoh'` to hold
+        the value of the last sample (zero-order hold).
+    offsets : Dict[str, Num]
+        Optional clock offsets in seconds by signal name that are added to
+        the signals' times.
+
+    Returns
+    -------
+    time : Vector
+        `(T,)` array of times in seconds over the interval all signals cover.
+    values : Matrix
+        `(T, C)` array of values of all signals, ready for batched analyses.
+    columns : Dict[str, slice]
+        Columns of every signal's values in `values` by signal name.
+    """
+    signals = list(signals)
+    offsets = offsets or {}
+    time = time_base(signals, sample_time, offsets)
+
+    widths = [signal.values.shape[1] for signal in signals]
+    bounds = _np.cumsum([0] + widths)
+    values = _np.empty((len(time), bounds[-1]))
+    columns = {}
+    for signal, start, stop in zip(signals, bounds[:-1], bounds[1:]):
+        resample(signal,
+                 time,
+                 method,
+                 offsets.get(signal.name, 0.0),
+                 out=values[:, start:stop])
+        columns.setdefault(signal.name, slice(start, stop))
+
+    return time, values, columns
+
+
+def _seconds(signal: _tcsignal.Signal):
+    return float(signal.sample_time.to('second').magnitude)
@@ -15,6 +15,7 @@ import numpy as _np
 from magic_repr import make_repr
 
 from cdpyr.stream.twincat import (
+    cache as _tccache,
     parser as _tcparser,
     signal as _tcsignal,
 )
@@ -39,8 +40,66 @@ class Scope(object):
             else ScopeMeta(**meta)
 
     @staticmethod
-    def from_file(f: Union[AnyStr, _pl.Path, IO], delimiter="\t"):
-        return Scope(**_tcparser.Parser(f, delimiter).parse())
+    def from_file(f: Union[AnyStr, _pl.Path, IO],
+                  delimiter="\t",
+                  cache: bool = False,
+                  **kwargs):
+        """
+        Read a scope from a TwinCAT 3 scope CSV file
+
+        Parameters
+        ----------
+        f : AnyStr | Path | IO
+            Path of the TwinCAT 3 scope CSV file.
+        delimiter : str
+            Delimiter of cells of the file.
+        cache : bool
+            Whether to load the scope from a binary cache next to the file if
+            it is valid, or to write the cache after parsing the file
+            otherwise. Signal values of scopes loaded from the cache are
+            read-only views of memory-mapped arrays. Defaults to `False`.
+
+        Returns
+        -------
+        scope : Scope
+            Scope of the file.
+        """
+        if cache:
+            scope = _tccache.load(f, delimiter)
+            if scope is not None:
+                return scope
+
+        scope = Scope(**_tcparser.Parser(f, delimiter, **kwargs).parse())
+
+        if cache:
+            _tccache.dump(f, scope, delimiter)
+
+        return scope
+
+    @staticmethod
+    def iter_file(f: Union[AnyStr, _pl.Path, IO],
+                  window: int,
+                  delimiter="\t",
+                  **kwargs):
+        """
+        Iterate over a scope file in windows of samples of all signals
+
+        Parameters
+        ----------
+        f : AnyStr | Path | IO
+            Path of the TwinCAT 3 scope CSV file.
+        window : int
+            Number of samples per window. The last window may be shorter.
+        delimiter : str
+            Delimiter of cells of the file.
+
+        Yields
+        ------
+        scope : Scope
+            Scope of the samples of the current window.
+        """
+        for data in _tcparser.Parser(f, delimiter, **kwargs).iterparse(window):
+            yield Scope(**data)
 
     @property
     def end(self):
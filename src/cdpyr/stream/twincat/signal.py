@@ -9,7 +9,7 @@ __all__ = [
 ]
 
 from collections import UserList
-from typing import Any, AnyStr, Dict, Iterable, List, Optional, Union
+from typing import Any, AnyStr, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as _np
 import pint as _pint
@@ -20,22 +20,39 @@ from cdpyr.typing import Matrix, Num, Vector
 
 
 class Signal(object):
-    _data: Matrix
+    _time: Vector
+    _values: Matrix
     _meta: SignalMeta
 
     def __init__(self,
                  time: Vector,
                  values: Vector,
                  meta: Union[SignalMeta, Dict[AnyStr, Any]]):
-        self._data = _np.hstack([_np.asarray(time)[:, None], values])
+        # samples and values are kept as given, so signals may be views into
+        # arrays shared with other signals
+        values = _np.asarray(values)
+        self._time = _np.asarray(time)
+        self._values = values[:, None] if values.ndim == 1 else values
         self._meta = meta \
             if isinstance(meta, SignalMeta) \
             else SignalMeta(**meta)
 
+    @staticmethod
+    def from_array(data: Matrix, meta: Union[SignalMeta, Dict[AnyStr, Any]]):
+        """
+        Create a signal from an `(N, 1 + K)` array of samples and values
+        without copying it e.g., from a memory-mapped array
+        """
+        return Signal(data[:, 0], data[:, 1:], meta)
+
     @property
     def bit_mask(self):
         return self._meta.bit_mask
 
+    @property
+    def data(self):
+        return _np.hstack((self._time[:, None], self._values))
+
     @property
     def data_type(self):
         return self._meta.data_type
@@ -69,11 +86,11 @@ class Signal(object):
         return self._meta.port
 
     def sampled(self):
-        return iter(self._data)
+        return iter(self.data)
 
     @property
     def samples(self):
-        return self._data[:, 0]
+        return self._time
 
     @property
     def sample_time(self):
@@ -97,21 +114,27 @@ class Signal(object):
 
     @property
     def time(self):
-        return self._data[:, 0] * self.sample_time
+        return self._time * self.sample_time
 
     def timed(self):
         return iter(_np.hstack((self.time.magnitude[:, None], self.values)))
 
     @property
     def values(self):
-        return self._data[:, 1:]
+        return self._values
 
     @property
     def variable_size(self):
         return self._meta.variable_size
 
+    def __getitem__(self, item):
+        """
+        Signal of a subset of samples as views of this signal's arrays
+        """
+        return Signal(self._time[item], self._values[item], self._meta)
+
     def __iter__(self):
-        return iter(self._data)
+        return iter(self.data)
 
     __repr__ = make_repr(
             'bit_mask',
@@ -134,27 +157,219 @@ class Signal(object):
 
 
 class SignalList(UserList):
+    """
+    List of signals backed by shared arrays if all signals share their
+    samples.
+
+    Signals sharing their samples are backed by one `(N,)` array of samples
+    and one `(N, K)` array of values, in which the values of every signal,
+    including vector signals, are a contiguous slice of columns. Signals
+    that already are adjacent views of one array, as read by the parser or
+    from the cache, are used without copying, otherwise their values are
+    copied once into a new array on first access. The signals in the list
+    are never modified, instead selecting signals of adjacent columns,
+    slicing by time, and decimating all return lists of views into the
+    shared arrays without copying.
+    """
     data: List[Signal]
+    _signals: Tuple[Signal, ...]
+    _views: Tuple[Signal, ...]
+    _names: Dict[str, List[int]]
+    _samples: Optional[Vector]
+    _values: Optional[Matrix]
+    _columns: Dict[str, slice]
 
     def __init__(self, initlist: Optional[Iterable[Any]] = None):
         super().__init__(initlist)
+        self._signals = ()
+        self._views = ()
+        self._names = {}
+        self._samples = None
+        self._values = None
+        self._columns = {}
 
-    def __getattr__(self, item, *args, **kwargs):
+    @property
+    def columns(self):
+        """
+        Columns of every signal's values in `values` by signal name
+        """
+        self._update()
+        return dict(self._columns)
 
-        try:
-            # filter signals by name
-            signals = [signal for signal in self.data if signal.name == item]
+    @property
+    def samples(self):
+        """
+        `(N,)` array of samples of all signals or `None` if the signals do not
+        share their samples
+        """
+        self._update()
+        return self._samples
+
+    @property
+    def values(self):
+        """
+        `(N, K)` array of values of all signals or `None` if the signals do
+        not share their samples
+        """
+        self._update()
+        return self._values
+
+    def select(self, *names: str) -> SignalList:
+        """
+        Signals of the given names in the given order
+
+        Parameters
+        ----------
+        names : str
+            Names of the signals to select.
+
+        Returns
+        -------
+        signals : SignalList
+            Selected signals.
+        """
+        self._update()
+        return SignalList(self._views[idx]
+                          for name in names
+                          for idx in self._names.get(name, ()))
+
+    def between(self, start: Num = None, stop: Num = None) -> SignalList:
+        """
+        Samples of all signals with time in the half-open interval
+        `[start, stop)`
+
+        Parameters
+        ----------
+        start : Num
+            Time in seconds of the first sample. Defaults to the first sample.
+        stop : Num
+            Time in seconds after the last sample. Defaults to after the last
+            sample.
+
+        Returns
+        -------
+        signals : SignalList
+            Signals of samples within the interval as views of these signals.
+        """
+        self._update()
+        signals = []
+        for signal in self._views:
+            # convert times into samples to not scale every sample
+            sample_time = signal.sample_time.to('second').magnitude
+            first = 0 \
+                if start is None \
+                else _np.searchsorted(signal.samples, start / sample_time,
+                                      'left')
+            last = len(signal.samples) \
+                if stop is None \
+                else _np.searchsorted(signal.samples, stop / sample_time,
+                                      'left')
+            signals.append(signal[first:last])
+
+        return SignalList(signals)
+
+    def decimate(self, factor: int) -> SignalList:
+        """
+        Every `factor`-th sample of all signals
+
+        Parameters
+        ----------
+        factor : int
+            Number of samples to advance per retained sample.
+
+        Returns
+        -------
+        signals : SignalList
+            Signals of every `factor`-th sample as views of these signals.
+        """
+        if factor < 1:
+            raise ValueError('factor must be a positive integer.')
+
+        self._update()
+        return SignalList(signal[::factor] for signal in self._views)
+
+    def _update(self):
+        # rebuild index and shared arrays only if signals were added, removed,
+        # or replaced since the last update
+        signals = tuple(self.data)
+        if len(signals) == len(self._signals) \
+                and all(a is b for a, b in zip(signals, self._signals)):
+            return
+
+        self._signals = signals
+        self._names = {}
+        for idx, signal in enumerate(signals):
+            self._names.setdefault(signal.name, []).append(idx)
+        self._samples, self._values, self._columns, self._views = \
+            _share(signals)
 
-            # if there are signals matching the name, we will return them as a
-            # new `SignalList`
+    def __getattr__(self, item, *args, **kwargs):
+        # private attributes are never signal names and may be looked up
+        # before `__init__` e.g., when unpickling
+        if not item.startswith('_') and item != 'data':
+            # if there are signals matching the name, we will return them as
+            # a new `SignalList`
+            signals = self.select(item)
             if signals:
-                return SignalList(signals)
-        except BaseException:
-            pass
+                return signals
 
         raise AttributeError(f"'SignalList' object has no attribute '{item}'")
 
 
+def _share(signals: Tuple[Signal, ...]):
+    # signals can only share their arrays if they share their samples
+    if not signals:
+        return None, None, {}, ()
+    samples = signals[0].samples
+    for signal in signals[1:]:
+        if signal.samples is not samples \
+                and not _np.array_equal(signal.samples, samples):
+            return None, None, {}, signals
+
+    values = _adjacent([signal.values for signal in signals])
+    if values is None:
+        values = _np.hstack([signal.values for signal in signals])
+
+    # views of the shared arrays leave the given signals untouched
+    columns = {}
+    views = []
+    start = 0
+    for signal in signals:
+        stop = start + signal.values.shape[1]
+        columns.setdefault(signal.name, slice(start, stop))
+        views.append(Signal(samples, values[:, start:stop], signal.meta))
+        start = stop
+
+    return samples, values, columns, tuple(views)
+
+
+def _adjacent(arrays: List[Matrix]) -> Optional[Matrix]:
+    # arrays are adjacent columns of one array if they share shape and
+    # strides of rows and each one starts where the previous one ends. then,
+    # each one starts within the previous one's memory, so all lie in the
+    # same memory
+    first = arrays[0]
+    if first.ndim != 2 or len(first) < 2 or first.strides[0] == 0:
+        return None
+
+    pointer = first.__array_interface__['data'][0]
+    width = 0
+    for array in arrays:
+        if array.dtype != first.dtype \
+                or array.ndim != 2 \
+                or array.shape[0] != first.shape[0] \
+                or array.strides != first.strides \
+                or array.__array_interface__['data'][0] \
+                != pointer + width * first.strides[1]:
+            return None
+        width += array.shape[1]
+
+    return _np.lib.stride_tricks.as_strided(first,
+                                            shape=(len(first), width),
+                                            strides=first.strides,
+                                            writeable=first.flags.writeable)
+
+
 class SignalMeta(object):
     bit_mask: Num
     data_type: str
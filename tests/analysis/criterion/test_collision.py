@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr import geometry
+from cdpyr.analysis.criterion import Collision
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.exceptions import InvalidPoseException
+from cdpyr.kinematics.transformation import Angular
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class CollisionTestSuite(object):
+
+    def test_obstacles(self,
+                       ik_standard: StandardKinematics,
+                       robot_3r3t: Robot):
+        robot = robot_3r3t
+        rng = np.random.RandomState(0)
+        obstacles = [geometry.Cuboid(0.1, 0.1, 0.1, center)
+                     for center in rng.uniform(-1, 1, (50, 3))] \
+                    + [geometry.Ellipsoid(0.05, center)
+                       for center in rng.uniform(-1, 1, (10, 3))]
+        criterion = Collision(ik_standard, obstacles)
+
+        positions = rng.uniform(-0.4, 0.4, (200, 3))
+        dcms = np.stack([Angular.random().dcm for _ in range(200)])
+        collisions = criterion.collisions(robot, positions, dcms,
+                                          chunk_size=64)
+
+        # same as checking every cable against every obstacle
+        anchors, leaves = ik_standard.segments_batch(robot, positions, dcms)
+        expected = np.zeros(collisions.shape, dtype=bool)
+        for obstacle in obstacles:
+            expected |= obstacle.intersects(anchors, leaves)
+
+        assert collisions.any()
+        assert not collisions.all()
+        assert np.array_equal(collisions, expected)
+        assert np.array_equal(
+                criterion.evaluate_batch(robot, positions, dcms),
+                ~expected.any(axis=1))
+
+        # batch agrees with single-pose evaluation
+        for position, dcm, collision in zip(positions[:20],
+                                            dcms[:20],
+                                            collisions[:20]):
+            pose = Pose(position, dcm)
+            if collision.any():
+                with pytest.raises(InvalidPoseException):
+                    criterion.evaluate(robot, pose)
+            else:
+                criterion.evaluate(robot, pose)
+
+    def test_platform(self,
+                      ik_standard: StandardKinematics,
+                      robot_3r3t: Robot,
+                      zero_pose: Pose):
+        robot = robot_3r3t
+        robot.platforms[0].geometry = geometry.Cuboid(0.2, 0.2, 0.2)
+        criterion = Collision(ik_standard)
+
+        # cables attached to the platform's surface do not collide
+        criterion.evaluate(robot, zero_pose)
+
+        # turning the platform half around pulls all cables through it
+        zero_pose.angular = Angular.rotation_z(180, True)
+        with pytest.raises(InvalidPoseException):
+            criterion.evaluate(robot, zero_pose)
+
+        # unless the platform's geometry is ignored
+        criterion.platform = False
+        criterion.evaluate(robot, zero_pose)
+
+    def test_no_obstacles(self,
+                          ik_standard: StandardKinematics,
+                          robot_3t: Robot):
+        criterion = Collision(ik_standard)
+
+        assert criterion.evaluate_batch(robot_3t, np.zeros((5, 3))).all()
+
+
+if __name__ == "__main__":
+    pytest.main()
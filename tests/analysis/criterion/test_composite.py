@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.criterion import (
+    CableLength,
+    Composite,
+    Context,
+    Interference,
+    Singularities,
+    WrenchFeasible,
+)
+from cdpyr.analysis.force_distribution import closed_form
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.exceptions import InvalidPoseException
+from cdpyr.kinematics.transformation import Angular
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class CountingKinematics(StandardKinematics):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = 0
+        self.batch_calls = 0
+
+    def backward(self, *args, **kwargs):
+        self.calls += 1
+        return super().backward(*args, **kwargs)
+
+    def backward_batch(self, *args, **kwargs):
+        self.batch_calls += 1
+        return super().backward_batch(*args, **kwargs)
+
+
+class CompositeTestSuite(object):
+
+    def test_shared_kinematics(self,
+                               robot_3r3t: Robot,
+                               zero_pose: Pose):
+        kinematics = CountingKinematics()
+        criterion = Composite([
+                CableLength(kinematics, [0.5, 2.5]),
+                Singularities(kinematics),
+                Interference(kinematics),
+                WrenchFeasible(closed_form.ClosedForm(kinematics, 1, 1000)),
+        ])
+
+        criterion.evaluate(robot_3r3t, zero_pose)
+
+        assert kinematics.calls == 1
+        assert len(criterion) == 4
+
+        # differently configured algorithms do not share results
+        other = CountingKinematics()
+        Composite([
+                CableLength(kinematics, [0.5, 2.5]),
+                CableLength(other, [0.5, 2.5]),
+        ]).evaluate(robot_3r3t, zero_pose)
+        assert (kinematics.calls, other.calls) == (2, 1)
+
+    def test_short_circuit(self,
+                           robot_3r3t: Robot,
+                           zero_pose: Pose):
+        kinematics = CountingKinematics()
+        criterion = Composite([
+                CableLength(kinematics, [0, 0.5]),
+                WrenchFeasible(closed_form.ClosedForm(kinematics, 1, 1000)),
+        ])
+
+        with pytest.raises(InvalidPoseException):
+            criterion.evaluate(robot_3r3t, zero_pose)
+
+        # the force distribution's structure matrix was never requested
+        context = Context(robot_3r3t, zero_pose)
+        with pytest.raises(InvalidPoseException):
+            criterion.evaluate(robot_3r3t, zero_pose, context=context)
+        assert not context._structure_matrices
+
+    def test_evaluate_batch(self,
+                            ik_standard: StandardKinematics,
+                            robot_3r3t: Robot):
+        criteria = [
+                CableLength(ik_standard, [0.5, 2.3]),
+                Singularities(ik_standard),
+                Interference(ik_standard, 1e-3),
+        ]
+        criterion = Composite(criteria)
+
+        rng = np.random.RandomState(0)
+        positions = rng.uniform(-0.8, 0.8, (50, 3))
+        dcms = np.stack([Angular.rotation_z(angle).dcm
+                         for angle in rng.uniform(-2, 2, 50)])
+        valid = criterion.evaluate_batch(robot_3r3t, positions, dcms)
+        assert valid.any()
+        assert not valid.all()
+
+        # same as checking every pose against every criterion
+        expected = np.ones_like(valid)
+        for index, (position, dcm) in enumerate(zip(positions, dcms)):
+            for each in criteria:
+                try:
+                    each.evaluate(robot_3r3t, Pose(position, dcm))
+                except InvalidPoseException:
+                    expected[index] = False
+
+        assert np.array_equal(valid, expected)
+
+    def test_evaluate_batch_shared_kinematics(self, robot_3r3t: Robot):
+        kinematics = CountingKinematics()
+        rng = np.random.RandomState(0)
+        positions = rng.uniform(-0.5, 0.5, (20, 3))
+
+        # batch criteria share one batch context
+        criterion = Composite([
+                Singularities(kinematics),
+                Interference(kinematics, 1e-3),
+        ])
+        valid = criterion.evaluate_batch(robot_3r3t, positions)
+        assert kinematics.batch_calls == 1
+
+        # and reuse the inverse kinematics of per-pose criteria
+        kinematics.batch_calls = 0
+        criterion = Composite([
+                CableLength(kinematics, [0, 10]),
+                WrenchFeasible(closed_form.ClosedForm(kinematics, 1, 1000)),
+                Singularities(kinematics),
+                Interference(kinematics, 1e-3),
+        ])
+        assert not (criterion.evaluate_batch(robot_3r3t, positions)
+                    & ~valid).any()
+        assert kinematics.calls == positions.shape[0]
+        assert kinematics.batch_calls == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
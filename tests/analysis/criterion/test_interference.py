@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from cdpyr.analysis.criterion import Interference
+from cdpyr.analysis.criterion.interference import _segment_distances
 from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.exceptions import InvalidPoseException
 from cdpyr.kinematics.transformation import Angular
 from cdpyr.motion.pose import Pose
 from cdpyr.robot import Robot
@@ -29,5 +32,79 @@ class ClosedFormForceDistributionTestSuite(object):
         criterion.evaluate(robot, pose)
 
 
+class InterferenceTestSuite(object):
+
+    def test_segment_distances(self):
+        points = np.random.normal(size=(200, 4, 3))
+        # touching, degenerate, and parallel segments
+        points[0:10, 2] = points[0:10, 0]
+        points[10:20, 1] = points[10:20, 0]
+        points[20:30] = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0],
+                         [0.5, 0.1, 0.0], [1.5, 0.1, 0.0]]
+
+        distances = _segment_distances(points[:, 0], points[:, 1],
+                                       points[:, 2], points[:, 3])
+
+        # brute force distance of finely sampled segments
+        samples = np.linspace(0, 1, 501)[:, None]
+        for point, distance in zip(points, distances):
+            first = point[0] + samples * (point[1] - point[0])
+            second = point[2] + samples * (point[3] - point[2])
+            brute = np.linalg.norm(first[:, None, :] - second[None, :, :],
+                                   axis=2).min()
+            assert distance <= brute + 1e-12
+            # sampling error is bounded by the sampling step
+            step = 1e-2 * max(np.linalg.norm(point[1] - point[0]),
+                              np.linalg.norm(point[3] - point[2]))
+            assert distance >= brute - step
+
+        assert np.allclose(distances[0:10], 0)
+        assert np.allclose(distances[20:30], 0.1)
+
+        # pruning only skips pairs that are further apart than the cutoff
+        pruned = _segment_distances(points[:, 0], points[:, 1],
+                                    points[:, 2], points[:, 3],
+                                    cutoff=0.5)
+        skipped = np.isinf(pruned)
+        assert np.allclose(pruned[~skipped], distances[~skipped])
+        assert (distances[skipped] > 0.5).all()
+
+    def test_evaluate_batch(self,
+                            ik_standard: StandardKinematics,
+                            robot_3r3t: Robot):
+        robot = robot_3r3t
+        criterion = Interference(ik_standard, clearance=0.01)
+
+        positions = np.random.uniform(-0.5, 0.5, (40, 3))
+        dcms = np.asarray([Angular.rotation_z(angle).dcm
+                           for angle in np.random.uniform(-np.pi, np.pi, 40)])
+        valid = criterion.evaluate_batch(robot, positions, dcms, chunk_size=7)
+        clearance = criterion.minimum_distance(robot, positions, dcms)
+
+        assert valid.shape == (40,)
+        assert np.all(valid == (clearance > 0.01))
+        assert np.all(valid == Interference(ik_standard,
+                                            clearance=0.01,
+                                            prune=False).evaluate_batch(
+                robot, positions, dcms))
+        for position, dcm, flag in zip(positions, dcms, valid):
+            try:
+                criterion.evaluate(robot, Pose(position, dcm))
+            except InvalidPoseException:
+                assert not flag
+            else:
+                assert flag
+
+    def test_shared_anchors(self,
+                            ik_standard: StandardKinematics,
+                            robot_3t: Robot):
+        # all cables of a point-mass platform meet in one point
+        criterion = Interference(ik_standard)
+
+        assert criterion.pairs(robot_3t)[0].size == 0
+        assert np.isinf(criterion.minimum_distance(robot_3t,
+                                                   np.zeros((1, 3)))).all()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.criterion import Singularities
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.exceptions import InvalidPoseException
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class SingularitiesTestSuite(object):
+
+    def test_evaluate_batch(self,
+                            ik_standard: StandardKinematics,
+                            robot_3r3t: Robot):
+        robot = robot_3r3t
+        criterion = Singularities(ik_standard)
+
+        positions = np.random.default_rng(0).uniform(-0.5, 0.5, (50, 3))
+        valid = criterion.evaluate_batch(robot, positions, chunk_size=16)
+
+        assert valid.shape == (50,)
+        for position, flag in zip(positions, valid):
+            try:
+                criterion.evaluate(robot, Pose(position))
+            except InvalidPoseException:
+                assert not flag
+            else:
+                assert flag
+
+    def test_singular_values(self,
+                             ik_standard: StandardKinematics,
+                             robot_3r3t: Robot):
+        robot = robot_3r3t
+        criterion = Singularities(ik_standard)
+        calculator = criterion._structure_matrix
+
+        positions = np.random.default_rng(1).uniform(-0.5, 0.5, (20, 3))
+        values = criterion.singular_values(robot, positions)
+        sigma = criterion.conditioning(robot, positions)
+
+        assert values.shape == (20, robot.num_dof)
+        assert np.allclose(sigma, values[:, -1])
+        for position, value in zip(positions, values):
+            matrix = calculator.evaluate(robot, Pose(position)).matrix
+            assert np.allclose(value,
+                               np.linalg.svd(matrix, compute_uv=False))
+
+    def test_singular_pose(self,
+                           ik_standard: StandardKinematics,
+                           robot_3t: Robot):
+        robot = robot_3t
+        criterion = Singularities(ik_standard, tolerance=1e-6)
+
+        # platform far outside the frame sees all cables (almost) parallel
+        positions = np.asarray([[0.0, 0.0, 0.0], [1e9, 0.0, 0.0]])
+
+        assert np.all(criterion.evaluate_batch(robot, positions)
+                      == [True, False])
+        assert criterion.conditioning(robot, positions)[1] < 1e-6
+        with pytest.raises(InvalidPoseException):
+            criterion.evaluate(robot, Pose(positions[1]))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from cdpyr.analysis.force_distribution import advanced_closed_form, \
+    quadratic_program
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class AdvancedClosedFormForceDistributionTestSuite(object):
+
+    def test_1r2t(self,
+                  robot_1r2t: Robot,
+                  zero_pose: Pose,
+                  ik_standard: StandardKinematics):
+        # force distribution solver
+        solver = advanced_closed_form.AdvancedClosedForm(
+                ik_standard,
+                force_minimum=1,
+                force_maximum=10
+        )
+
+        # create a gravitational wrench
+        wrench = np.zeros(robot_1r2t.platforms[0].dof)
+        # add gravity at last translational degree of freedom
+        wrench[1] = -9.81 * 1
+
+        # and calculate force distribution
+        distribution = solver.evaluate(
+                robot_1r2t,
+                zero_pose,
+                wrench,
+        )
+        structure_matrix = solver.calculator.evaluate(robot_1r2t, zero_pose)
+
+        # assertion
+        assert distribution.pose == zero_pose
+        assert distribution.forces.shape == (
+            robot_1r2t.num_kinematic_chains,)
+        assert (distribution.forces >= 1).all()
+        assert (distribution.forces <= 10).all()
+        assert structure_matrix.matrix.dot(distribution.forces) == \
+               pytest.approx(-wrench)
+
+    def test_2r3t(self,
+                  robot_2r3t: Robot,
+                  zero_pose: Pose,
+                  ik_standard: StandardKinematics):
+        # a redundancy of three is not supported
+        solver = advanced_closed_form.AdvancedClosedForm(
+                ik_standard,
+                force_minimum=1,
+                force_maximum=10
+        )
+
+        with pytest.raises(NotImplementedError):
+            solver.evaluate(robot_2r3t,
+                            zero_pose,
+                            np.zeros(robot_2r3t.platforms[0].dof))
+
+    @pytest.mark.parametrize(
+            ('robot', 'force_maximum', 'deviation'),
+            (
+                    ('robot_1r2t', 100, 10),
+                    ('ipanema_3', 3000, 50),
+            )
+    )
+    def test_evaluate_batch(self,
+                            robot: str,
+                            force_maximum: float,
+                            deviation: float,
+                            ik_standard: StandardKinematics,
+                            request):
+        robot = request.getfixturevalue(robot)
+        solver = advanced_closed_form.AdvancedClosedForm(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=force_maximum
+        )
+        # the same solution is optimal for the quadratic program
+        reference = quadratic_program.QuadraticProgram(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=force_maximum,
+                force_reference=0.5 * (10 + force_maximum),
+                warm_start=False
+        )
+
+        num_poses = 200
+        num_dof = robot.platforms[0].dof
+        positions = np.random.uniform(-0.3, 0.3, (num_poses, 3))
+        positions[:, robot.platforms[0].motion_pattern.dof_translation:] = 0
+        wrenches = np.random.normal(0, deviation, (num_poses, num_dof))
+        matrices = solver.calculator.evaluate_batch(robot, positions)
+
+        forces, feasible = solver.evaluate_batch(robot,
+                                                 positions,
+                                                 None,
+                                                 wrenches,
+                                                 structure_matrices=matrices)
+        expected, expected_feasible = reference.evaluate_batch(
+                robot,
+                positions,
+                None,
+                wrenches,
+                structure_matrices=matrices)
+
+        # assertion
+        assert feasible.any()
+        assert (feasible == expected_feasible).all()
+        assert np.isnan(forces[~feasible]).all()
+        assert forces[feasible] == pytest.approx(expected[feasible],
+                                                 rel=1e-6,
+                                                 abs=1e-6)
+        # same as evaluating every pose on its own
+        for position, wrench, force, valid in zip(positions,
+                                                  wrenches,
+                                                  forces,
+                                                  feasible):
+            if valid:
+                assert solver.evaluate(robot,
+                                       Pose(position),
+                                       wrench).forces == pytest.approx(force)
+            else:
+                with pytest.raises(ArithmeticError):
+                    solver.evaluate(robot, Pose(position), wrench)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from cdpyr.analysis.force_distribution import barycentric, \
+    closed_form_improved
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.analysis.structure_matrix import structure_matrix
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class BarycentricForceDistributionTestSuite(object):
+
+    def test_1r2t(self,
+                  robot_1r2t: Robot,
+                  zero_pose: Pose,
+                  ik_standard: StandardKinematics):
+        # force distribution solver
+        solver = barycentric.Barycentric(
+                ik_standard,
+                force_minimum=1,
+                force_maximum=10
+        )
+
+        # create a gravitational wrench
+        wrench = np.zeros(robot_1r2t.platforms[0].dof)
+        # add gravity at last translational degree of freedom
+        wrench[1] = -9.81 * 1
+
+        # and calculate force distribution
+        distribution = solver.evaluate(
+                robot_1r2t,
+                zero_pose,
+                wrench,
+        )
+        structure_matrix = solver.calculator.evaluate(robot_1r2t, zero_pose)
+
+        # assertion
+        assert distribution.pose == zero_pose
+        assert distribution.forces.shape == (
+            robot_1r2t.num_kinematic_chains,)
+        assert structure_matrix.matrix.dot(distribution.forces) == \
+               pytest.approx(-wrench)
+        # moving along the kernel, the distribution is as far from the
+        # lower end of the interval of valid distributions as from its upper
+        # end
+        kernel = structure_matrix.kernel[:, 0]
+        bounds = np.stack(((1 - distribution.forces) / kernel,
+                           (10 - distribution.forces) / kernel))
+        assert bounds.min(axis=0).max() == \
+               pytest.approx(-bounds.max(axis=0).min())
+
+    def test_ipanema_3(self,
+                       ipanema_3: Robot,
+                       ik_standard: StandardKinematics):
+        solver = barycentric.Barycentric(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000
+        )
+        reference = closed_form_improved.ClosedFormImproved(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000
+        )
+
+        num_poses = 200
+        positions = np.random.uniform(-0.3, 0.3, (num_poses, 3))
+        wrenches = ipanema_3.gravitational_wrench(Pose()) \
+                   + np.random.normal(0, 50, (num_poses, 6))
+        matrices = solver.calculator.evaluate_batch(ipanema_3, positions)
+
+        forces, feasible = solver.evaluate_batch(ipanema_3,
+                                                 positions,
+                                                 None,
+                                                 wrenches,
+                                                 structure_matrices=matrices)
+        _, feasible_cfi = reference.evaluate_batch(ipanema_3,
+                                                   positions,
+                                                   None,
+                                                   wrenches,
+                                                   structure_matrices=matrices)
+
+        # assertion
+        assert feasible[feasible_cfi].all()
+        assert np.einsum('kij,kj->ki',
+                         matrices[feasible],
+                         forces[feasible]) == pytest.approx(-wrenches[feasible])
+        assert (forces[feasible] >= 10).all()
+        assert (forces[feasible] <= 3000).all()
+        # same as evaluating every pose on its own
+        for position, wrench, force, valid in zip(positions,
+                                                  wrenches,
+                                                  forces,
+                                                  feasible):
+            if valid:
+                assert solver.evaluate(ipanema_3,
+                                       Pose(position),
+                                       wrench).forces == pytest.approx(force)
+            else:
+                with pytest.raises(ArithmeticError):
+                    solver.evaluate(ipanema_3, Pose(position), wrench)
+
+    def test_singular(self,
+                      ipanema_3: Robot,
+                      ik_standard: StandardKinematics):
+        solver = barycentric.Barycentric(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000
+        )
+        positions = np.zeros((2, 3))
+        wrench = ipanema_3.gravitational_wrench(Pose())
+        matrices = solver.calculator.evaluate_batch(ipanema_3,
+                                                    positions).copy()
+        # a structure matrix losing rank by round-off only
+        matrices[1, 5, :] = matrices[1, 4, :] * (1 + 1e-17)
+
+        _, feasible = solver.evaluate_batch(ipanema_3,
+                                            positions,
+                                            None,
+                                            wrench,
+                                            structure_matrices=matrices)
+
+        # batches agree with the structure matrix's result on the rank
+        assert feasible[0]
+        assert not feasible[1]
+        assert structure_matrix.Result(Pose(), matrices[1]).is_singular
+
+
+if __name__ == "__main__":
+    pytest.main()
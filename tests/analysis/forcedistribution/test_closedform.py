@@ -187,6 +187,35 @@ class ClosedFormForceDistributionTestSuite(object):
         assert distribution.forces.shape == (robot_3r3t.num_kinematic_chains,)
         assert (distribution.forces > 0).all()
 
+    def test_evaluate_batch(self,
+                            robot_3r3t: Robot,
+                            ik_standard: StandardKinematics):
+        # force distribution solver
+        solver = closed_form.ClosedForm(
+                ik_standard,
+                force_minimum=1,
+                force_maximum=10
+        )
+
+        num_poses = 20
+        positions = np.random.uniform(-0.4, 0.4, (num_poses, 3))
+        wrenches = np.random.normal(0, 10, (num_poses, 6))
+
+        # and calculate force distributions
+        forces, feasible = solver.evaluate_batch(robot_3r3t,
+                                                 positions,
+                                                 None,
+                                                 wrenches)
+
+        # assertion
+        assert forces.shape == (num_poses, robot_3r3t.num_kinematic_chains)
+        assert feasible.all()
+        # same as evaluating every pose on its own
+        for position, wrench, force in zip(positions, wrenches, forces):
+            assert solver.evaluate(robot_3r3t,
+                                   Pose(position),
+                                   wrench).forces == pytest.approx(force)
+
 
 if __name__ == "__main__":
     pytest.main()
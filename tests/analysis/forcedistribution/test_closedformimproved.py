@@ -3,6 +3,7 @@ import pytest
 
 from cdpyr.analysis.force_distribution import closed_form_improved
 from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.kinematics.transformation import Angular
 from cdpyr.motion.pose import Pose
 from cdpyr.robot import Robot
 
@@ -197,5 +198,55 @@ class ClosedFormImprovedorceDistributionTestSuite(object):
         assert (distribution.forces > 0).all()
 
 
+    def test_evaluate_batch(self,
+                            robot_3r3t: Robot,
+                            ik_standard: StandardKinematics):
+        # force distribution solver with distinct limits per cable
+        solver = \
+            closed_form_improved.ClosedFormImproved(
+                    ik_standard,
+                    force_minimum=[1, 2, 1, 2, 1, 2, 1, 2],
+                    force_maximum=[50, 60, 50, 60, 50, 60, 50, 60]
+            )
+
+        num_poses = 200
+        positions = np.random.uniform(-0.4, 0.4, (num_poses, 3))
+        dcms = np.stack([Angular.rotation_z(angle).dcm for angle in
+                         np.random.uniform(-0.3, 0.3, num_poses)])
+        wrenches = np.random.normal(0, 10, (num_poses, 6))
+
+        # and calculate force distributions
+        forces, feasible = solver.evaluate_batch(robot_3r3t,
+                                                 positions,
+                                                 dcms,
+                                                 wrenches)
+
+        # assertion
+        assert forces.shape == (num_poses, robot_3r3t.num_kinematic_chains)
+        assert feasible.any()
+        assert np.isnan(forces[~feasible]).all()
+        assert (forces[feasible] >= solver.force_minimum - 1e-10).all()
+        assert (forces[feasible] <= solver.force_maximum + 1e-10).all()
+
+        # same as evaluating every pose on its own
+        matrices = solver.calculator.evaluate_batch(robot_3r3t,
+                                                    positions,
+                                                    dcms)
+        for position, dcm, wrench, force, valid, matrix in zip(positions,
+                                                               dcms,
+                                                               wrenches,
+                                                               forces,
+                                                               feasible,
+                                                               matrices):
+            pose = Pose(position, dcm)
+            if valid:
+                assert matrix.dot(force) == pytest.approx(-wrench)
+                assert solver.evaluate(robot_3r3t, pose, wrench).forces == \
+                       pytest.approx(force)
+            else:
+                with pytest.raises(ArithmeticError):
+                    solver.evaluate(robot_3r3t, pose, wrench)
+
+
 if __name__ == "__main__":
     pytest.main()
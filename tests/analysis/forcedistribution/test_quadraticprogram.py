@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from cdpyr.analysis.force_distribution import closed_form_improved, \
+    quadratic_program
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class QuadraticProgramForceDistributionTestSuite(object):
+
+    def test_2r3t(self,
+                  robot_2r3t: Robot,
+                  zero_pose: Pose,
+                  ik_standard: StandardKinematics):
+        # force distribution solver
+        solver = quadratic_program.QuadraticProgram(
+                ik_standard,
+                force_minimum=1,
+                force_maximum=10
+        )
+
+        # create a gravitational wrench
+        wrench = np.zeros(robot_2r3t.platforms[0].dof)
+        # add gravity at last translational degree of freedom
+        wrench[2] = -9.81 * 1
+
+        # and calculate force distribution
+        distribution = solver.evaluate(
+                robot_2r3t,
+                zero_pose,
+                wrench,
+        )
+        structure_matrix = solver.calculator.evaluate(robot_2r3t, zero_pose)
+
+        # assertion
+        assert distribution.pose == zero_pose
+        assert distribution.forces.shape == (
+            robot_2r3t.num_kinematic_chains,)
+        assert (distribution.forces >= 1 - 1e-10).all()
+        assert (distribution.forces <= 10 + 1e-10).all()
+        assert structure_matrix.matrix.dot(distribution.forces) == \
+               pytest.approx(-wrench)
+
+    def test_infeasible(self,
+                        robot_3r3t: Robot,
+                        zero_pose: Pose,
+                        ik_standard: StandardKinematics):
+        # the sample robot is not force closed, so no distribution exists
+        solver = quadratic_program.QuadraticProgram(
+                ik_standard,
+                force_minimum=1,
+                force_maximum=10
+        )
+
+        wrench = np.zeros(robot_3r3t.platforms[0].dof)
+        wrench[2] = -9.81 * 1
+
+        with pytest.raises(ArithmeticError):
+            solver.evaluate(robot_3r3t, zero_pose, wrench)
+
+    def test_evaluate_batch(self,
+                            ipanema_3: Robot,
+                            ik_standard: StandardKinematics):
+        solver = quadratic_program.QuadraticProgram(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000,
+                force_reference=100,
+                warm_start=False
+        )
+        reference = closed_form_improved.ClosedFormImproved(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000
+        )
+
+        num_poses = 200
+        positions = np.random.uniform(-0.3, 0.3, (num_poses, 3))
+        wrenches = ipanema_3.gravitational_wrench(Pose()) \
+                   + np.random.normal(0, 50, (num_poses, 6))
+        matrices = solver.calculator.evaluate_batch(ipanema_3, positions)
+
+        forces, feasible = solver.evaluate_batch(ipanema_3,
+                                                 positions,
+                                                 None,
+                                                 wrenches,
+                                                 structure_matrices=matrices)
+        forces_cfi, feasible_cfi = reference.evaluate_batch(
+                ipanema_3,
+                positions,
+                None,
+                wrenches,
+                structure_matrices=matrices)
+
+        # assertion
+        assert feasible.any()
+        assert np.isnan(forces[~feasible]).all()
+        # every pose with some valid distribution has an optimal one
+        assert feasible[feasible_cfi].all()
+        assert np.einsum('kij,kj->ki',
+                         matrices[feasible],
+                         forces[feasible]) == pytest.approx(-wrenches[feasible])
+        assert (forces[feasible] >= 10 - 1e-10).all()
+        assert (forces[feasible] <= 3000 + 1e-10).all()
+        # and it is closer to the reference force than any other one
+        assert (np.linalg.norm(forces[feasible_cfi] - 100, axis=1)
+                <= np.linalg.norm(forces_cfi[feasible_cfi] - 100, axis=1)
+                + 1e-8).all()
+
+    def test_warm_start(self,
+                        ipanema_3: Robot,
+                        ik_standard: StandardKinematics):
+        cold = quadratic_program.QuadraticProgram(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000,
+                warm_start=False
+        )
+        warm = quadratic_program.QuadraticProgram(
+                ik_standard,
+                force_minimum=10,
+                force_maximum=3000,
+                warm_start=True
+        )
+
+        # consecutive samples of a trajectory
+        wrench = ipanema_3.gravitational_wrench(Pose())
+        for position in np.linspace([-0.2, -0.1, 0.0], [0.2, 0.1, 0.1], 20):
+            pose = Pose(position)
+            assert warm.evaluate(ipanema_3, pose, wrench).forces == \
+                   pytest.approx(cold.evaluate(ipanema_3, pose, wrench).forces)
+
+        # forgetting the previous solution
+        warm.reset()
+        assert warm.evaluate(ipanema_3, Pose(), wrench).forces == \
+               pytest.approx(cold.evaluate(ipanema_3, Pose(), wrench).forces)
+
+
+if __name__ == "__main__":
+    pytest.main()
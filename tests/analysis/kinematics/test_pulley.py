@@ -56,6 +56,24 @@ class PulleyKinematicsBackwardTestSuite(object):
         assert (0 <= res_backward.lengths).all()
         assert res_backward.directions.shape == (robot.num_kinematic_chains, nl)
 
+    def test_backward_batch(self, robot_3r3t: Robot):
+        ik = Kinematics()
+        poses = [_pose.PoseGenerator.random_3r3t() for _ in range(10)]
+        positions = np.asarray([pose.linear.position for pose in poses])
+        dcms = np.asarray([pose.angular.dcm for pose in poses])
+        joints = np.empty((10, robot_3r3t.num_kinematic_chains))
+
+        lengths, directions = ik.backward_batch(robot_3r3t,
+                                                positions,
+                                                dcms,
+                                                joints=joints)
+
+        for index, pose in enumerate(poses):
+            expected = ik.backward(robot_3r3t, pose)
+            assert lengths[index] == pytest.approx(expected.workspace_length)
+            assert directions[index] == pytest.approx(expected.directions)
+            assert joints[index] == pytest.approx(expected.joints)
+
     @pytest.mark.parametrize(
             ('robot', 'pose'),
             (
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from cdpyr.analysis.kinematics.standard import Standard as Kinematics
+from cdpyr.kinematics.transformation import Angular
 from cdpyr.motion import pose as _pose
 from cdpyr.robot import kinematicchain, Robot, sample
 
@@ -130,6 +131,30 @@ class StandardKinematicsBackwardTestSuite(object):
             assert np.linalg.norm(res_backward.directions[idxkc, 0:nl]) \
                    == pytest.approx(1)
 
+    def test_forward_batch(self, ipanema_3: Robot):
+        ik = Kinematics()
+        # a continuous trajectory
+        poses = [_pose.Pose([0.2 * np.sin(t), 0.1 * np.cos(t), 0.05 * t],
+                            angular=Angular(sequence='xyz',
+                                            euler=[0.02 * t, -0.01 * t, 0.0]))
+                 for t in np.linspace(0, 2, 10)]
+        joints = np.asarray([ik.backward(ipanema_3, pose).joints
+                             for pose in poses])
+        # a sample without measurement
+        joints[4] = np.nan
+
+        positions, dcms, residuals = ik.forward_batch(ipanema_3, joints)
+
+        assert np.isnan(residuals[4])
+        assert np.isnan(positions[4]).all()
+        for index, pose in enumerate(poses):
+            if index == 4:
+                continue
+            assert positions[index] == pytest.approx(pose.linear.position,
+                                                     abs=1e-6)
+            assert dcms[index] == pytest.approx(pose.angular.dcm, abs=1e-6)
+            assert residuals[index] < 1e-8
+
 
 if __name__ == "__main__":
     pytest.main()
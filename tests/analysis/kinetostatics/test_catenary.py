@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.kinematics.standard import Standard as Kinematics
+from cdpyr.analysis.kinetostatics.catenary import Catenary as Kinetostatics
+from cdpyr.analysis.kinetostatics.elastic import Elastic
+from cdpyr.kinematics.transformation import Angular
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import Robot, sample
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class CatenaryKinetostaticsTestSuite(object):
+
+    @pytest.mark.parametrize(
+            ('robot', 'pose'),
+            (
+                    (sample.robot_3t(),
+                     _pose.Pose([0.05, 0.02, 0.01])),
+                    (sample.robot_3r3t(),
+                     _pose.Pose([0.05, 0.02, 0.01],
+                                Angular(sequence='xyz',
+                                        euler=[0.02, 0.01, 0.03]).dcm)),
+                    (sample.cogiro(),
+                     _pose.Pose([0.50, -0.20, 1.00])),
+            ),
+            ids=['3T', '3R3T', 'cogiro'],
+    )
+    def test_evaluate(self, robot: Robot, pose: _pose.Pose):
+        lengths = Kinematics().backward(robot, pose).lengths * (1 - 1e-4)
+
+        kinetostatics = Kinetostatics(axial_stiffness=1e5,
+                                      linear_density=0.05)
+        result = kinetostatics.evaluate(robot, lengths)
+
+        assert result.forces.shape == (robot.num_kinematic_chains,)
+        assert (result.forces > 0).all()
+        assert result.residual < 1e-6
+        assert np.allclose(result.pose.linear.position,
+                           pose.linear.position,
+                           atol=2e-1)
+
+    def test_massless_matches_elastic(self):
+        robot = sample.robot_3r3t()
+        pose = _pose.Pose([0.05, 0.02, 0.01],
+                          Angular(sequence='xyz',
+                                  euler=[0.02, 0.01, 0.03]).dcm)
+        lengths = Kinematics().backward(robot, pose).lengths * (1 - 1e-4)
+
+        elastic = Elastic(axial_stiffness=1e5).evaluate(robot, lengths)
+        catenary = Kinetostatics(axial_stiffness=1e5,
+                                 linear_density=0.0).evaluate(
+                robot, lengths, x0=elastic.pose)
+
+        assert np.allclose(catenary.pose.linear.position,
+                           elastic.pose.linear.position,
+                           atol=1e-6)
+        assert np.allclose(catenary.forces, elastic.forces, rtol=1e-4)
+
+    def test_evaluate_path(self):
+        robot = sample.cogiro()
+        ik = Kinematics()
+        poses = [_pose.Pose([0.5 * np.sin(t), 0.5 * np.cos(t), 1.0])
+                 for t in np.linspace(0, np.pi, 21)]
+        lengths = np.asarray([ik.backward(robot, pose).lengths
+                              for pose in poses])
+
+        kinetostatics = Kinetostatics(axial_stiffness=1e6,
+                                      linear_density=0.1)
+        path = kinetostatics.evaluate_path(robot, lengths)
+
+        assert path.success.all()
+        assert path.positions.shape == (len(poses), 3)
+        assert path.unknowns.shape == (len(poses),
+                                       2 * robot.num_kinematic_chains)
+        # sagging cables let the platform sink below the geometric pose
+        assert (path.positions[:, 2]
+                < np.asarray([p.linear.position[2] for p in poses])).all()
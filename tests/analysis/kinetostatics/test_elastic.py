@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.kinematics.standard import Standard as Kinematics
+from cdpyr.analysis.kinetostatics.elastic import Elastic as Kinetostatics
+from cdpyr.kinematics.transformation import Angular
+from cdpyr.motion import pose as _pose
+from cdpyr.robot import Robot, sample
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class ElasticKinetostaticsTestSuite(object):
+
+    @pytest.mark.parametrize(
+            ('robot', 'pose'),
+            (
+                    (sample.robot_1t(),
+                     _pose.Pose([0.05, 0.0, 0.0])),
+                    (sample.robot_2t(),
+                     _pose.Pose([0.05, 0.02, 0.0])),
+                    (sample.robot_3t(),
+                     _pose.Pose([0.05, 0.02, 0.01])),
+                    (sample.robot_3r3t(),
+                     _pose.Pose([0.05, 0.02, 0.01],
+                                Angular(sequence='xyz',
+                                        euler=[0.02, 0.01, 0.03]).dcm)),
+                    (sample.cogiro(),
+                     _pose.Pose([0.50, -0.20, 1.00])),
+            ),
+            ids=['1T', '2T', '3T', '3R3T', 'cogiro'],
+    )
+    def test_evaluate(self, robot: Robot, pose: _pose.Pose):
+        # unstrained cable lengths slightly shorter than the geometric ones
+        lengths = Kinematics().backward(robot, pose).lengths * (1 - 1e-4)
+
+        kinetostatics = Kinetostatics(axial_stiffness=1e5)
+        result = kinetostatics.evaluate(robot, lengths)
+
+        assert result.pose.linear.position.shape == (3,)
+        assert result.forces.shape == (robot.num_kinematic_chains,)
+        assert (result.forces >= 0).all()
+        assert result.residual < 1e-6
+        # strained cables are longer than unstrained ones
+        strained = Kinematics().backward(robot, result.pose).lengths
+        assert (strained >= lengths - 1e-9).all()
+        # the platform remains close to the geometric pose
+        assert np.allclose(result.pose.linear.position,
+                           pose.linear.position,
+                           atol=1e-1)
+
+    def test_missing_stiffness_raises(self):
+        robot = sample.robot_3r3t()
+        lengths = Kinematics().backward(robot, _pose.ZeroPose).lengths
+
+        with pytest.raises(ValueError):
+            Kinetostatics().evaluate(robot, lengths)
+
+    def test_evaluate_batch_and_path(self):
+        robot = sample.robot_3t()
+        ik = Kinematics()
+        poses = [_pose.Pose([0.1 * np.sin(t), 0.1 * np.cos(t), 0.0])
+                 for t in np.linspace(0, np.pi, 11)]
+        lengths = np.asarray([ik.backward(robot, pose).lengths
+                              for pose in poses]) * (1 - 1e-4)
+
+        kinetostatics = Kinetostatics(axial_stiffness=1e5)
+        batch = kinetostatics.evaluate_batch(robot, lengths)
+        path = kinetostatics.evaluate_path(robot, lengths, chunk_size=3)
+
+        assert len(batch) == len(poses)
+        assert len(path) == len(poses)
+        assert batch.success.all()
+        assert path.success.all()
+        assert np.allclose(batch.positions, path.positions, atol=1e-8)
+        assert np.allclose(batch.forces, path.forces, atol=1e-4)
+        # warm-starting along the path needs fewer iterations
+        assert path.iterations[1:].mean() <= batch.iterations[1:].mean()
+        # single results and slices
+        assert np.allclose(path[3].pose.linear.position, path.positions[3])
+        assert len(path[2:5]) == 3
+        assert len(path.to_poselist()) == len(poses)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.buffer import Buffer
+from cdpyr.analysis.cache import Cache
+from cdpyr.analysis.force_distribution import closed_form_improved, dykstra
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.analysis.structure_matrix import Calculator
+from cdpyr.motion.pose import Pose, PoseGenerator
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class BufferTestSuite(object):
+
+    def test_array(self):
+        buffer = Buffer()
+
+        first = buffer.array('a', (4, 3))
+        assert first.shape == (4, 3)
+        assert buffer.array('a', (4, 3)) is first
+        # shorter arrays are leading slices of longer ones
+        assert np.shares_memory(buffer.array('a', (2, 3)), first)
+        assert buffer.array('a', (2, 3)).flags.c_contiguous
+        assert buffer.allocations == 1
+
+        # other trailing shapes, types, or longer arrays reallocate
+        assert buffer.array('a', (4, 2)).shape == (4, 2)
+        assert buffer.array('a', (4, 2), dtype=bool).dtype == bool
+        assert buffer.array('a', (8, 2), dtype=bool).shape == (8, 2)
+        assert buffer.allocations == 4
+        assert len(buffer) == 1
+
+        buffer.clear()
+        assert 'a' not in buffer
+        assert buffer.allocations == 0
+
+    def test_kinematics(self, robot_3r3t: Robot, rand_pose_3r3t: Pose):
+        buffer = Buffer()
+        buffered = StandardKinematics(buffer=buffer)
+        unbuffered = StandardKinematics()
+
+        result = buffered.backward(robot_3r3t, rand_pose_3r3t)
+        expected = unbuffered.backward(robot_3r3t, rand_pose_3r3t)
+        assert result.lengths == pytest.approx(expected.lengths)
+        assert result.directions == pytest.approx(expected.directions)
+        assert result.swivel_angles == pytest.approx(expected.swivel_angles)
+        assert result.leave_points == pytest.approx(expected.leave_points)
+
+        # steady state allocates nothing
+        allocations = buffer.allocations
+        for _ in range(5):
+            buffered.backward(robot_3r3t, PoseGenerator.random_3r3t())
+        assert buffer.allocations == allocations
+
+        # but results share the buffer's arrays
+        assert result.lengths != pytest.approx(expected.lengths)
+
+    def test_kinematics_cache(self, robot_3r3t: Robot, rand_pose_3r3t: Pose):
+        buffer = Buffer()
+        ik = StandardKinematics(cache=Cache(), buffer=buffer)
+
+        # cached results must not share the buffer's arrays
+        result = ik.backward(robot_3r3t, rand_pose_3r3t)
+        lengths = result.lengths.copy()
+        ik.backward(robot_3r3t, PoseGenerator.random_3r3t())
+        assert result.lengths == pytest.approx(lengths)
+        assert buffer.allocations == 0
+
+    def test_backward_batch(self, robot_3r3t: Robot):
+        buffer = Buffer()
+        ik = StandardKinematics(buffer=buffer)
+        positions = np.random.uniform(-0.4, 0.4, (20, 3))
+        dcms = np.asarray([PoseGenerator.random_3r3t().angular.dcm
+                           for _ in range(20)])
+
+        lengths, directions = StandardKinematics().backward_batch(robot_3r3t,
+                                                                  positions,
+                                                                  dcms)
+        out = (np.empty((20, 8)), np.empty((20, 8, 3)))
+        assert ik.backward_batch(robot_3r3t,
+                                 positions,
+                                 dcms,
+                                 out=out)[0] is out[0]
+        assert np.allclose(out[0], lengths)
+        assert np.allclose(out[1], directions)
+
+        buffered = ik.backward_batch(robot_3r3t, positions, dcms)
+        allocations = buffer.allocations
+        buffered = ik.backward_batch(robot_3r3t, positions, dcms)
+        assert buffer.allocations == allocations
+        assert np.allclose(buffered[0], lengths)
+        assert np.allclose(buffered[1], directions)
+
+    def test_structure_matrix(self, robot_3r3t: Robot, rand_pose_3r3t: Pose):
+        buffer = Buffer()
+        sms = Calculator(StandardKinematics(buffer=buffer))
+        assert sms.buffer is buffer
+
+        expected = Calculator(StandardKinematics()).evaluate(robot_3r3t,
+                                                             rand_pose_3r3t)
+        assert np.allclose(sms.evaluate(robot_3r3t, rand_pose_3r3t).matrix,
+                           expected.matrix)
+
+        positions = np.random.uniform(-0.4, 0.4, (10, 3))
+        matrices = sms.evaluate_batch(robot_3r3t, positions)
+        assert np.allclose(
+                matrices,
+                Calculator(StandardKinematics()).evaluate_batch(robot_3r3t,
+                                                                positions))
+
+        # steady state of single poses and batches up to the largest one
+        # allocates nothing
+        allocations = buffer.allocations
+        sms.evaluate(robot_3r3t, PoseGenerator.random_3r3t())
+        sms.evaluate_batch(robot_3r3t, positions)
+        sms.evaluate_batch(robot_3r3t, positions[0:5])
+        assert buffer.allocations == allocations
+
+    def test_dykstra(self, ipanema_3: Robot):
+        buffer = Buffer()
+        buffered = dykstra.Dykstra(StandardKinematics(),
+                                   force_minimum=10,
+                                   force_maximum=3000,
+                                   buffer=buffer)
+        unbuffered = dykstra.Dykstra(StandardKinematics(),
+                                     force_minimum=10,
+                                     force_maximum=3000)
+
+        wrench = ipanema_3.gravitational_wrench(Pose())
+        buffered.evaluate(ipanema_3, Pose(), wrench)
+        allocations = buffer.allocations
+
+        for position in np.linspace([-0.2, -0.1, 0.0], [0.2, 0.1, 0.1], 5):
+            pose = Pose(position)
+            assert buffered.evaluate(ipanema_3, pose, wrench).forces == \
+                   pytest.approx(unbuffered.evaluate(ipanema_3,
+                                                     pose,
+                                                     wrench).forces)
+
+        # steady state allocates nothing
+        assert buffer.allocations == allocations
+
+    def test_evaluate_batch(self, ipanema_3: Robot):
+        buffer = Buffer()
+        solver = closed_form_improved.ClosedFormImproved(StandardKinematics(),
+                                                         force_minimum=10,
+                                                         force_maximum=3000,
+                                                         buffer=buffer)
+        positions = np.random.uniform(-0.3, 0.3, (50, 3))
+        wrench = ipanema_3.gravitational_wrench(Pose())
+
+        forces, feasible = solver.evaluate_batch(ipanema_3,
+                                                 positions,
+                                                 None,
+                                                 wrench,
+                                                 chunk_size=20)
+        expected = forces.copy(), feasible.copy()
+        allocations = buffer.allocations
+
+        forces, feasible = solver.evaluate_batch(ipanema_3,
+                                                 positions,
+                                                 None,
+                                                 wrench,
+                                                 chunk_size=20)
+        assert buffer.allocations == allocations
+        assert np.array_equal(feasible, expected[1])
+        assert np.allclose(forces[feasible], expected[0][feasible])
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.cache import Cache, fingerprint
+from cdpyr.analysis.kinematics.pulley import Pulley as PulleyKinematics
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.analysis.structure_matrix import Calculator
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot, sample
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class CacheTestSuite(object):
+
+    def test_fingerprint(self, robot_3r3t: Robot):
+        other = sample.robot_3r3t()
+
+        assert fingerprint(robot_3r3t) == fingerprint(other)
+
+        other.platforms[0].anchors[0].position = [0.0, 0.0, 0.0]
+        assert fingerprint(robot_3r3t) != fingerprint(other)
+
+    def test_key(self, robot_3r3t: Robot, rand_pose_3r3t: Pose):
+        cache = Cache(resolution=1e-6)
+        position, dcm = rand_pose_3r3t.position
+
+        # equal poses of distinct objects share a key
+        assert cache.key(robot_3r3t, rand_pose_3r3t) == \
+               cache.key(sample.robot_3r3t(), Pose(position.copy(), dcm))
+        assert cache.key(robot_3r3t, rand_pose_3r3t) == \
+               cache.key(robot_3r3t, Pose(position + 1e-8, dcm))
+        assert cache.key(robot_3r3t, rand_pose_3r3t) != \
+               cache.key(robot_3r3t, Pose(position + 1e-3, dcm))
+        assert cache.key(robot_3r3t, rand_pose_3r3t, 'a') != \
+               cache.key(robot_3r3t, rand_pose_3r3t, 'b')
+
+    def test_pin(self,
+                 robot_3r3t: Robot,
+                 rand_pose_3r3t: Pose,
+                 monkeypatch):
+        cache = Cache()
+        calls = []
+        monkeypatch.setattr('cdpyr.analysis.cache.fingerprint',
+                            lambda robot: calls.append(robot) or 'robot')
+
+        with cache.pin(robot_3r3t):
+            for _ in range(3):
+                cache.key(robot_3r3t, rand_pose_3r3t)
+            # other robots are still fingerprinted every time
+            cache.key(sample.robot_3r3t(), rand_pose_3r3t)
+        assert len(calls) == 2
+
+        # unpinned robots are fingerprinted on every key
+        cache.key(robot_3r3t, rand_pose_3r3t)
+        assert len(calls) == 3
+
+    def test_lru(self):
+        cache = Cache(maxsize=2)
+
+        assert cache.get('a', lambda: 1) == 1
+        assert cache.get('b', lambda: 2) == 2
+        assert cache.get('a', lambda: 3) == 1
+        assert cache.get('c', lambda: 4) == 4
+
+        # `b` was least recently used
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_kinematics(self, robot_3r3t: Robot, rand_pose_3r3t: Pose):
+        cache = Cache()
+        standard = StandardKinematics(cache=cache)
+        pulley = PulleyKinematics(cache=cache)
+
+        expected = StandardKinematics().backward(robot_3r3t, rand_pose_3r3t)
+        first = standard.backward(robot_3r3t, rand_pose_3r3t)
+        second = standard.backward(robot_3r3t,
+                                   Pose(*rand_pose_3r3t.position))
+
+        assert second is first
+        assert first.lengths == pytest.approx(expected.lengths)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # different algorithms do not share results
+        pulley.backward(robot_3r3t, rand_pose_3r3t)
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_structure_matrix(self, robot_3r3t: Robot, rand_pose_3r3t: Pose):
+        cache = Cache()
+        calculator = Calculator(StandardKinematics(cache=cache))
+
+        expected = Calculator(StandardKinematics()).evaluate(robot_3r3t,
+                                                             rand_pose_3r3t)
+        first = calculator.evaluate(robot_3r3t, rand_pose_3r3t)
+        second = calculator.evaluate(robot_3r3t, rand_pose_3r3t)
+
+        # the calculator shares the kinematics' cache
+        assert calculator.cache is cache
+        assert second is first
+        assert np.allclose(first.matrix, expected.matrix)
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis import archetype, workspace
+from cdpyr.analysis.cache import Cache
+from cdpyr.analysis.criterion import CableLength, Composite, WrenchFeasible
+from cdpyr.analysis.force_distribution import ClosedFormImproved
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.analysis.profile import caches, Profile
+from cdpyr.exceptions import InvalidPoseException
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class ProfileTestSuite(object):
+
+    def test_profile(self):
+        profile = Profile()
+        with profile.stage('a'):
+            pass
+        profile.add('a', 1.0, 2)
+        profile.poses = 4
+        profile.invalid = 1
+
+        other = Profile()
+        other.add('b', 0.5)
+        other.comparisons = 2
+        other.early_exits = 1
+        profile.merge(other)
+
+        assert profile.counts == {'a': 3, 'b': 1}
+        assert profile.times['a'] >= 1.0
+        assert profile.times['b'] == pytest.approx(0.5)
+        assert profile.invalid_rate == pytest.approx(0.25)
+        assert profile.early_exit_rate == pytest.approx(0.5)
+
+        profile.reset()
+        assert profile.counts == {}
+        assert profile.poses == 0
+
+    def test_track(self, ipanema_3: Robot):
+        cache = Cache()
+        ik = StandardKinematics(cache=cache)
+        criterion = Composite([
+                CableLength(ik, [0, 20]),
+                WrenchFeasible(ClosedFormImproved(ik, 10, 3000)),
+        ])
+        assert caches(criterion) == [cache]
+
+        profile = Profile()
+        with profile.track(caches(criterion)):
+            criterion.evaluate(ipanema_3, Pose())
+            criterion.evaluate(ipanema_3, Pose())
+
+        assert profile.cache_hits > 0
+        assert profile.cache_misses > 0
+
+    def test_criterion(self, ipanema_3: Robot):
+        profile = Profile()
+        ik = StandardKinematics()
+        criterion = Composite([CableLength(ik, [0, 1]),
+                               CableLength(ik, [0, 20])],
+                              profile=profile)
+
+        with pytest.raises(InvalidPoseException):
+            criterion.evaluate(ipanema_3, Pose())
+
+        # the first criterion rejects the pose and the second is skipped
+        assert profile.rejections == {'CableLength': 1, 'Composite': 1}
+        assert profile.counts['criterion.CableLength'] == 1
+        assert profile.counts['kinematics'] == 1
+
+        # without a profile, nothing is recorded
+        criterion.profile = None
+        with pytest.raises(InvalidPoseException):
+            criterion.evaluate(ipanema_3, Pose())
+        assert profile.counts['criterion.CableLength'] == 1
+
+    @pytest.mark.parametrize('parallel', (False, True))
+    def test_grid(self, ipanema_3: Robot, parallel: bool):
+        ik = StandardKinematics()
+        criterion = Composite([
+                CableLength(ik, [0, 20]),
+                WrenchFeasible(ClosedFormImproved(ik, 10, 3000)),
+        ])
+        profile = Profile()
+        grid = workspace.Grid(archetype.Translation(np.eye(3)),
+                              criterion,
+                              [-1.0, -1.0, -1.0],
+                              [1.0, 1.0, 1.0],
+                              3,
+                              profile=profile)
+
+        result = grid.evaluate(ipanema_3, parallel=parallel)
+
+        assert result.profile is profile
+        assert profile.poses == len(result) == 64
+        assert profile.comparisons == 64
+        assert profile.invalid == np.count_nonzero(~result.flags)
+        assert profile.counts['kinematics'] == 64
+        assert profile.counts['workspace'] == 1
+        # the structure matrix reuses the kinematics of cable lengths
+        assert profile.context_hits >= 64
+        for stage in ('poses', 'kinematics', 'criterion.Composite'):
+            assert profile.times[stage] > 0
+
+        # without a profile, nothing is recorded
+        grid.profile = None
+        assert grid.evaluate(ipanema_3).profile is None
+        assert profile.poses == 64
+
+    def test_grid_single_pose(self, ipanema_3: Robot):
+        profile = Profile()
+        grid = workspace.Grid(archetype.Translation(np.eye(3)),
+                              CableLength(StandardKinematics(), [0, 11]),
+                              [-1.0, -1.0, -1.0],
+                              [1.0, 1.0, 1.0],
+                              3,
+                              profile=profile)
+
+        grid.evaluate(ipanema_3)
+
+        # deciding on the only pose of a coordinate checks all its poses
+        assert 0 < profile.invalid < profile.comparisons == 64
+        assert profile.early_exits == 0
+        assert profile.early_exit_rate == 0
+
+    def test_hull(self, ipanema_3: Robot):
+        profile = Profile()
+        hull = workspace.Hull(archetype.Dextrous(steps=2),
+                              CableLength(StandardKinematics(), [0, 20]),
+                              center=[0.0, 0.0, 0.0],
+                              depth=1,
+                              profile=profile)
+
+        result = hull.evaluate(ipanema_3)
+
+        assert result.profile is profile
+        assert 0 < profile.comparisons <= profile.poses
+        assert 0 < profile.early_exits < profile.comparisons
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -4,10 +4,11 @@ import numpy as np
 import pytest
 
 from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.analysis.structure_matrix import structure_matrix
 from cdpyr.analysis.structure_matrix.calculator import Calculator as \
     StructureMatrixCalculator
-from cdpyr.motion.pose import Pose
-from cdpyr.robot import Robot
+from cdpyr.motion.pose import Pose, PoseGenerator
+from cdpyr.robot import Robot, sample
 
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
@@ -130,5 +131,98 @@ class StructureMatrixTestSuite(object):
         assert np.allclose(np.linalg.norm(structmat.matrix[0:3, :], axis=0), 1)
 
 
+    @pytest.mark.parametrize(
+            ('robot', 'generator'),
+            (
+                    (sample.robot_1t(), PoseGenerator.random_1t),
+                    (sample.robot_2t(), PoseGenerator.random_2t),
+                    (sample.robot_3t(), PoseGenerator.random_3t),
+                    (sample.robot_1r2t(), PoseGenerator.random_1r2t),
+                    (sample.robot_2r3t(), PoseGenerator.random_2r3t),
+                    (sample.robot_3r3t(), PoseGenerator.random_3r3t),
+            ),
+            ids=['1T', '2T', '3T', '1R2T', '2R3T', '3R3T'],
+    )
+    def test_evaluate_batch(self,
+                            robot: Robot,
+                            generator,
+                            ik_standard: StandardKinematics):
+        poses = [generator() for _ in range(10)]
+        positions = np.asarray([pose.linear.position for pose in poses])
+        dcms = np.asarray([pose.angular.dcm for pose in poses])
+
+        sms = StructureMatrixCalculator(ik_standard)
+        matrices = sms.evaluate_batch(robot, positions, dcms)
+
+        assert matrices.shape == (len(poses),
+                                  robot.num_dof,
+                                  robot.num_kinematic_chains)
+        for pose, matrix in zip(poses, matrices):
+            assert np.allclose(matrix, sms.evaluate(robot, pose).matrix)
+
+        # writing into a preallocated buffer
+        out = np.empty_like(matrices)
+        assert sms.evaluate_batch(robot, positions, dcms, out=out) is out
+        assert np.allclose(out, matrices)
+
+    def test_moments(self):
+        anchors = np.random.uniform(-1, 1, (8, 3))
+        dcms = np.asarray([PoseGenerator.random_3r3t().angular.dcm
+                           for _ in range(10)])
+        directions = np.random.uniform(-1, 1, (10, 8, 3))
+
+        out = np.empty((10, 3, 8))
+        assert structure_matrix.moments(dcms, anchors, directions, out) is out
+        assert np.allclose(out, np.einsum('kij,kmj->kim',
+                                          dcms,
+                                          np.cross(anchors, directions)))
+
+        # planar directions lack their z-component
+        planar = np.empty((10, 1, 8))
+        structure_matrix.moments(dcms[:, 2:3, :],
+                                 anchors,
+                                 directions[:, :, 0:2],
+                                 planar)
+        directions[:, :, 2] = 0
+        assert np.allclose(planar[:, 0, :],
+                           np.einsum('kj,kmj->km',
+                                     dcms[:, 2, :],
+                                     np.cross(anchors, directions)))
+
+    def test_decomposition(self,
+                           robot_3r3t: Robot,
+                           rand_pose_3r3t: Pose,
+                           ik_standard: StandardKinematics):
+        sms = StructureMatrixCalculator(ik_standard)
+        structmat = sms.evaluate(robot_3r3t, rand_pose_3r3t)
+        matrix = structmat.matrix
+
+        # kernel and pseudo-inverse from one shared SVD
+        assert structmat.svd is structmat.svd
+        assert structmat.kernel.shape == (8, 2)
+        assert np.allclose(matrix.dot(structmat.kernel), 0)
+        assert np.allclose(structmat.kernel.T.dot(structmat.kernel),
+                           np.eye(2))
+        assert np.allclose(structmat.pinv, np.linalg.pinv(matrix))
+        assert structmat.rank == np.linalg.matrix_rank(matrix)
+        assert not structmat.is_singular
+
+    def test_decompose(self,
+                       robot_3r3t: Robot,
+                       ik_standard: StandardKinematics):
+        positions = np.random.uniform(-0.4, 0.4, (20, 3))
+
+        sms = StructureMatrixCalculator(ik_standard)
+        matrices = sms.evaluate_batch(robot_3r3t, positions)
+        kernels, pinvs = structure_matrix.decompose(matrices)
+
+        assert kernels.shape == (20, 8, 2)
+        assert pinvs.shape == (20, 8, 6)
+        for matrix, kernel, pinv in zip(matrices, kernels, pinvs):
+            assert np.allclose(matrix.dot(kernel), 0)
+            assert np.allclose(kernel.T.dot(kernel), np.eye(2))
+            assert np.allclose(pinv, np.linalg.pinv(matrix))
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import pathlib as pl
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis import archetype, workspace
+from cdpyr.analysis.criterion import CableLength, WrenchFeasible
+from cdpyr.analysis.force_distribution import QuadraticProgram
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.analysis.workspace import store, Store
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class WorkspaceStoreTestSuite(object):
+
+    def test_dump_load(self, ipanema_3: Robot, tmpdir: pl.Path):
+        grid = workspace.Grid(archetype.Translation(np.eye(3)),
+                              CableLength(StandardKinematics(), [0, 20]),
+                              [-1.0, -1.0, -1.0],
+                              [1.0, 1.0, 1.0],
+                              2)
+        result = grid.evaluate(ipanema_3)
+        file = tmpdir / 'grid.npz'
+
+        store.dump(file, result, ipanema_3)
+        loaded = store.load(file)
+
+        # the dumped result is left untouched
+        assert result.meta is None
+
+        assert isinstance(loaded, workspace.GridResult)
+        assert loaded.algorithm is None
+        assert np.array_equal(loaded.coordinates, result.coordinates)
+        assert np.array_equal(loaded.flags, result.flags)
+        # arrays are memory-mapped
+        assert not loaded.coordinates.flags.writeable
+        assert loaded.meta['key'] == store.key(grid, ipanema_3)
+        assert loaded.meta['algorithm'] == store.describe(grid)
+
+    def test_describe(self, tmpdir: pl.Path):
+        kinematics = StandardKinematics()
+        hull = workspace.Hull(archetype.Dextrous(steps=2),
+                              CableLength(kinematics, [0, 20]),
+                              depth=1)
+        other = workspace.Hull(archetype.Dextrous(steps=2),
+                               CableLength(StandardKinematics(), [0, 20]),
+                               depth=1,
+                               store=Store(tmpdir))
+
+        # runtime state does not change the description
+        kinematics.cache = object()
+        assert store.describe(hull) == store.describe(other)
+
+        other.depth = 2
+        assert store.describe(hull) != store.describe(other)
+
+        del other.store
+        assert other.store is None
+
+    def test_describe_warm_start(self, ipanema_3: Robot):
+        ik = StandardKinematics()
+        criterion = WrenchFeasible(QuadraticProgram(ik, 10, 3000))
+        description = store.describe(criterion)
+
+        # the warm start of an evaluation does not change the description
+        criterion.evaluate(ipanema_3, Pose())
+        assert criterion.force_distribution._previous is not None
+        assert store.describe(criterion) == description
+
+    def test_describe_callables(self):
+        def scale(factor):
+            return lambda x: factor * x
+
+        # functions sharing their name are told apart by their code and the
+        # values they use
+        assert store.describe(scale(2)) == store.describe(scale(2))
+        assert store.describe(scale(2)) != store.describe(scale(3))
+        assert store.describe(lambda x: x + 1) \
+               != store.describe(lambda x: x - 1)
+        assert store.describe(np.linalg.norm) == 'numpy.linalg.norm'
+
+        class Local(object):
+            pass
+
+        with pytest.raises(ValueError):
+            store.describe(Local)
+
+    @pytest.mark.parametrize('algorithm', ('grid', 'hull'))
+    def test_store(self, ipanema_3: Robot, tmpdir: pl.Path, algorithm: str):
+        results = Store(tmpdir / 'workspaces')
+        criterion = CableLength(StandardKinematics(), [0, 20])
+        if algorithm == 'grid':
+            calculator = workspace.Grid(archetype.Translation(np.eye(3)),
+                                        criterion,
+                                        [-1.0, -1.0, -1.0],
+                                        [1.0, 1.0, 1.0],
+                                        2,
+                                        store=results)
+        else:
+            calculator = workspace.Hull(archetype.Translation(np.eye(3)),
+                                        criterion,
+                                        depth=1,
+                                        store=results)
+
+        computed = calculator.evaluate(ipanema_3)
+        loaded = calculator.evaluate(ipanema_3)
+
+        assert (results.hits, results.misses) == (1, 1)
+        assert store.key(calculator, ipanema_3) in results
+        assert loaded.algorithm is calculator
+        assert loaded.volume == pytest.approx(computed.volume)
+
+        # a different robot is a different workspace
+        ipanema_3.frame.anchors[0].position = [1.0, 1.0, 1.0]
+        calculator.evaluate(ipanema_3)
+        assert (results.hits, results.misses) == (1, 2)
+        assert len(results) == 2
+
+        results.clear()
+        assert len(results) == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
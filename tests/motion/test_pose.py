@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 
 from cdpyr.kinematics.transformation import Angular, Linear
-from cdpyr.motion.pose import Pose
+from cdpyr.motion.pose import Pose, PoseGenerator, PoseList
 from cdpyr.typing import Matrix, Vector
 
 __author__ = "Philipp Tempel"
@@ -263,6 +263,29 @@ class MotionPoseTestSuite(object):
         assert pose_1 >= pose_0
         assert pose_0 >= pose_1
 
+    def test_pose_list_columns(self):
+        poses = PoseList(PoseGenerator.random_3r3t(10))
+        columns = poses.columns
+
+        assert columns['time'].shape == (10,)
+        assert columns['position'].shape == (10, 3)
+        assert columns['quaternion'].shape == (10, 4)
+
+        resto = PoseList.from_columns(**columns)
+        # the arrays are used as they are until the poses are accessed
+        assert len(resto) == 10
+        assert np.shares_memory(resto.columns['position'],
+                                columns['position'])
+        assert resto == poses
+        assert resto[3].linear.position == pytest.approx(
+                poses[3].linear.position)
+
+        # poses may be changed after being accessed, so are columns
+        resto[3].linear.position = [1.0, 2.0, 3.0]
+        assert resto.columns['position'][3] == pytest.approx([1.0, 2.0, 3.0])
+        assert columns['position'][3] == pytest.approx(
+                poses[3].linear.position)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.realtime import Latency
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class LatencyTestSuite(object):
+
+    def test_record(self):
+        latency = Latency()
+        assert latency.p99 == 0.0
+
+        for value in np.linspace(1e-5, 1e-4, 100):
+            latency.record(value)
+        latency.record(1e-2)
+
+        assert latency.count == 101
+        assert latency.counts.sum() == 101
+        assert latency.max == pytest.approx(1e-2)
+        # percentiles are accurate to one bin
+        assert 5.5e-5 <= latency.p50 <= 5.5e-5 * 10 ** (1 / 20) * 1.01
+        assert 1e-4 <= latency.p99 <= 1e-4 * 10 ** (1 / 20) * 1.01
+        assert latency.percentile(100) == pytest.approx(1e-2)
+
+    def test_clamp(self):
+        latency = Latency(minimum=1e-6, maximum=1e-3)
+        latency.record(1e-9)
+        latency.record(1.0)
+
+        assert latency.counts[0] == 1
+        assert latency.counts[-1] == 1
+        assert latency.percentile(100) == pytest.approx(1.0)
+
+        latency.reset()
+        assert latency.count == 0
+        assert latency.counts.sum() == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.force_distribution.closed_form_improved import \
+    ClosedFormImproved
+from cdpyr.analysis.kinematics.pulley import Pulley as PulleyKinematics
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.exceptions import DeadlineExceededWarning
+from cdpyr.kinematics.transformation import Angular
+from cdpyr.motion.pose import Pose
+from cdpyr.realtime import Loop
+from cdpyr.robot import Robot
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class LoopTestSuite(object):
+
+    @pytest.mark.parametrize(
+            'kinematics',
+            (StandardKinematics, PulleyKinematics),
+            ids=['standard', 'pulley'],
+    )
+    def test_call(self, ipanema_3: Robot, kinematics):
+        ik = kinematics()
+        fd = ClosedFormImproved(ik, force_minimum=10, force_maximum=3000)
+        loop = Loop(ipanema_3, ik, fd)
+
+        for position in np.linspace([-0.2, -0.1, 0.0], [0.2, 0.1, 0.1], 5):
+            pose = Pose(position,
+                        angular=Angular(quaternion=[0.02, -0.01, 0.05, 1.0]))
+            wrench = ipanema_3.gravitational_wrench(pose)
+
+            joints, forces = loop(pose.linear.position,
+                                  pose.angular.quaternion,
+                                  wrench)
+
+            assert loop.feasible
+            assert joints == pytest.approx(ik.backward(ipanema_3,
+                                                       pose).joints)
+            assert forces == pytest.approx(fd.evaluate(ipanema_3,
+                                                       pose,
+                                                       wrench).forces)
+
+        assert loop.latency.count == 5
+        # steady state allocates no buffer arrays
+        allocations = loop._buffer.allocations
+        loop(np.zeros(3), np.asarray([0, 0, 0, 1]), wrench)
+        assert loop._buffer.allocations == allocations
+
+    def test_check(self, ipanema_3: Robot):
+        ik = StandardKinematics()
+        fd = ClosedFormImproved(ik, force_minimum=10, force_maximum=3000)
+        loop = Loop(ipanema_3, ik, fd, deadline=1.0)
+        wrench = ipanema_3.gravitational_wrench(Pose())
+
+        loop(np.zeros(3), np.asarray([0, 0, 0, 1]), wrench)
+        assert loop.check()
+        assert loop.overruns == 0
+
+        loop.deadline = 1e-12
+        loop(np.zeros(3), np.asarray([0, 0, 0, 1]), wrench)
+        assert loop.overruns == 1
+        with pytest.warns(DeadlineExceededWarning):
+            assert not loop.check()
+
+        loop.reset()
+        assert loop.latency.count == 0
+        assert loop.overruns == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
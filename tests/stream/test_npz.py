@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pathlib as pl
+
+import numpy as np
+import pytest
+
+import cdpyr
+from cdpyr.analysis.workspace import grid, hull
+from cdpyr.geometry import Polyhedron
+from cdpyr.motion.pose import PoseGenerator, PoseList
+from cdpyr.stream import parser, Stream
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class NpzParserTestSuite(object):
+
+    def test_robot(self, robot_3r3t: cdpyr.robot.Robot, tmpdir: pl.Path):
+        stream = Stream(parser.Npz())
+        tmpfile = tmpdir / f'robot.{parser.Npz.EXT}'
+
+        with open(tmpfile, 'wb') as f:
+            stream.dump(f, robot_3r3t)
+        with open(tmpfile, 'rb') as f:
+            resto = stream.load(f)
+
+        assert isinstance(resto, cdpyr.robot.Robot)
+        assert resto == robot_3r3t
+        assert stream.loads(stream.dumps(robot_3r3t)) == robot_3r3t
+
+    def test_pose_list(self):
+        stream = Stream(parser.Npz())
+        orig = PoseList(PoseGenerator.random_3r3t(20))
+
+        resto = stream.loads(stream.dumps(orig))
+
+        assert isinstance(resto, PoseList)
+        assert resto == orig
+        assert stream.loads(stream.dumps(PoseList())) == PoseList()
+
+    def test_pose_list_file(self, tmpdir: pl.Path):
+        stream = Stream(parser.Npz())
+        tmpfile = tmpdir / f'poses.{parser.Npz.EXT}'
+        orig = PoseList(PoseGenerator.random_3r3t(20))
+
+        with open(tmpfile, 'wb') as f:
+            stream.dump(f, orig)
+        with open(tmpfile, 'rb') as f:
+            resto = stream.load(f)
+
+        # poses are not created from the memory-mapped columns until accessed
+        assert len(resto) == 20
+        assert not resto.columns['position'].flags.writeable
+        assert np.array_equal(resto.columns['position'],
+                              orig.columns['position'])
+
+        # array-backed lists are dumped from their columns as they are
+        assert stream.loads(stream.dumps(resto)) == orig
+        assert resto == orig
+
+    def test_grid_result(self, tmpdir: pl.Path):
+        stream = Stream(parser.Npz())
+        tmpfile = tmpdir / f'grid.{parser.Npz.EXT}'
+        orig = grid.Result(None, None, None,
+                           np.random.random((1000, 3)),
+                           np.random.random(1000) > 0.5)
+
+        with open(tmpfile, 'wb') as f:
+            stream.dump(f, orig)
+        with open(tmpfile, 'rb') as f:
+            resto = stream.load(f)
+        with open(tmpfile, 'rb') as f:
+            loaded = stream.load(f, mmap_mode=None)
+
+        assert isinstance(resto, grid.Result)
+        assert np.array_equal(resto.coordinates, orig.coordinates)
+        assert np.array_equal(resto.flags, orig.flags)
+        # arrays are memory-mapped read-only unless asked otherwise
+        assert not resto.coordinates.flags.writeable
+        assert loaded.coordinates.flags.writeable
+        assert np.array_equal(loaded.coordinates, orig.coordinates)
+
+        # archives are plain NPZ files
+        with np.load(str(tmpfile)) as archive:
+            assert any(np.array_equal(archive[name], orig.coordinates)
+                       for name in archive.files if name != 'tree.json')
+
+    def test_hull_result(self):
+        stream = Stream(parser.Npz())
+        polyhedron = Polyhedron.from_octahedron(1)
+        orig = hull.Result(None, None, None,
+                           polyhedron.vertices,
+                           polyhedron.faces)
+
+        resto = stream.loads(stream.dumps(orig))
+
+        assert isinstance(resto, hull.Result)
+        assert np.array_equal(resto.vertices, orig.vertices)
+        assert np.array_equal(resto.faces, orig.faces)
+        assert resto.volume == pytest.approx(orig.volume)
+
+    def test_builtin_types(self):
+        stream = Stream(parser.Npz())
+        orig = {'foo': np.arange(6).reshape((2, 3)),
+                'bar': [1.0, np.float64(2.0)],
+                'baz': np.empty((0, 3))}
+
+        resto = stream.loads(stream.dumps(orig))
+
+        assert np.array_equal(resto['foo'], orig['foo'])
+        assert resto['foo'].dtype == orig['foo'].dtype
+        assert resto['bar'] == [1.0, 2.0]
+        assert resto['baz'].shape == (0, 3)
+        assert stream.loads(stream.dumps(42)) == 42
+
+
+if __name__ == "__main__":
+    pytest.main()
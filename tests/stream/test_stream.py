@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+from marshmallow import EXCLUDE, INCLUDE, ValidationError
+
+import cdpyr
+from cdpyr.analysis.workspace import grid, hull
+from cdpyr.geometry import Cylinder, Polyhedron
+from cdpyr.helper.resolve import full_classname as fcn
+from cdpyr.motion.pattern import MP_3R3T
+from cdpyr.motion.pose import PoseGenerator, PoseList
+from cdpyr.schema.loader import loader
+from cdpyr.schema.robot import RobotSchema
+from cdpyr.stream import parser, Stream
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class StreamTestSuite(object):
+
+    def test_tagged(self, robot_3r3t: cdpyr.robot.Robot):
+        stream = Stream(parser.Json())
+
+        dumped = json.loads(stream.dumps(robot_3r3t))
+        anchors = json.loads(
+                stream.dumps(robot_3r3t.platforms[0].anchors))
+
+        assert dumped[Stream.TYPE] == 'cdpyr.robot.robot.Robot'
+        assert anchors[Stream.TYPE] \
+               == 'cdpyr.robot.platform.PlatformAnchorList'
+        assert len(anchors[Stream.DATA]) \
+               == len(robot_3r3t.platforms[0].anchors)
+
+        resto = stream.loads(stream.dumps(robot_3r3t))
+        assert isinstance(resto, cdpyr.robot.Robot)
+        assert resto == robot_3r3t
+
+        # platform anchors are no longer mistaken for frame anchors
+        anchor = stream.loads(
+                stream.dumps(robot_3r3t.platforms[0].anchors[0]))
+        assert isinstance(anchor, cdpyr.robot.PlatformAnchor)
+
+        with pytest.raises(ValueError):
+            stream.loads(json.dumps({Stream.TYPE: 'foo.Bar'}))
+
+    def test_untagged(self, robot_3r3t: cdpyr.robot.Robot):
+        stream = Stream(parser.Json())
+
+        dumped = json.loads(stream.dumps(robot_3r3t))
+        del dumped[Stream.TYPE]
+
+        resto = stream.loads(json.dumps(dumped))
+        assert isinstance(resto, cdpyr.robot.Robot)
+        assert stream.loads(json.dumps({'foo': 'bar'})) == {'foo': 'bar'}
+
+    def test_loader(self, ipanema_3: cdpyr.robot.Robot):
+        stream = Stream(parser.Json())
+        schema = RobotSchema()
+        dumped = schema.dump(ipanema_3)
+
+        compiled = loader(schema)
+
+        assert loader(RobotSchema()) is compiled
+        assert stream.dumps(compiled(dumped)) \
+               == stream.dumps(schema.load(dumped))
+
+        # invalid data is rejected like by the schema itself
+        for invalid in ({**dumped, 'foo': 'bar'},
+                        {k: v for k, v in dumped.items() if k != 'frame'}):
+            with pytest.raises(ValidationError):
+                compiled(invalid)
+
+        # the schema's handling of unknown fields is honored
+        for unknown in (EXCLUDE, INCLUDE):
+            other = RobotSchema(unknown=unknown)
+            with_foo = {**dumped, 'foo': 'bar'}
+            assert loader(other) is not compiled
+            assert stream.dumps(loader(other)(with_foo)) \
+                   == stream.dumps(other.load(with_foo))
+
+    def test_loader_resolver(self, ipanema_3: cdpyr.robot.Robot):
+        robot = ipanema_3
+        drum = cdpyr.robot.Drum(radius=0.05, geometry=Cylinder(0.05, 0.1))
+        gearbox = cdpyr.robot.Gearbox(ratio=5, inertia=0.01)
+        motor = cdpyr.robot.Motor({'stall': 1, 'peak': 2, 'rated': 3,
+                                   'rms': 4},
+                                  inertia=0.01,
+                                  rated_speed=100,
+                                  rated_power=200)
+        polyhedron = Polyhedron.from_octahedron(1)
+        poses = PoseList(PoseGenerator.random_3r3t(5))
+        objects = [
+                robot.cables[0],
+                robot.cables,
+                drum,
+                cdpyr.robot.Drivetrain(drum, motor, gearbox),
+                robot.frame,
+                robot.frame.anchors[0],
+                robot.frame.anchors,
+                gearbox,
+                robot.kinematic_chains[0],
+                robot.kinematic_chains,
+                motor,
+                robot.platforms[0],
+                robot.platforms,
+                robot.platforms[0].anchors[0],
+                robot.platforms[0].anchors,
+                robot.frame.anchors[0].pulley,
+                robot,
+                poses[0],
+                poses,
+                MP_3R3T,
+                grid.Result(None, None, None,
+                            np.random.random((10, 3)),
+                            np.random.random(10) > 0.5),
+                hull.Result(None, None, None,
+                            polyhedron.vertices,
+                            polyhedron.faces),
+        ]
+
+        # every type the stream resolves is covered
+        assert {fcn(o) for o in objects} == set(Stream._RESOLVER)
+        for o in objects:
+            schema = Stream._RESOLVER[fcn(o)]
+            dumped = schema.dump(o)
+            assert schema.dump(loader(schema)(dumped)) \
+                   == schema.dump(schema.load(dumped))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import io
+import pathlib as pl
+
+import numpy as np
+import pytest
+
+import cdpyr
+from cdpyr.stream import parser, Stream
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class WcrfxParserTestSuite(object):
+
+    def test_load(self, ipanema_3: cdpyr.robot.Robot, tmpdir: pl.Path):
+        stream = Stream(parser.Wcrfx())
+        tmpfile = tmpdir / f'robot.{parser.Wcrfx.EXT}'
+
+        with open(tmpfile, 'w') as f:
+            stream.dump(f, ipanema_3)
+        with open(tmpfile, 'rb') as f:
+            d = parser.Wcrfx().load(f)
+        with open(tmpfile, 'r') as f:
+            resto = stream.load(f)
+
+        assert isinstance(resto, cdpyr.robot.Robot)
+        # anchors are read into arrays directly
+        assert isinstance(d['frame']['anchors'][0]['position'], np.ndarray)
+        assert d['frame']['anchors'][0]['dcm'].shape == (3, 3)
+        for chain, orig in zip(resto.kinematic_chains,
+                               ipanema_3.kinematic_chains):
+            assert np.allclose(
+                    resto.frame.anchors[chain.frame_anchor].position,
+                    ipanema_3.frame.anchors[orig.frame_anchor].position)
+            assert np.allclose(
+                    resto.platforms[chain.platform].anchors[
+                        chain.platform_anchor].position,
+                    ipanema_3.platforms[orig.platform].anchors[
+                        orig.platform_anchor].position)
+
+    def test_iterload(self, ipanema_3: cdpyr.robot.Robot):
+        wcrfx = parser.Wcrfx()
+        model = Stream(wcrfx).dumps(ipanema_3).split('?>', 1)[1]
+        # a trajectory is skipped over without being kept
+        trajectory = '<trajectory>{}</trajectory>'.format(''.join(
+                f'<pose t="{idx}" x="0" y="0" z="1"/>' for idx in range(100)))
+        doc = '<export>{}</export>'.format(
+                model.replace('</models>', f'{trajectory}</models>') * 3)
+
+        models = list(wcrfx.iterload(io.StringIO(doc)))
+
+        assert len(models) == 3
+        assert all(len(each['kinematic_chains'])
+                   == ipanema_3.num_kinematic_chains for each in models)
+        assert np.array_equal(models[0]['frame']['anchors'][0]['position'],
+                              models[2]['frame']['anchors'][0]['position'])
+
+        with pytest.raises(ValueError):
+            wcrfx.loads('<export></export>')
+
+
+if __name__ == "__main__":
+    pytest.main()
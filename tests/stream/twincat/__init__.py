@@ -0,0 +1,2 @@
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import pathlib as pl
+
+import numpy as np
+import pytest
+
+from cdpyr.stream.twincat import cache
+from cdpyr.stream.twincat.scope import Scope
+from tests.stream.twincat.test_parser import write_scope
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class TwinCATCacheTestSuite(object):
+
+    def test_cache(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        write_scope(file, 20)
+
+        assert cache.load(file) is None
+
+        parsed = Scope.from_file(file, cache=True)
+        assert (cache.path(file) / 'meta.json').exists()
+
+        cached = Scope.from_file(file, cache=True)
+
+        assert repr(cached.meta) == repr(parsed.meta)
+        # memory-mapped arrays are read-only
+        assert not cached.signals.values.flags.writeable
+        for actual, expected in zip(cached.signals, parsed.signals):
+            assert np.shares_memory(actual.values, cached.signals.values)
+            assert repr(actual.meta) == repr(expected.meta)
+            assert np.array_equal(actual.samples, expected.samples)
+            assert np.array_equal(actual.values, expected.values)
+            assert np.array_equal(actual.time.magnitude,
+                                  expected.time.magnitude)
+
+        # other delimiters need other caches
+        assert cache.load(file, ';') is None
+
+    def test_ragged(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file, 20, missing=3)
+        Scope.from_file(file, cache=True)
+
+        scope = cache.load(file)
+
+        assert scope.signals.values is None
+        assert np.array_equal(scope.signals[1].samples, np.arange(17))
+        assert np.array_equal(scope.signals[1].values[:, 0], data[:17, 2])
+
+    def test_invalidate(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        write_scope(file, 10)
+        Scope.from_file(file, cache=True)
+
+        # same content but newer modification time
+        stat = os.stat(file)
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert cache.load(file) is not None
+
+        # new content
+        data = write_scope(file, 10)
+        assert cache.load(file) is None
+        scope = Scope.from_file(file, cache=True)
+        assert np.array_equal(scope.signals[0].values, data[:, 0:2])
+        assert np.array_equal(cache.load(file).signals[0].values,
+                              data[:, 0:2])
+
+
+if __name__ == "__main__":
+    pytest.main()
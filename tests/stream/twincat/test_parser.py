@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pathlib as pl
+
+import numpy as np
+import pytest
+
+from cdpyr.stream.twincat.parser import Parser
+from cdpyr.stream.twincat.scope import Scope
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+def write_scope(path: pl.Path,
+                num_samples: int = 7,
+                names=('MAIN.position[0]', 'MAIN.position[1]', 'MAIN.force'),
+                missing: int = 0):
+    lines = ['Name\tScope Project',
+             'File\tC:\\TwinCAT\\Scope.tcscopex',
+             'StartRecord\t132223\tMonday, 06 January, 2020 10:00:00',
+             'EndRecord\t132224\tMonday, 06 January, 2020 10:00:05',
+             '']
+    meta = {
+            'Name':           [name.split('.')[-1] for name in names],
+            'NetId':          ['5.22.1.1.1.1'] * len(names),
+            'Port':           ['851'] * len(names),
+            'SampleTime[ms]': ['1'] * len(names),
+            'SymbolBased':    ['True'] * len(names),
+            'SymbolName':     list(names),
+            'SymbolComment':  [''] * len(names),
+            'IndexGroup':     ['16448'] * len(names),
+            'IndexOffset':    ['12345'] * len(names),
+            'DataType':       ['REAL64'] * len(names),
+            'VariableSize':   ['8'] * len(names),
+            'Offset':         ['0'] * len(names),
+            'ScaleFactor':    ['1'] * len(names),
+            'BitMask':        ['0xFFFFFFFF'] * len(names),
+    }
+    for key, values in meta.items():
+        lines.append(key + '\t' + '\t\t'.join(values) + '\t')
+    lines.append('')
+
+    data = np.random.random((num_samples, len(names)))
+    for sample in range(num_samples):
+        cells = []
+        for idx in range(len(names)):
+            # the last signal has fewer samples than the others
+            if idx == len(names) - 1 and sample >= num_samples - missing:
+                cells += ['', '']
+            else:
+                cells += [str(sample), repr(data[sample, idx])]
+        lines.append('\t'.join(cells))
+    lines.append('\t'.join([' '] * (2 * len(names))))
+    lines.append('EOF')
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return data
+
+
+class TwinCATParserTestSuite(object):
+
+    @pytest.mark.parametrize('chunk_size', (2 ** 24, 64))
+    def test_vectorized(self, tmpdir: pl.Path, chunk_size: int):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file, 50)
+
+        vectorized = Parser(file, chunk_size=chunk_size).parse()
+        legacy = Parser(file, vectorized=False).parse()
+
+        assert vectorized['meta'] == legacy['meta']
+        assert len(vectorized['signals']) == len(legacy['signals']) == 2
+        for actual, expected in zip(vectorized['signals'],
+                                    legacy['signals']):
+            assert actual['meta'] == expected['meta']
+            assert actual['time'].dtype == np.int64
+            assert actual['time'].tolist() == list(expected['time'])
+            assert np.array_equal(actual['values'],
+                                  np.asarray(expected['values'], dtype=float))
+
+        assert np.array_equal(vectorized['signals'][0]['values'], data[:, 0:2])
+        assert np.array_equal(vectorized['signals'][1]['values'][:, 0],
+                              data[:, 2])
+
+    def test_missing_samples(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file, 20, missing=3)
+
+        signals = Parser(file, chunk_size=128).parse()['signals']
+
+        assert signals[0]['time'].tolist() == list(range(20))
+        assert signals[1]['time'].tolist() == list(range(17))
+        assert np.array_equal(signals[1]['values'][:, 0], data[:17, 2])
+
+    def test_scope(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file, 10)
+
+        scope = Scope.from_file(file)
+
+        assert len(scope.signals) == 2
+        assert scope.signals[0].name == 'position'
+        assert np.array_equal(scope.signals[0].values, data[:, 0:2])
+        assert np.array_equal(scope.signals[0].samples, np.arange(10))
+
+    @pytest.mark.parametrize('window', (1, 7, 20, 100))
+    def test_iterparse(self, tmpdir: pl.Path, window: int):
+        file = tmpdir / 'scope.csv'
+        write_scope(file, 20, missing=3)
+
+        expected = Parser(file).parse()
+        windows = list(Parser(file, chunk_size=64).iterparse(window))
+
+        assert len(windows) == -(-20 // window)
+        for idx, signal in enumerate(expected['signals']):
+            assert np.array_equal(
+                    np.concatenate([w['signals'][idx]['time']
+                                    for w in windows]),
+                    signal['time'])
+            assert np.array_equal(
+                    np.concatenate([w['signals'][idx]['values']
+                                    for w in windows]),
+                    signal['values'])
+            assert all(w['signals'][idx]['meta'] == signal['meta']
+                       for w in windows)
+
+        with pytest.raises(ValueError):
+            next(Parser(file).iterparse(0))
+
+    def test_scope_iter_file(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file, 10)
+
+        scopes = list(Scope.iter_file(file, 4))
+
+        assert [len(scope.signals[0].samples) for scope in scopes] == [4, 4, 2]
+        assert scopes[1].signals[0].samples.tolist() == [4, 5, 6, 7]
+        assert np.array_equal(
+                np.vstack([scope.signals[0].values for scope in scopes]),
+                data[:, 0:2])
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.analysis.force_distribution.closed_form_improved import \
+    ClosedFormImproved
+from cdpyr.analysis.kinematics.standard import Standard as StandardKinematics
+from cdpyr.kinematics.transformation import Angular
+from cdpyr.motion.pose import Pose
+from cdpyr.robot import Robot
+from cdpyr.stream.twincat.replay import Replay
+from cdpyr.stream.twincat.signal import Signal, SignalList
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+def record(robot: Robot, num_samples: int = 12):
+    # a recording of joint lengths in millimeters along a trajectory
+    ik = StandardKinematics()
+    poses = [Pose([0.2 * np.sin(t), 0.1 * np.cos(t), 0.05 * t],
+                  angular=Angular(sequence='xyz', euler=[0.02 * t, 0.0, 0.0]))
+             for t in np.linspace(0, 2, num_samples)]
+    joints = np.asarray([ik.backward(robot, pose).joints for pose in poses])
+
+    return poses, joints
+
+
+def signals(joints: np.ndarray):
+    return SignalList([
+            Signal(np.arange(len(joints)),
+                   joints * 1e3,
+                   {'name': 'length', 'sample_time': 0.01}),
+    ])
+
+
+class ReplayTestSuite(object):
+
+    @pytest.mark.parametrize('parallel', (False, True))
+    def test_evaluate(self, ipanema_3: Robot, parallel: bool):
+        poses, joints = record(ipanema_3)
+        replay = Replay(ipanema_3,
+                        StandardKinematics(),
+                        'length',
+                        scale=1e-3)
+
+        result = replay.evaluate(signals(joints),
+                                 parallel=parallel,
+                                 n_jobs=2,
+                                 chunk_size=5)
+
+        assert len(result) == len(poses)
+        assert result.time == pytest.approx(np.arange(len(poses)) * 0.01)
+        assert result.solved.all()
+        assert result.forces is None
+        for index, pose in enumerate(poses):
+            assert result.positions[index] \
+                   == pytest.approx(pose.linear.position, abs=1e-6)
+            assert result.dcms[index] \
+                   == pytest.approx(pose.angular.dcm, abs=1e-6)
+
+    def test_channels(self, ipanema_3: Robot):
+        poses, joints = record(ipanema_3, 5)
+        num_cables = ipanema_3.num_kinematic_chains
+        ik = StandardKinematics()
+        fd = ClosedFormImproved(ik, force_minimum=10, force_maximum=3000)
+        wrench = ipanema_3.gravitational_wrench(Pose())
+        # channels in reverse order
+        replay = Replay(ipanema_3,
+                        ik,
+                        [('length', num_cables - 1 - index)
+                         for index in range(num_cables)],
+                        scale=1e-3,
+                        force_distribution=fd,
+                        wrench=wrench)
+
+        result = replay.evaluate(signals(joints[:, ::-1]))
+
+        assert result.positions[-1] \
+               == pytest.approx(poses[-1].linear.position, abs=1e-6)
+        assert result.feasible.all()
+        assert result.forces[0] == pytest.approx(
+                fd.evaluate(ipanema_3, poses[0], wrench).forces, rel=1e-4)
+
+        with pytest.raises(KeyError):
+            Replay(ipanema_3, ik, 'position').joints(signals(joints))
+        with pytest.raises(ValueError):
+            Replay(ipanema_3, ik, [('length', 0)]).joints(signals(joints))
+
+
+if __name__ == "__main__":
+    pytest.main()
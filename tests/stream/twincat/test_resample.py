@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cdpyr.stream.twincat import resample
+from cdpyr.stream.twincat.signal import Signal, SignalList
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+@pytest.fixture
+def signals():
+    # a ramp sampled at 10 Hz and a vector ramp sampled at 100 Hz
+    return SignalList([
+            Signal(np.arange(11),
+                   2 * np.arange(11.0),
+                   {'name': 'slow', 'sample_time': 0.1}),
+            Signal(np.arange(101),
+                   np.column_stack((np.arange(101.0), -np.arange(101.0))),
+                   {'name': 'fast', 'sample_time': 0.01}),
+    ])
+
+
+class ResampleTestSuite(object):
+
+    def test_time_base(self, signals: SignalList):
+        assert np.allclose(resample.time_base(signals), np.arange(11) * 0.1)
+        assert np.allclose(resample.time_base(signals, 0.25),
+                           [0.0, 0.25, 0.5, 0.75, 1.0])
+        assert np.allclose(resample.time_base(signals, offsets={'fast': 0.5}),
+                           0.5 + np.arange(6) * 0.1)
+
+        with pytest.raises(ValueError):
+            resample.time_base(signals, offsets={'fast': 2.0})
+
+    def test_resample(self, signals: SignalList):
+        slow, fast = signals
+        time = np.array([-0.05, 0.0, 0.05, 0.1, 0.55, 1.05])
+
+        linear = resample.resample(slow, time)
+        assert np.allclose(linear[1:5, 0], [0.0, 1.0, 2.0, 11.0])
+        assert np.isnan(linear[[0, 5], 0]).all()
+
+        zoh = resample.resample(slow, time, 'zoh')
+        assert np.allclose(zoh[1:5, 0], [0.0, 0.0, 2.0, 10.0])
+
+        out = np.empty((len(time), 2))
+        shifted = resample.resample(fast, time, offset=0.05, out=out)
+        assert shifted is out
+        assert np.allclose(out[3:5], [[5.0, -5.0], [50.0, -50.0]])
+        assert np.isnan(out[:2]).all()
+
+        with pytest.raises(ValueError):
+            resample.resample(slow, time, 'cubic')
+
+    def test_resample_duplicates(self):
+        # the last sample is repeated with another value
+        signal = Signal(np.array([0, 1, 2, 2]),
+                        np.array([0.0, 1.0, 2.0, 3.0]),
+                        {'name': 'repeated', 'sample_time': 1})
+        time = np.array([0.5, 1.5, 2.0])
+
+        with np.errstate(divide='raise', invalid='raise'):
+            linear = resample.resample(signal, time)
+        assert np.allclose(linear[:, 0], [0.5, 2.0, 3.0])
+        assert np.allclose(resample.resample(signal, time, 'zoh')[:, 0],
+                           [0.0, 1.0, 3.0])
+
+    def test_align(self, signals: SignalList):
+        time, values, columns = resample.align(signals)
+
+        assert columns == {'slow': slice(0, 1), 'fast': slice(1, 3)}
+        assert values.shape == (11, 3)
+        assert np.allclose(values[:, columns['slow']][:, 0], 2 * np.arange(11))
+        assert np.allclose(values[:, columns['fast']],
+                           np.column_stack((time * 100, -time * 100)))
+
+    def test_align_round_off(self):
+        # `3 * 0.1` exceeds `30 * 0.01` by round-off
+        signals = SignalList([
+                Signal(np.arange(4),
+                       np.arange(4.0),
+                       {'name': 'slow', 'sample_time': 0.1}),
+                Signal(np.arange(31),
+                       np.arange(31.0),
+                       {'name': 'fast', 'sample_time': 0.01}),
+        ])
+
+        time, values, _ = resample.align(signals)
+
+        assert time[-1] == 0.3
+        assert not np.isnan(values).any()
+        assert np.allclose(values, np.column_stack((time * 10, time * 100)))
+
+    def test_decimate(self):
+        # slow sine with high-frequency noise sampled at 1 kHz
+        time = np.arange(1000) * 1e-3
+        slow = np.sin(2 * np.pi * time)
+        signal = Signal(np.arange(1000),
+                        slow + 0.5 * np.sin(2 * np.pi * 400 * time),
+                        {'name': 'noisy', 'sample_time': 1e-3})
+
+        decimated = resample.decimate(signal, 10)
+
+        assert np.array_equal(decimated.samples, np.arange(0, 1000, 10))
+        assert decimated.values.shape == (100, 1)
+        assert decimated.sample_time == signal.sample_time
+        # the anti-aliasing filter removes the noise away from the edges
+        assert np.allclose(decimated.values[10:-10, 0],
+                           slow[100:-100:10],
+                           atol=0.05)
+
+        with pytest.raises(ValueError):
+            resample.decimate(signal, 0)
+
+if __name__ == "__main__":
+    pytest.main()
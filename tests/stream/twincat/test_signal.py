@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pathlib as pl
+
+import numpy as np
+import pytest
+
+from cdpyr.stream.twincat.scope import Scope
+from cdpyr.stream.twincat.signal import Signal, SignalList
+from tests.stream.twincat.test_parser import write_scope
+
+__author__ = "Philipp Tempel"
+__email__ = "p.tempel@tudelft.nl"
+
+
+class SignalListTestSuite(object):
+
+    def test_shared(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file,
+                           100,
+                           names=('MAIN.force', 'MAIN.position[0]',
+                                  'MAIN.position[1]', 'MAIN.position[2]'))
+
+        signals = Scope.from_file(file).signals
+
+        assert signals.columns == {'force': slice(0, 1),
+                                   'position': slice(1, 4)}
+        assert np.array_equal(signals.samples, np.arange(100))
+        assert np.array_equal(signals.values, data)
+        # the parsed values are used without copying
+        for signal in signals:
+            assert np.shares_memory(signal.values, signals.values)
+
+        position = signals.position
+        assert len(position) == 1
+        assert np.shares_memory(position.values, signals.values)
+        assert np.array_equal(position.values, data[:, 1:4])
+        assert signals.select('position', 'force').columns == {
+                'position': slice(0, 3),
+                'force':    slice(3, 4)}
+
+        with pytest.raises(AttributeError):
+            signals.velocity
+
+    def test_between(self, tmpdir: pl.Path):
+        file = tmpdir / 'scope.csv'
+        data = write_scope(file, 100)
+        signals = Scope.from_file(file).signals
+
+        # sample time is one millisecond
+        between = signals.between(0.010, 0.020)
+        assert np.array_equal(between.samples, np.arange(10, 20))
+        assert np.array_equal(between.values, signals.values[10:20])
+        assert np.shares_memory(between.values, signals.values)
+        assert len(signals.between(stop=0.005).samples) == 5
+
+        decimated = signals.decimate(10)
+        assert np.array_equal(decimated.samples, np.arange(0, 100, 10))
+        assert np.array_equal(decimated.values[:, 2], data[::10, 2])
+        assert np.shares_memory(decimated.values, signals.values)
+
+        with pytest.raises(ValueError):
+            signals.decimate(0)
+
+    def test_copy(self):
+        meta = {'name': 'force', 'sample_time': 1}
+        time = np.arange(5)
+        force = Signal(time, np.random.random(5), meta)
+        position = Signal(time, np.random.random((5, 3)),
+                          dict(meta, name='position'))
+        signals = SignalList([force, position])
+
+        assert signals.values.shape == (5, 4)
+        # selected signals are views of the shared values, but the signals
+        # in the list are left untouched
+        assert np.shares_memory(signals.force.values, signals.values)
+        assert np.shares_memory(signals.position.values, signals.values)
+        assert not np.shares_memory(force.values, signals.values)
+        assert signals[0] is force
+        assert np.array_equal(signals.position.values, position.values)
+
+        # signals are shared again after changing the list
+        signals.append(Signal(time, np.zeros(5), dict(meta, name='torque')))
+        assert signals.values.shape == (5, 5)
+
+        # signals with other samples share nothing
+        signals.append(Signal(np.arange(3), np.zeros(3), meta))
+        assert signals.values is None
+        assert signals.samples is None
+        assert len(signals.force) == 2
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -4,9 +4,11 @@ from typing import Mapping
 
 import numpy as _np
 import pytest
+from scipy.spatial import ConvexHull
 
 from cdpyr import geometry
 from cdpyr.geometry.primitive import Primitive
+from cdpyr.geometry.tube import Tube
 
 __author__ = "Philipp Tempel"
 __email__ = "p.tempel@tudelft.nl"
@@ -121,6 +123,102 @@ class GeometryTestSuite(object):
         assert geometry.surface_area == pytest.approx(expected['surface'], rel=1e-2)
         assert geometry.volume == pytest.approx(expected['volume'], rel=1e-2)
 
+    @pytest.mark.parametrize(
+            'geometry',
+            (
+                    geometry.Cuboid(1, 2, 3, [-1, -1, -1]),
+                    geometry.Cylinder([1, 2], 3, [-1, -1, -1]),
+                    geometry.Ellipsoid([1, 2, 3], [-1, -1, -1]),
+                    geometry.Polyhedron.from_octahedron(1, [-1, -1, -1]),
+                    geometry.Tube([1, 2], [3, 4], 5, [-1, -1, -1]),
+            )
+    )
+    def test_intersects(self, geometry: Primitive):
+        lower, upper = geometry.bounding_box
+        assert _np.all(lower < geometry.centroid)
+        assert _np.all(geometry.centroid < upper)
+
+        # segments crossing the whole geometry along the x- and z-axis; for
+        # the tube, these must cross its wall instead of its hole
+        offset = _np.zeros(3)
+        if isinstance(geometry, Tube):
+            offset = _np.asarray([2, 0, 0])
+        starts = _np.stack((geometry.centroid + offset - [10, 0, 0],
+                            geometry.centroid + offset - [0, 0, 10]))
+        ends = _np.stack((geometry.centroid + offset + [10, 0, 0],
+                          geometry.centroid + offset + [0, 0, 10]))
+        assert _np.all(geometry.intersects(starts, ends))
+
+        # segments far away from the geometry
+        assert not _np.any(geometry.intersects(starts + 20, ends + 20))
+
+        # segment starting on the surface and pointing away or inside
+        surface = _np.asarray([lower[0], geometry.centroid[1] + offset[1],
+                               geometry.centroid[2]])
+        if isinstance(geometry, Tube):
+            surface = geometry.centroid - [3, 0, 0]
+        assert not geometry.intersects(surface, surface - [1, 0, 0])
+        assert geometry.intersects(surface, surface + [0.5, 0, 0])
+
+    def test_intersects_tube_hole(self):
+        tube = geometry.Tube([1, 2], [3, 4], 5, [-1, -1, -1])
+
+        assert not tube.intersects([-1, -1, -10], [-1, -1, 10])
+        assert not tube.intersects([-1.5, -1, -1], [-0.5, -1, -1])
+        assert tube.intersects([-1, -1, -1], [3, -1, -1])
+
+    def test_intersects_polyhedron_shared_edge(self):
+        # triangulated cube whose ray from the segment's midpoint passes
+        # through an edge shared by two triangles
+        vertices = _np.asarray([[x, y, z]
+                                for x in (-1, 1)
+                                for y in (-1, 1)
+                                for z in (-1, 1)],
+                               dtype=float)[[7, 6, 5, 2, 1, 0, 4, 3]]
+        faces = ConvexHull(vertices).simplices
+        cube = geometry.Polyhedron(vertices, faces)
+        y = 1 - 0.5774 / 0.5773
+
+        assert cube.intersects([-0.1, y, -0.5], [0.1, y, -0.5])
+        assert cube.intersects([-0.1, -1.73e-4, 0.0], [0.1, -1.73e-4, 0.0])
+
+    def test_intersects_ellipsoidal_torus(self):
+        torus = geometry.Ellipsoid([1, 2, 3], [-1, -1, -1], axis=2)
+
+        # bounded conservatively by the enclosing sphere
+        assert torus.bounding_box == pytest.approx(
+                _np.asarray([[-6, -6, -6], [4, 4, 4]]))
+        assert torus.intersects([-1, -1, -10], [-1, -1, 10])
+        assert not torus.intersects([10, 10, -10], [10, 10, 10])
+
+    def test_bounding_volume_hierarchy(self):
+        rng = _np.random.RandomState(0)
+        primitives = [geometry.Cuboid(*size, center)
+                      for size, center in zip(rng.uniform(0.05, 0.2, (40, 3)),
+                                              rng.uniform(-1, 1, (40, 3)))] \
+                     + [geometry.Ellipsoid(radius, center)
+                        for radius, center in zip(rng.uniform(0.05, 0.2, 20),
+                                                  rng.uniform(-1, 1, (20, 3)))]
+        tree = geometry.BoundingVolumeHierarchy(primitives)
+
+        assert len(tree) == len(primitives)
+        assert tree.bounding_box[0] == pytest.approx(
+                _np.min([p.bounding_box[0] for p in primitives], axis=0))
+        assert tree.bounding_box[1] == pytest.approx(
+                _np.max([p.bounding_box[1] for p in primitives], axis=0))
+
+        starts = rng.uniform(-1.5, 1.5, (500, 3))
+        ends = rng.uniform(-1.5, 1.5, (500, 3))
+        expected = _np.zeros(starts.shape[0], dtype=bool)
+        for primitive in primitives:
+            expected |= primitive.intersects(starts, ends)
+
+        assert _np.array_equal(tree.intersects(starts, ends), expected)
+
+        # candidates are a superset of the actual intersections
+        segments, _ = tree.candidates(starts, ends)
+        assert set(_np.flatnonzero(expected)) <= set(segments.tolist())
+
 
 if __name__ == "__main__":
     pytest.main()